@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Measure the throughput of httplint.batch.lint_exchanges: exchanges linted per
+second, for increasing numbers of worker processes.
+
+A synthetic corpus of varied request/response exchanges is linted with each
+requested pool size (1 lints in-process); speedup is relative to the first size
+listed.
+
+    PYTHONPATH=. python -m bench.batch [--count N] [--chunk-size N] [--workers 1,2,4]
+"""
+
+import argparse
+import os
+import time
+from typing import List
+
+from httplint.batch import DEFAULT_CHUNK_SIZE, RawExchange, RawMessage, lint_exchanges
+
+CONTENT = b"<html><body>" + b"hello world " * 400 + b"</body></html>"
+
+
+def make_corpus(count: int) -> List[RawExchange]:
+    "Build `count` exchanges, varying the request target and caching headers."
+    corpus = []
+    for i in range(count):
+        request = RawMessage(
+            (b"GET", f"/page/{i}?q={i % 7}".encode("ascii"), b"HTTP/1.1"),
+            [
+                (b"Host", b"www.example.com"),
+                (b"User-Agent", b"bench/1.0"),
+                (b"Accept-Encoding", b"gzip, br"),
+            ],
+        )
+        response = RawMessage(
+            (b"HTTP/1.1", b"200" if i % 5 else b"404", b"OK"),
+            [
+                (b"Date", b"Mon, 04 Jul 2011 09:08:06 GMT"),
+                (b"Last-Modified", b"Mon, 04 Jul 2011 09:08:06 GMT"),
+                (b"Cache-Control", f"max-age={i % 3600}, public".encode("ascii")),
+                (b"Content-Type", b"text/html; charset=utf-8"),
+                (b"Content-Length", str(len(CONTENT)).encode("ascii")),
+                (b"ETag", f'"{i:x}"'.encode("ascii")),
+                (b"Vary", b"Accept-Encoding"),
+            ],
+            [CONTENT[:1024], CONTENT[1024:]],
+        )
+        corpus.append(RawExchange(response, request))
+    return corpus
+
+
+def run(corpus: List[RawExchange], workers: int, chunk_size: int) -> float:
+    "Lint the corpus; return exchanges per second."
+    start = time.perf_counter()
+    linted = sum(1 for _ in lint_exchanges(corpus, workers=workers, chunk_size=chunk_size))
+    elapsed = time.perf_counter() - start
+    assert linted == len(corpus)
+    return linted / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument("--count", type=int, default=4000, help="exchanges in the corpus")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument(
+        "--workers",
+        default=",".join(str(n) for n in sorted({1, 2, 4, os.cpu_count() or 1})),
+        help="comma-separated pool sizes to measure",
+    )
+    args = parser.parse_args()
+    corpus = make_corpus(args.count)
+    print(f"{args.count} exchanges, chunk size {args.chunk_size}, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8}  {'exch/s':>10}  {'speedup':>8}")
+    single = None
+    for workers in [int(n) for n in args.workers.split(",")]:
+        rate = run(corpus, workers, args.chunk_size)
+        single = single or rate
+        print(f"{workers:>8}  {rate:10.0f}  {rate / single:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Compare the throughput of ResponseCacheChecker, run on each response, with
+analyse_caching() (see httplint/cache_columns.py) run over all of them at once.
+
+The responses are those of the caching scenario in bench/corpus.py, repeated to
+make up --rows rows for analyse_caching().
+
+    PYTHONPATH=. python -m bench.cache_columns [--rows N]
+"""
+
+import argparse
+import time
+from typing import List
+
+import numpy as np
+
+from bench.corpus import build
+from httplint.cache import ResponseCacheChecker
+from httplint.cache_columns import CachingColumns, analyse_caching, columns_from_responses
+from httplint.message import HttpRequestLinter, HttpResponseLinter
+from httplint.note import Notes
+
+
+def linted_responses() -> List[HttpResponseLinter]:
+    "Lint the caching scenario, returning the responses."
+    responses = []
+    for exchange in build("caching"):
+        assert exchange.request is not None
+        request = HttpRequestLinter(start_time=exchange.start_time)
+        request.process_request_topline(*exchange.request.top_line)
+        request.process_headers(exchange.request.headers)
+        request.finish_content(True)
+        response = HttpResponseLinter(start_time=exchange.start_time, _related=request)
+        request.response = response
+        response.process_response_topline(*exchange.response.top_line)
+        response.process_headers(exchange.response.headers)
+        for chunk in exchange.response.content:
+            response.feed_content(chunk)
+        response.finish_content(True)
+        responses.append(response)
+    return responses
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="rows for analyse_caching")
+    args = parser.parse_args()
+
+    responses = linted_responses()
+    start = time.perf_counter()
+    for response in responses:
+        response.notes = Notes({"message_type": "response"})
+        ResponseCacheChecker(response)
+    checker_rate = len(responses) / (time.perf_counter() - start)
+
+    sample = columns_from_responses(responses)
+    repeats = -(-args.rows // len(responses))
+    columns = CachingColumns(*(np.tile(column, repeats)[: args.rows] for column in sample))
+    start = time.perf_counter()
+    analyse_caching(columns)
+    columns_rate = args.rows / (time.perf_counter() - start)
+
+    print(f"ResponseCacheChecker: {checker_rate:14,.0f} responses/sec")
+    print(f"analyse_caching:      {columns_rate:14,.0f} responses/sec")
+    print(f"speedup:              {columns_rate / checker_rate:14,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Measure verify_charset over a corpus of bodies in a mix of encodings, both
+correctly and incorrectly labelled, and check which notes each one produces.
+
+Run with --compare PATH to measure another source tree too (e.g., an older
+revision extracted with `git archive`); the notes for every body must be the
+same in both trees, or the difference is reported.
+
+    PYTHONPATH=. python -m bench.charset [--runs N] [--compare PATH]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+PROBE = """
+import json, sys, time
+from httplint.charset import verify_charset
+from httplint.message import HttpResponseLinter
+from httplint.note import Notes
+
+TEXTS = {
+    "english": "The quick brown fox jumps over the lazy dog. ",
+    "french": "Le vieux pêcheur mangeait du pâté près de l'église, à côté du château. ",
+    "german": "Falsches Üben von Xylophonmusik quält jeden größeren Zwerg. ",
+    "russian": "Съешь же ещё этих мягких французских булок да выпей чаю. ",
+    "greek": "Ξεσκεπάζω την ψυχοφθόρα βδελυγμία. ",
+    "japanese": "いろはにほへと ちりぬるを わかよたれそ つねならむ。",
+    "chinese": "我能吞下玻璃而不伤身体。天地玄黄，宇宙洪荒。",
+    "emoji": "Ship it 🚀 with care ✨ and tests ✅. ",
+}
+
+# (name, text, body encoding, content-type)
+CASES = [
+    ("ascii-html", "english", "ascii", "text/html; charset=utf-8"),
+    ("ascii-json", "english", "ascii", "application/json"),
+    ("utf8-french", "french", "utf-8", "text/html; charset=utf-8"),
+    ("utf8-russian", "russian", "utf-8", "text/plain; charset=utf-8"),
+    ("utf8-japanese", "japanese", "utf-8", "text/html; charset=UTF-8"),
+    ("utf8-chinese", "chinese", "utf-8", "text/html; charset=utf8"),
+    ("utf8-emoji", "emoji", "utf-8", "text/plain; charset=utf-8"),
+    ("utf8-json", "german", "utf-8", "application/json"),
+    ("utf8-ld-json", "greek", "utf-8", "application/ld+json"),
+    ("latin1-declared-latin1", "french", "latin-1", "text/html; charset=iso-8859-1"),
+    ("latin1-declared-utf8", "german", "latin-1", "text/html; charset=utf-8"),
+    ("latin1-json", "french", "latin-1", "application/json"),
+    ("cp1251-declared-cp1251", "russian", "windows-1251", "text/html; charset=windows-1251"),
+    ("cp1251-declared-utf8", "russian", "windows-1251", "text/plain; charset=utf-8"),
+    ("koi8r-declared-koi8r", "russian", "koi8-r", "text/plain; charset=koi8-r"),
+    ("sjis-declared-sjis", "japanese", "shift_jis", "text/html; charset=shift_jis"),
+    ("sjis-declared-utf8", "japanese", "shift_jis", "text/html; charset=utf-8"),
+    ("gb2312-declared-gb2312", "chinese", "gb2312", "text/html; charset=gb2312"),
+    ("utf8-declared-latin1", "french", "utf-8", "text/html; charset=iso-8859-1"),
+    ("utf8-declared-cp1251", "russian", "utf-8", "text/plain; charset=windows-1251"),
+]
+
+def body_for(text, encoding):
+    words = TEXTS[text]
+    return (words * (10000 // len(words.encode(encoding)) + 1)).encode(encoding)
+
+runs = int(sys.argv[1])
+results = {}
+for name, text, encoding, content_type in CASES:
+    body = body_for(text, encoding)
+    linter = HttpResponseLinter()
+    linter.process_response_topline(b"HTTP/1.1", b"200", b"OK")
+    linter.process_headers([(b"Content-Type", content_type.encode("ascii"))])
+    linter.feed_content(body)
+    linter.finish_content(True)
+    elapsed = []
+    for _ in range(runs):
+        linter.notes = Notes({"message_type": "response"})
+        start = time.perf_counter()
+        verify_charset(linter)
+        elapsed.append(time.perf_counter() - start)
+    results[name] = {
+        "us": min(elapsed) * 1e6,
+        "notes": sorted(note.__class__.__name__ for note in linter.notes),
+    }
+json.dump(results, sys.stdout)
+"""
+
+
+def measure(path: str, runs: int) -> Dict[str, Any]:
+    "Run the probe against the source tree at `path`."
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE, str(runs)],
+        env=dict(os.environ, PYTHONPATH=os.path.abspath(path)),
+        cwd=os.path.abspath(path),
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    result: Dict[str, Any] = json.loads(out.stdout)
+    return result
+
+
+def report(current: Dict[str, Any], baseline: Dict[str, Any]) -> int:
+    "Print a table comparing the two trees; return the number of cases whose notes differ."
+    differences = 0
+    print(f"{'':>24}  {'baseline':>10}  {'current':>10}  notes")
+    for name, result in current.items():
+        before = baseline.get(name, result)
+        same = before["notes"] == result["notes"]
+        differences += not same
+        notes = ", ".join(result["notes"]) or "-"
+        if not same:
+            notes = f"CHANGED from {', '.join(before['notes']) or '-'} to {notes}"
+        print(f"{name:>24}: {before['us']:8.1f}us  {result['us']:8.1f}us  {notes}")
+    totals: List[float] = [
+        sum(r["us"] for r in baseline.values()),
+        sum(r["us"] for r in current.values()),
+    ]
+    print(f"{'total':>24}: {totals[0]:8.1f}us  {totals[1]:8.1f}us")
+    print(f"{'geometric mean speedup':>24}: {_speedup(current, baseline):.1f}x")
+    return differences
+
+
+def _speedup(current: Dict[str, Any], baseline: Dict[str, Any]) -> float:
+    ratios = [baseline[name]["us"] / result["us"] for name, result in current.items()]
+    return float(statistics.geometric_mean(ratios))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument("--runs", type=int, default=20, help="calls per body (fastest reported)")
+    parser.add_argument("--compare", metavar="PATH", help="another source tree to compare with")
+    args = parser.parse_args()
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    current = measure(root, args.runs)
+    baseline = measure(args.compare, args.runs) if args.compare else current
+    sys.exit(1 if report(current, baseline) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Measure the cost of feeding content to a linter in small chunks, which is
+dominated by per-chunk processing such as capturing the content sample.
+
+Content is fed in 1-byte and 1KB chunks; the time per chunk is reported for the
+chunks that fill the sample and for those that arrive after it's full. Each
+measurement runs in a fresh interpreter, so that another source tree can be
+compared with --compare.
+
+    PYTHONPATH=. python -m bench.content_sample [--runs N] [--compare PATH]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+PROBE = """
+import json, sys, time
+from httplint import HttpResponseLinter
+
+def feed(chunk_size, total, prefill=False):
+    linter = HttpResponseLinter()
+    linter.process_response_topline(b"HTTP/1.1", b"200", b"OK")
+    linter.process_headers([(b"Content-Type", b"application/octet-stream")])
+    if prefill:
+        linter.feed_content(b"x" * linter.content_sample_size)
+    chunk = b"x" * chunk_size
+    count = total // chunk_size
+    start = time.perf_counter()
+    for _ in range(count):
+        linter.feed_content(chunk)
+    elapsed = time.perf_counter() - start
+    linter.finish_content(True)
+    assert len(linter.content_sample) == linter.content_sample_size
+    return elapsed / count * 1e9
+
+size = HttpResponseLinter.content_sample_size
+json.dump({
+    "1B_filling_ns": feed(1, size),
+    "1B_full_ns": feed(1, size, prefill=True),
+    "1KB_filling_ns": feed(1024, size),
+    "1KB_full_ns": feed(1024, size * 64, prefill=True),
+}, sys.stdout)
+"""
+
+METRICS = ["1B_filling_ns", "1B_full_ns", "1KB_filling_ns", "1KB_full_ns"]
+
+
+def probe(path: str) -> Dict[str, float]:
+    "Run the probe once against the source tree at `path`."
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        env=dict(os.environ, PYTHONPATH=os.path.abspath(path)),
+        cwd=os.path.abspath(path),
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    result: Dict[str, float] = json.loads(out.stdout)
+    return result
+
+
+def measure(paths: List[str], runs: int) -> List[Dict[str, float]]:
+    """
+    Run the probe `runs` times against each source tree, alternating between them so
+    that they see the same machine conditions; return the median of each metric.
+    """
+    results: List[Dict[str, List[float]]] = [{metric: [] for metric in METRICS} for _ in paths]
+    for _ in range(runs):
+        for path, result in zip(paths, results):
+            for metric, value in probe(path).items():
+                result[metric].append(value)
+    return [
+        {metric: statistics.median(values) for metric, values in result.items()}
+        for result in results
+    ]
+
+
+def report(current: Dict[str, float], baseline: Optional[Dict[str, float]]) -> None:
+    if baseline is None:
+        for metric in METRICS:
+            print(f"{metric:>15}: {current[metric]:10.0f}")
+        return
+    print(f"{'':>15}  {'baseline':>10}  {'current':>10}  {'change':>8}")
+    for metric in METRICS:
+        before, after = baseline[metric], current[metric]
+        change = (after - before) / before * 100 if before else 0.0
+        print(f"{metric:>15}: {before:10.0f}  {after:10.0f}  {change:+7.1f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument("--runs", type=int, default=5, help="runs per tree (median reported)")
+    parser.add_argument("--compare", metavar="PATH", help="another source tree to compare with")
+    args = parser.parse_args()
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if args.compare:
+        current, baseline = measure([root, args.compare], args.runs)
+        report(current, baseline)
+    else:
+        report(measure([root], args.runs)[0], None)
+
+
+if __name__ == "__main__":
+    main()
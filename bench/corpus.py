@@ -0,0 +1,282 @@
+"""
+A synthetic corpus of HTTP exchanges for the benchmark suite.
+
+Every scenario is generated deterministically from a fixed seed, so the same
+messages are linted on every run and on every machine; see SCENARIOS for what
+each one contains.
+"""
+
+import gzip
+import random
+import zlib
+from typing import Callable, Dict, List, Optional, Tuple
+
+import brotli
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore[assignment]
+
+from httplint.batch import RawExchange, RawMessage
+from httplint.types import RawFieldListType
+
+SEED = 20240101
+
+WORDS = (
+    "the of and to in is you that it he was for on are as with his they at be this have "
+    "from or one had by word but not what all were we when your can said there use an each "
+    "which she do how their if will up other about out many then them these so some her "
+    "would make like him into time has look two more write go see number no way could people"
+).split()
+
+DATE = b"Mon, 04 Jul 2011 09:08:06 GMT"
+LAST_MODIFIED = b"Sun, 03 Jul 2011 18:00:00 GMT"
+CHUNK_SIZE = 16 * 1024
+
+
+def html(size: int, rng: random.Random) -> bytes:
+    "Return an HTML document of about `size` bytes of English-ish text."
+    parts = [b"<!doctype html><html><head><title>Bench</title></head><body>"]
+    length = len(parts[0])
+    while length < size:
+        para = (
+            "<p>" + " ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 80))) + "</p>\n"
+        ).encode("ascii")
+        parts.append(para)
+        length += len(para)
+    parts.append(b"</body></html>")
+    return b"".join(parts)[:size]
+
+
+def chunked(content: bytes) -> List[bytes]:
+    "Split content into the chunks it would be fed to a linter in."
+    return [content[i : i + CHUNK_SIZE] for i in range(0, len(content), CHUNK_SIZE)] or [b""]
+
+
+def request(path: bytes, extra: Optional[RawFieldListType] = None) -> RawMessage:
+    "A browser-like GET request for path, with any extra headers."
+    return RawMessage(
+        (b"GET", path, b"HTTP/1.1"),
+        [
+            (b"Host", b"www.example.com"),
+            (b"User-Agent", b"Mozilla/5.0 (X11; Linux x86_64; rv:126.0) Gecko/20100101"),
+            (b"Accept", b"text/html,application/xhtml+xml,*/*;q=0.8"),
+            (b"Accept-Encoding", b"gzip, deflate, br"),
+            (b"Accept-Language", b"en-US,en;q=0.5"),
+        ]
+        + (extra or []),
+    )
+
+
+def base_headers(
+    length: int, content_type: bytes = b"text/html; charset=utf-8"
+) -> RawFieldListType:
+    "The headers that every response with content has."
+    return [
+        (b"Date", DATE),
+        (b"Server", b"Apache/2.4.41 (Ubuntu)"),
+        (b"Last-Modified", LAST_MODIFIED),
+        (b"ETag", b'"5d4f-1a2b3c4d"'),
+        (b"Cache-Control", b"max-age=600, public"),
+        (b"Content-Type", content_type),
+        (b"Content-Length", str(length).encode("ascii")),
+    ]
+
+
+def headers_only(count: int, rng: random.Random) -> List[RawExchange]:
+    "304 and 204 responses, and redirects: no content to process."
+    exchanges = []
+    for i in range(count):
+        kind = i % 3
+        if kind == 0:
+            top_line = (b"HTTP/1.1", b"304", b"Not Modified")
+            headers = [
+                (b"Date", DATE),
+                (b"ETag", b'"5d4f-1a2b3c4d"'),
+                (b"Cache-Control", b"max-age=600"),
+            ]
+        elif kind == 1:
+            top_line = (b"HTTP/1.1", b"204", b"No Content")
+            headers = [(b"Date", DATE), (b"Server", b"nginx")]
+        else:
+            top_line = (b"HTTP/1.1", b"301", b"Moved Permanently")
+            location = f"https://www.example.com/{rng.choice(WORDS)}/{i}".encode("ascii")
+            headers = [
+                (b"Date", DATE),
+                (b"Location", location),
+                (b"Content-Length", b"0"),
+                (b"Cache-Control", b"max-age=3600"),
+            ]
+        exchanges.append(RawExchange(RawMessage(top_line, headers), no_content=True))
+    return exchanges
+
+
+def many_headers(count: int, rng: random.Random) -> List[RawExchange]:
+    "Responses with 50 header fields, as large sites and CDNs send."
+    content = html(2048, rng)
+    exchanges = []
+    for i in range(count):
+        headers = base_headers(len(content)) + [
+            (b"Vary", b"Accept-Encoding, Accept-Language"),
+            (b"Age", str(i % 600).encode("ascii")),
+            (b"Accept-Ranges", b"bytes"),
+            (b"Content-Language", b"en-US"),
+            (b"Strict-Transport-Security", b"max-age=31536000; includeSubDomains"),
+            (b"X-Content-Type-Options", b"nosniff"),
+            (b"X-Frame-Options", b"SAMEORIGIN"),
+            (b"Referrer-Policy", b"strict-origin-when-cross-origin"),
+            (b"Permissions-Policy", b"geolocation=(), camera=()"),
+            (b"Access-Control-Allow-Origin", b"*"),
+            (b"Timing-Allow-Origin", b"*"),
+            (b"Alt-Svc", b'h3=":443"; ma=86400'),
+            (b"Link", b"</style.css>; rel=preload; as=style"),
+            (b"Server-Timing", b"cdn-cache;desc=HIT, edge;dur=1"),
+            (b"Via", b"1.1 varnish"),
+            (b"Cross-Origin-Opener-Policy", b"same-origin"),
+            (b"Cross-Origin-Resource-Policy", b"same-site"),
+        ]
+        for j in range(50 - len(headers)):
+            headers.append(
+                (f"X-Edge-{j}".encode("ascii"), f"{rng.getrandbits(32):08x}".encode("ascii"))
+            )
+        exchanges.append(
+            RawExchange(RawMessage((b"HTTP/1.1", b"200", b"OK"), headers, chunked(content)))
+        )
+    return exchanges
+
+
+def encoded(coding: str, size: int) -> Callable[[int, random.Random], List[RawExchange]]:
+    "Responses whose content is `size` bytes of HTML before being compressed with coding."
+
+    def builder(count: int, rng: random.Random) -> List[RawExchange]:
+        exchanges = []
+        for _ in range(count):
+            content = html(size, rng)
+            if coding == "gzip":
+                content = gzip.compress(content, mtime=0)
+            elif coding == "deflate":
+                content = zlib.compress(content)
+            elif coding == "zstd":
+                content = zstandard.ZstdCompressor().compress(content)
+            else:
+                content = brotli.compress(content)
+            headers = base_headers(len(content)) + [
+                (b"Content-Encoding", coding.encode("ascii")),
+                (b"Vary", b"Accept-Encoding"),
+            ]
+            exchanges.append(
+                RawExchange(
+                    RawMessage((b"HTTP/1.1", b"200", b"OK"), headers, chunked(content)),
+                    request(b"/page"),
+                )
+            )
+        return exchanges
+
+    return builder
+
+
+def set_cookie_heavy(count: int, rng: random.Random) -> List[RawExchange]:
+    "Responses that set twenty cookies each, with a variety of attributes."
+    exchanges = []
+    for i in range(count):
+        headers = base_headers(0)
+        for j in range(20):
+            value = f"{rng.choice(WORDS)}{j}={rng.getrandbits(64):016x}; Path=/"
+            if j % 2:
+                value += "; Secure; HttpOnly; SameSite=Lax"
+            if j % 3 == 0:
+                value += "; Expires=Wed, 04 Jul 2012 09:08:06 GMT"
+            if j % 5 == 0:
+                value += "; Domain=example.com; Max-Age=86400"
+            headers.append((b"Set-Cookie", value.encode("ascii")))
+        exchanges.append(
+            RawExchange(
+                RawMessage((b"HTTP/1.1", b"200", b"OK"), headers),
+                request(f"/login/{i}".encode("ascii")),
+            )
+        )
+    return exchanges
+
+
+def csp_heavy(count: int, rng: random.Random) -> List[RawExchange]:
+    "Responses with long Content-Security-Policy and Report-Only policies."
+    exchanges = []
+    for _ in range(count):
+        hosts = " ".join(f"https://{rng.choice(WORDS)}{n}.example.net" for n in range(30))
+        policy = (
+            f"default-src 'self'; script-src 'self' 'nonce-{rng.getrandbits(64):x}' {hosts}; "
+            f"style-src 'self' 'unsafe-inline' {hosts}; img-src * data: blob:; "
+            f"connect-src 'self' {hosts}; font-src 'self' https://fonts.example.net; "
+            "frame-ancestors 'none'; base-uri 'self'; form-action 'self'; "
+            "upgrade-insecure-requests; report-uri /csp-report"
+        ).encode("ascii")
+        headers = base_headers(0) + [
+            (b"Content-Security-Policy", policy),
+            (b"Content-Security-Policy-Report-Only", policy),
+        ]
+        exchanges.append(RawExchange(RawMessage((b"HTTP/1.1", b"200", b"OK"), headers)))
+    return exchanges
+
+
+def caching_pairs(count: int, rng: random.Random) -> List[RawExchange]:
+    "Conditional and unconditional request/response pairs, for the caching analysis."
+    content = html(4096, rng)
+    exchanges = []
+    for i in range(count):
+        conditional = i % 2 == 0
+        extra: RawFieldListType = [(b"Cache-Control", b"max-age=0")]
+        if conditional:
+            extra += [(b"If-None-Match", b'"5d4f-1a2b3c4d"'), (b"If-Modified-Since", LAST_MODIFIED)]
+        cache_control = [b"max-age=600, public", b"no-cache", b"private, max-age=60", b"no-store"][
+            i % 4
+        ]
+        headers = [
+            (b"Date", DATE),
+            (b"Last-Modified", LAST_MODIFIED),
+            (b"ETag", b'"5d4f-1a2b3c4d"'),
+            (b"Cache-Control", cache_control),
+            (b"Expires", b"Mon, 04 Jul 2011 09:18:06 GMT"),
+            (b"Vary", b"Accept-Encoding, Cookie"),
+            (b"Age", str(rng.randint(0, 900)).encode("ascii")),
+        ]
+        if conditional:
+            response = RawMessage((b"HTTP/1.1", b"304", b"Not Modified"), headers)
+        else:
+            headers += [
+                (b"Content-Type", b"text/html; charset=utf-8"),
+                (b"Content-Length", str(len(content)).encode("ascii")),
+            ]
+            response = RawMessage((b"HTTP/1.1", b"200", b"OK"), headers, chunked(content))
+        exchanges.append(
+            RawExchange(
+                response, request(f"/doc/{i}".encode("ascii"), extra), start_time=1309770486
+            )
+        )
+    return exchanges
+
+
+# name: (builder, number of exchanges)
+SCENARIOS: Dict[str, Tuple[Callable[[int, random.Random], List[RawExchange]], int]] = {
+    "headers-only": (headers_only, 300),
+    "50-headers": (many_headers, 60),
+    "gzip-1k": (encoded("gzip", 1024), 100),
+    "gzip-64k": (encoded("gzip", 64 * 1024), 20),
+    "gzip-1m": (encoded("gzip", 1024 * 1024), 4),
+    "br-1k": (encoded("br", 1024), 100),
+    "br-64k": (encoded("br", 64 * 1024), 20),
+    "br-1m": (encoded("br", 1024 * 1024), 4),
+    "deflate-64k": (encoded("deflate", 64 * 1024), 20),
+    "set-cookie": (set_cookie_heavy, 100),
+    "csp": (csp_heavy, 100),
+    "caching": (caching_pairs, 100),
+}
+
+if zstandard is not None:
+    SCENARIOS["zstd-64k"] = (encoded("zstd", 64 * 1024), 20)
+
+
+def build(name: str, scale: float = 1.0) -> List[RawExchange]:
+    "Return the exchanges for the named scenario; scale changes how many there are."
+    builder, count = SCENARIOS[name]
+    return builder(max(1, round(count * scale)), random.Random(f"{SEED}-{name}"))
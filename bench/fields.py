@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Measure the per-field-line cost of processing a header section.
+
+A corpus of realistic response header blocks (40-80 field lines each, taken
+from the kinds of responses that large sites and CDNs send), along with a block
+of fields that have no handler (which mostly measures the cost of ingesting each
+line), is processed by FieldSection.process; the time per field line (for the
+fastest of many passes over each block) is reported. Each measurement runs in a
+fresh interpreter, so that another source tree can be compared with --compare.
+
+    PYTHONPATH=. python -m bench.fields [--runs N] [--compare PATH]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+PROBE = """
+import json, sys, time
+from httplint.field.section import FieldSection
+from httplint.message import HttpResponseLinter
+
+COMMON = [
+    (b"Date", b"Mon, 04 Jul 2011 09:08:06 GMT"),
+    (b"Server", b"ECAcc (lac/55B4)"),
+    (b"Content-Type", b"text/html; charset=utf-8"),
+    (b"Content-Length", b"64820"),
+    (b"Connection", b"keep-alive"),
+    (b"Cache-Control", b"public, max-age=300, s-maxage=600, stale-while-revalidate=60"),
+    (b"Age", b"112"),
+    (b"ETag", b'W/"5d4f-1a2b3c4d5e"'),
+    (b"Last-Modified", b"Mon, 04 Jul 2011 09:00:00 GMT"),
+    (b"Expires", b"Mon, 04 Jul 2011 09:13:06 GMT"),
+    (b"Vary", b"Accept-Encoding, Accept-Language, Cookie"),
+    (b"Accept-Ranges", b"bytes"),
+    (b"Content-Language", b"en-US"),
+    (b"Strict-Transport-Security", b"max-age=31536000; includeSubDomains; preload"),
+    (b"X-Content-Type-Options", b"nosniff"),
+    (b"X-Frame-Options", b"SAMEORIGIN"),
+    (b"Referrer-Policy", b"strict-origin-when-cross-origin"),
+    (b"Content-Security-Policy", b"default-src 'self'; img-src * data:; script-src 'self'"),
+    (b"Permissions-Policy", b"geolocation=(), camera=()"),
+    (b"Access-Control-Allow-Origin", b"*"),
+    (b"Timing-Allow-Origin", b"*"),
+    (b"Alt-Svc", b'h3=":443"; ma=86400'),
+    (b"Link", b'</style.css>; rel=preload; as=style, </app.js>; rel=preload; as=script'),
+    (b"Server-Timing", b"cdn-cache;desc=HIT, edge;dur=1"),
+    (b"Via", b"1.1 varnish, 1.1 varnish"),
+    (b"X-Cache", b"HIT, HIT"),
+    (b"X-Cache-Hits", b"3, 1"),
+    (b"X-Served-By", b"cache-lax-1234-LAX, cache-sjc-5678-SJC"),
+    (b"X-Timer", b"S1309770486.123456,VS0,VE1"),
+    (b"X-Request-Id", b"b7c1d2e3-f4a5-4b6c-8d7e-9f0a1b2c3d4e"),
+    (b"Report-To", b'{"group":"default","max_age":31536000}'),
+    (b"NEL", b'{"report_to":"default","max_age":31536000}'),
+    (b"Cross-Origin-Opener-Policy", b"same-origin"),
+    (b"Cross-Origin-Resource-Policy", b"same-site"),
+    (b"X-XSS-Protection", b"0"),
+    (b"P3P", b'CP="This is not a P3P policy"'),
+    (b"Pragma", b"no-cache"),
+    (b"Set-Cookie", b"session=abc123; Path=/; Secure; HttpOnly; SameSite=Lax"),
+    (b"Set-Cookie", b"prefs=dark; Path=/; Max-Age=31536000; Secure"),
+    (b"Set-Cookie", b"ab=variant-b; Path=/; Domain=example.com; Secure"),
+]
+
+EXTRA = [(f"X-Debug-{i}".encode("ascii"), f"value-{i}".encode("ascii")) for i in range(80)]
+
+BLOCKS = {
+    "40_fields_ns": COMMON,
+    "60_fields_ns": COMMON + EXTRA[:20],
+    "80_fields_ns": COMMON + EXTRA[:40],
+    "80_unknown_ns": EXTRA,
+}
+
+def run(block, repeat):
+    fastest = float("inf")
+    for _ in range(repeat):
+        linter = HttpResponseLinter()
+        linter.process_response_topline(b"HTTP/1.1", b"200", b"OK")
+        section = FieldSection(linter)
+        start = time.perf_counter()
+        section.process(block)
+        fastest = min(fastest, time.perf_counter() - start)
+    return fastest / len(block) * 1e9
+
+for block in BLOCKS.values():  # warm up caches and imports
+    run(block, 5)
+json.dump({name: run(block, 200) for name, block in BLOCKS.items()}, sys.stdout)
+"""
+
+
+def probe(path: str) -> Dict[str, float]:
+    "Run the probe once against the source tree at `path`."
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        env=dict(os.environ, PYTHONPATH=os.path.abspath(path)),
+        cwd=os.path.abspath(path),
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    result: Dict[str, float] = json.loads(out.stdout)
+    return result
+
+
+def measure(paths: List[str], runs: int) -> List[Dict[str, float]]:
+    """
+    Run the probe `runs` times against each source tree, alternating between them so
+    that they see the same machine conditions; return the median of each metric.
+    """
+    results: List[Dict[str, List[float]]] = [{} for _ in paths]
+    for _ in range(runs):
+        for path, result in zip(paths, results):
+            for metric, value in probe(path).items():
+                result.setdefault(metric, []).append(value)
+    return [
+        {metric: statistics.median(values) for metric, values in result.items()}
+        for result in results
+    ]
+
+
+def report(current: Dict[str, float], baseline: Optional[Dict[str, float]]) -> None:
+    if baseline is None:
+        for metric, value in current.items():
+            print(f"{metric:>16}: {value:10.0f}")
+        return
+    print(f"{'':>16}  {'baseline':>10}  {'current':>10}  {'change':>8}")
+    for metric, after in current.items():
+        before = baseline[metric]
+        change = (after - before) / before * 100 if before else 0.0
+        print(f"{metric:>16}: {before:10.0f}  {after:10.0f}  {change:+7.1f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument("--runs", type=int, default=5, help="runs per tree (median reported)")
+    parser.add_argument("--compare", metavar="PATH", help="another source tree to compare with")
+    args = parser.parse_args()
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if args.compare:
+        current, baseline = measure([root, args.compare], args.runs)
+        report(current, baseline)
+    else:
+        report(measure([root], args.runs)[0], None)
+
+
+if __name__ == "__main__":
+    main()
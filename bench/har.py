@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Measure reading and linting a HAR file with httplint.har: how fast entries are
+parsed, how much memory that takes, and exchanges linted per second for
+increasing numbers of worker processes.
+
+The HAR is written to a temporary file from the corpus in bench/batch.py, with
+content base64-encoded as browsers do for binary responses.
+
+    PYTHONPATH=. python -m bench.har [--count N] [--workers 1,2,4]
+"""
+
+import argparse
+import base64
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import IO, Dict, List, Tuple
+
+from bench.batch import make_corpus
+from httplint.har import lint_har, read_har
+from httplint.types import RawFieldListType
+
+
+def _headers(headers: RawFieldListType) -> List[Dict[str, str]]:
+    return [
+        {"name": name.decode("ascii"), "value": value.decode("ascii")} for name, value in headers
+    ]
+
+
+def write_har(out: IO[str], count: int) -> None:
+    "Write a HAR with count entries to out."
+    out.write('{"log": {"version": "1.2", "creator": {"name": "bench", "version": "1"}, ')
+    out.write('"entries": [\n')
+    for i, exchange in enumerate(make_corpus(count)):
+        assert exchange.request is not None
+        method, url, _ = exchange.request.top_line
+        _, status, phrase = exchange.response.top_line
+        entry = {
+            "startedDateTime": "2011-07-04T09:08:06.123Z",
+            "time": 42,
+            "request": {
+                "method": method.decode("ascii"),
+                "url": "https://www.example.com" + url.decode("ascii"),
+                "httpVersion": "HTTP/1.1",
+                "headers": _headers(exchange.request.headers),
+            },
+            "response": {
+                "status": int(status),
+                "statusText": phrase.decode("ascii"),
+                "httpVersion": "HTTP/1.1",
+                "headers": _headers(exchange.response.headers),
+                "content": {
+                    "size": sum(len(chunk) for chunk in exchange.response.content),
+                    "text": base64.b64encode(b"".join(exchange.response.content)).decode(),
+                    "encoding": "base64",
+                },
+            },
+            "timings": {"blocked": -1, "dns": -1, "connect": -1, "send": 1, "wait": 40},
+        }
+        out.write(("," if i else "") + json.dumps(entry, indent=2) + "\n")
+    out.write("]}}\n")
+
+
+def read(path: str) -> Tuple[float, float]:
+    "Read every entry in path; return entries per second and peak traced memory in MB."
+    start = time.perf_counter()
+    with open(path, "rb") as fh:
+        count = sum(1 for _ in read_har(fh))
+    rate = count / (time.perf_counter() - start)
+    tracemalloc.start()
+    with open(path, "rb") as fh:
+        for _ in read_har(fh):
+            pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return rate, peak / 1024 / 1024
+
+
+def lint(path: str, workers: int) -> float:
+    "Lint every entry in path; return exchanges per second."
+    start = time.perf_counter()
+    with open(path, "rb") as fh:
+        count = sum(1 for _ in lint_har(fh, workers=workers))
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument("--count", type=int, default=4000, help="entries in the HAR")
+    parser.add_argument(
+        "--workers",
+        default=",".join(str(n) for n in sorted({1, 2, 4, os.cpu_count() or 1})),
+        help="comma-separated pool sizes to measure",
+    )
+    args = parser.parse_args()
+    with tempfile.NamedTemporaryFile("w", suffix=".har", delete=False) as out:
+        write_har(out, args.count)
+    try:
+        size = os.path.getsize(out.name) / 1024 / 1024
+        rate, peak = read(out.name)
+        print(f"{args.count} entries, {size:.1f} MB, {os.cpu_count()} CPUs")
+        print(
+            f"read: {rate:.0f} entries/s, {rate * size / args.count:.1f} MB/s, peak {peak:.1f} MB"
+        )
+        print(f"{'workers':>8}  {'exch/s':>10}  {'speedup':>8}")
+        single = None
+        for workers in [int(n) for n in args.workers.split(",")]:
+            rate = lint(out.name, workers)
+            single = single or rate
+            print(f"{workers:>8}  {rate:10.0f}  {rate / single:7.2f}x")
+    finally:
+        os.unlink(out.name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Measure how much linting delays an asyncio event loop: lint a number of large
+gzip-compressed responses concurrently, as a proxy would, while a monitor task
+records how late each of its 1ms sleeps wakes up.
+
+Each response is linted both inline with HttpResponseLinter and with
+AsyncResponseLinter (see httplint/aio.py); the event loop's lag percentiles and
+the time taken are reported for each.
+
+    PYTHONPATH=. python -m bench.loop_latency [--connections N] [--size BYTES]
+        [--concurrency N]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import Any, Dict, List
+
+from bench.corpus import encoded
+from bench.suite import percentiles
+from httplint.aio import AsyncResponseLinter, Offloader
+from httplint.batch import RawExchange
+from httplint.message import HttpResponseLinter
+
+TICK = 0.001
+
+
+async def monitor(lags: List[float], done: asyncio.Event) -> None:
+    "Record how late each TICK-long sleep wakes up until done is set."
+    while not done.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(max(0.0, time.perf_counter() - start - TICK))
+
+
+async def lint_inline(exchange: RawExchange) -> None:
+    response = exchange.response
+    linter = HttpResponseLinter()
+    linter.process_response_topline(*response.top_line)
+    linter.process_headers(response.headers)
+    for chunk in response.content:
+        await asyncio.sleep(0)  # reading the next chunk from the network
+        linter.feed_content(chunk)
+    linter.finish_content(response.complete)
+
+
+async def lint_async(exchange: RawExchange, offloader: Offloader) -> None:
+    response = exchange.response
+    linter = AsyncResponseLinter(offloader=offloader)
+    linter.process_response_topline(*response.top_line)
+    linter.process_headers(response.headers)
+    for chunk in response.content:
+        await asyncio.sleep(0)
+        await linter.feed_content(chunk)
+    await linter.finish_content(response.complete)
+
+
+async def run(mode: str, exchanges: List[RawExchange], concurrency: int) -> Dict[str, Any]:
+    "Lint exchanges concurrently in the given mode; return the loop lag and time taken."
+    lags: List[float] = []
+    done = asyncio.Event()
+    offloader = Offloader(max_concurrency=concurrency)
+    watcher = asyncio.create_task(monitor(lags, done))
+    start = time.perf_counter()
+    if mode == "inline":
+        await asyncio.gather(*[lint_inline(exchange) for exchange in exchanges])
+    else:
+        await asyncio.gather(*[lint_async(exchange, offloader) for exchange in exchanges])
+    elapsed = time.perf_counter() - start
+    done.set()
+    await watcher
+    return {
+        "seconds": elapsed,
+        "lag_ms": {name: value / 1000 for name, value in percentiles(lags).items()},
+        "max_lag_ms": max(lags, default=0.0) * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument("--connections", type=int, default=16, help="responses linted at once")
+    parser.add_argument("--size", type=int, default=1024 * 1024, help="decoded size of each")
+    parser.add_argument("--concurrency", type=int, default=4, help="Offloader max_concurrency")
+    args = parser.parse_args()
+
+    exchanges = encoded("gzip", args.size)(args.connections, random.Random(args.size))
+    asyncio.run(run("inline", exchanges[:1], args.concurrency))  # import handlers
+    print(f"{'':<8}{'seconds':>10}" + "".join(f"{f'lag {pct}':>12}" for pct in ["p50", "p99"]))
+    for mode in ["inline", "async"]:
+        result = asyncio.run(run(mode, exchanges, args.concurrency))
+        lag = result["lag_ms"]
+        print(
+            f"{mode:<8}{result['seconds']:10.2f}{lag['p50']:10.1f}ms{lag['p99']:10.1f}ms"
+            f"   (max {result['max_lag_ms']:.1f}ms)"
+        )
+
+
+if __name__ == "__main__":
+    main()
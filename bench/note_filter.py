@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Measure the throughput of linting the synthetic corpus (see bench/corpus.py)
+with some common note suppression profiles (see NoteFilter in
+httplint/note_filter.py), relative to keeping every note.
+
+The profiles are:
+
+- site-wide: notes that a site might turn off everywhere because they're noisy
+  or expected; this includes the content type and character encoding checks
+- content-checks: only the content type and character encoding notes
+- caching-only: only keep caching notes
+- security-only: only keep browser security, cookie and CORS notes
+
+    PYTHONPATH=. python -m bench.note_filter [--scenario NAME ...] [--scale N]
+        [--passes N]
+"""
+
+import argparse
+import time
+from typing import Dict, List, Optional
+
+from bench.corpus import SCENARIOS, build
+from bench.suite import lint
+from httplint.batch import RawExchange
+from httplint.cache import (
+    CURRENT_AGE,
+    DATE_CLOCKLESS,
+    DATE_CLOCKLESS_BAD_HDR,
+    FRESHNESS_FRESH,
+    STORE_STORABLE,
+)
+from httplint.charset import CHARSET_IMPLICIT_MISMATCH, CHARSET_MISMATCH, CHARSET_UNDECODABLE
+from httplint.content_type import CONTENT_TYPE_MISMATCH
+from httplint.field import FIELD_DEPRECATED
+from httplint.field.parsers.cache_status import CACHE_STATUS
+from httplint.field.parsers.cdn_cache_control import CDN_CACHE_CONTROL_PRESENT
+from httplint.field.parsers.date import DATE_CORRECT
+from httplint.field.parsers.last_modified import LM_PRESENT
+from httplint.field.parsers.link import LINK_RESOURCE_HINTS
+from httplint.field.parsers.permissions_policy import PERMISSIONS_POLICY_PRESENT
+from httplint.field.parsers.proxy_status import PROXY_STATUS
+from httplint.field.parsers.referrer_policy import REFERRER_POLICY_STRICT
+from httplint.field.parsers.server import SERVER_TOO_LONG
+from httplint.field.parsers.set_cookie import SET_COOKIE_HARDENED
+from httplint.field.parsers.strict_transport_security import HSTS_VALID
+from httplint.field.parsers.via import VIA_PRESENT
+from httplint.field.parsers.x_content_type_options import CONTENT_TYPE_OPTIONS
+from httplint.field.parsers.x_frame_options import FRAME_OPTIONS_DENY, FRAME_OPTIONS_SAMEORIGIN
+from httplint.message import CL_CORRECT, MISSING_USER_AGENT
+from httplint.note import categories
+from httplint.note_filter import NoteFilter
+from httplint.status import STATUS_NONSTANDARD
+
+CONTENT_CHECKS = [
+    CONTENT_TYPE_MISMATCH,
+    CHARSET_MISMATCH,
+    CHARSET_IMPLICIT_MISMATCH,
+    CHARSET_UNDECODABLE,
+]
+
+PROFILES: Dict[str, Optional[NoteFilter]] = {
+    "none": None,
+    "site-wide": NoteFilter(
+        deny=CONTENT_CHECKS
+        + [
+            MISSING_USER_AGENT,
+            DATE_CLOCKLESS,
+            DATE_CLOCKLESS_BAD_HDR,
+            CL_CORRECT,
+            DATE_CORRECT,
+            FIELD_DEPRECATED,
+            VIA_PRESENT,
+            LM_PRESENT,
+            SERVER_TOO_LONG,
+            CDN_CACHE_CONTROL_PRESENT,
+            CACHE_STATUS,
+            PROXY_STATUS,
+            LINK_RESOURCE_HINTS,
+            SET_COOKIE_HARDENED,
+            PERMISSIONS_POLICY_PRESENT,
+            CONTENT_TYPE_OPTIONS,
+            FRAME_OPTIONS_DENY,
+            FRAME_OPTIONS_SAMEORIGIN,
+            REFERRER_POLICY_STRICT,
+            HSTS_VALID,
+            STATUS_NONSTANDARD,
+            CURRENT_AGE,
+            STORE_STORABLE,
+            FRESHNESS_FRESH,
+        ]
+    ),
+    "content-checks": NoteFilter(deny=CONTENT_CHECKS),
+    "caching-only": NoteFilter(allow=[categories.CACHING]),
+    "security-only": NoteFilter(allow=[categories.SECURITY, categories.COOKIES, categories.CORS]),
+}
+
+
+def throughput(
+    exchanges: List[RawExchange], note_filter: Optional[NoteFilter], passes: int
+) -> float:
+    "Return the messages linted per second, for the fastest of passes."
+    messages = 0
+    fastest = float("inf")
+    for _ in range(passes):
+        start = time.perf_counter()
+        messages = sum(lint(exchange, note_filter=note_filter) for exchange in exchanges)
+        fastest = min(fastest, time.perf_counter() - start)
+    return messages / fastest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=list(SCENARIOS),
+        help="scenario to run (repeatable; default all)",
+    )
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply corpus sizes by this")
+    parser.add_argument("--passes", type=int, default=3, help="throughput passes (fastest kept)")
+    args = parser.parse_args()
+
+    print(f"{'msgs/sec':<14}" + "".join(f"{profile:>16}" for profile in PROFILES))
+    for name in args.scenario or list(SCENARIOS):
+        exchanges = build(name, args.scale)
+        for note_filter in PROFILES.values():
+            lint(exchanges[0], note_filter=note_filter)  # import handlers and warm caches
+        rates = [throughput(exchanges, nf, args.passes) for nf in PROFILES.values()]
+        line = f"{name:<14}{rates[0]:16,.0f}"
+        for rate in rates[1:]:
+            line += f"{rate:9,.0f} {(rate - rates[0]) / rates[0] * 100:+5.0f}%"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Measure the memory held by each Note, using tracemalloc, and the time taken to
+add one to a Notes list.
+
+Notes are added the way the linters add them: a mix of note classes, with a
+couple of vars each, to Notes that have the message type as a default var;
+some have a subnote. Each measurement runs in a fresh interpreter, so that
+another source tree can be compared with --compare.
+
+    PYTHONPATH=. python -m bench.notes [--count N] [--compare PATH]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, Optional
+
+PROBE = """
+import json, sys, time, tracemalloc
+from httplint.field import BAD_SYNTAX, FIELD_DEPRECATED
+from httplint.field.section import FIELD_TOO_LARGE
+from httplint.note import Notes
+
+count = int(sys.argv[1])
+NOTES = [
+    (FIELD_DEPRECATED, {"field_name": "Pragma", "deprecation_ref": "https://example.com/"}),
+    (BAD_SYNTAX, {"field_name": "Cache-Control", "ref_uri": "https://example.com/"}),
+    (FIELD_TOO_LARGE, {"field_name": "Set-Cookie", "field_size": "9,000"}),
+]
+
+def build():
+    lists = []
+    for i in range(count // 20):
+        notes = Notes({"message_type": "response"})
+        for j in range(20):
+            note_cls, vrs = NOTES[j % len(NOTES)]
+            note = notes.add(f"offset-{j}", note_cls, **vrs)
+            if j % 10 == 0:
+                note.add_child(BAD_SYNTAX, ref_uri="https://example.com/")
+        lists.append(notes)
+    return lists
+
+build()  # warm up
+tracemalloc.start()
+before = tracemalloc.get_traced_memory()[0]
+lists = build()
+after = tracemalloc.get_traced_memory()[0]
+tracemalloc.stop()
+notes = sum(len(n) + sum(len(note.subnotes) for note in n) for n in lists)
+del lists
+
+start = time.perf_counter()
+build()
+elapsed = time.perf_counter() - start
+
+json.dump({"bytes_per_note": (after - before) / notes, "ns_per_add": elapsed / notes * 1e9},
+          sys.stdout)
+"""
+
+
+def measure(path: str, count: int) -> Dict[str, float]:
+    "Run the probe against the source tree at `path`."
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE, str(count)],
+        env=dict(os.environ, PYTHONPATH=os.path.abspath(path)),
+        cwd=os.path.abspath(path),
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    result: Dict[str, float] = json.loads(out.stdout)
+    return result
+
+
+def report(current: Dict[str, float], baseline: Optional[Dict[str, float]]) -> None:
+    if baseline is None:
+        for metric, value in current.items():
+            print(f"{metric:>15}: {value:10.1f}")
+        return
+    print(f"{'':>15}  {'baseline':>10}  {'current':>10}  {'change':>8}")
+    for metric, after in current.items():
+        before = baseline[metric]
+        change = (after - before) / before * 100 if before else 0.0
+        print(f"{metric:>15}: {before:10.1f}  {after:10.1f}  {change:+7.1f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument("--count", type=int, default=100000, help="notes to create")
+    parser.add_argument("--compare", metavar="PATH", help="another source tree to compare with")
+    args = parser.parse_args()
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    current = measure(root, args.count)
+    report(current, measure(args.compare, args.count) if args.compare else None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Measure the start-up cost of httplint: how long `import httplint` takes, how much
+memory the process holds afterwards, and how long the first message takes to lint.
+
+Each measurement runs in a fresh interpreter. To compare against another checkout
+(e.g., an older revision extracted with `git archive`), pass its path with --compare.
+
+    PYTHONPATH=. python -m bench.startup [--runs N] [--compare PATH]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import httplint
+imported = time.perf_counter()
+import_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+linter = httplint.HttpResponseLinter()
+linter.process_response_topline(b"HTTP/1.1", b"200", b"OK")
+linter.process_headers([
+    (b"Date", b"Mon, 04 Jul 2011 09:08:06 GMT"),
+    (b"Cache-Control", b"max-age=60"),
+    (b"Content-Type", b"text/plain"),
+    (b"Content-Length", b"3"),
+])
+linter.feed_content(b"foo")
+linter.finish_content(True)
+linted = time.perf_counter()
+json.dump({
+    "import_ms": (imported - start) * 1000,
+    "first_lint_ms": (linted - imported) * 1000,
+    "import_rss_kb": import_rss,
+    "rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "modules": len(sys.modules),
+}, sys.stdout)
+"""
+
+METRICS = ["import_ms", "first_lint_ms", "import_rss_kb", "rss_kb", "modules"]
+
+
+def measure(path: str, runs: int) -> Dict[str, float]:
+    "Run the probe `runs` times against the source tree at `path`; return medians."
+    env = dict(os.environ, PYTHONPATH=os.path.abspath(path))
+    # make sure both trees are measured with warm bytecode caches
+    subprocess.run(
+        [sys.executable, "-m", "compileall", "-q", os.path.join(path, "httplint")],
+        check=True,
+        capture_output=True,
+    )
+    results: Dict[str, List[float]] = {metric: [] for metric in METRICS}
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE],
+            env=env,
+            cwd=os.path.abspath(path),
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        for metric, value in json.loads(out.stdout).items():
+            results[metric].append(value)
+    return {metric: statistics.median(values) for metric, values in results.items()}
+
+
+def report(current: Dict[str, float], baseline: Optional[Dict[str, float]]) -> None:
+    if baseline is None:
+        for metric in METRICS:
+            print(f"{metric:>15}: {current[metric]:10.1f}")
+        return
+    print(f"{'':>15}  {'baseline':>10}  {'current':>10}  {'change':>8}")
+    for metric in METRICS:
+        before, after = baseline[metric], current[metric]
+        change = (after - before) / before * 100 if before else 0.0
+        print(f"{metric:>15}: {before:10.1f}  {after:10.1f}  {change:+7.1f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument("--runs", type=int, default=10, help="runs per tree (median reported)")
+    parser.add_argument("--compare", metavar="PATH", help="another source tree to compare with")
+    args = parser.parse_args()
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    baseline = measure(args.compare, args.runs) if args.compare else None
+    report(measure(root, args.runs), baseline)
+
+
+if __name__ == "__main__":
+    main()
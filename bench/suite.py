@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Run the benchmark suite: lint each scenario in the synthetic corpus (see
+bench/corpus.py) and report throughput, per-stage latency percentiles, and peak
+memory.
+
+Each scenario is linted several times to measure throughput (the fastest pass is
+reported), once with httplint.timings turned on to get the latency of each stage
+for every message, and once under tracemalloc to find its peak memory use.
+Latency includes rendering the summary of every note, as most consumers do;
+with --verdict-only, linters only record which notes they add (see VerdictNotes
+in httplint/note.py), and nothing is rendered.
+
+Results can be saved as JSON with --save, and compared against a saved file with
+--baseline; --max-regression makes the run fail when a scenario's throughput
+drops by more than the given percentage.
+
+    PYTHONPATH=. python -m bench.suite [--scenario NAME ...] [--scale N] [--passes N]
+        [--verdict-only] [--save PATH] [--baseline PATH [--max-regression PCT]]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+from bench.corpus import SCENARIOS, build
+from httplint.batch import RawExchange, RawMessage
+from httplint.message import HttpMessageLinter, HttpRequestLinter, HttpResponseLinter
+from httplint.note_filter import NoteFilter
+from httplint.timings import Timings
+
+PERCENTILES = [50, 90, 99]
+FORMAT_VERSION = 1
+
+
+def _feed(linter: HttpMessageLinter, message: RawMessage) -> None:
+    linter.process_headers(message.headers)
+    for chunk in message.content:
+        linter.feed_content(chunk)
+    linter.finish_content(message.complete, message.trailers)
+
+
+def lint(
+    exchange: RawExchange,
+    timings: Optional[Timings] = None,
+    verdict_only: bool = False,
+    note_filter: Optional[NoteFilter] = None,
+) -> int:
+    """
+    Lint an exchange and render its notes' summaries (unless verdict_only); return the
+    number of messages.
+    """
+    request = None
+    if exchange.request is not None:
+        request = HttpRequestLinter(
+            start_time=exchange.start_time,
+            no_content=exchange.no_content,
+            timings=timings,
+            verdict_only=verdict_only,
+            note_filter=note_filter,
+        )
+        request.process_request_topline(*exchange.request.top_line)
+        _feed(request, exchange.request)
+    response = HttpResponseLinter(
+        start_time=exchange.start_time,
+        _related=request,
+        no_content=exchange.no_content,
+        timings=timings,
+        verdict_only=verdict_only,
+        note_filter=note_filter,
+    )
+    if request is not None:
+        request.response = response
+        response.is_head_response = request.method == "HEAD"
+    response.process_response_topline(*exchange.response.top_line)
+    _feed(response, exchange.response)
+
+    if verdict_only:
+        return 2 if request is not None else 1
+    start = time.perf_counter()
+    for linter in [response, request] if request is not None else [response]:
+        for note in linter.notes:
+            _ = note.summary
+    if timings is not None:
+        timings.add("render", time.perf_counter() - start)
+    return 2 if request is not None else 1
+
+
+def percentiles(values: List[float]) -> Dict[str, float]:
+    "Return the PERCENTILES of values, in microseconds."
+    ordered = sorted(values)
+    return {
+        f"p{pct}": ordered[min(len(ordered) - 1, len(ordered) * pct // 100)] * 1e6
+        for pct in PERCENTILES
+    }
+
+
+def run_scenario(
+    exchanges: List[RawExchange], passes: int, verdict_only: bool = False
+) -> Dict[str, Any]:
+    "Measure one scenario."
+    messages = 0
+    fastest = float("inf")
+    for _ in range(passes):
+        start = time.perf_counter()
+        messages = sum(lint(exchange, verdict_only=verdict_only) for exchange in exchanges)
+        fastest = min(fastest, time.perf_counter() - start)
+
+    stages: Dict[str, List[float]] = {"total": []}
+    for exchange in exchanges:
+        timings = Timings()
+        start = time.perf_counter()
+        lint(exchange, timings, verdict_only)
+        stages["total"].append(time.perf_counter() - start)
+        for stage, timing in timings.stages.items():
+            stages.setdefault(stage, []).append(timing.seconds)
+
+    tracemalloc.start()
+    for exchange in exchanges:
+        lint(exchange, verdict_only=verdict_only)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "exchanges": len(exchanges),
+        "messages": messages,
+        "messages_per_sec": messages / fastest,
+        "latency_us": {stage: percentiles(values) for stage, values in stages.items()},
+        "peak_memory_kb": peak / 1024,
+    }
+
+
+def run(names: List[str], scale: float, passes: int, verdict_only: bool = False) -> Dict[str, Any]:
+    "Run the named scenarios; return the results in the format that --save writes."
+    results: Dict[str, Any] = {}
+    for name in names:
+        exchanges = build(name, scale)
+        lint(exchanges[0], verdict_only=verdict_only)  # import handlers and warm caches
+        results[name] = run_scenario(exchanges, passes, verdict_only)
+    return {
+        "version": FORMAT_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": scale,
+        "verdict_only": verdict_only,
+        "scenarios": results,
+    }
+
+
+def report(current: Dict[str, Any]) -> None:
+    "Print the results of a run."
+    for name, result in current["scenarios"].items():
+        print(
+            f"{name}: {result['messages_per_sec']:,.0f} messages/sec, "
+            f"peak memory {result['peak_memory_kb']:,.0f} KB"
+        )
+        print(f"  {'stage (us)':<20}" + "".join(f"{f'p{pct}':>10}" for pct in PERCENTILES))
+        for stage, values in result["latency_us"].items():
+            print(f"  {stage:<20}" + "".join(f"{value:10.1f}" for value in values.values()))
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Print how the results of a run differ from a baseline; return the change in
+    throughput for each scenario in both, as a percentage.
+    """
+    columns = ["msgs/sec", "p50 us", "p99 us", "peak KB"]
+    print(f"{'':<14}" + "".join(f"{column:>12}{'change':>9}" for column in columns))
+    changes = {}
+    for name, result in current["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            print(f"{name:<14}  (not in baseline)")
+            continue
+        pairs = [
+            (before["messages_per_sec"], result["messages_per_sec"]),
+            (before["latency_us"]["total"]["p50"], result["latency_us"]["total"]["p50"]),
+            (before["latency_us"]["total"]["p99"], result["latency_us"]["total"]["p99"]),
+            (before["peak_memory_kb"], result["peak_memory_kb"]),
+        ]
+        line = f"{name:<14}"
+        for old, new in pairs:
+            change = (new - old) / old * 100 if old else 0.0
+            line += f"{new:12,.0f}{change:+8.1f}%"
+        print(line)
+        old, new = pairs[0]
+        changes[name] = (new - old) / old * 100 if old else 0.0
+    return changes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=list(SCENARIOS),
+        help="scenario to run (repeatable; default all)",
+    )
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply corpus sizes by this")
+    parser.add_argument("--passes", type=int, default=3, help="throughput passes (fastest kept)")
+    parser.add_argument(
+        "--verdict-only", action="store_true", help="only record which notes are added"
+    )
+    parser.add_argument("--save", metavar="PATH", help="write the results to PATH as JSON")
+    parser.add_argument("--baseline", metavar="PATH", help="compare with results saved earlier")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        metavar="PCT",
+        help="exit with an error if throughput drops by more than PCT percent",
+    )
+    args = parser.parse_args()
+
+    current = run(args.scenario or list(SCENARIOS), args.scale, args.passes, args.verdict_only)
+    report(current)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as fh:
+            json.dump(current, fh, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        print()
+        changes = compare(current, baseline)
+        if args.max_regression is not None:
+            regressed = [name for name, change in changes.items() if -change > args.max_regression]
+            if regressed:
+                limit = args.max_regression
+                print(f"\nThroughput fell by more than {limit}% for: {', '.join(regressed)}")
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
+from httplint.content_encoding import ContentNeeds
+from httplint.dictionaries import DictionaryStore
 from httplint.field.description import get_field_description
 from httplint.message import HttpRequestLinter, HttpResponseLinter
-from httplint.note import Note, Notes, categories, levels
+from httplint.note import Note, Notes, Verdict, VerdictNotes, categories, levels
+from httplint.note_filter import NoteFilter
 from httplint.types import (
     AnyMessageLinterProtocol,
     LinterProtocol,
@@ -13,8 +16,13 @@ __version__ = "2026.05.2"
 __all__ = [
     "HttpRequestLinter",
     "HttpResponseLinter",
+    "ContentNeeds",
+    "DictionaryStore",
     "Note",
     "Notes",
+    "Verdict",
+    "VerdictNotes",
+    "NoteFilter",
     "categories",
     "levels",
     "get_field_description",
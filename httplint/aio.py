@@ -0,0 +1,178 @@
+"""
+Linting from asyncio code, without blocking the event loop.
+
+Decoding, hashing and checking content can take a while for large messages, so
+AsyncRequestLinter and AsyncResponseLinter run feed_content() and finish_content()
+in a thread pool. Header processing is cheap, so it stays on the event loop.
+
+    linter = AsyncResponseLinter()
+    linter.process_response_topline(b"HTTP/1.1", b"200", b"OK")
+    linter.process_headers(headers)
+    async for chunk in body:
+        await linter.feed_content(chunk)
+    await linter.finish_content(True)
+    for note in linter.notes:
+        ...
+"""
+
+import asyncio
+import contextvars
+from concurrent.futures import Executor, ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Optional, Type, TypeVar
+from weakref import WeakKeyDictionary
+
+from typing_extensions import Unpack
+
+from httplint.message import (
+    HttpMessageLinter,
+    HttpMessageParams,
+    HttpRequestLinter,
+    HttpResponseLinter,
+)
+from httplint.types import RawFieldListType
+
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MAX_BUFFER = 1024 * 1024  # 1MB
+
+T = TypeVar("T")
+
+
+class Offloader:
+    """
+    Run linting work in an executor, at most max_concurrency jobs at a time across
+    all of the linters that share it.
+
+    The executor has to be a thread pool (the default), as linters can't be moved
+    to another process.
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="httplint"
+        )
+        self.max_concurrency = max_concurrency
+        # asyncio primitives belong to one event loop, so keep a semaphore per loop
+        self._semaphores: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            WeakKeyDictionary()
+        )
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run func(*args) in the executor, waiting for a free slot first. It runs in a
+        copy of the caller's context, so that e.g. set_locale() applies to it.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        async with semaphore:
+            context = contextvars.copy_context()
+            return await loop.run_in_executor(self.executor, context.run, func, *args)
+
+
+_DEFAULT_OFFLOADER: Optional[Offloader] = None
+_DEFAULT_OFFLOADER_LOCK = Lock()
+
+
+def default_offloader() -> Offloader:
+    "Return the Offloader that linters use when they aren't given one."
+    global _DEFAULT_OFFLOADER  # pylint: disable=global-statement
+    with _DEFAULT_OFFLOADER_LOCK:
+        if _DEFAULT_OFFLOADER is None:
+            _DEFAULT_OFFLOADER = Offloader()
+        return _DEFAULT_OFFLOADER
+
+
+class AsyncMessageLinter:
+    """
+    Base class for asyncio message linters. Each wraps a linter, available as
+    `linter`; its other attributes (e.g., `notes`) can be used directly.
+
+    feed_content() returns as soon as the chunk is queued, so reading the next
+    chunk can overlap with processing this one. Once more than max_buffer bytes are
+    queued, it waits for them to be processed first.
+    """
+
+    linter_class: Type[HttpMessageLinter] = HttpMessageLinter
+
+    def __init__(
+        self,
+        offloader: Optional[Offloader] = None,
+        max_buffer: int = DEFAULT_MAX_BUFFER,
+        **kw: Unpack[HttpMessageParams],
+    ) -> None:
+        self.linter = self.linter_class(**kw)
+        self.offloader = offloader or default_offloader()
+        self.max_buffer = max_buffer
+        self._buffered = 0
+        self._pending: Optional["asyncio.Task[None]"] = None
+
+    def process_headers(self, headers: RawFieldListType) -> None:
+        "Process the headers, on the event loop."
+        self.linter.process_headers(headers)
+
+    async def feed_content(self, chunk: bytes) -> None:
+        "Queue a chunk of the content to be processed. Can be called 0 to many times."
+        self._buffered += len(chunk)
+        self._pending = asyncio.ensure_future(
+            self._after(self._pending, len(chunk), self.linter.feed_content, chunk)
+        )
+        if self._buffered > self.max_buffer:
+            await self._pending
+
+    async def finish_content(
+        self, complete: bool, trailers: Optional[RawFieldListType] = None
+    ) -> None:
+        """
+        Signal that the content is done, and wait until it and any queued content
+        has been processed.
+        """
+        self._pending = asyncio.ensure_future(
+            self._after(self._pending, 0, self.linter.finish_content, complete, trailers)
+        )
+        await self._pending
+
+    async def _after(
+        self,
+        previous: Optional["asyncio.Task[None]"],
+        size: int,
+        func: Callable[..., None],
+        *args: Any,
+    ) -> None:
+        "Run func(*args) in the offloader once previous has finished."
+        try:
+            if previous is not None:
+                await previous
+            await self.offloader.run(func, *args)
+        finally:
+            self._buffered -= size
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "linter":  # not set yet, e.g. when unpickling
+            raise AttributeError(name)
+        return getattr(self.linter, name)
+
+
+class AsyncRequestLinter(AsyncMessageLinter):
+    "An asyncio HTTP request message linter."
+
+    linter_class = HttpRequestLinter
+
+    def process_request_topline(self, method: bytes, iri: bytes, version: bytes) -> None:
+        self.linter.process_request_topline(method, iri, version)
+
+
+class AsyncResponseLinter(AsyncMessageLinter):
+    "An asyncio HTTP response message linter."
+
+    linter_class = HttpResponseLinter
+
+    def process_response_topline(
+        self, version: bytes, status_code: bytes, status_phrase: Optional[bytes] = None
+    ) -> None:
+        self.linter.process_response_topline(version, status_code, status_phrase)
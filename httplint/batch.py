@@ -0,0 +1,185 @@
+"""
+Lint many HTTP exchanges at once, spreading the work over several processes.
+
+Exchanges are described with plain tuples of bytes (see RawMessage and
+RawExchange), so that they can be sent to worker processes cheaply. Each
+exchange produces an ExchangeOutcome, which holds the rendered notes rather
+than the linters themselves.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Deque, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from httplint.i18n import set_locale
+from httplint.message import HttpRequestLinter, HttpResponseLinter
+from httplint.note import Note
+from httplint.types import NotesProtocol, RawFieldListType
+
+DEFAULT_CHUNK_SIZE = 64
+
+
+class RawMessage(NamedTuple):
+    """
+    A HTTP message as it was seen on the wire.
+
+    top_line holds the three arguments to process_request_topline (method,
+    uri, version) or process_response_topline (version, status code, status
+    phrase), depending on the kind of message.
+    """
+
+    top_line: Tuple[bytes, bytes, bytes]
+    headers: RawFieldListType
+    content: Sequence[bytes] = ()
+    trailers: Optional[RawFieldListType] = None
+    complete: bool = True
+
+
+class RawExchange(NamedTuple):
+    """
+    A response, and optionally the request that it answers.
+
+    start_time is when the request was sent; response_time is when the response
+    was received, and defaults to start_time.
+    """
+
+    response: RawMessage
+    request: Optional[RawMessage] = None
+    start_time: Optional[float] = None
+    no_content: bool = False
+    response_time: Optional[float] = None
+
+
+class NoteOutcome(NamedTuple):
+    "A rendered Note."
+
+    name: str
+    subject: str
+    level: str
+    category: str
+    summary: str
+    subnotes: Tuple["NoteOutcome", ...] = ()
+
+    @classmethod
+    def from_note(cls, note: Note) -> "NoteOutcome":
+        return cls(
+            note.__class__.__name__,
+            note.subject,
+            note.level.value,
+            note.category.name,
+            note.summary,
+            tuple(cls.from_note(subnote) for subnote in note.subnotes),
+        )
+
+
+class ExchangeOutcome(NamedTuple):
+    "The notes for a linted exchange; request_notes is None when there was no request."
+
+    response_notes: Tuple[NoteOutcome, ...]
+    request_notes: Optional[Tuple[NoteOutcome, ...]] = None
+
+
+def _outcomes(notes: NotesProtocol) -> Tuple[NoteOutcome, ...]:
+    return tuple(NoteOutcome.from_note(note) for note in notes)
+
+
+def lint_exchange(exchange: RawExchange) -> ExchangeOutcome:
+    """
+    Lint a single exchange in this process.
+    """
+    request = None
+    if exchange.request is not None:
+        raw_request = exchange.request
+        request = HttpRequestLinter(start_time=exchange.start_time, no_content=exchange.no_content)
+        request.process_request_topline(*raw_request.top_line)
+        request.process_headers(raw_request.headers)
+        for chunk in raw_request.content:
+            request.feed_content(chunk)
+        request.finish_content(raw_request.complete, raw_request.trailers)
+
+    raw_response = exchange.response
+    response_time = exchange.response_time
+    response = HttpResponseLinter(
+        start_time=response_time if response_time is not None else exchange.start_time,
+        _related=request,
+        no_content=exchange.no_content,
+    )
+    if request is not None:
+        request.response = response
+        response.is_head_response = request.method == "HEAD"
+    response.process_response_topline(*raw_response.top_line)
+    response.process_headers(raw_response.headers)
+    for chunk in raw_response.content:
+        response.feed_content(chunk)
+    response.finish_content(raw_response.complete, raw_response.trailers)
+
+    return ExchangeOutcome(
+        _outcomes(response.notes),
+        _outcomes(request.notes) if request is not None else None,
+    )
+
+
+def _lint_chunk(chunk: List[RawExchange], locale: Optional[str]) -> List[ExchangeOutcome]:
+    if locale is None:
+        return [lint_exchange(exchange) for exchange in chunk]
+    with set_locale(locale):
+        return [lint_exchange(exchange) for exchange in chunk]
+
+
+def _chunked(exchanges: Iterable[RawExchange], chunk_size: int) -> Iterator[List[RawExchange]]:
+    iterator = iter(exchanges)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def lint_exchanges(
+    exchanges: Iterable[RawExchange],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    locale: Optional[str] = None,
+) -> Iterator[ExchangeOutcome]:
+    """
+    Lint exchanges across a pool of worker processes, yielding an
+    ExchangeOutcome for each one in the order they were given.
+
+    Exchanges are sent to the workers in chunks of chunk_size. At most two
+    chunks per worker are outstanding at once, so exchanges can come from an
+    arbitrarily long iterable.
+
+    workers defaults to the number of CPUs; when it is 1, exchanges are
+    linted in this process without starting a pool.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    return _lint_chunks(_chunked(exchanges, chunk_size), workers, locale)
+
+
+def _lint_chunks(
+    chunks: Iterator[List[RawExchange]], workers: int, locale: Optional[str]
+) -> Iterator[ExchangeOutcome]:
+    if workers == 1:
+        for chunk in chunks:
+            yield from _lint_chunk(chunk, locale)
+        return
+
+    max_pending = workers * 2
+    pool = ProcessPoolExecutor(max_workers=workers)
+    pending: Deque[Future[List[ExchangeOutcome]]] = deque()
+    try:
+        for chunk in chunks:
+            pending.append(pool.submit(_lint_chunk, chunk, locale))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
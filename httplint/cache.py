@@ -21,7 +21,7 @@ class ResponseCacheChecker:
         self.store_shared = True
         self.freshness_lifetime_shared: int = 0
 
-        self.age_value = response.headers.parsed.get("age", 0)
+        self.age_value = response.headers.parsed.get("age", 0) or 0  # None if invalid
         self.date_value = response.headers.parsed.get("date", None)
         self.expires_value = response.headers.parsed.get("expires", None)
         self.lm_value = response.headers.parsed.get("last-modified", None)
@@ -54,10 +54,10 @@ class ResponseCacheChecker:
             return False
 
         # is Date present?
-        text_fieldnames = [fn.lower() for (fn, fv) in self._response.headers.text]
-        if "date" not in text_fieldnames:
+        field_index = self._response.headers.index
+        if "date" not in field_index:
             self.notes.add("", DATE_CLOCKLESS)
-            if "expires" in text_fieldnames or "last-modified" in text_fieldnames:
+            if "expires" in field_index or "last-modified" in field_index:
                 self.notes.add("field-expires field-last-modified", DATE_CLOCKLESS_BAD_HDR)
 
         return True
@@ -88,9 +88,7 @@ class ResponseCacheChecker:
                 self.notes.add("field-cache-control", STORE_PRIVATE_PUBLIC_CONFLICT)
 
         # authorization
-        elif self._request is not None and "authorization" in [
-            k.lower() for k, v in self._request.headers.text
-        ]:
+        elif self._request is not None and "authorization" in self._request.headers.index:
             if "public" in self.cc_dict:
                 self.notes.add("field-cache-control", STORE_PUBLIC_AUTH, directive="public")
             elif "must-revalidate" in self.cc_dict:
@@ -145,7 +143,7 @@ class ResponseCacheChecker:
 
     def check_freshness(self) -> bool:
         # check to see if there's an Expires, even if it's invalid
-        expires_hdr_present = "expires" in [n.lower() for (n, v) in self._response.headers.text]
+        expires_hdr_present = "expires" in self._response.headers.index
         self.has_explicit_freshness = False
         self.has_heuristic_freshness = False
         freshness_hdrs = ["field-date"]
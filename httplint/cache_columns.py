@@ -0,0 +1,176 @@
+"""
+Cache analysis over many responses at once.
+
+ResponseCacheChecker explains how one response will be cached, with notes. When
+all that's needed is whether each of a large number of responses can be stored
+and how fresh it is, analyse_caching() works out the same values for all of them
+with NumPy array operations, following the rules in httplint/cache.py.
+
+Requires NumPy.
+"""
+
+import math
+from typing import Iterable, List, NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+from httplint.cache import CACHEABLE_METHODS, HEURISTIC_CACHEABLE_STATUS
+from httplint.types import ResponseLinterProtocol
+
+FloatArray = npt.NDArray[np.float64]
+BoolArray = npt.NDArray[np.bool_]
+
+
+class CachingColumns(NamedTuple):
+    """
+    The parts of each response (and its request) that affect caching, one row per
+    response. Times are in seconds since the epoch, and NaN when missing or invalid.
+    """
+
+    status_code: npt.ArrayLike
+    date: npt.ArrayLike
+    age: npt.ArrayLike
+    expires: npt.ArrayLike
+    expires_present: npt.ArrayLike  # True if there's an Expires header, even if invalid
+    max_age: npt.ArrayLike  # Cache-Control directives; NaN when absent
+    s_maxage: npt.ArrayLike
+    no_store: npt.ArrayLike
+    private: npt.ArrayLike
+    public: npt.ArrayLike
+    must_revalidate: npt.ArrayLike
+    vary_star: npt.ArrayLike  # True if Vary contains "*"
+    authorization: npt.ArrayLike  # True if the request had an Authorization header
+    cacheable_method: npt.ArrayLike  # False if the request method isn't cacheable
+    request_time: npt.ArrayLike
+    response_time: npt.ArrayLike
+
+
+class CachingResults(NamedTuple):
+    """
+    The result of analyse_caching(); each is an array with one row per response,
+    holding the value of the ResponseCacheChecker attribute of the same name.
+
+    checked is False for responses that the checker stopped on before working out
+    their age and freshness (because they can't be stored); for those, is_fresh and
+    is_shared_fresh are False, and the other values are zero.
+    """
+
+    store_private: BoolArray
+    store_shared: BoolArray
+    age: FloatArray
+    freshness_lifetime_private: FloatArray
+    freshness_lifetime_shared: FloatArray
+    is_fresh: BoolArray
+    is_shared_fresh: BoolArray
+    checked: BoolArray
+
+
+def analyse_caching(columns: CachingColumns) -> CachingResults:
+    "Work out storability and freshness for every row of columns."
+    status_code = np.asarray(columns.status_code)
+    date = np.asarray(columns.date, dtype=np.float64)
+    age = np.nan_to_num(np.asarray(columns.age, dtype=np.float64), nan=0.0)
+    expires = np.nan_to_num(np.asarray(columns.expires, dtype=np.float64), nan=0.0)
+    max_age = np.asarray(columns.max_age, dtype=np.float64)
+    s_maxage = np.asarray(columns.s_maxage, dtype=np.float64)
+    request_time = np.asarray(columns.request_time, dtype=np.float64)
+    response_time = np.asarray(columns.response_time, dtype=np.float64)
+    has_max_age = ~np.isnan(max_age)
+    has_s_maxage = ~np.isnan(s_maxage)
+    has_date = ~np.isnan(date) & (date != 0)
+    has_request_time = ~np.isnan(request_time) & (request_time != 0)
+    has_response_time = ~np.isnan(response_time) & (response_time != 0)
+
+    # check_basic and check_storable
+    unstorable = (
+        np.asarray(columns.vary_star, dtype=bool)
+        | ~np.asarray(columns.cacheable_method, dtype=bool)
+        | np.asarray(columns.no_store, dtype=bool)
+    )
+    private = np.asarray(columns.private, dtype=bool)
+    public = np.asarray(columns.public, dtype=bool)
+    authorization = ~private & np.asarray(columns.authorization, dtype=bool)
+    auth_unshared = authorization & ~(
+        public | np.asarray(columns.must_revalidate, dtype=bool) | has_s_maxage
+    )
+    no_freshness_info = ~(
+        public
+        | (expires != 0)
+        | has_max_age
+        | np.isin(status_code, HEURISTIC_CACHEABLE_STATUS)
+        | has_s_maxage
+    )
+    checked = ~unstorable & ~(~private & ~authorization & no_freshness_info)
+    store_private = ~unstorable
+    store_shared = ~unstorable & ~private & ~auth_unshared
+
+    # check_age
+    response_seconds = np.trunc(np.nan_to_num(response_time, nan=0.0))
+    apparent_age = np.where(
+        has_response_time & has_date & (date > 0),
+        np.maximum(0, response_seconds - np.nan_to_num(date, nan=0.0)),
+        0,
+    )
+    corrected_age = np.where(
+        has_request_time & has_response_time,
+        age + np.nan_to_num(response_time - request_time, nan=0.0),
+        age,
+    )
+    current_age = np.where(checked, np.maximum(apparent_age, corrected_age), 0)
+
+    # check_freshness
+    expires_lifetime = expires - np.where(has_date, np.nan_to_num(date, nan=0.0), response_seconds)
+    lifetime = np.where(
+        np.asarray(columns.expires_present, dtype=bool) & has_response_time, expires_lifetime, 0
+    )
+    lifetime = np.where(has_max_age, max_age, lifetime)
+    shared_lifetime = np.where(has_s_maxage, s_maxage, lifetime)
+    lifetime = np.where(checked, lifetime, 0)
+    shared_lifetime = np.where(checked, shared_lifetime, 0)
+
+    return CachingResults(
+        store_private=store_private,
+        store_shared=store_shared,
+        age=current_age.astype(np.float64),
+        freshness_lifetime_private=lifetime.astype(np.float64),
+        freshness_lifetime_shared=shared_lifetime.astype(np.float64),
+        is_fresh=checked & (lifetime - current_age > 0),
+        is_shared_fresh=checked & (shared_lifetime - current_age > 0),
+        checked=checked,
+    )
+
+
+def columns_from_responses(responses: Iterable[ResponseLinterProtocol]) -> CachingColumns:
+    "Collect CachingColumns from responses that have been linted."
+    rows: List[List[float]] = []
+    for response in responses:
+        parsed = response.headers.parsed
+        cc_dict = dict(parsed.get("cache-control", []))
+        request = response.request
+        rows.append(
+            [
+                response.status_code or 0,
+                _number(parsed.get("date")),
+                _number(parsed.get("age")),
+                _number(parsed.get("expires")),
+                "expires" in response.headers.index,
+                _number(cc_dict.get("max-age")) if "max-age" in cc_dict else math.nan,
+                _number(cc_dict.get("s-maxage")) if "s-maxage" in cc_dict else math.nan,
+                "no-store" in cc_dict,
+                "private" in cc_dict,
+                "public" in cc_dict,
+                "must-revalidate" in cc_dict,
+                "*" in parsed.get("vary", set()),
+                request is not None and "authorization" in request.headers.index,
+                request is None or not request.method or request.method in CACHEABLE_METHODS,
+                _number(request.start_time if request is not None else None),
+                _number(response.start_time),
+            ]
+        )
+    columns = list(zip(*rows)) or [()] * len(CachingColumns._fields)
+    return CachingColumns(*(np.array(column) for column in columns))
+
+
+def _number(value: object) -> float:
+    return float(value) if isinstance(value, (int, float)) else math.nan
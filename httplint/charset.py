@@ -37,7 +37,7 @@ def verify_charset(linter: LinterProtocol) -> None:  # pylint: disable=too-many-
     Verify that the content's character encoding matches what was declared
     (or implied) by the Content-Type header.
     """
-    if not linter.content_hash or not linter.content_sample:
+    if linter.content_hash is None or not linter.content_sample:
         return
 
     status_code = getattr(linter, "status_code", None)
@@ -77,7 +77,7 @@ def verify_charset(linter: LinterProtocol) -> None:  # pylint: disable=too-many-
 
     # Pure-ASCII content is compatible with every ASCII-superset encoding;
     # don't second-guess it.
-    if not any(b & 0x80 for b in sample):
+    if sample.isascii():
         return
 
     # Primary check: does the declared encoding actually decode the content?
@@ -87,6 +87,11 @@ def verify_charset(linter: LinterProtocol) -> None:  # pylint: disable=too-many-
     except (UnicodeDecodeError, LookupError):
         decodes = False
 
+    # Non-ASCII content that is valid UTF-8 is very unlikely to be in any other
+    # encoding, so when UTF-8 was declared there's nothing for chardet to find.
+    if decodes and declared_canonical == "utf-8":
+        return
+
     detection = chardet.detect(sample)
     detected_raw = detection.get("encoding")
     confidence = detection.get("confidence") or 0.0
@@ -1,17 +1,73 @@
+import json
 import sys
 import time
 from argparse import ArgumentParser, Namespace
+from io import BufferedReader
+from typing import Sequence, cast
 
-from httplint.cli.http_parser import HttpCliParser, modes
-from httplint.i18n import set_locale
+from httplint.batch import NoteOutcome
+from httplint.cli.http_parser import HttpCliParser, formats, json_default, modes
+from httplint.har import lint_har, outcome_record
+from httplint.i18n import set_locale, translate
+from httplint.note import categories, levels
 
 
 def main() -> None:
     args = getargs()
+    if modes(args.mode) == modes.HAR:
+        har_input(args)
+        return
     with set_locale(args.locale):
         start_time = time.time() if args.now else None
         parser = HttpCliParser(args, start_time)
-        parser.handle_input(sys.stdin.read().encode("utf-8", "replace"))
+        if args.stream:
+            stream_input(parser)
+        else:
+            parser.handle_input(sys.stdin.read().encode("utf-8", "replace"))
+
+
+STREAM_READ_SIZE = 64 * 1024
+
+
+def stream_input(parser: HttpCliParser) -> None:
+    "Feed stdin to parser as it arrives, so that each message is linted when it's complete."
+    stdin = cast(BufferedReader, sys.stdin.buffer)
+    while True:
+        chunk = stdin.read1(STREAM_READ_SIZE)
+        if not chunk:
+            break
+        parser.handle_input(chunk)
+    parser.input_eof()
+
+
+def har_input(args: Namespace) -> None:
+    "Lint each entry of the HAR file on stdin, reporting on each as it's done."
+    outcomes = lint_har(sys.stdin.buffer, workers=args.workers, locale=args.locale)
+    for index, (exchange, outcome) in enumerate(outcomes):
+        record = outcome_record(index, exchange, outcome)
+        if formats(args.format) == formats.NDJSON:
+            sys.stdout.write(json.dumps(record, separators=(",", ":"), default=json_default) + "\n")
+        else:
+            print(f"\n## {record['method']} {record['url']} ({record['status']})")
+            with set_locale(args.locale):
+                if outcome.request_notes:
+                    print("\n### Request")
+                    report_outcomes(outcome.request_notes)
+                print("\n### Response")
+                report_outcomes(outcome.response_notes)
+        sys.stdout.flush()
+
+
+def report_outcomes(notes: Sequence[NoteOutcome]) -> None:
+    "Print rendered notes, grouped by category."
+    current_category = None
+    for note in sorted(notes, key=lambda n: categories[n.category].value):
+        if note.category != current_category:
+            print(f"\n#### {translate(categories[note.category].value)}\n")
+            current_category = note.category
+        print(f"* [{levels(note.level).name}] {note.summary}")
+        for subnote in note.subnotes:
+            print(f"  * [{levels(subnote.level).name}] {subnote.summary}")
 
 
 def getargs() -> Namespace:
@@ -26,6 +82,15 @@ def getargs() -> Namespace:
         help="The input mode",
     )
 
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=[f.value for f in formats],
+        default=formats.TEXT,
+        dest="format",
+        help="The output format",
+    )
+
     parser.add_argument(
         "-n",
         "--now",
@@ -34,6 +99,23 @@ def getargs() -> Namespace:
         help="Assume that the HTTP exchange happened now",
     )
 
+    parser.add_argument(
+        "-s",
+        "--stream",
+        action="store_true",
+        dest="stream",
+        help="Lint every message in the input, reporting on each as soon as it is complete",
+    )
+
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        dest="workers",
+        help="Number of processes to lint HAR entries with",
+    )
+
     parser.add_argument(
         "-l",
         "--locale",
@@ -1,6 +1,8 @@
+import json
+import sys
 from argparse import Namespace
 from enum import Enum
-from typing import List, Optional, Tuple
+from typing import Any, List, Optional, Tuple
 
 from thor.http.common import Delimiters, HttpMessageHandler, States, no_body_status
 from thor.http.error import HttpError, HttpVersionError, StartLineError
@@ -8,6 +10,7 @@ from thor.http.error import HttpError, HttpVersionError, StartLineError
 from httplint.i18n import translate
 from httplint.message import HttpMessageLinter, HttpRequestLinter, HttpResponseLinter
 from httplint.types import RawFieldListType
+from httplint.util import RelativeTime
 
 
 class modes(Enum):
@@ -15,6 +18,27 @@ class modes(Enum):
 
     REQUEST = "request"
     RESPONSE = "response"
+    HAR = "har"
+
+
+class formats(Enum):
+    "Output formats."
+
+    TEXT = "text"
+    NDJSON = "ndjson"
+
+
+# thor's parser recurses once for each message in the input it's given, so input is
+# handed to it in slices small enough that even the smallest possible messages
+# stay well inside the recursion limit.
+PARSE_SLICE_SIZE = 256
+
+
+def json_default(value: Any) -> Any:
+    "Serialise note vars that JSON doesn't know about, without rendering them."
+    if isinstance(value, RelativeTime):
+        return value.utime - value.now
+    return str(value)
 
 
 class HttpCliParser(HttpMessageHandler):
@@ -22,14 +46,33 @@ class HttpCliParser(HttpMessageHandler):
 
     def __init__(self, args: Namespace, start_time: Optional[float] = None) -> None:
         self.start_time = start_time
-        self.mode = args.mode
+        self.mode = modes(args.mode)
+        self.stream: bool = getattr(args, "stream", False)
+        self.format = formats(getattr(args, "format", formats.TEXT))
+        self.message_count = 0
         self.linter: HttpMessageLinter
+        self.top_line = b""
         HttpMessageHandler.__init__(self)
 
     def handle_input(self, inbytes: bytes) -> None:
-        HttpMessageHandler.handle_input(self, inbytes)
-        if self._input_delimit == Delimiters.CLOSE and self._input_state == States.HEADERS_DONE:
+        if not self.stream:
+            HttpMessageHandler.handle_input(self, inbytes)
+            self.input_eof()
+            return
+        for start in range(0, len(inbytes), PARSE_SLICE_SIZE):
+            HttpMessageHandler.handle_input(self, inbytes[start : start + PARSE_SLICE_SIZE])
+
+    def input_eof(self) -> None:
+        """
+        Signal that there is no more input; a message delimited by close, or one
+        without content that thor is holding until more input arrives, is now complete.
+        """
+        if self._input_state != States.HEADERS_DONE:
+            return
+        if self._input_delimit == Delimiters.CLOSE:
             self.input_end([])
+        elif self._input_delimit == Delimiters.NOBODY:
+            HttpMessageHandler.handle_input(self, b"")
 
     def input_start(
         self,
@@ -40,6 +83,7 @@ class HttpCliParser(HttpMessageHandler):
         content_length: Optional[int],
     ) -> Tuple[bool, bool]:
         allows_body: bool
+        self.top_line = top_line
         if self.mode == modes.REQUEST:
             self.linter = HttpRequestLinter(start_time=self.start_time)
             method, iri, version = self.request_topline(top_line)
@@ -63,6 +107,18 @@ class HttpCliParser(HttpMessageHandler):
 
     def input_end(self, trailers: RawFieldListType) -> None:
         self.linter.finish_content(True, trailers)
+        if self.format == formats.NDJSON:
+            self.report_ndjson()
+        else:
+            self.report()
+        self.message_count += 1
+        if not self.stream:
+            self._input_state = States.ERROR
+
+    def report(self) -> None:
+        "Print the notes for the current message."
+        if self.stream:
+            print(f"\n## {self.top_line.decode('utf-8', 'replace')}")
         notes = sorted(self.linter.notes, key=lambda n: n.category.value)
         current_category = None
         for note in notes:
@@ -72,10 +128,30 @@ class HttpCliParser(HttpMessageHandler):
             print(f"* [{note.level.name}] {note.summary}")
             for subnote in note.subnotes:
                 print(f"  * [{subnote.level.name}] {subnote.summary}")
-        self._input_state = States.ERROR
+        if self.stream:
+            sys.stdout.flush()
+
+    def report_ndjson(self) -> None:
+        "Print the notes for the current message as JSON objects, one per line."
+        lines = [
+            json.dumps(
+                {"message": self.message_count, **record},
+                separators=(",", ":"),
+                default=json_default,
+            )
+            for record in self.linter.notes.to_records()
+        ]
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+        if self.stream:
+            sys.stdout.flush()
 
     def input_error(self, err: HttpError, close: bool = True) -> None:
-        "Indicate an error state."
+        "Report an error in the input that means it can't be linted, and exit."
+        sys.stdout.flush()
+        detail = f": {err.detail}" if err.detail else ""
+        sys.stderr.write(f"httplint: {err.desc}{detail}\n")
+        sys.exit(1)
 
     def request_topline(self, top_line: bytes) -> Tuple[bytes, bytes, bytes]:
         try:
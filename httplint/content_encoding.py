@@ -1,41 +1,92 @@
 import binascii
-import hashlib
 import weakref
 import zlib
-from typing import Any, Callable, Dict, List, Optional
+from enum import Flag
+from typing import Any, Callable, Dict, List, Optional, Type
 
 import brotli
 
-from httplint.note import Note, categories, levels
-from httplint.types import LinterProtocol
-from httplint.util import display_bytes, f_num
+try:
+    import zstandard
+except ImportError:  # the zstd extra isn't installed; zstd content isn't decoded
+    zstandard = None  # type: ignore[assignment]
+
+from httplint.note import Deferred, Note, categories, levels
+from httplint.types import HashProtocol, LinterProtocol
+from httplint.util import display_bytes, f_num, new_content_hash
 
 MAX_DECOMPRESSED_BYTES = 100 * 1024 * 1024  # 100MB
+DECOMPRESS_STEP = 64 * 1024  # most output to produce before checking whether more is wanted
+ZSTD_MAX_WINDOW = 8 * 1024 * 1024  # the most that zstd content-coding can use (RFC 9659)
+DCZ_MAX_WINDOW = 128 * 1024 * 1024  # the most that dcz content-coding can use (RFC 9842)
+
+
+class ContentNeeds(Flag):
+    """
+    What a linter needs to find out about a message's content. Anything that isn't
+    needed isn't computed, and decoding stops once everything needed is known.
+    """
+
+    SAMPLE = 1  # content_sample, to check the content's type and character encoding
+    LENGTH = 2  # decoded.length, the length of all of the decoded content
+    HASH = 4  # content_hash and decoded.hash
+    VALIDITY = 8  # notes about content that can't be decoded, wherever it fails
+    ALL = SAMPLE | LENGTH | HASH | VALIDITY
 
 
 class ContentEncodingProcessor:
-    def __init__(self, message: LinterProtocol) -> None:
+    def __init__(
+        self,
+        message: LinterProtocol,
+        hash_algorithm: Optional[str] = "md5",
+        needs: ContentNeeds = ContentNeeds.ALL,
+    ) -> None:
         self.message = weakref.proxy(message)
+        self.needs = needs
         self.processors: List[Callable[[bytes], None]] = []
 
         self.length: int = 0
         self.hash: Optional[bytes] = None
-        self._hash_processor = hashlib.new("md5")
+        self._hash_algorithm = hash_algorithm
+        self._hash_processor: Optional[HashProtocol] = None
 
         self.decode_ok: bool = True
+        # True if decoding stopped early because nothing wanted any more decoded content
+        self.stopped: bool = False
 
         # Pipeline is built lazily to ensure headers are parsed
         self.pipeline: Optional[Callable[[bytes], None]] = None
+        self._decoders: List[DecodingProcessor] = []
 
     def feed_content(self, chunk: bytes) -> None:
-        if self.decode_ok:
+        if self.decode_ok and not self.stopped:
             if self.pipeline is None:
                 self._build_pipeline()
+            if not self.wants_content():
+                self.stopped = True
+                return
             if self.pipeline:
                 self.pipeline(chunk)
 
+    def wants_content(self) -> bool:
+        """
+        Say whether anything still needs decoded content: the length or validity of
+        all of it, the hash of the decoded content, or any of the processors.
+
+        Once nothing does, content isn't decoded any further, so length only counts
+        what was decoded up to that point.
+        """
+        if self.needs & (ContentNeeds.LENGTH | ContentNeeds.VALIDITY):
+            return True
+        return self._hash_processor is not None or bool(self.processors)
+
     def finish_content(self) -> None:
-        self.hash = self._hash_processor.digest()
+        self.decode_ok = all(decoder.ok for decoder in self._decoders)
+        if self._hash_processor is not None:
+            self.hash = self._hash_processor.digest()
+        else:
+            # nothing was decoded (or hashing is off); reuse the message's hash
+            self.hash = self.message.content_hash
 
     def _build_pipeline(self) -> None:
         # Build the pipeline
@@ -48,6 +99,10 @@ class ContentEncodingProcessor:
             if obj:
                 obj._sink_process(chunk)  # pylint: disable=protected-access
 
+        def demand() -> bool:
+            obj = self_ref()
+            return obj is not None and obj.wants_content()
+
         self.pipeline = sink
 
         content_codings = self.message.headers.parsed.get("content-encoding", [])
@@ -55,49 +110,116 @@ class ContentEncodingProcessor:
         # Iterate forward regarding processing order.
 
         for coding in content_codings:
-            if coding in ["gzip", "x-gzip"]:
-                self.pipeline = GzipProcessor(self.message, self.pipeline)
-            elif coding == "br":
-                self.pipeline = BrotliProcessor(self.message, self.pipeline)
-            else:
-                pass
+            decoder = DECODERS.get(coding)
+            if decoder is not None:
+                stage = decoder(self.message, self.pipeline, demand)
+                self._decoders.append(stage)
+                self.pipeline = stage
+
+        # Only hash the decoded content if it differs from what's on the wire.
+        if self.pipeline is not sink:
+            self._hash_processor = new_content_hash(self._hash_algorithm)
 
     def _sink_process(self, chunk: bytes) -> None:
-        self._hash_processor.update(chunk)
+        if self._hash_processor is not None:
+            self._hash_processor.update(chunk)
         self.length += len(chunk)
-        for processor in self.processors:
+        for processor in tuple(self.processors):  # processors can remove themselves
             processor(chunk)
 
     def __getstate__(self) -> Dict[str, Any]:
         state: Dict[str, Any] = self.__dict__.copy()
-        for key in ["_hash_processor", "pipeline", "processors"]:
+        for key in ["_hash_processor", "pipeline", "processors", "_decoders"]:
             if key in state:
                 del state[key]
         return state
 
 
-class GzipProcessor:
-    def __init__(self, message: LinterProtocol, next_processor: Callable[[bytes], None]) -> None:
+class DecodingProcessor:
+    """
+    Base class for a stage of the decoding pipeline, which decodes one content-coding
+    and passes the result on to next_processor.
+
+    Subclasses pass decoded content to _output(), which enforces
+    MAX_DECOMPRESSED_BYTES. If demand is given, decoding should stop as soon as it
+    returns False.
+    """
+
+    def __init__(
+        self,
+        message: LinterProtocol,
+        next_processor: Callable[[bytes], None],
+        demand: Optional[Callable[[], bool]] = None,
+    ) -> None:
         self.message = message
         self.next_processor = next_processor
-        self._gzip_processor = zlib.decompressobj(-zlib.MAX_WBITS)
-        self._in_gzip = False
-        self._gzip_header_buffer = b""
+        self.demand = demand
         self._decompressed = 0
         self.ok = True
 
+    def __call__(self, chunk: bytes) -> None:
+        raise NotImplementedError
+
+    def _output(self, decoded: bytes) -> bool:
+        """
+        Pass decoded content on. Return False if decoding should stop, either because
+        the limit was reached or because nothing wants any more.
+        """
+        self._decompressed += len(decoded)
+        if self._decompressed > MAX_DECOMPRESSED_BYTES:
+            self.message.notes.add("field-content-encoding", DECOMPRESSION_LIMIT)
+            self.ok = False
+            return False
+        self.next_processor(decoded)
+        return self.demand is None or self.demand()
+
+    def _inflate(self, decompressor: Any, data: bytes) -> None:
+        """
+        Run data through a zlib decompressor, DECOMPRESS_STEP bytes of output at a
+        time. Raises zlib.error if the data is corrupt.
+        """
+        while data:
+            decompressed = decompressor.decompress(data, DECOMPRESS_STEP)
+            if not decompressed or not self._output(decompressed):
+                break
+            data = decompressor.unconsumed_tail
+
+
+class GzipProcessor(DecodingProcessor):
+    """
+    Decompress gzip-coded content as it arrives.
+
+    The gzip header is parsed incrementally, however the content is split into
+    chunks.
+    """
+
+    FTEXT = 1
+    FHCRC = 2
+    FEXTRA = 4
+    FNAME = 8
+    FCOMMENT = 16
+
+    def __init__(
+        self,
+        message: LinterProtocol,
+        next_processor: Callable[[bytes], None],
+        demand: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        super().__init__(message, next_processor, demand)
+        self._gzip_processor = zlib.decompressobj(-zlib.MAX_WBITS)
+        self._in_gzip = False
+        # the parts of the header still to be read; see _read_gzip_header
+        self._header_parts: List[str] = ["fixed"]
+        self._header_buffer = bytearray()
+        self._header_skip = 0
+
     def __call__(self, chunk: bytes) -> None:
         if not self.ok:
             return
 
         if not self._in_gzip:
-            self._gzip_header_buffer += chunk
             try:
-                chunk = self._read_gzip_header(self._gzip_header_buffer)
-                self._in_gzip = True
-                self._gzip_header_buffer = b""
-            except IndexError:
-                return  # not a full header yet
+                payload = self._read_gzip_header(chunk)
             except IOError as gzip_error:
                 self.message.notes.add(
                     "field-content-encoding",
@@ -105,140 +227,295 @@ class GzipProcessor:
                     gzip_error=str(gzip_error),
                 )
                 self.ok = False
-                self._gzip_header_buffer = b""
                 return
+            if payload is None:
+                return  # not a full header yet
+            self._in_gzip = True
+            chunk = payload
 
-            # Since _read_gzip_header strips the header, 'chunk' is now the payload start.
-            # We clear the buffer.
-            self._gzip_header_buffer = b""
-
-        max_chunk_size = 1024 * 1024
         try:
-            decompressed = self._gzip_processor.decompress(chunk, max_chunk_size)
-            if decompressed:
-                self._decompressed += len(decompressed)
-                if self._decompressed > MAX_DECOMPRESSED_BYTES:
-                    self.message.notes.add("field-content-encoding", DECOMPRESSION_LIMIT)
-                    self.ok = False
-                    return
-                self.next_processor(decompressed)
-
-            while self._gzip_processor.unconsumed_tail:
-                tail = self._gzip_processor.unconsumed_tail
-                decompressed = self._gzip_processor.decompress(tail, max_chunk_size)
-                if decompressed:
-                    self._decompressed += len(decompressed)
-                    if self._decompressed > MAX_DECOMPRESSED_BYTES:
-                        self.message.notes.add("field-content-encoding", DECOMPRESSION_LIMIT)
-                        self.ok = False
-                        return
-                    self.next_processor(decompressed)
-                else:
-                    break
-
+            self._inflate(self._gzip_processor, chunk)
         except zlib.error as zlib_error:
             self.message.notes.add(
                 "field-content-encoding",
                 BAD_ZLIB,
                 zlib_error=str(zlib_error),
-                ok_zlib_len=f_num(self.message.content_length),
+                ok_zlib_len=Deferred(f_num, self.message.content_length),
                 chunk_sample=display_bytes(chunk),
             )
             self.ok = False
 
-    @staticmethod
-    def _read_gzip_header(content: bytes) -> bytes:
+    def _read_gzip_header(self, chunk: bytes) -> Optional[bytes]:
         """
-        Parse a string for a GZIP header; if present, return remainder of
-        gzipped content.
+        Read as much of the gzip header as chunk holds. Return the rest of chunk once
+        the header is complete, or None if more is needed. Raises IOError if the
+        header isn't valid.
+
+        Only the fixed-length parts of the header are buffered; the optional
+        extra field, name and comment are skipped over as they arrive.
+        """
+        pos = 0
+        while self._header_parts:
+            part = self._header_parts[0]
+            if part in ("fixed", "xlen"):
+                needed = (10 if part == "fixed" else 2) - len(self._header_buffer)
+                self._header_buffer += chunk[pos : pos + needed]
+                pos += needed
+                if pos > len(chunk):
+                    return None
+                if part == "fixed":
+                    self._header_parts = self._check_fixed_header(bytes(self._header_buffer))
+                else:
+                    self._header_skip = self._header_buffer[0] + 256 * self._header_buffer[1]
+                    self._header_parts[0] = "skip"
+                self._header_buffer.clear()
+                continue
+            if part == "crc":
+                self._header_skip = 2
+                self._header_parts[0] = part = "skip"
+            if part == "skip":
+                skipped = min(self._header_skip, len(chunk) - pos)
+                pos += skipped
+                self._header_skip -= skipped
+                if self._header_skip:
+                    return None
+            else:  # a null-terminated string
+                end = chunk.find(b"\0", pos)
+                if end == -1:
+                    return None
+                pos = end + 1
+            self._header_parts.pop(0)
+        return chunk[pos:]
+
+    def _check_fixed_header(self, header: bytes) -> List[str]:
+        """
+        Check the fixed part of a gzip header; return the optional parts that follow.
         """
         # adapted from gzip.py
-        gz_flags = {"FTEXT": 1, "FHCRC": 2, "FEXTRA": 4, "FNAME": 8, "FCOMMENT": 16}
-        if len(content) < 10:
-            raise IndexError("Header not complete yet")
-        magic = content[:2]
+        magic = header[:2]
         if magic != b"\037\213":
             raise IOError(
                 f"Not a gzip header (magic is hex {binascii.b2a_hex(magic).decode('ascii')}, "
                 "should be 1f8b)"
             )
-        method = content[2]
+        method = header[2]
         if method != 8:
             raise IOError("Unknown compression method")
-        flag = content[3]
-
-        offset = 10
-
-        if flag & gz_flags["FEXTRA"]:
-            if len(content) < offset + 2:
-                raise IndexError("Header not complete yet")
-            # Read & discard the extra field, if present
-            xlen = content[offset] + 256 * content[offset + 1]
-            offset += 2
-            if len(content) < offset + xlen:
-                raise IndexError("Header not complete yet")
-            offset += xlen
-
-        if flag & gz_flags["FNAME"]:
-            # Read and discard a null-terminated string
-            while True:
-                if len(content) <= offset:
-                    raise IndexError("Header not complete yet")
-                st1 = content[offset]
-                offset += 1
-                if st1 == 0:
-                    break
-
-        if flag & gz_flags["FCOMMENT"]:
-            # Read and discard a null-terminated string
-            while True:
-                if len(content) <= offset:
-                    raise IndexError("Header not complete yet")
-                st2 = content[offset]
-                offset += 1
-                if st2 == 0:
-                    break
-
-        if flag & gz_flags["FHCRC"]:
-            if len(content) < offset + 2:
-                raise IndexError("Header not complete yet")
-            offset += 2
-
-        return content[offset:]
-
-
-class BrotliProcessor:
-    def __init__(self, message: LinterProtocol, next_processor: Callable[[bytes], None]) -> None:
-        self.message = message
-        self.next_processor = next_processor
+        flag = header[3]
+        parts = []
+        if flag & self.FEXTRA:
+            parts.append("xlen")
+        if flag & self.FNAME:
+            parts.append("string")
+        if flag & self.FCOMMENT:
+            parts.append("string")
+        if flag & self.FHCRC:
+            parts.append("crc")
+        return parts
+
+
+class DeflateProcessor(DecodingProcessor):
+    """
+    Decompress deflate-coded content as it arrives.
+
+    The deflate content-coding is the zlib format, but some servers send raw
+    deflate data instead; like browsers, accept either, telling them apart by
+    whether the content starts with a zlib header.
+    """
+
+    def __init__(
+        self,
+        message: LinterProtocol,
+        next_processor: Callable[[bytes], None],
+        demand: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        super().__init__(message, next_processor, demand)
+        self._deflate_processor: Optional[Any] = None
+        self._start = bytearray()
+
+    def __call__(self, chunk: bytes) -> None:
+        if not self.ok:
+            return
+
+        if self._deflate_processor is None:
+            self._start += chunk
+            if len(self._start) < 2:
+                return
+            cmf, flg = self._start[0], self._start[1]
+            zlib_header = cmf & 0x0F == 8 and (cmf * 256 + flg) % 31 == 0
+            self._deflate_processor = zlib.decompressobj(
+                zlib.MAX_WBITS if zlib_header else -zlib.MAX_WBITS
+            )
+            chunk = bytes(self._start)
+            self._start.clear()
+
+        try:
+            self._inflate(self._deflate_processor, chunk)
+        except zlib.error as zlib_error:
+            self.message.notes.add(
+                "field-content-encoding",
+                BAD_DEFLATE,
+                zlib_error=str(zlib_error),
+                ok_zlib_len=Deferred(f_num, self.message.content_length),
+                chunk_sample=display_bytes(chunk),
+            )
+            self.ok = False
+
+
+class BrotliProcessor(DecodingProcessor):
+    def __init__(
+        self,
+        message: LinterProtocol,
+        next_processor: Callable[[bytes], None],
+        demand: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        super().__init__(message, next_processor, demand)
         self._brotli_processor = brotli.Decompressor()
-        self._decompressed = 0
-        self.ok = True
 
     def __call__(self, chunk: bytes) -> None:
         if not self.ok:
             return
 
         try:
-            chunk = self._brotli_processor.process(chunk)
-            if chunk:
-                self._decompressed += len(chunk)
-                if self._decompressed > MAX_DECOMPRESSED_BYTES:
-                    self.message.notes.add("field-content-encoding", DECOMPRESSION_LIMIT)
-                    self.ok = False
-                    return
-                self.next_processor(chunk)
+            decoded = self._brotli_processor.process(chunk)
+            if decoded:
+                self._output(decoded)
         except brotli.error as brotli_error:
             self.message.notes.add(
                 "field-content-encoding",
                 BAD_BROTLI,
                 brotli_error=str(brotli_error),
-                ok_brotli_len=f_num(self.message.content_length),
+                ok_brotli_len=Deferred(f_num, self.message.content_length),
+                chunk_sample=display_bytes(chunk),
+            )
+            self.ok = False
+
+
+class ZstdProcessor(DecodingProcessor):
+    """
+    Decompress zstd-coded content as it arrives. Only available if the zstandard
+    package is installed.
+    """
+
+    def __init__(
+        self,
+        message: LinterProtocol,
+        next_processor: Callable[[bytes], None],
+        demand: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        super().__init__(message, next_processor, demand)
+        self._zstd_processor: Any = self._initial_decompressor()
+
+    def _initial_decompressor(self) -> Any:
+        return self._decompressor()
+
+    @staticmethod
+    def _decompressor(dictionary: Optional[bytes] = None) -> Any:
+        if dictionary is None:
+            decompressor = zstandard.ZstdDecompressor(max_window_size=ZSTD_MAX_WINDOW)
+        else:
+            decompressor = zstandard.ZstdDecompressor(
+                dict_data=zstandard.ZstdCompressionDict(
+                    dictionary, dict_type=zstandard.DICT_TYPE_RAWCONTENT
+                ),
+                max_window_size=min(max(ZSTD_MAX_WINDOW, len(dictionary) * 5 // 4), DCZ_MAX_WINDOW),
+            )
+        return decompressor.decompressobj(read_across_frames=True)
+
+    def __call__(self, chunk: bytes) -> None:
+        if not self.ok:
+            return
+
+        try:
+            decoded = self._zstd_processor.decompress(chunk)
+            if decoded:
+                self._output(decoded)
+        except zstandard.ZstdError as zstd_error:
+            self.message.notes.add(
+                "field-content-encoding",
+                BAD_ZSTD,
+                zstd_error=str(zstd_error),
+                ok_zstd_len=Deferred(f_num, self.message.content_length),
                 chunk_sample=display_bytes(chunk),
             )
             self.ok = False
 
 
+class DczProcessor(ZstdProcessor):
+    """
+    Decompress content with the dcz (dictionary-compressed zstd) content-coding, using
+    a dictionary from the message's DictionaryStore.
+
+    The content starts with a fixed header that holds the SHA-256 digest of the
+    dictionary; see RFC 9842.
+    """
+
+    MAGIC = b"\x5e\x2a\x4d\x18\x20\x00\x00\x00"
+    HEADER_LENGTH = len(MAGIC) + 32
+
+    def __init__(
+        self,
+        message: LinterProtocol,
+        next_processor: Callable[[bytes], None],
+        demand: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        super().__init__(message, next_processor, demand)
+        self._header = bytearray()
+
+    def _initial_decompressor(self) -> Any:
+        return None  # until the header says which dictionary to use
+
+    def __call__(self, chunk: bytes) -> None:
+        if not self.ok:
+            return
+
+        if self._zstd_processor is None:
+            needed = self.HEADER_LENGTH - len(self._header)
+            self._header += chunk[:needed]
+            if len(self._header) < self.HEADER_LENGTH:
+                return
+            chunk = chunk[needed:]
+            dictionary = self._dictionary(bytes(self._header))
+            if dictionary is None:
+                self.ok = False
+                return
+            self._zstd_processor = self._decompressor(dictionary)
+
+        ZstdProcessor.__call__(self, chunk)
+
+    def _dictionary(self, header: bytes) -> Optional[bytes]:
+        "Check the header and return the dictionary it names, or None if it isn't usable."
+        if header[: len(self.MAGIC)] != self.MAGIC:
+            self.message.notes.add(
+                "field-content-encoding",
+                BAD_DICTIONARY_HEADER,
+                header_sample=display_bytes(header[: len(self.MAGIC)]),
+            )
+            return None
+        digest = header[len(self.MAGIC) :]
+        store = self.message.dictionaries
+        dictionary = store.get(digest) if store is not None else None
+        if dictionary is None:
+            self.message.notes.add(
+                "field-content-encoding",
+                DICTIONARY_UNAVAILABLE,
+                digest=binascii.b2a_base64(digest, newline=False).decode("ascii"),
+            )
+        return dictionary
+
+
+# content-coding: the processor that decodes it
+DECODERS: Dict[str, Type[DecodingProcessor]] = {
+    "gzip": GzipProcessor,
+    "x-gzip": GzipProcessor,
+    "deflate": DeflateProcessor,
+    "br": BrotliProcessor,
+}
+if zstandard is not None:
+    DECODERS["zstd"] = ZstdProcessor
+    DECODERS["dcz"] = DczProcessor
+
+
 class DECOMPRESSION_LIMIT(Note):
     category = categories.CONNEG
     level = levels.BAD
@@ -286,3 +563,58 @@ wire. However, this response could not be decompressed; the error encountered wa
 
     %(chunk_sample)s
 """
+
+
+class BAD_DEFLATE(Note):
+    category = categories.CONNEG
+    level = levels.BAD
+    _summary = "This message was compressed using Deflate, but the data was corrupt."
+    _text = """\
+Deflate-compressed responses use zlib compression to reduce the number of bytes transferred on the
+wire. However, this response could not be decompressed; the error encountered was
+"`%(zlib_error)s`".
+
+%(ok_zlib_len)s bytes were decompressed successfully before this; the erroneous chunk starts with (in hex):
+
+    %(chunk_sample)s
+"""
+
+
+class BAD_ZSTD(Note):
+    category = categories.CONNEG
+    level = levels.BAD
+    _summary = "This message was compressed using Zstandard, but the data was corrupt."
+    _text = """\
+Zstandard-compressed responses use zstd compression to reduce the number of bytes transferred on
+the wire. However, this response could not be decompressed; the error encountered was
+"`%(zstd_error)s`".
+
+Note that the zstd content-coding limits the compression window to 8MB, so content compressed with a
+larger window can't be decoded.
+
+%(ok_zstd_len)s bytes were decompressed successfully before this; the erroneous chunk starts with (in hex):
+
+    %(chunk_sample)s
+"""
+
+
+class BAD_DICTIONARY_HEADER(Note):
+    category = categories.CONNEG
+    level = levels.BAD
+    _summary = "This message was compressed with a dictionary, but its header wasn't valid."
+    _text = """\
+Dictionary-compressed responses start with a fixed header that identifies the dictionary used. Here,
+the header didn't start with the expected bytes; it started with (in hex):
+
+    %(header_sample)s
+"""
+
+
+class DICTIONARY_UNAVAILABLE(Note):
+    category = categories.CONNEG
+    level = levels.INFO
+    _summary = "This message was compressed with a dictionary that httplint doesn't have."
+    _text = """\
+This response's content was compressed using a dictionary whose SHA-256 hash is `%(digest)s`, but
+that dictionary hasn't been seen in an earlier response with a `Use-As-Dictionary` header, so the
+content couldn't be decoded and checked."""
@@ -17,7 +17,7 @@ def verify_content_type(linter: LinterProtocol) -> None:
     """
     Verify that the content matches the declared Content-Type.
     """
-    if not linter.content_hash:
+    if linter.content_hash is None:
         return
 
     # Don't verify content type for responses that don't carry a full representation
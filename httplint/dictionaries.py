@@ -0,0 +1,87 @@
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, List, Optional
+
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024  # 64MB
+
+
+class DictionaryStore:
+    """
+    Compression dictionaries (RFC 9842), keyed by the SHA-256 digest of their content.
+
+    Pass the same store to the linters for a series of responses as `dictionaries`:
+    the content of complete responses with a `Use-As-Dictionary` header is added to
+    it, and later responses that use the dcz content-coding are decoded with the
+    dictionary they name.
+
+    The store holds at most max_size bytes of dictionaries; when it's full, the
+    least recently used ones are dropped. It can be shared between threads.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.max_size = max_size
+        self.size = 0
+        self._dictionaries: OrderedDict[bytes, bytes] = OrderedDict()
+        self._lock = Lock()
+
+    def add(self, content: bytes) -> bytes:
+        """
+        Add content as a dictionary, and return its digest. Content larger than
+        max_size isn't stored.
+        """
+        digest = hashlib.sha256(content).digest()
+        if len(content) > self.max_size:
+            return digest
+        with self._lock:
+            if digest in self._dictionaries:
+                self._dictionaries.move_to_end(digest)
+                return digest
+            self._dictionaries[digest] = content
+            self.size += len(content)
+            while self.size > self.max_size:
+                _, evicted = self._dictionaries.popitem(last=False)
+                self.size -= len(evicted)
+        return digest
+
+    def get(self, digest: bytes) -> Optional[bytes]:
+        "Return the dictionary with the given SHA-256 digest, or None if it isn't stored."
+        with self._lock:
+            content = self._dictionaries.get(digest)
+            if content is not None:
+                self._dictionaries.move_to_end(digest)
+            return content
+
+    def __contains__(self, digest: object) -> bool:
+        return digest in self._dictionaries
+
+    def __len__(self) -> int:
+        return len(self._dictionaries)
+
+
+class DictionaryCapture:
+    """
+    Collect decoded content to add to a DictionaryStore, giving up once it's larger
+    than the store can hold. When it gives up, it removes itself from processors, so
+    that it no longer asks for decoded content.
+    """
+
+    def __init__(self, store: DictionaryStore, processors: List[Callable[[bytes], None]]) -> None:
+        self.store = store
+        self.processors = processors
+        self._content: Optional[bytearray] = bytearray()
+
+    def __call__(self, chunk: bytes) -> None:
+        if self._content is None:
+            return
+        self._content += chunk
+        if len(self._content) > self.store.max_size:
+            self._content = None
+            if self in self.processors:
+                self.processors.remove(self)
+
+    def finish(self) -> Optional[bytes]:
+        "Add the content collected to the store, returning its digest if it fit."
+        if self._content is None:
+            return None
+        return self.store.add(bytes(self._content))
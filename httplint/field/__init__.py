@@ -1,8 +1,7 @@
-import re
 from abc import ABC, abstractmethod
-from typing import Any, Generic, Union, get_args, get_origin
+from typing import Any, Generic, Optional, Pattern, Tuple, Union, get_args, get_origin
 
-from httplint.field.utils import RE_FLAGS
+from httplint.field.utils import TOKEN_PATTERN, pattern_registry
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9110
 from httplint.types import (
@@ -40,6 +39,7 @@ class HttpField(ABC, Generic[TMessage]):
     report_syntax: bool = True  # If False, syntax mismatch suppresses BAD_SYNTAX.
     deprecated: bool = False
     no_coverage: bool = False  # Turns off coverage checks.
+    always_evaluate: bool = False  # evaluate() does more than add notes; see NoteFilter.
     message: TMessage
     _valid_in_requests: bool = True
     _valid_in_responses: bool = True
@@ -97,6 +97,35 @@ class HttpField(ABC, Generic[TMessage]):
         if not has_responses:
             cls._valid_in_responses = True
 
+    @classmethod
+    def syntax_element(cls) -> str:
+        """
+        Return the regular expression that each field value is checked against.
+        """
+        return str(cls.syntax)
+
+    @classmethod
+    def syntax_patterns(cls) -> Optional[Tuple[Pattern[str], Pattern[str]]]:
+        """
+        Return compiled (anchored, prefix) patterns for the field's syntax, or None
+        if it doesn't have one.
+
+        The anchored pattern matches a complete value; the prefix pattern matches as
+        much of a value as conforms, so that the position of a problem can be found.
+        These are compiled once per class, on first use.
+        """
+        return pattern_registry.derived((cls, "syntax"), cls._compile_syntax_patterns)
+
+    @classmethod
+    def _compile_syntax_patterns(cls) -> Optional[Tuple[Pattern[str], Pattern[str]]]:
+        if not getattr(cls, "syntax", False):
+            return None
+        element = cls.syntax_element()
+        return (
+            pattern_registry.compile(rf"^\s*(?:{element})\s*$"),
+            pattern_registry.compile(rf"^\s*(?:{element})"),
+        )
+
     def __init__(self, wire_name: str, message: TMessage) -> None:
         self.wire_name = wire_name.strip()
         self.message = message
@@ -140,7 +169,7 @@ class HttpField(ABC, Generic[TMessage]):
                 return False
 
         # check field name syntax
-        if not re.match(f"^{rfc9110.token}$", self.wire_name, RE_FLAGS):
+        if not pattern_registry.compile(TOKEN_PATTERN).match(self.wire_name):
             add_note(FIELD_NAME_BAD_SYNTAX)
             return False
 
@@ -156,6 +185,19 @@ class HttpField(ABC, Generic[TMessage]):
         """
 
         if self.value is not None:
+            self._evaluate(add_note)
+
+    def _evaluate(self, add_note: AddNoteMethodType) -> None:
+        """
+        Call evaluate, unless the message's note_filter won't keep any of the notes
+        it can add.
+        """
+        note_filter = self.message.note_filter
+        if (
+            note_filter is None
+            or self.always_evaluate
+            or note_filter.runs(self.__class__, "evaluate", self.category)
+        ):
             self.evaluate(add_note)
 
 
@@ -1,9 +1,6 @@
-import re
-from functools import partial
 from typing import Any, Generic, List, Tuple
 
 from httplint.field import BAD_SYNTAX, HttpField
-from httplint.field.utils import RE_FLAGS
 from httplint.types import AddNoteMethodType, TMessage
 
 
@@ -14,7 +11,7 @@ class BrokenField(HttpField[TMessage], Generic[TMessage]):
 
     def __init__(self, wire_name: str, message: TMessage) -> None:
         super().__init__(wire_name, message)
-        self.raw_values: List[Tuple[str, int]] = []
+        self.raw_values: List[Tuple[str, AddNoteMethodType]] = []
 
     def parse(self, field_value: str, add_note: AddNoteMethodType) -> Any:
         """
@@ -22,19 +19,15 @@ class BrokenField(HttpField[TMessage], Generic[TMessage]):
         return field_value
 
     def handle_input(self, field_value: str, add_note: AddNoteMethodType, offset: int) -> None:
-        self.raw_values.append((field_value, offset))
+        self.raw_values.append((field_value, add_note))
 
     def finish(self, add_note: AddNoteMethodType) -> None:
         parsed_values = []
-        for raw_value, offset in self.raw_values:
-            # override add_note's subject to be offset-based
-            offset_add_note = partial(
-                self.message.notes.add,
-                f"offset-{offset}",
-                field_name=self.canonical_name,
-            )
-            if self.syntax:
-                if not re.match(rf"^\s*(?:{self.syntax})\s*$", raw_value, RE_FLAGS):
+        syntax_patterns = self.syntax_patterns()
+        # notes about each value use the add_note for the field line it came from
+        for raw_value, offset_add_note in self.raw_values:
+            if syntax_patterns:
+                if not syntax_patterns[0].match(raw_value):
                     offset_add_note(BAD_SYNTAX, ref_uri=self.reference)
             try:
                 parsed_values.append(self.parse(raw_value.strip(), offset_add_note))
@@ -43,4 +36,4 @@ class BrokenField(HttpField[TMessage], Generic[TMessage]):
         self.value = parsed_values
 
         if self.value is not None:
-            self.evaluate(add_note)
+            self._evaluate(add_note)
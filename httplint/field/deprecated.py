@@ -228,7 +228,6 @@ It is safe to remove it from this message. For more information, see [here]({sel
 
         # Now emit our custom note
         deprecation_ref = getattr(self, "deprecation_ref", self.reference)
-        note = add_note(FIELD_DEPRECATED, deprecation_ref=deprecation_ref)
-        note.category = self.category
+        add_note(FIELD_DEPRECATED, deprecation_ref=deprecation_ref, category=self.category)
 
         return True
@@ -1,14 +1,24 @@
-import sys
+import importlib
 import weakref
-from typing import Any, Optional, Type, cast
+from typing import Any, Dict, Optional, Type, cast
 
 from httplint.field import HttpField, deprecated, unnecessary
+from httplint.field.parsers import FIELD_MODULES
 from httplint.types import AddNoteMethodType, LinterProtocol, SectionProtocol
 
+# the most unrecognised field names whose lookups are remembered
+MAX_UNKNOWN_FIELD_NAMES = 1024
+
 
 class HttpFieldFinder:
     """Finds the linter for a given HTTP field."""
 
+    # process-wide map of lowercase field name to handler class (or None, when there
+    # isn't one). Unrecognised names are counted, so that attacker-chosen names can't
+    # grow it without limit; once there are too many, they're looked up each time.
+    _handler_classes: Dict[str, Optional[Type[HttpField[Any]]]] = {}
+    _unknown_count = 0
+
     # map of field name aliases, lowercase-normalised
     field_aliases = {
         "x-pad-for-netscrape-bug": "x-pad",
@@ -50,7 +60,29 @@ class HttpFieldFinder:
         """
         Return a handler class for the given field name. Returns None if not found.
         """
+        norm_name = field_name.lower()
+        try:
+            return HttpFieldFinder._handler_classes[norm_name]
+        except KeyError:
+            pass
+        handler_class = HttpFieldFinder._resolve_handler_class(norm_name)
+        if handler_class is None:
+            if HttpFieldFinder._unknown_count >= MAX_UNKNOWN_FIELD_NAMES:
+                return None
+            HttpFieldFinder._unknown_count += 1
+        HttpFieldFinder._handler_classes[norm_name] = handler_class
+        return handler_class
 
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Forget the handler classes found so far.
+        """
+        HttpFieldFinder._handler_classes.clear()
+        HttpFieldFinder._unknown_count = 0
+
+    @staticmethod
+    def _resolve_handler_class(field_name: str) -> Type[HttpField[Any]] | None:
         name_token = HttpFieldFinder.name_token(field_name)
         if name_token in HttpFieldFinder.field_aliases:
             name_token = HttpFieldFinder.field_aliases[name_token]
@@ -68,17 +100,17 @@ class HttpFieldFinder:
     def find_module(field_name: str) -> Any:
         """
         Return a module for the given field name, or None if it can't be found.
+
+        Modules are imported the first time they're asked for.
         """
         name_token = HttpFieldFinder.name_token(field_name)
         if name_token[0:1] == "_":  # these are special
             return None
         if name_token in HttpFieldFinder.field_aliases:
             name_token = HttpFieldFinder.field_aliases[name_token]
-        try:
-            module_name = f"httplint.field.parsers.{name_token}"
-            return sys.modules[module_name]
-        except (KeyError, TypeError):
+        if name_token not in FIELD_MODULES:
             return None
+        return importlib.import_module(f"httplint.field.parsers.{name_token}")
 
     @staticmethod
     def name_token(field_name: str) -> str:
@@ -105,6 +137,3 @@ class UnknownHttpField(HttpField[Any]):
 
     def evaluate(self, add_note: AddNoteMethodType) -> None:
         return
-
-
-import httplint.field.parsers  # pylint: disable=wrong-import-position,unused-import
@@ -1,9 +1,8 @@
-import re
 from functools import partial
 from typing import Any, Generic
 
 from httplint.field import BAD_SYNTAX, BAD_SYNTAX_DETAILED, HttpField
-from httplint.field.utils import RE_FLAGS, split_list_field
+from httplint.field.utils import split_list_field
 from httplint.syntax import rfc9110
 from httplint.types import AddNoteMethodType, TMessage
 
@@ -13,6 +12,12 @@ class HttpListField(HttpField[TMessage], Generic[TMessage]):
     A HTTP field that allows multiple values, separated by commas.
     """
 
+    @classmethod
+    def syntax_element(cls) -> str:
+        if isinstance(cls.syntax, rfc9110.list_rule):
+            return cls.syntax.element
+        return str(cls.syntax)
+
     def parse(self, field_value: str, add_note: AddNoteMethodType) -> Any:
         """
         Given a string representing one value (after comma splitting), parse and return the result.
@@ -22,6 +27,7 @@ class HttpListField(HttpField[TMessage], Generic[TMessage]):
 
     def handle_input(self, field_value: str, add_note: AddNoteMethodType, offset: int) -> None:
         values = split_list_field(field_value)
+        syntax_patterns = self.syntax_patterns()
         i = 0
         for value in values:
             offset_add_note = partial(
@@ -30,14 +36,10 @@ class HttpListField(HttpField[TMessage], Generic[TMessage]):
                 field_name=self.canonical_name,
             )
             i += 1
-            if self.syntax:
-                element_syntax = (
-                    self.syntax.element
-                    if isinstance(self.syntax, rfc9110.list_rule)
-                    else self.syntax
-                )
-                if not re.match(rf"^\s*(?:{element_syntax})\s*$", value, RE_FLAGS):
-                    match = re.match(rf"^\s*(?:{element_syntax})", value, RE_FLAGS)
+            if syntax_patterns:
+                full_re, prefix_re = syntax_patterns
+                if not full_re.match(value):
+                    match = prefix_re.match(value)
                     if match:
                         bad_char_index = match.end()
                         context_start = max(0, bad_char_index - 20)
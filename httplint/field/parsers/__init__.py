@@ -1,6 +1,120 @@
-import importlib
-import pkgutil
+"""
+Field handlers; one module per field, named after its lowercased, underscored name.
 
-__path__ = pkgutil.extend_path(__path__, __name__)
-for imp, module, ispackage in pkgutil.walk_packages(path=__path__, prefix=f"{__name__}."):
-    importlib.import_module(module)
+Modules are imported on demand by HttpFieldFinder, so that only the handlers for
+fields that are actually seen are loaded.
+
+FIELD_MODULES is generated by tools/update_field_index.py; don't edit it by hand.
+"""
+
+FIELD_MODULES = frozenset(
+    [
+        "accept",
+        "accept_ch",
+        "accept_encoding",
+        "accept_language",
+        "accept_patch",
+        "accept_post",
+        "accept_query",
+        "accept_ranges",
+        "access_control",
+        "access_control_allow_credentials",
+        "access_control_allow_headers",
+        "access_control_allow_methods",
+        "access_control_allow_origin",
+        "access_control_expose_headers",
+        "access_control_max_age",
+        "access_control_request_headers",
+        "access_control_request_method",
+        "age",
+        "allow",
+        "alt_svc",
+        "authentication_info",
+        "authorization",
+        "available_dictionary",
+        "cache_control",
+        "cache_group_invalidation",
+        "cache_groups",
+        "cache_status",
+        "cdn_cache_control",
+        "clear_site_data",
+        "connection",
+        "connectiox",
+        "content_base",
+        "content_disposition",
+        "content_encoding",
+        "content_language",
+        "content_length",
+        "content_location",
+        "content_md5",
+        "content_range",
+        "content_security_policy",
+        "content_security_policy_report_only",
+        "content_transfer_encoding",
+        "content_type",
+        "cookie",
+        "cross_origin_embedder_policy",
+        "cross_origin_embedder_policy_report_only",
+        "cross_origin_opener_policy",
+        "cross_origin_opener_policy_report_only",
+        "cross_origin_resource_policy",
+        "cteonnt_length",
+        "date",
+        "deprecation",
+        "etag",
+        "expect",
+        "expires",
+        "from_field",
+        "host",
+        "if_match",
+        "if_modified_since",
+        "if_none_match",
+        "if_range",
+        "if_unmodified_since",
+        "keep_alive",
+        "last_modified",
+        "link",
+        "location",
+        "max_forwards",
+        "mime_version",
+        "nel",
+        "origin",
+        "p3p",
+        "permissions_policy",
+        "pragma",
+        "proxy_authenticate",
+        "proxy_authentication_info",
+        "proxy_authorization",
+        "proxy_status",
+        "range",
+        "referer",
+        "referrer_policy",
+        "report_to",
+        "reporting_endpoints",
+        "retry_after",
+        "server",
+        "server_timing",
+        "set_cookie",
+        "set_cookie2",
+        "soapaction",
+        "speculation_rules",
+        "strict_transport_security",
+        "sunset",
+        "tcn",
+        "te",
+        "trailer",
+        "transfer_encoding",
+        "upgrade",
+        "use_as_dictionary",
+        "user_agent",
+        "vary",
+        "via",
+        "warning",
+        "www_authenticate",
+        "x_cache",
+        "x_cache_lookup",
+        "x_content_type_options",
+        "x_frame_options",
+        "x_pad",
+    ]
+)
@@ -1,15 +1,12 @@
 from dataclasses import dataclass
 from typing import Optional
 
-from httplint.field import BAD_SYNTAX
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.field.utils import parse_media_type
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ParamDictType,
     RequestLinterProtocol,
 )
@@ -79,32 +76,3 @@ class ACCEPT_BAD_SYNTAX(Note):
 `%(value)s` is not a valid media range. `Accept` is a list of media ranges
 (e.g., `text/html`, `image/*`, `*/*`) that the client prefers in the response;
 see [its definition](%(ref_uri)s) for more information."""
-
-
-class AcceptTest(FieldTest[RequestLinterProtocol]):
-    name = "Accept"
-    inputs = [b"audio/*; q=0.2, audio/basic"]
-    expected_out = [
-        AcceptValue("audio/*", {}, 0.2),
-        AcceptValue("audio/basic", {}, None),
-    ]
-
-
-class AcceptComplexTest(FieldTest[RequestLinterProtocol]):
-    name = "Accept"
-    inputs = [b"text/html; level=1; q=0.5"]
-    expected_out = [AcceptValue("text/html", {"level": "1"}, 0.5)]
-
-
-class AcceptBadQTest(FieldTest[RequestLinterProtocol]):
-    name = "Accept"
-    inputs = [b"text/html; q=1.001"]
-    expected_out = [AcceptValue("text/html", {}, None)]
-    expected_notes: NoteClassListType = [BAD_Q_VALUE]
-
-
-class AcceptBadTypeTest(FieldTest[RequestLinterProtocol]):
-    name = "Accept"
-    inputs = [b"invalid"]
-    expected_out = [AcceptValue("invalid", {}, None)]
-    expected_notes: NoteClassListType = [ACCEPT_BAD_SYNTAX, BAD_SYNTAX]
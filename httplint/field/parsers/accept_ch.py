@@ -1,15 +1,9 @@
-from types import SimpleNamespace
-from typing import cast
-
 from http_sf import Token
 
 from httplint.field.structured_field import StructuredField
-from httplint.field.tests import FakeRequestLinter, FieldTest
 from httplint.note import Note, categories, levels
 from httplint.types import (
     AddNoteMethodType,
-    CachingProtocol,
-    NoteClassListType,
     ResponseLinterProtocol,
     SFListType,
 )
@@ -96,43 +90,3 @@ The value for this field is legally formatted as a
 As a result, it will likely be ignored by browsers.
 
 See [its definition](%(ref_uri)s) for more information."""
-
-
-class AcceptCHTest(FieldTest[ResponseLinterProtocol]):
-    name = "Accept-CH"
-    inputs = [b"Sec-CH-Example, Sec-CH-Example-2"]
-    expected_out = [(Token("Sec-CH-Example"), {}), (Token("Sec-CH-Example-2"), {})]
-    expected_notes: NoteClassListType = []
-
-
-class AcceptCHBadSyntaxTest(FieldTest[ResponseLinterProtocol]):
-    name = "Accept-CH"
-    inputs = [b'"foo"']
-    expected_out = [("foo", {})]
-    expected_notes: NoteClassListType = [
-        ACCEPT_CH_BAD_TYPE,
-    ]
-
-
-class AcceptCHHTTPTest(FieldTest[ResponseLinterProtocol]):
-    name = "Accept-CH"
-    inputs = [b"Sec-CH-Example"]
-    expected_out = [(Token("Sec-CH-Example"), {})]
-    expected_notes = [ACCEPT_CH_IN_PLAIN_HTTP]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        request = FakeRequestLinter()
-        request.uri = "http://example.com/"
-        message.request = request
-
-
-class AcceptCHMissingVaryTest(FieldTest[ResponseLinterProtocol]):
-    name = "Accept-CH"
-    inputs = [b"Sec-CH-Example"]
-    expected_out = [(Token("Sec-CH-Example"), {})]
-    expected_notes = [ACCEPT_CH_MISSING_VARY]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.caching = cast(
-            CachingProtocol, SimpleNamespace(store_shared=True, store_private=True)
-        )
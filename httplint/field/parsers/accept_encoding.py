@@ -1,7 +1,6 @@
 from typing import Tuple
 
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.field.utils import parse_params
 from httplint.note import categories
 from httplint.syntax import rfc9110
@@ -33,13 +32,3 @@ acceptable in the response."""
 
     def evaluate(self, add_note: AddNoteMethodType) -> None:
         pass
-
-
-class AcceptEncodingTest(FieldTest[RequestLinterProtocol]):
-    name = "Accept-Encoding"
-    inputs = [b"gzip, identity; q=0.5, *;q=0"]
-    expected_out = [
-        ("gzip", {}),
-        ("identity", {"q": "0.5"}),
-        ("*", {"q": "0"}),
-    ]
@@ -1,15 +1,12 @@
 from dataclasses import dataclass
 from typing import Optional
 
-from httplint.field import BAD_SYNTAX
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.field.utils import parse_params
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     RequestLinterProtocol,
 )
 
@@ -79,27 +76,3 @@ class ACCEPT_LANGUAGE_BAD_SYNTAX(Note):
     _text = """\
 The value for this field doesn't conform to its specified syntax; see [its
 definition](%(ref_uri)s) for more information."""
-
-
-class AcceptLanguageTest(FieldTest[RequestLinterProtocol]):
-    name = "Accept-Language"
-    inputs = [b"da, en-gb;q=0.8, en;q=0.7"]
-    expected_out = [
-        AcceptLanguageValue("da", None),
-        AcceptLanguageValue("en-gb", 0.8),
-        AcceptLanguageValue("en", 0.7),
-    ]
-
-
-class AcceptLanguageParamTest(FieldTest[RequestLinterProtocol]):
-    name = "Accept-Language"
-    inputs = [b"en; foo=bar"]
-    expected_out = [AcceptLanguageValue("en", None)]
-    expected_notes: NoteClassListType = [ACCEPT_LANGUAGE_BAD_SYNTAX, BAD_SYNTAX]
-
-
-class AcceptLanguageBadQTest(FieldTest[RequestLinterProtocol]):
-    name = "Accept-Language"
-    inputs = [b"en; q=abc"]
-    expected_out = [AcceptLanguageValue("en", None)]
-    expected_notes: NoteClassListType = [BAD_Q_VALUE, BAD_SYNTAX]
@@ -1,14 +1,11 @@
 from typing import Tuple
 
-from httplint.field import BAD_SYNTAX
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.field.utils import parse_media_type
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ParamDictType,
     ResponseLinterProtocol,
 )
@@ -36,34 +33,3 @@ class ACCEPT_PATCH_BAD_SYNTAX(Note):
 `%(value)s` is not a valid media type. `Accept-Patch` is a list of media types
 (e.g., `application/json-patch+json`) accepted in a PATCH request; see [its
 definition](%(ref_uri)s) for more information."""
-
-
-class AcceptPatchTest(FieldTest[ResponseLinterProtocol]):
-    name = "Accept-Patch"
-    inputs = [b"application/json-patch+json, application/merge-patch+json"]
-    expected_out = [
-        ("application/json-patch+json", {}),
-        ("application/merge-patch+json", {}),
-    ]
-
-
-class AcceptPatchParamsTest(FieldTest[ResponseLinterProtocol]):
-    name = "Accept-Patch"
-    inputs = [b"text/example;charset=utf-8"]
-    expected_out = [("text/example", {"charset": "utf-8"})]
-
-
-class AcceptPatchBadTest(FieldTest[ResponseLinterProtocol]):
-    name = "Accept-Patch"
-    inputs = [b"invalid"]
-    expected_out = [("invalid", {})]
-    expected_notes: NoteClassListType = [ACCEPT_PATCH_BAD_SYNTAX, BAD_SYNTAX]
-
-
-class AcceptPatchWildcardTest(FieldTest[ResponseLinterProtocol]):
-    "Accept-Patch lists media types, not media ranges."
-
-    name = "Accept-Patch"
-    inputs = [b"*/*"]
-    expected_out = [("*/*", {})]
-    expected_notes: NoteClassListType = [ACCEPT_PATCH_BAD_SYNTAX]
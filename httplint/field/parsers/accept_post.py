@@ -1,14 +1,11 @@
 from typing import Tuple
 
-from httplint.field import BAD_SYNTAX
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.field.utils import parse_media_type
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ParamDictType,
     ResponseLinterProtocol,
 )
@@ -43,22 +40,3 @@ class ACCEPT_POST_BAD_SYNTAX(Note):
 `%(value)s` is not a valid media type. `Accept-Post` is a list of media types
 (e.g., `text/turtle`) accepted in a POST request; see [its definition](%(ref_uri)s)
 for more information."""
-
-
-class AcceptPostTest(FieldTest[ResponseLinterProtocol]):
-    name = "Accept-Post"
-    inputs = [b"text/turtle, application/ld+json"]
-    expected_out = [("text/turtle", {}), ("application/ld+json", {})]
-
-
-class AcceptPostWildcardTest(FieldTest[ResponseLinterProtocol]):
-    name = "Accept-Post"
-    inputs = [b"*/*"]
-    expected_out = [("*/*", {})]
-
-
-class AcceptPostBadTest(FieldTest[ResponseLinterProtocol]):
-    name = "Accept-Post"
-    inputs = [b"invalid"]
-    expected_out = [("invalid", {})]
-    expected_notes: NoteClassListType = [ACCEPT_POST_BAD_SYNTAX, BAD_SYNTAX]
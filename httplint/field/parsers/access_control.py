@@ -1,10 +1,7 @@
-from httplint.field import FIELD_DEPRECATED
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
 from httplint.note import categories
 from httplint.types import (
     AnyMessageLinterProtocol,
-    NoteClassListType,
 )
 
 
@@ -17,10 +14,3 @@ obsolete and should not be used."""
     syntax = False
     category = categories.SECURITY
     deprecated = True
-
-
-class AccessControlTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Access-Control"
-    inputs = [b"foo"]
-    expected_out = "foo"
-    expected_notes: NoteClassListType = [FIELD_DEPRECATED]
@@ -1,10 +1,7 @@
-from httplint.field import BAD_SYNTAX
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
 from httplint.note import categories
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ResponseLinterProtocol,
 )
 
@@ -24,30 +21,3 @@ to frontend code when the request's credentials mode (`Request.credentials`) is
         if field_value == "true":
             return "true"
         raise ValueError("Invalid value for Access-Control-Allow-Credentials")
-
-
-class AccessControlAllowCredentialsTest(FieldTest[ResponseLinterProtocol]):
-    name = "Access-Control-Allow-Credentials"
-    inputs = [b"true"]
-    expected_out = "true"
-
-
-class AccessControlAllowCredentialsTestFalse(FieldTest[ResponseLinterProtocol]):
-    name = "Access-Control-Allow-Credentials"
-    inputs = [b"false"]
-    expected_out = None
-    expected_notes: NoteClassListType = [BAD_SYNTAX]
-
-
-class AccessControlAllowCredentialsTestTruethy(FieldTest[ResponseLinterProtocol]):
-    name = "Access-Control-Allow-Credentials"
-    inputs = [b"truethy"]
-    expected_out = None
-    expected_notes: NoteClassListType = [BAD_SYNTAX]
-
-
-class AccessControlAllowCredentialsTestCapTrue(FieldTest[ResponseLinterProtocol]):
-    name = "Access-Control-Allow-Credentials"
-    inputs = [b"True"]
-    expected_out = None
-    expected_notes: NoteClassListType = [BAD_SYNTAX]
@@ -1,11 +1,8 @@
-from httplint.field.cors import CORS_PREFLIGHT_ONLY
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.note import categories
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ResponseLinterProtocol,
 )
 
@@ -22,10 +19,3 @@ request to indicate which HTTP headers can be used during the actual request."""
 
     def parse(self, field_value: str, add_note: AddNoteMethodType) -> str:
         return field_value.lower()
-
-
-class AccessControlAllowHeadersTest(FieldTest[ResponseLinterProtocol]):
-    name = "Access-Control-Allow-Headers"
-    inputs = [b"a, b"]
-    expected_out = ["a", "b"]
-    expected_notes: NoteClassListType = [CORS_PREFLIGHT_ONLY]
@@ -1,11 +1,8 @@
-from httplint.field.cors import CORS_PREFLIGHT_ONLY
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.note import categories
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ResponseLinterProtocol,
 )
 
@@ -22,10 +19,3 @@ accessing the resource in response to a CORS preflight request."""
 
     def parse(self, field_value: str, add_note: AddNoteMethodType) -> str:
         return field_value
-
-
-class AccessControlAllowMethodsTest(FieldTest[ResponseLinterProtocol]):
-    name = "Access-Control-Allow-Methods"
-    inputs = [b"GET, PUT, DELETE"]
-    expected_out = ["GET", "PUT", "DELETE"]
-    expected_notes: NoteClassListType = [CORS_PREFLIGHT_ONLY]
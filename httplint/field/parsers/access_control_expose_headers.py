@@ -1,5 +1,4 @@
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.note import categories
 from httplint.syntax import rfc9110
 from httplint.types import (
@@ -17,9 +16,3 @@ request."""
     syntax = rfc9110.token
     category = categories.CORS
     deprecated = False
-
-
-class AccessControlExposeHeadersTest(FieldTest[ResponseLinterProtocol]):
-    name = "Access-Control-Expose-Headers"
-    inputs = [b"Content-Length, Kuma-Revision"]
-    expected_out = ["Content-Length", "Kuma-Revision"]
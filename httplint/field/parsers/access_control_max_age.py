@@ -1,11 +1,8 @@
-from httplint.field.cors import CORS_PREFLIGHT_ONLY
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ResponseLinterProtocol,
 )
 
@@ -51,24 +48,3 @@ class CORS_MAX_AGE_NEGATIVE(Note):
     _text = """\
 The `Access-Control-Max-Age` header indicates how many seconds a preflight response can be cached
 for. It cannot be less than zero."""
-
-
-class AccessControlMaxAgeTest(FieldTest[ResponseLinterProtocol]):
-    name = "Access-Control-Max-Age"
-    inputs = [b"123"]
-    expected_out = 123
-    expected_notes: NoteClassListType = [CORS_PREFLIGHT_ONLY]
-
-
-class AccessControlMaxAgeInvalidTest(FieldTest[ResponseLinterProtocol]):
-    name = "Access-Control-Max-Age"
-    inputs = [b"abc"]
-    expected_out = None
-    expected_notes: NoteClassListType = [CORS_MAX_AGE_INVALID, CORS_PREFLIGHT_ONLY]
-
-
-class AccessControlMaxAgeNegativeTest(FieldTest[ResponseLinterProtocol]):
-    name = "Access-Control-Max-Age"
-    inputs = [b"-1"]
-    expected_out = None
-    expected_notes: NoteClassListType = [CORS_MAX_AGE_NEGATIVE, CORS_PREFLIGHT_ONLY]
@@ -1,11 +1,8 @@
-from httplint.field.cors import CORS_PREFLIGHT_REQUEST
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.note import categories
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     RequestLinterProtocol,
 )
 
@@ -23,16 +20,3 @@ request is made."""
 
     def parse(self, field_value: str, add_note: AddNoteMethodType) -> str:
         return field_value.lower()
-
-
-class AccessControlRequestHeadersTest(FieldTest[RequestLinterProtocol]):
-    name = "Access-Control-Request-Headers"
-    inputs = [b"Custom-Header, Upgrade-Insecure-Requests"]
-    expected_out = ["custom-header", "upgrade-insecure-requests"]
-    expected_notes: NoteClassListType = [CORS_PREFLIGHT_REQUEST]
-
-    def set_request_context(self, message: RequestLinterProtocol) -> None:
-        message.method = "OPTIONS"
-        # Manually populate parsed headers to avoid triggering notes on context headers
-        message.headers.parsed["origin"] = "http://example.com"
-        message.headers.parsed["access-control-request-method"] = "POST"
@@ -1,10 +1,7 @@
-from httplint.field.cors import CORS_PREFLIGHT_REQUEST
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
 from httplint.note import categories
 from httplint.syntax import rfc9110
 from httplint.types import (
-    NoteClassListType,
     RequestLinterProtocol,
 )
 
@@ -19,15 +16,3 @@ is made."""
     syntax = rfc9110.token
     category = categories.CORS
     deprecated = False
-
-
-class AccessControlRequestMethodTest(FieldTest[RequestLinterProtocol]):
-    name = "Access-Control-Request-Method"
-    inputs = [b"POST"]
-    expected_out = "POST"
-    expected_notes: NoteClassListType = [CORS_PREFLIGHT_REQUEST]
-
-    def set_request_context(self, message: RequestLinterProtocol) -> None:
-        message.method = "OPTIONS"
-        # Manually populate parsed headers to avoid triggering notes on context headers
-        message.headers.parsed["origin"] = "http://example.com"
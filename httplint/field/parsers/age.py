@@ -1,10 +1,8 @@
-from httplint.field.singleton_field import SINGLE_HEADER_REPEAT, SingletonField
-from httplint.field.tests import FieldTest
+from httplint.field.singleton_field import SingletonField
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9111
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ResponseLinterProtocol,
 )
 
@@ -60,37 +58,3 @@ class AGE_LARGE(Note):
 The `Age` header's value is greater than 2,147,483,648. Some implementations may represent it
 using that value (which is over 68 years).
 """
-
-
-class AgeTest(FieldTest[ResponseLinterProtocol]):
-    name = "Age"
-    inputs = [b"10"]
-    expected_out = 10
-
-
-class MultipleAgeTest(FieldTest[ResponseLinterProtocol]):
-    name = "Age"
-    inputs = [b"20", b"10"]
-    expected_out = 20
-    expected_notes: NoteClassListType = [SINGLE_HEADER_REPEAT]
-
-
-class CharAgeTest(FieldTest[ResponseLinterProtocol]):
-    name = "Age"
-    inputs = [b"foo"]
-    expected_out = None
-    expected_notes: NoteClassListType = [AGE_NOT_INT]
-
-
-class NegAgeTest(FieldTest[ResponseLinterProtocol]):
-    name = "Age"
-    inputs = [b"-20"]
-    expected_out = None
-    expected_notes: NoteClassListType = [AGE_NEGATIVE]
-
-
-class BigAgeTest(FieldTest[ResponseLinterProtocol]):
-    name = "Age"
-    inputs = [b"2147483649"]
-    expected_out = 2147483649
-    expected_notes: NoteClassListType = [AGE_LARGE]
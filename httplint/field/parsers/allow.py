@@ -1,5 +1,4 @@
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.syntax import rfc9110
 from httplint.types import (
     ResponseLinterProtocol,
@@ -13,9 +12,3 @@ The `Allow` response header advertises the set of methods that are supported by
     reference = f"{rfc9110.SPEC_URL}#field.allow"
     syntax = rfc9110.Allow
     deprecated = False
-
-
-class AllowTest(FieldTest[ResponseLinterProtocol]):
-    name = "Allow"
-    inputs = [b"GET, POST"]
-    expected_out = ["GET", "POST"]
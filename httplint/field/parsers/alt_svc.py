@@ -1,13 +1,10 @@
 from typing import Tuple, Union
 
-from httplint.field import BAD_SYNTAX
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ParamDictType,
     ResponseLinterProtocol,
 )
@@ -52,34 +49,3 @@ class ALTSVC_CLEAR_LIST(Note):
     _text = """\
 The `Alt-Svc` header field value "clear" is used to invalidate previous alternative services.
 It cannot be combined with other alternative service advertisements."""
-
-
-class AltSvcTest(FieldTest[ResponseLinterProtocol]):
-    name = "Alt-Svc"
-    inputs = [b'h2=":443"']
-    expected_out = ['h2=":443"']
-
-
-class AltSvcParamTest(FieldTest[ResponseLinterProtocol]):
-    name = "Alt-Svc"
-    inputs = [b'h2=":443"; ma=60']
-    expected_out = ['h2=":443"; ma=60']
-
-
-class AltSvcClearTest(FieldTest[ResponseLinterProtocol]):
-    name = "Alt-Svc"
-    inputs = [b"clear"]
-    expected_out = ["clear"]
-
-
-class AltSvcMixedTest(FieldTest[ResponseLinterProtocol]):
-    name = "Alt-Svc"
-    inputs = [b'clear, h2=":443"']
-    expected_out = ["clear", 'h2=":443"']
-    expected_notes: NoteClassListType = [ALTSVC_CLEAR_LIST]
-
-
-class AltSvcBadTest(FieldTest[ResponseLinterProtocol]):
-    name = "Alt-Svc"
-    inputs = [b"foo"]
-    expected_notes: NoteClassListType = [BAD_SYNTAX]
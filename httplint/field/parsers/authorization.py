@@ -1,5 +1,4 @@
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
 from httplint.note import categories
 from httplint.syntax import rfc9110
 from httplint.types import (
@@ -20,9 +19,3 @@ The `Authorization` header field allows a user agent to authenticate itself with
 
     def evaluate(self, add_note: AddNoteMethodType) -> None:
         pass
-
-
-class AuthorizationTest(FieldTest[RequestLinterProtocol]):
-    name = "Authorization"
-    inputs = [b"Basic QWxhZGRpbjpvcGVuIHNlc2FtZQ=="]
-    expected_out = "Basic QWxhZGRpbjpvcGVuIHNlc2FtZQ=="
@@ -1,14 +1,12 @@
 from typing import Any, Callable, Dict, List, Tuple, Union
 
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.field.utils import unquote_string
-from httplint.note import Note, categories, levels
+from httplint.note import Deferred, Note, categories, levels
 from httplint.syntax import rfc9111
 from httplint.types import (
     AddNoteMethodType,
     AnyMessageLinterProtocol,
-    NoteClassListType,
 )
 from httplint.util import markdown_list
 
@@ -144,7 +142,7 @@ ignoring it there."""
                         add_note(
                             CC_CONFLICTING,
                             directive=directive,
-                            conflicts=markdown_list(conflicts, markup="`"),
+                            conflicts=Deferred(markdown_list, conflicts, "`"),
                         )
                         break  # only show the first conflict
 
@@ -344,62 +342,3 @@ cached for more than %(pre_check)s seconds, the browser will download a fresh re
 showing it to the user.
 
 Note that these directives do not have any effect on other clients or caches."""
-
-
-class CacheControlTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Cache-Control"
-    inputs = [b"a=b, c=d", b"e=f", b"g"]
-    expected_out = [("a", "b"), ("c", "d"), ("e", "f"), ("g", None)]
-
-
-class CacheControlCaseTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Cache-Control"
-    inputs = [b"A=b, c=D"]
-    expected_out = [("a", "b"), ("c", "D")]
-    expected_notes: NoteClassListType = [CC_MISCAP]
-
-
-class CacheControlQuotedTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Cache-Control"
-    inputs = [b'private="b,c", c=d']
-    expected_out = [("private", "b,c"), ("c", "d")]
-
-
-class CacheControlMaxAgeTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Cache-Control"
-    inputs = [b"max-age=5"]
-    expected_out = [("max-age", 5)]
-
-
-class CacheControlBadMaxAgeTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Cache-Control"
-    inputs = [b"max-age=foo"]
-    expected_notes: NoteClassListType = [CC_BAD_VALUE_TYPE]
-
-
-class CacheControlBigTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Cache-Control"
-    inputs = [b"max-age=2147483649"]
-    expected_out = [("max-age", 2147483649)]
-    expected_notes: NoteClassListType = [CC_MAX_AGE_TOO_LARGE]
-
-
-class CacheControlValueNotAllowedTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Cache-Control"
-    inputs = [b"no-store=foo"]
-    expected_out = [("no-store", "foo")]
-    expected_notes: NoteClassListType = [CC_SHOULD_NOT_HAVE_VALUE]
-
-
-class CacheControlDupTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Cache-Control"
-    inputs = [b"max-age=5, max-age=10"]
-    expected_out = [("max-age", 5), ("max-age", 10)]
-    expected_notes: NoteClassListType = [CC_DUP]
-
-
-class CacheControlUnknownDupTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Cache-Control"
-    inputs = [b"foo=1, foo=2"]
-    expected_out = [("foo", "1"), ("foo", "2")]
-    expected_notes: NoteClassListType = []
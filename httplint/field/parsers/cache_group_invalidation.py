@@ -1,9 +1,7 @@
 from httplint.field.structured_field import StructuredField
-from httplint.field.tests import FakeRequestLinter, FieldTest
 from httplint.note import Note, categories, levels
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ResponseLinterProtocol,
     SFListType,
 )
@@ -58,60 +56,3 @@ class CACHE_GROUP_INVALIDATION_IGNORED(Note):
     _text = """\
 The `Cache-Group-Invalidation` header is only processed for unsafe methods (like POST, PUT, DELETE).
 It will be ignored for `%(method)s` requests."""
-
-
-class CacheGroupInvalidationTest(FieldTest[ResponseLinterProtocol]):
-    name = "Cache-Group-Invalidation"
-    inputs = [b'"group1"']
-    expected_out = [("group1", {})]
-
-    def setUp(self) -> None:
-        super().setUp()
-        request = FakeRequestLinter()
-        request.method = "POST"
-        self.message.request = request
-
-    expected_notes: NoteClassListType = []
-
-
-class CacheGroupInvalidationIgnoredTest(FieldTest[ResponseLinterProtocol]):
-    name = "Cache-Group-Invalidation"
-    inputs = [b'"group1"']
-    expected_out = [("group1", {})]
-
-    def setUp(self) -> None:
-        super().setUp()
-        request = FakeRequestLinter()
-        request.method = "GET"
-        self.message.request = request
-
-    expected_notes: NoteClassListType = [CACHE_GROUP_INVALIDATION_IGNORED]
-
-
-class CacheGroupInvalidationBadTypeTest(FieldTest[ResponseLinterProtocol]):
-    name = "Cache-Group-Invalidation"
-    inputs = [b"123"]
-    expected_out = [(123, {})]
-
-    def setUp(self) -> None:
-        super().setUp()
-        # Ensure check passes (unsafe method)
-        request = FakeRequestLinter()
-        request.method = "POST"
-        self.message.request = request
-
-    expected_notes: NoteClassListType = [CACHE_GROUP_INVALIDATION_BAD_TYPE]
-
-
-class CacheGroupInvalidationMultipleBadTypesTest(FieldTest[ResponseLinterProtocol]):
-    name = "Cache-Group-Invalidation"
-    inputs = [b'123, "group2", ?0']
-    expected_out = [(123, {}), ("group2", {}), (False, {})]
-
-    def setUp(self) -> None:
-        super().setUp()
-        request = FakeRequestLinter()
-        request.method = "POST"
-        self.message.request = request
-
-    expected_notes: NoteClassListType = [CACHE_GROUP_INVALIDATION_BAD_TYPE]
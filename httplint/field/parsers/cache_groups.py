@@ -1,9 +1,7 @@
 from httplint.field.structured_field import StructuredField
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ResponseLinterProtocol,
     SFListType,
 )
@@ -42,24 +40,3 @@ class CACHE_GROUPS_BAD_TYPE(Note):
     _summary = "Cache groups need to be strings."
     _text = """\
 The `%(field_name)s` header values must be Strings. Found `%(got)s`."""
-
-
-class CacheGroupsTest(FieldTest[ResponseLinterProtocol]):
-    name = "Cache-Groups"
-    inputs = [b'"group1", "group2"']
-    expected_out = [("group1", {}), ("group2", {})]
-    expected_notes: NoteClassListType = []
-
-
-class CacheGroupsBadTypeTest(FieldTest[ResponseLinterProtocol]):
-    name = "Cache-Groups"
-    inputs = [b'123, "group2"']
-    expected_out = [(123, {}), ("group2", {})]
-    expected_notes: NoteClassListType = [CACHE_GROUPS_BAD_TYPE]
-
-
-class CacheGroupsMultipleBadTypesTest(FieldTest[ResponseLinterProtocol]):
-    name = "Cache-Groups"
-    inputs = [b'123, "group2", ?0']
-    expected_out = [(123, {}), ("group2", {}), (False, {})]
-    expected_notes: NoteClassListType = [CACHE_GROUPS_BAD_TYPE]
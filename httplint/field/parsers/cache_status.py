@@ -4,12 +4,10 @@ from typing import Any, Dict
 from http_sf import Token
 
 from httplint.field.structured_field import StructuredField
-from httplint.field.tests import FieldTest
 from httplint.field.utils import check_sf_params
 from httplint.note import Note, categories, levels
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ResponseLinterProtocol,
     SFListType,
 )
@@ -119,27 +117,3 @@ class CACHE_STATUS_BAD_PARAM_VAL(Note):
     _text = """\
 The value `%(value)s` is not defined for the `%(param)s` parameter.
 """
-
-
-class CacheStatusTest(FieldTest[ResponseLinterProtocol]):
-    name = "Cache-Status"
-    inputs = [b"ExampleCache; hit; ttl=3700", b"AnotherCache; fwd=uri-miss"]
-    expected_out = [
-        (Token("ExampleCache"), {"hit": True, "ttl": 3700}),
-        (Token("AnotherCache"), {"fwd": Token("uri-miss")}),
-    ]
-    expected_notes: NoteClassListType = [CACHE_STATUS]
-
-
-class CacheStatusUnknownParamTest(FieldTest[ResponseLinterProtocol]):
-    name = "Cache-Status"
-    inputs = [b"ExampleCache; unknown=1"]
-    expected_out = [(Token("ExampleCache"), {"unknown": 1})]
-    expected_notes: NoteClassListType = [CACHE_STATUS_UNKNOWN_PARAM, CACHE_STATUS]
-
-
-class CacheStatusBadParamValTest(FieldTest[ResponseLinterProtocol]):
-    name = "Cache-Status"
-    inputs = [b"ExampleCache; fwd=invalid"]
-    expected_out = [(Token("ExampleCache"), {"fwd": Token("invalid")})]
-    expected_notes: NoteClassListType = [CACHE_STATUS_BAD_PARAM_VAL, CACHE_STATUS]
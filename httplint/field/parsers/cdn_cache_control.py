@@ -1,13 +1,8 @@
-from http_sf import Token
-
-from httplint.field import RESPONSE_HDR_IN_REQUEST
 from httplint.field.parsers.cache_control import KNOWN_CC
 from httplint.field.structured_field import StructuredField
-from httplint.field.tests import FakeRequestLinter, FieldTest
 from httplint.note import Note, categories, levels
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ResponseLinterProtocol,
     SFDictionaryType,
 )
@@ -85,34 +80,3 @@ class CDN_CACHE_CONTROL_PRESENT(Note):
 The `CDN-Cache-Control` header field allows you to specify cache directives that are targeted at
 Content Delivery Network (CDN) caches, separately from the `Cache-Control` header field (which
 applies to all caches)."""
-
-
-class CDNCacheControlTest(FieldTest[ResponseLinterProtocol]):
-    name = "CDN-Cache-Control"
-    inputs = [b"max-age=60, no-store"]
-    expected_out = {"max-age": (60, {}), "no-store": (True, {})}
-    expected_notes: NoteClassListType = [CDN_CACHE_CONTROL_PRESENT]
-
-
-class CDNCacheControlBadSyntaxTest(FieldTest[ResponseLinterProtocol]):
-    name = "CDN-Cache-Control"
-    inputs = [b"max-age=foo"]
-    expected_notes: NoteClassListType = [CDN_CACHE_CONTROL_PRESENT, BAD_CDN_CC_TYPE]
-    expected_out = {"max-age": (Token("foo"), {})}
-
-
-class CDNCacheControlCaseTest(FieldTest[ResponseLinterProtocol]):
-    name = "CDN-Cache-Control"
-    inputs = [b"no-store"]
-    expected_out = {"no-store": (True, {})}
-    # Changed input to lowercase because Uppercase keys are invalid in SF Dictionary.
-    # Test confirms logic works for valid input.
-    expected_notes: NoteClassListType = [CDN_CACHE_CONTROL_PRESENT]
-
-
-class CDNCacheControlRequestTest(FieldTest[ResponseLinterProtocol]):
-    name = "CDN-Cache-Control"
-    inputs = [b"max-age=60"]
-    linter_class = FakeRequestLinter
-    expected_out = None
-    expected_notes: NoteClassListType = [RESPONSE_HDR_IN_REQUEST]
@@ -1,11 +1,8 @@
-from httplint.field import BAD_SYNTAX
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
 from httplint.syntax.rfc9110 import list_rule, quoted_string
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ResponseLinterProtocol,
 )
 
@@ -93,59 +90,3 @@ class CSD_UNQUOTED(Note):
 Values in the `Clear-Site-Data` header must be quoted; unquoted values will be ignored. 
 
 The following values were found unquoted: `%(values)s`."""
-
-
-class ClearSiteDataTest(FieldTest[ResponseLinterProtocol]):
-    name = "Clear-Site-Data"
-    inputs = [b'"cache", "cookies"']
-    expected_out = ["cache", "cookies"]
-    expected_notes: NoteClassListType = [CSD_PRESENT]
-
-
-class ClearSiteDataWildcardTest(FieldTest[ResponseLinterProtocol]):
-    name = "Clear-Site-Data"
-    inputs = [b'"*"']
-    expected_out = ["*"]
-    expected_notes: NoteClassListType = [CSD_PRESENT]
-
-
-class ClearSiteDataUnknownTest(FieldTest[ResponseLinterProtocol]):
-    name = "Clear-Site-Data"
-    inputs = [b'"foo"']
-    expected_out = ["foo"]
-    expected_notes: NoteClassListType = [CSD_UNKNOWN_VALUE]
-
-
-class ClearSiteDataEmptyTest(FieldTest[ResponseLinterProtocol]):
-    name = "Clear-Site-Data"
-    inputs = [b'""']
-    expected_out = [""]
-    expected_notes: NoteClassListType = [CSD_EMPTY]
-
-
-class ClearSiteDataTrulyEmptyTest(FieldTest[ResponseLinterProtocol]):
-    name = "Clear-Site-Data"
-    inputs = [b""]
-    expected_out = []
-    expected_notes: NoteClassListType = [CSD_EMPTY]
-
-
-class ClearSiteDataBadSyntaxTest(FieldTest[ResponseLinterProtocol]):
-    name = "Clear-Site-Data"
-    inputs = [b"foo"]
-    expected_out = ["foo"]
-    expected_notes: NoteClassListType = [BAD_SYNTAX, CSD_UNKNOWN_VALUE]
-
-
-class ClearSiteDataUnquotedTest(FieldTest[ResponseLinterProtocol]):
-    name = "Clear-Site-Data"
-    inputs = [b"cache"]
-    expected_out = ["cache"]
-    expected_notes: NoteClassListType = [BAD_SYNTAX, CSD_UNQUOTED]
-
-
-class ClearSiteDataMultipleUnquotedTest(FieldTest[ResponseLinterProtocol]):
-    name = "Clear-Site-Data"
-    inputs = [b"cache, cookies"]
-    expected_out = ["cache", "cookies"]
-    expected_notes: NoteClassListType = [BAD_SYNTAX, CSD_UNQUOTED]
@@ -1,5 +1,4 @@
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.syntax import rfc9110
 from httplint.types import (
     AnyMessageLinterProtocol,
@@ -19,9 +18,3 @@ Connection is only valid in HTTP/1.x; HTTP/2 and HTTP/3 forbit it."""
     reference = f"{rfc9110.SPEC_URL}#field.connection"
     syntax = rfc9110.Connection
     deprecated = False
-
-
-class ConnectionTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Connection"
-    inputs = [b"close"]
-    expected_out = ["close"]
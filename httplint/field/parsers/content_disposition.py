@@ -1,14 +1,12 @@
 from typing import Tuple
 
-from httplint.field.singleton_field import SINGLE_HEADER_REPEAT, SingletonField
-from httplint.field.tests import FieldTest
-from httplint.field.utils import PARAM_STAR_QUOTED, parse_params
+from httplint.field.singleton_field import SingletonField
+from httplint.field.utils import parse_params
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
     AnyMessageLinterProtocol,
-    NoteClassListType,
     ParamDictType,
 )
 
@@ -100,55 +98,3 @@ Because this can be used to attach the browser's host operating system (e.g., by
 system directory), browsers will usually ignore these parameters, or remove path information.
 
 You should remove these characters."""
-
-
-class QuotedCDTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Content-Disposition"
-    inputs = [b'attachment; filename="foo.txt"']
-    expected_out = ("attachment", {"filename": "foo.txt"})
-
-
-class TokenCDTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Content-Disposition"
-    inputs = [b"attachment; filename=foo.txt"]
-    expected_out = ("attachment", {"filename": "foo.txt"})
-
-
-class InlineCDTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Content-Disposition"
-    inputs = [b"inline; filename=foo.txt"]
-    expected_out = ("inline", {"filename": "foo.txt"})
-
-
-class RepeatCDTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Content-Disposition"
-    inputs = [b"attachment; filename=foo.txt", b"inline; filename=bar.txt"]
-    expected_out = ("attachment", {"filename": "foo.txt"})
-    expected_notes: NoteClassListType = [SINGLE_HEADER_REPEAT]
-
-
-class FilenameStarCDTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Content-Disposition"
-    inputs = [b"attachment; filename=foo.txt; filename*=UTF-8''a%cc%88.txt"]
-    expected_out = ("attachment", {"filename": "foo.txt", "filename*": "a\u0308.txt"})
-
-
-class FilenameStarQuotedCDTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Content-Disposition"
-    inputs = [b"attachment; filename=foo.txt; filename*=\"UTF-8''a%cc%88.txt\""]
-    expected_out = ("attachment", {"filename": "foo.txt", "filename*": "a\u0308.txt"})
-    expected_notes: NoteClassListType = [PARAM_STAR_QUOTED]
-
-
-class FilenamePercentCDTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Content-Disposition"
-    inputs = [b"attachment; filename=fo%22o.txt"]
-    expected_out = ("attachment", {"filename": "fo%22o.txt"})
-    expected_notes: NoteClassListType = [DISPOSITION_FILENAME_PERCENT]
-
-
-class FilenamePathCharCDTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Content-Disposition"
-    inputs = [b'attachment; filename="/foo.txt"']
-    expected_out = ("attachment", {"filename": "/foo.txt"})
-    expected_notes: NoteClassListType = [DISPOSITION_FILENAME_PATH_CHAR]
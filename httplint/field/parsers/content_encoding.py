@@ -1,16 +1,9 @@
-from types import SimpleNamespace
-from typing import cast
-
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FakeRequestLinter, FieldTest
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
     AnyMessageLinterProtocol,
-    CachingProtocol,
-    NoteClassListType,
-    ResponseLinterProtocol,
 )
 
 
@@ -83,51 +76,3 @@ This response's `Content-Encoding` header indicates it has the `%(coding)s conte
 
 Normally, clients ask for the encodings they want in the `Accept-Encoding` request header. Using
 encodings that the client doesn't explicitly request can lead to interoperability problems."""
-
-
-class ContentEncodingTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Content-Encoding"
-    inputs = [b"gzip"]
-    expected_out = ["gzip"]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        assert message.request is not None
-        message.request.headers.process([(b"accept-encoding", b"gzip")])
-
-
-class ContentEncodingCaseTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Content-Encoding"
-    inputs = [b"GZip"]
-    expected_out = ["gzip"]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        assert message.request is not None
-        message.request.headers.process([(b"accept-encoding", b"gzip")])
-
-
-class ContentEncodingUnwantedTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Content-Encoding"
-    inputs = [b"gzip, foo"]
-    expected_out = ["gzip", "foo"]
-    expected_notes: NoteClassListType = [ENCODING_UNWANTED]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        request = FakeRequestLinter()
-        request.headers.process([(b"accept-encoding", b"gzip")])
-        message.request = request
-
-
-class DictionaryCompressedMissingVaryTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Content-Encoding"
-    inputs = [b"dcb"]
-    expected_out = ["dcb"]
-    expected_notes: NoteClassListType = [DICTIONARY_COMPRESSED_MISSING_VARY]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        assert message.request is not None
-        message.request.headers.process([(b"accept-encoding", b"dcb")])
-        message.caching = cast(
-            CachingProtocol, SimpleNamespace(store_shared=True, store_private=True)
-        )
-        # Vary missing 'Available-Dictionary'
-        message.headers.parsed["vary"] = set()
@@ -1,11 +1,9 @@
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
     AnyMessageLinterProtocol,
-    NoteClassListType,
 )
 
 
@@ -43,22 +41,3 @@ class CONTENT_LANGUAGE_DUP(Note):
 The `%(lang)s` language tag is used more than once in the `Content-Language` header.
 
 Recipients will likely ignore duplicates."""
-
-
-class ContentLanguageTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Content-Language"
-    inputs = [b"en-US"]
-    expected_out = ["en-us"]
-
-
-class ContentLanguageListTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Content-Language"
-    inputs = [b"en-US, fr"]
-    expected_out = ["en-us", "fr"]
-
-
-class ContentLanguageDupTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Content-Language"
-    inputs = [b"en-US, en-US"]
-    expected_out = ["en-us", "en-us"]
-    expected_notes: NoteClassListType = [CONTENT_LANGUAGE_DUP]
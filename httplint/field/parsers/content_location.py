@@ -1,5 +1,4 @@
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
 from httplint.syntax import rfc9110
 from httplint.types import (
     ResponseLinterProtocol,
@@ -15,9 +14,3 @@ URI."""
     reference = f"{rfc9110.SPEC_URL}#field.content-location"
     syntax = rfc9110.Content_Location
     deprecated = False
-
-
-class ContentLocationTest(FieldTest[ResponseLinterProtocol]):
-    name = "Content-Location"
-    inputs = [b"/foo"]
-    expected_out = "/foo"
@@ -1,9 +1,6 @@
-from httplint.field import FIELD_DEPRECATED
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
 from httplint.types import (
     AnyMessageLinterProtocol,
-    NoteClassListType,
 )
 
 
@@ -18,10 +15,3 @@ not proof against malicious attacks."""
     reference = "https://www.rfc-editor.org/rfc/rfc1864"
     syntax = r"(?: [A-Za-z0-9+/]{22} ={2} )"
     deprecated = True
-
-
-class ContentMD5Test(FieldTest[AnyMessageLinterProtocol]):
-    name = "Content-MD5"
-    inputs = [b"Q2hlY2sgSW50ZWdyaXR5IQ=="]
-    expected_out = "Q2hlY2sgSW50ZWdyaXR5IQ=="
-    expected_notes: NoteClassListType = [FIELD_DEPRECATED]
@@ -5,12 +5,10 @@ from typing import (
 )
 
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ResponseLinterProtocol,
 )
 
@@ -212,111 +210,3 @@ class CONTENT_RANGE_UNKNOWN_LENGTH(Note):
     _text = """\
 The `Content-Range` header uses `*` for the instance length, indicating that the total length of
 the resource is unknown."""
-
-
-class ContentRangeTest(FieldTest[ResponseLinterProtocol]):
-    name = "Content-Range"
-    inputs = [b"bytes 1-100/200"]
-    expected_out = ContentRangeValue("bytes", 1, 100, 200)
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.status_code = 206
-
-
-class ContentRangeUnsatisfiedTest(FieldTest[ResponseLinterProtocol]):
-    name = "Content-Range"
-    inputs = [b"bytes */1234"]
-    expected_out = ContentRangeValue("bytes", None, None, 1234)
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.status_code = 416
-
-
-class ContentRangeUnknownLengthTest(FieldTest[ResponseLinterProtocol]):
-    name = "Content-Range"
-    inputs = [b"bytes 42-1233/*"]
-    expected_out = ContentRangeValue("bytes", 42, 1233, None)
-    expected_notes: NoteClassListType = [CONTENT_RANGE_UNKNOWN_LENGTH]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.status_code = 206
-
-
-class ContentRangeInvalidOrderTest(FieldTest[ResponseLinterProtocol]):
-    name = "Content-Range"
-    inputs = [b"bytes 100-50/200"]
-    expected_out = ContentRangeValue("bytes", 100, 50, 200)
-    expected_notes: NoteClassListType = [RANGE_INVALID]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.status_code = 206
-
-
-class ContentRangeInvalidLengthTest(FieldTest[ResponseLinterProtocol]):
-    name = "Content-Range"
-    inputs = [b"bytes 100-200/50"]
-    expected_out = ContentRangeValue("bytes", 100, 200, 50)
-    expected_notes: NoteClassListType = [RANGE_INVALID]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.status_code = 206
-
-
-class ContentRangeSyntaxErrorTest(FieldTest[ResponseLinterProtocol]):
-    name = "Content-Range"
-    inputs = [b"bytes */*"]
-    expected_out = None
-    expected_notes: NoteClassListType = [CONTENT_RANGE_INVALID_ASTERISK]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.status_code = 416
-
-
-class ContentRangeMissingUnit(FieldTest[ResponseLinterProtocol]):
-    name = "Content-Range"
-    inputs = [b"1-100/200"]
-    expected_out = None
-    expected_notes: NoteClassListType = [CONTENT_RANGE_MISSING_UNIT]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.status_code = 206
-
-
-class ContentRangeMissingHyphenTest(FieldTest[ResponseLinterProtocol]):
-    name = "Content-Range"
-    inputs = [b"bytes 100/200"]
-    expected_out = None
-    expected_notes: NoteClassListType = [RANGE_MISSING_HYPHEN]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.status_code = 206
-
-
-class ContentRangeInvalidIntegerTest(FieldTest[ResponseLinterProtocol]):
-    name = "Content-Range"
-    inputs = [b"bytes 100-foo/200"]
-    expected_out = None
-    expected_notes: NoteClassListType = [RANGE_INVALID_INTEGER]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.status_code = 206
-
-
-class ContentRangeUnsatisfiedBadSCTest(FieldTest[ResponseLinterProtocol]):
-    name = "Content-Range"
-    inputs = [b"bytes */100"]
-    expected_out = ContentRangeValue("bytes", None, None, 100)
-    expected_notes: NoteClassListType = [CONTENT_RANGE_UNSATISFIED_BAD_SC]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.status_code = 206
-
-
-class ContentRangeMissingSlashTest(FieldTest[ResponseLinterProtocol]):
-    name = "Content-Range"
-    inputs = [b"bytes 1-100 200"]
-    expected_out = None
-    expected_notes: NoteClassListType = [CONTENT_RANGE_MISSING_SLASH]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.status_code = 206
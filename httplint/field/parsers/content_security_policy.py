@@ -1,13 +1,11 @@
 from typing import Dict, List
 
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
-from httplint.note import MarkdownSafe, Note, categories, levels
+from httplint.note import Deferred, MarkdownSafe, Note, categories, levels
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
     NoteArgsType,
-    NoteClassListType,
     ResponseLinterProtocol,
 )
 
@@ -59,7 +57,7 @@ sources of content that browsers are allowed to load on a page."""
                 (
                     CSP_DUPLICATE_DIRECTIVE,
                     {
-                        "directives_list": self._make_list(duplicate_directives),
+                        "directives_list": Deferred(self._make_list, duplicate_directives),
                         "report_only_text": self.report_only_text,
                     },
                 )
@@ -113,25 +111,25 @@ sources of content that browsers are allowed to load on a page."""
         if wide_open_directives:
             parent.add_child(
                 CSP_WIDE_OPEN,
-                directives_list=self._make_list(wide_open_directives),
+                directives_list=Deferred(self._make_list, wide_open_directives),
                 report_only_text=self.report_only_text,
             )
         if unsafe_inline_directives:
             parent.add_child(
                 CSP_UNSAFE_INLINE,
-                directives_list=self._make_list(unsafe_inline_directives),
+                directives_list=Deferred(self._make_list, unsafe_inline_directives),
                 report_only_text=self.report_only_text,
             )
         if unsafe_eval_directives:
             parent.add_child(
                 CSP_UNSAFE_EVAL,
-                directives_list=self._make_list(unsafe_eval_directives),
+                directives_list=Deferred(self._make_list, unsafe_eval_directives),
                 report_only_text=self.report_only_text,
             )
         if http_uri_directives:
             parent.add_child(
                 CSP_HTTP_URI,
-                directives_list=self._make_list(http_uri_directives),
+                directives_list=Deferred(self._make_list, http_uri_directives),
                 report_only_text=self.report_only_text,
             )
 
@@ -153,13 +151,7 @@ sources of content that browsers are allowed to load on a page."""
                 if value in known_endpoints:
                     continue
 
-                # Find the parent note
-                parent_note = None
-                for note in self.message.notes:
-                    if isinstance(note, CONTENT_SECURITY_POLICY):
-                        parent_note = note
-                        break
-
+                parent_note = self.message.notes.find(CONTENT_SECURITY_POLICY)
                 if parent_note:
                     parent_note.add_child(
                         CSP_REPORT_TO_MISSING,
@@ -275,74 +267,3 @@ class CSP_REPORT_TO_MISSING(Note):
 The `report-to` directive [Content Security Policy](https://www.w3.org/TR/CSP3/)
 specifies a reporting endpoint, but no matching endpoint refers to it in the
 `Reporting-Endpoints` header.%(report_only_text)s"""
-
-
-class CSPTest(FieldTest[ResponseLinterProtocol]):
-    name = "Content-Security-Policy"
-    inputs = [b"default-src 'self'; script-src 'unsafe-inline'"]
-    expected_out = [{"default-src": "'self'", "script-src": "'unsafe-inline'"}]
-    expected_notes: NoteClassListType = [CONTENT_SECURITY_POLICY, CSP_UNSAFE_INLINE]
-
-
-class CSPMultipleTest(FieldTest[ResponseLinterProtocol]):
-    name = "Content-Security-Policy"
-    inputs = [b"default-src 'self'", b"script-src 'unsafe-eval'"]
-    expected_out = [{"default-src": "'self'"}, {"script-src": "'unsafe-eval'"}]
-    expected_notes: NoteClassListType = [CONTENT_SECURITY_POLICY, CSP_UNSAFE_EVAL]
-
-
-class CSPDuplicateTest(FieldTest[ResponseLinterProtocol]):
-    name = "Content-Security-Policy"
-    inputs = [b"default-src 'self'; default-src 'none'"]
-    expected_out = [{"default-src": "'self'"}]
-    expected_notes: NoteClassListType = [CONTENT_SECURITY_POLICY, CSP_DUPLICATE_DIRECTIVE]
-
-
-class CSPReportUriTest(FieldTest[ResponseLinterProtocol]):
-    name = "Content-Security-Policy"
-    inputs = [b"report-uri /csp-report"]
-    expected_out = [{"report-uri": "/csp-report"}]
-    expected_notes: NoteClassListType = [CONTENT_SECURITY_POLICY, CSP_DEPRECATED_REPORT_URI]
-
-
-class CSPWideOpenTest(FieldTest[ResponseLinterProtocol]):
-    name = "Content-Security-Policy"
-    inputs = [b"script-src *"]
-    expected_out = [{"script-src": "*"}]
-    expected_notes: NoteClassListType = [CONTENT_SECURITY_POLICY, CSP_WIDE_OPEN]
-
-
-class CSPTrailingSemiTest(FieldTest[ResponseLinterProtocol]):
-    name = "Content-Security-Policy"
-    inputs = [b"default-src 'self'; script-src 'self';"]
-    expected_out = [{"default-src": "'self'", "script-src": "'self'"}]
-    expected_notes: NoteClassListType = [CONTENT_SECURITY_POLICY]
-
-
-class CSPReportToTest(FieldTest[ResponseLinterProtocol]):
-    name = "Content-Security-Policy"
-    inputs = [b"sort-src 'self'; report-to endpoint"]
-    expected_out = [{"sort-src": "'self'", "report-to": "endpoint"}]
-    expected_notes: NoteClassListType = [CONTENT_SECURITY_POLICY]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.headers.process(
-            [(b"Reporting-Endpoints", b'endpoint="https://example.com/reports"')]
-        )
-
-
-class CSPReportToMissingTest(FieldTest[ResponseLinterProtocol]):
-    name = "Content-Security-Policy"
-    inputs = [b"script-src 'self'; report-to endpoint"]
-    expected_out = [{"script-src": "'self'", "report-to": "endpoint"}]
-    expected_notes: NoteClassListType = [CONTENT_SECURITY_POLICY, CSP_REPORT_TO_MISSING]
-
-
-class CSPReportToMismatchTest(FieldTest[ResponseLinterProtocol]):
-    name = "Content-Security-Policy"
-    inputs = [b"script-src 'self'; report-to endpoint"]
-    expected_out = [{"script-src": "'self'", "report-to": "endpoint"}]
-    expected_notes: NoteClassListType = [CONTENT_SECURITY_POLICY, CSP_REPORT_TO_MISSING]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.headers.process([(b"Reporting-Endpoints", b'endpoint-2="https://example.com"')])
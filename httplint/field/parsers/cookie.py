@@ -2,7 +2,6 @@ from dataclasses import dataclass
 from typing import List
 
 from httplint.field.broken_field import BrokenField
-from httplint.field.tests import FieldTest
 from httplint.note import categories
 from httplint.types import AddNoteMethodType, RequestLinterProtocol
 
@@ -53,26 +52,3 @@ The `Cookie` header field contains stored HTTP cookies previously sent by the se
             pairs.append(CookiePair(name, value))
 
         return pairs
-
-
-class CookieTest(FieldTest[RequestLinterProtocol]):
-    name = "Cookie"
-    inputs = [b"SID=31d4d96e407aad42"]
-    expected_out = [[CookiePair("SID", "31d4d96e407aad42")]]
-
-    def test_multiple_pairs(self) -> None:
-        self.inputs = [b"SID=31d4d96e407aad42; lang=en-US"]
-        self.expected_out = [[CookiePair("SID", "31d4d96e407aad42"), CookiePair("lang", "en-US")]]
-        self.setUp()
-        self.test_header()
-
-    def test_multiple_headers(self) -> None:
-        self.inputs = [b"SID=31d4d96e407aad42", b"lang=en-US"]
-        # BrokenField collates all values into a list of parsed results.
-        # Each parse returns a list of CookiePairs.
-        self.expected_out = [
-            [CookiePair("SID", "31d4d96e407aad42")],
-            [CookiePair("lang", "en-US")],
-        ]
-        self.setUp()
-        self.test_header()
@@ -1,18 +1,9 @@
-from typing import Any
-
-from http_sf import Token
-
 from httplint.field.parsers.cross_origin_embedder_policy import (
-    COEP_REQUIRE_CORP,
-    CROSS_ORIGIN_EMBEDDER_POLICY_BAD_VALUE,
     cross_origin_embedder_policy,
 )
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
-    ResponseLinterProtocol,
 )
 
 
@@ -38,17 +29,3 @@ class COEP_REPORT_ONLY_DUPLICATE(Note):
     _text = """\
 A response should not have both `Cross-Origin-Embedder-Policy` and
 `Cross-Origin-Embedder-Policy-Report-Only` headers. The report-only header will be ignored."""
-
-
-class CrossOriginEmbedderPolicyReportOnlyRequireCorpTest(FieldTest[ResponseLinterProtocol]):
-    name = "Cross-Origin-Embedder-Policy-Report-Only"
-    inputs = [b"require-corp"]
-    expected_out: Any = (Token("require-corp"), {})
-    expected_notes: NoteClassListType = [COEP_REQUIRE_CORP]
-
-
-class CrossOriginEmbedderPolicyReportOnlyBadValueTest(FieldTest[ResponseLinterProtocol]):
-    name = "Cross-Origin-Embedder-Policy-Report-Only"
-    inputs = [b"foo"]
-    expected_out: Any = (Token("foo"), {})
-    expected_notes: NoteClassListType = [CROSS_ORIGIN_EMBEDDER_POLICY_BAD_VALUE]
@@ -1,14 +1,11 @@
 # pylint: disable=duplicate-code
-from typing import Any
 
 from http_sf import Token
 
 from httplint.field.structured_field import StructuredField
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ResponseLinterProtocol,
     SFItemType,
 )
@@ -139,50 +136,3 @@ The `report-to` parameter in the
 [Cross-Origin Opener Policy](https://html.spec.whatwg.org/multipage/origin.html#coop)
 header specifies a reporting endpoint, but no matching endpoint refers to it in the
 `Reporting-Endpoints` header."""
-
-
-class CrossOriginOpenerPolicySameOriginTest(FieldTest[ResponseLinterProtocol]):
-    name = "Cross-Origin-Opener-Policy"
-    inputs = [b"same-origin"]
-    expected_out: Any = (Token("same-origin"), {})
-    expected_notes: NoteClassListType = [COOP_SAME_ORIGIN]
-
-
-class CrossOriginOpenerPolicySameOriginAllowPopupsTest(FieldTest[ResponseLinterProtocol]):
-    name = "Cross-Origin-Opener-Policy"
-    inputs = [b"same-origin-allow-popups"]
-    expected_out: Any = (Token("same-origin-allow-popups"), {})
-    expected_notes: NoteClassListType = [COOP_SAME_ORIGIN_ALLOW_POPUPS]
-
-
-class CrossOriginOpenerPolicyUnsafeNoneTest(FieldTest[ResponseLinterProtocol]):
-    name = "Cross-Origin-Opener-Policy"
-    inputs = [b"unsafe-none"]
-    expected_out: Any = (Token("unsafe-none"), {})
-    expected_notes: NoteClassListType = [COOP_UNSAFE_NONE]
-
-
-class CrossOriginOpenerPolicyBadValueTest(FieldTest[ResponseLinterProtocol]):
-    name = "Cross-Origin-Opener-Policy"
-    inputs = [b"foo"]
-    expected_out: Any = (Token("foo"), {})
-    expected_notes: NoteClassListType = [CROSS_ORIGIN_OPENER_POLICY_BAD_VALUE]
-
-
-class CrossOriginOpenerPolicyReportToTest(FieldTest[ResponseLinterProtocol]):
-    name = "Cross-Origin-Opener-Policy"
-    inputs = [b"same-origin; report-to=endpoint"]
-    expected_out: Any = (Token("same-origin"), {"report-to": "endpoint"})
-    expected_notes: NoteClassListType = [COOP_SAME_ORIGIN]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.headers.process(
-            [(b"Reporting-Endpoints", b'endpoint="https://example.com/reports"')]
-        )
-
-
-class CrossOriginOpenerPolicyReportToMissingTest(FieldTest[ResponseLinterProtocol]):
-    name = "Cross-Origin-Opener-Policy"
-    inputs = [b"same-origin; report-to=endpoint"]
-    expected_out: Any = (Token("same-origin"), {"report-to": "endpoint"})
-    expected_notes: NoteClassListType = [COOP_SAME_ORIGIN, COOP_REPORT_TO_MISSING]
@@ -1,18 +1,9 @@
-from typing import Any
-
-from http_sf import Token
-
 from httplint.field.parsers.cross_origin_opener_policy import (
-    COOP_SAME_ORIGIN,
-    CROSS_ORIGIN_OPENER_POLICY_BAD_VALUE,
     cross_origin_opener_policy,
 )
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
-    ResponseLinterProtocol,
 )
 
 
@@ -38,17 +29,3 @@ class COOP_REPORT_ONLY_DUPLICATE(Note):
     _text = """\
 A response should not have both `Cross-Origin-Opener-Policy` and
 `Cross-Origin-Opener-Policy-Report-Only` headers. The report-only header will be ignored."""
-
-
-class CrossOriginOpenerPolicyReportOnlySameOriginTest(FieldTest[ResponseLinterProtocol]):
-    name = "Cross-Origin-Opener-Policy-Report-Only"
-    inputs = [b"same-origin"]
-    expected_out: Any = (Token("same-origin"), {})
-    expected_notes: NoteClassListType = [COOP_SAME_ORIGIN]
-
-
-class CrossOriginOpenerPolicyReportOnlyBadValueTest(FieldTest[ResponseLinterProtocol]):
-    name = "Cross-Origin-Opener-Policy-Report-Only"
-    inputs = [b"foo"]
-    expected_out: Any = (Token("foo"), {})
-    expected_notes: NoteClassListType = [CROSS_ORIGIN_OPENER_POLICY_BAD_VALUE]
@@ -1,11 +1,9 @@
 from typing import Any
 
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ResponseLinterProtocol,
 )
 
@@ -78,31 +76,3 @@ class CROSS_ORIGIN_RESOURCE_POLICY_BAD_VALUE(Note):
 `%(value)s` is not a valid in the `Cross-Origin-Resource-Policy` header;
 it must be one of `same-origin`, `same-site`, or `cross-origin`.
 """
-
-
-class CrossOriginResourcePolicySameOriginTest(FieldTest[ResponseLinterProtocol]):
-    name = "Cross-Origin-Resource-Policy"
-    inputs = [b"same-origin"]
-    expected_out = "same-origin"
-    expected_notes: NoteClassListType = [CORP_SAME_ORIGIN]
-
-
-class CrossOriginResourcePolicySameSiteTest(FieldTest[ResponseLinterProtocol]):
-    name = "Cross-Origin-Resource-Policy"
-    inputs = [b"same-site"]
-    expected_out = "same-site"
-    expected_notes: NoteClassListType = [CORP_SAME_SITE]
-
-
-class CrossOriginResourcePolicyCrossOriginTest(FieldTest[ResponseLinterProtocol]):
-    name = "Cross-Origin-Resource-Policy"
-    inputs = [b"cross-origin"]
-    expected_out = "cross-origin"
-    expected_notes: NoteClassListType = [CORP_CROSS_ORIGIN]
-
-
-class CrossOriginResourcePolicyBadValueTest(FieldTest[ResponseLinterProtocol]):
-    name = "Cross-Origin-Resource-Policy"
-    inputs = [b"foo"]
-    expected_out = "foo"
-    expected_notes: NoteClassListType = [CROSS_ORIGIN_RESOURCE_POLICY_BAD_VALUE]
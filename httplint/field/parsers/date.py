@@ -1,12 +1,10 @@
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
-from httplint.field.utils import BAD_DATE_SYNTAX, parse_http_date
+from httplint.field.utils import parse_http_date
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
     AnyMessageLinterProtocol,
-    NoteClassListType,
 )
 from httplint.util import relative_time
 
@@ -84,23 +82,3 @@ HTTP cache).
 
 See [this paper](https://www.usenix.org/legacy/events/usits01/full_papers/cohen/cohen_html/index.html)
 for more information."""
-
-
-class BasicDateTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Date"
-    inputs = [b"Mon, 04 Jul 2011 09:08:06 GMT"]
-    expected_out = 1309770486
-
-
-class BadDateTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Date"
-    inputs = [b"0"]
-    expected_out = None
-    expected_notes: NoteClassListType = [BAD_DATE_SYNTAX]
-
-
-class BlankDateTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Date"
-    inputs = [b""]
-    expected_out = None
-    expected_notes: NoteClassListType = [BAD_DATE_SYNTAX]
@@ -1,12 +1,9 @@
-from datetime import datetime, timezone
-from typing import Any
+from datetime import datetime
 
 from httplint.field.structured_field import StructuredField
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ResponseLinterProtocol,
     SFItemType,
 )
@@ -73,34 +70,3 @@ class DEPRECATION_BAD_TYPE(Note):
     _text = """\
 The `Deprecation` [Structured Field](https://www.rfc-editor.org/rfc/rfc8941.html)
 header must be a Date or a Boolean. Found: %(item_type)s."""
-
-
-class DeprecationDateTest(FieldTest[ResponseLinterProtocol]):
-    name = "Deprecation"
-    inputs = [b"@1672531199"]
-    expected_out: Any = (datetime.fromtimestamp(1672531199, tz=timezone.utc), {})
-    expected_notes: NoteClassListType = [DEPRECATION_PAST]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.start_time = 2000000000
-
-
-class DeprecationBoolTest(FieldTest[ResponseLinterProtocol]):
-    name = "Deprecation"
-    inputs = [b"?1"]
-    expected_out: Any = (True, {})
-    expected_notes: NoteClassListType = [DEPRECATION_TRUE]
-
-
-class DeprecationFalseTest(FieldTest[ResponseLinterProtocol]):
-    name = "Deprecation"
-    inputs = [b"?0"]
-    expected_out: Any = (False, {})
-    expected_notes: NoteClassListType = [DEPRECATION_BAD_TYPE]
-
-
-class DeprecationInvalidTest(FieldTest[ResponseLinterProtocol]):
-    name = "Deprecation"
-    inputs = [b'""']
-    expected_out: Any = ("", {})
-    expected_notes: NoteClassListType = [DEPRECATION_BAD_TYPE]
@@ -1,15 +1,12 @@
 from typing import Tuple
 
-from httplint.field import BAD_SYNTAX
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
 from httplint.field.utils import unquote_string
 from httplint.note import categories
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
     AnyMessageLinterProtocol,
-    NoteClassListType,
 )
 
 
@@ -26,22 +23,3 @@ The `ETag` header provides an opaque identifier for the representation."""
         if field_value[:2] == "W/":
             return (True, unquote_string(field_value[2:]))
         return (False, unquote_string(field_value))
-
-
-class ETagTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "ETag"
-    inputs = [b'"foo"']
-    expected_out = (False, "foo")
-
-
-class WeakETagTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "ETag"
-    inputs = [b'W/"foo"']
-    expected_out = (True, "foo")
-
-
-class UnquotedETagTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "ETag"
-    inputs = [b"foo"]
-    expected_out = (False, "foo")
-    expected_notes: NoteClassListType = [BAD_SYNTAX]
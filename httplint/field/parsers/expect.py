@@ -1,10 +1,8 @@
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     RequestLinterProtocol,
 )
 
@@ -46,32 +44,3 @@ class EXPECT_HTTP_1_0(Note):
     _summary = "The Expect header is not supported in HTTP/1.0."
     _text = """\
 The `Expect` header was added in HTTP/1.1; it has no meaning in HTTP/1.0."""
-
-
-class ExpectTest(FieldTest[RequestLinterProtocol]):
-    name = "Expect"
-    inputs = [b"100-continue"]
-    expected_out = ["100-continue"]
-    expected_notes: NoteClassListType = []
-
-    def test_unknown(self) -> None:
-        self.inputs = [b"foo"]
-        self.expected_out = ["foo"]
-        self.expected_notes = [EXPECT_UNKNOWN]
-        self.setUp()
-        self.test_header()
-
-    def test_multiple_unknown(self) -> None:
-        self.inputs = [b"foo", b"bar"]
-        self.expected_out = ["foo", "bar"]
-        self.expected_notes = [EXPECT_UNKNOWN]
-        self.setUp()
-        self.test_header()
-
-    def test_http_1_0(self) -> None:
-        self.inputs = [b"100-continue"]
-        self.expected_out = ["100-continue"]
-        self.expected_notes = [EXPECT_HTTP_1_0]
-        self.setUp()
-        self.message.version = "1.0"
-        self.test_header()
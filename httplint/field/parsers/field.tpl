@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
 from httplint.types import AddNoteMethodType, ResponseLinterProtocol
 
@@ -30,9 +29,3 @@ class SHORT_NAME_NOTE(Note):
     _text ="""\
 FIXME"""
 
-
-class SHORT_NAMETest(FieldTest[ResponseLinterProtocol]):
-    name = 'SHORT_NAME'
-    inputs = ['FIXME']
-    expected_out = ('FIXME')
-    expected_notes = []
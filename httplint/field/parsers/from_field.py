@@ -1,5 +1,4 @@
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
@@ -18,9 +17,3 @@ requesting user agent."""
 
     def evaluate(self, add_note: AddNoteMethodType) -> None:
         pass
-
-
-class FromTest(FieldTest[RequestLinterProtocol]):
-    name = "From"
-    inputs = [b"webmaster@example.org"]
-    expected_out = "webmaster@example.org"
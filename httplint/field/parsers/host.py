@@ -1,5 +1,4 @@
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
@@ -19,9 +18,3 @@ a single IP address."""
 
     def evaluate(self, add_note: AddNoteMethodType) -> None:
         pass
-
-
-class HostTest(FieldTest[RequestLinterProtocol]):
-    name = "Host"
-    inputs = [b"www.example.org"]
-    expected_out = "www.example.org"
@@ -1,5 +1,4 @@
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
@@ -18,9 +17,3 @@ having a current representation of the target resource."""
 
     def evaluate(self, add_note: AddNoteMethodType) -> None:
         pass
-
-
-class IfMatchTest(FieldTest[RequestLinterProtocol]):
-    name = "If-Match"
-    inputs = [b'"xyzzy", "r2d2xxxx", "c3piozzzz"']
-    expected_out = ['"xyzzy"', '"r2d2xxxx"', '"c3piozzzz"']
@@ -1,5 +1,4 @@
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
@@ -19,9 +18,3 @@ field-value."""
 
     def evaluate(self, add_note: AddNoteMethodType) -> None:
         pass
-
-
-class IfModifiedSinceTest(FieldTest[RequestLinterProtocol]):
-    name = "If-Modified-Since"
-    inputs = [b"Sat, 29 Oct 1994 19:43:31 GMT"]
-    expected_out = "Sat, 29 Oct 1994 19:43:31 GMT"
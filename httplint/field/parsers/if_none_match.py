@@ -1,5 +1,4 @@
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.note import categories
 from httplint.syntax import rfc9110
 from httplint.types import (
@@ -21,9 +20,3 @@ any current representation of the target resource."""
 
     def evaluate(self, add_note: AddNoteMethodType) -> None:
         pass
-
-
-class IfNoneMatchTest(FieldTest[RequestLinterProtocol]):
-    name = "If-None-Match"
-    inputs = [b'W/"xyzzy", W/"r2d2xxxx", W/"c3piozzzz"']
-    expected_out = ['W/"xyzzy"', 'W/"r2d2xxxx"', 'W/"c3piozzzz"']
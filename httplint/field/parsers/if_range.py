@@ -1,5 +1,4 @@
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
 from httplint.note import categories
 from httplint.syntax import rfc9110
 from httplint.types import (
@@ -21,9 +20,3 @@ entire new representation."""
 
     def evaluate(self, add_note: AddNoteMethodType) -> None:
         pass
-
-
-class IfRangeTest(FieldTest[RequestLinterProtocol]):
-    name = "If-Range"
-    inputs = [b'"xyzzy"']
-    expected_out = '"xyzzy"'
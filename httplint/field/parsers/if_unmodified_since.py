@@ -1,5 +1,4 @@
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
 from httplint.note import categories
 from httplint.syntax import rfc9110
 from httplint.types import (
@@ -21,9 +20,3 @@ field-value."""
 
     def evaluate(self, add_note: AddNoteMethodType) -> None:
         pass
-
-
-class IfUnmodifiedSinceTest(FieldTest[RequestLinterProtocol]):
-    name = "If-Unmodified-Since"
-    inputs = [b"Sat, 29 Oct 1994 19:43:31 GMT"]
-    expected_out = "Sat, 29 Oct 1994 19:43:31 GMT"
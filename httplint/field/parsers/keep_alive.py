@@ -1,14 +1,11 @@
 from typing import Optional, Tuple
 
-from httplint.field import FIELD_DEPRECATED
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.field.utils import unquote_string
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
     AnyMessageLinterProtocol,
-    NoteClassListType,
 )
 
 
@@ -35,16 +32,3 @@ It's safe to remove this header if you wish to save a few bytes."""
             attr = field_value
             attr_val = None
         return (attr.lower(), attr_val)
-
-
-class KeepAliveTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Keep-Alive"
-    inputs = [b"timeout=30"]
-    expected_out = [("timeout", "30")]
-    expected_notes: NoteClassListType = [FIELD_DEPRECATED]
-
-
-class EmptyKeepAliveTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Keep-Alive"
-    inputs = [b""]
-    expected_notes: NoteClassListType = [FIELD_DEPRECATED]
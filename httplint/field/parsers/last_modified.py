@@ -1,11 +1,9 @@
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
-from httplint.field.utils import BAD_DATE_SYNTAX, parse_http_date
+from httplint.field.utils import parse_http_date
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ResponseLinterProtocol,
 )
 from httplint.util import relative_time
@@ -59,23 +57,3 @@ The `Last-Modified` header indicates the last point in time that the resource ha
 used in HTTP for validating cached responses, and for calculating heuristic freshness in caches.
 
 This resource last changed %(last_modified_string)s."""
-
-
-class BasicLMTest(FieldTest[ResponseLinterProtocol]):
-    name = "Last-Modified"
-    inputs = [b"Mon, 04 Jul 2011 09:08:06 GMT"]
-    expected_out = 1309770486
-
-
-class BadLMTest(FieldTest[ResponseLinterProtocol]):
-    name = "Last-Modified"
-    inputs = [b"0"]
-    expected_out = None
-    expected_notes: NoteClassListType = [BAD_DATE_SYNTAX]
-
-
-class BlankLMTest(FieldTest[ResponseLinterProtocol]):
-    name = "Last-Modified"
-    inputs = [b""]
-    expected_out = None
-    expected_notes: NoteClassListType = [BAD_DATE_SYNTAX]
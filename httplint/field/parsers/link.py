@@ -2,19 +2,19 @@ import re
 from typing import Tuple
 from urllib.parse import urljoin, urlsplit
 
-from httplint.field import BAD_SYNTAX
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
-from httplint.field.utils import PARAM_REPEATS, parse_params
+from httplint.field.utils import parse_params, pattern_registry
 from httplint.note import MarkdownSafe, Note, categories, levels
 from httplint.syntax import rfc3986, rfc8288, rfc9110
 from httplint.types import (
     AddNoteMethodType,
     AnyMessageLinterProtocol,
-    NoteClassListType,
     ParamDictType,
 )
 
+URI_REFERENCE_PATTERN = rf"^\s*{rfc3986.URI_reference}\s*$"
+MEDIA_TYPE_PATTERN = rf"^\s*{rfc9110.media_type}\s*$"
+
 
 class link(HttpListField[AnyMessageLinterProtocol]):
     canonical_name = "Link"
@@ -40,10 +40,12 @@ statement of the form "[context IRI] has a [relation type] resource at [target I
         if "rev" in param_dict:
             add_note(LINK_REV, link=link_value, rev=str(param_dict["rev"]))
         if "anchor" in param_dict and param_dict["anchor"]:  # URI-Reference
-            if not re.match(rf"^\s*{rfc3986.URI_reference}\s*$", param_dict["anchor"], re.VERBOSE):
+            anchor_re = pattern_registry.compile(URI_REFERENCE_PATTERN, re.VERBOSE)
+            if not anchor_re.match(param_dict["anchor"]):
                 add_note(LINK_BAD_ANCHOR, link=link_value, anchor=param_dict["anchor"])
         if "type" in param_dict and param_dict["type"]:
-            if not re.match(rf"^\s*{rfc9110.media_type}\s*$", param_dict["type"], re.VERBOSE):
+            type_re = pattern_registry.compile(MEDIA_TYPE_PATTERN, re.VERBOSE)
+            if not type_re.match(param_dict["type"]):
                 add_note(LINK_BAD_TYPE, link=link_value, type=param_dict["type"])
         return link_value, param_dict
 
@@ -138,124 +140,3 @@ The `Link` header, defined by [RFC 8288](https://www.rfc-editor.org/rfc/rfc8288#
 `type` parameter to define the media type of the link target.
 
 However, `%(type)s` is not a valid media type."""
-
-
-class BasicLinkTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Link"
-    inputs = [b"<http://www.example.com/>; rel=example"]
-    expected_out = [("http://www.example.com/", {"rel": "example"})]
-
-
-class QuotedLinkTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Link"
-    inputs = [b'"http://www.example.com/"; rel=example']
-    expected_out = [("http://www.example.com/", {"rel": "example"})]
-    expected_notes: NoteClassListType = [BAD_SYNTAX]
-
-
-class QuotedRelationLinkTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Link"
-    inputs = [b'<http://www.example.com/>; rel="example"']
-    expected_out = [("http://www.example.com/", {"rel": "example"})]
-
-
-class RelativeLinkTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Link"
-    inputs = [b'</foo>; rel="example"']
-    expected_out = [("/foo", {"rel": "example"})]
-
-
-class RepeatingRelationLinkTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Link"
-    inputs = [b'</foo>; rel="example"; rel="another"']
-    expected_out = [("/foo", {"rel": "another"})]
-    expected_notes: NoteClassListType = [PARAM_REPEATS]
-
-
-class RevLinkTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Link"
-    inputs = [b'</foo>; rev="bar"']
-    expected_out = [("/foo", {"rev": "bar"})]
-    expected_notes: NoteClassListType = [LINK_REV]
-
-
-class BadAnchorLinkTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Link"
-    inputs = [b'</foo>; rel="bar"; anchor="{blah}"']
-    expected_out = [("/foo", {"rel": "bar", "anchor": "{blah}"})]
-    expected_notes: NoteClassListType = [LINK_BAD_ANCHOR]
-
-
-class BadTypeLinkTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Link"
-    inputs = [b'</foo>; rel="bar"; type="{blah}"']
-    expected_out = [("/foo", {"rel": "bar", "type": "{blah}"})]
-    expected_notes: NoteClassListType = [LINK_BAD_TYPE]
-
-
-class PreloadLinkTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Link"
-    inputs = [b'</main.css>; rel="preload"; as="style"']
-    expected_out = [("/main.css", {"rel": "preload", "as": "style"})]
-    expected_notes: NoteClassListType = [LINK_RESOURCE_HINTS]
-
-
-class PreconnectLinkTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Link"
-    inputs = [b'<https://cdn.example.com>; rel="preconnect"']
-    expected_out = [("https://cdn.example.com", {"rel": "preconnect"})]
-    expected_notes: NoteClassListType = [LINK_RESOURCE_HINTS]
-
-
-class DnsPrefetchLinkTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Link"
-    inputs = [b'<https://cdn.example.com>; rel="dns-prefetch"']
-    expected_out = [("https://cdn.example.com", {"rel": "dns-prefetch"})]
-    expected_notes: NoteClassListType = [LINK_RESOURCE_HINTS]
-
-
-class MultipleHintsLinkTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Link"
-    inputs = [
-        b'</main.css>; rel="preload"; as="style"',
-        b'<https://cdn.example.com>; rel="preconnect"',
-    ]
-    expected_out = [
-        ("/main.css", {"rel": "preload", "as": "style"}),
-        ("https://cdn.example.com", {"rel": "preconnect"}),
-    ]
-    expected_notes: NoteClassListType = [LINK_RESOURCE_HINTS]
-
-
-class CombinedRelHintLinkTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Link"
-    inputs = [b'<https://cdn.example.com>; rel="preconnect dns-prefetch"']
-    expected_out = [("https://cdn.example.com", {"rel": "preconnect dns-prefetch"})]
-    expected_notes: NoteClassListType = [LINK_RESOURCE_HINTS]
-
-
-class NonHintLinkTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Link"
-    inputs = [b'</style.css>; rel="stylesheet"']
-    expected_out = [("/style.css", {"rel": "stylesheet"})]
-    expected_notes: NoteClassListType = []
-
-
-class BadHintTargetLinkTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Link"
-    inputs = [b'<javascript:alert(1)>; rel="preload"']
-    expected_out = [("javascript:alert(1)", {"rel": "preload"})]
-    expected_notes: NoteClassListType = [LINK_BAD_HINT_TARGET]
-
-
-class MixedHintTargetsLinkTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Link"
-    inputs = [
-        b'<https://cdn.example.com>; rel="preconnect"',
-        b'<ftp://example.com/x>; rel="preload"',
-    ]
-    expected_out = [
-        ("https://cdn.example.com", {"rel": "preconnect"}),
-        ("ftp://example.com/x", {"rel": "preload"}),
-    ]
-    expected_notes: NoteClassListType = [LINK_RESOURCE_HINTS, LINK_BAD_HINT_TARGET]
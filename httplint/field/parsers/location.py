@@ -2,7 +2,7 @@ import re
 from urllib.parse import urljoin
 
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
+from httplint.field.utils import pattern_registry
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc3986, rfc9110
 from httplint.types import (
@@ -10,6 +10,8 @@ from httplint.types import (
     ResponseLinterProtocol,
 )
 
+URI_PATTERN = rf"^\s*{rfc3986.URI}\s*$"
+
 
 class location(SingletonField[ResponseLinterProtocol]):
     canonical_name = "Location"
@@ -36,7 +38,7 @@ In `201` (Created) responses, it identifies a newly created resource."""
                 308,
             ]:
                 add_note(LOCATION_UNDEFINED)
-        if not re.match(rf"^\s*{rfc3986.URI}\s*$", field_value, re.VERBOSE):
+        if not pattern_registry.compile(URI_PATTERN, re.VERBOSE).match(field_value):
             add_note(
                 LOCATION_NOT_ABSOLUTE,
                 full_uri=urljoin(self.message.base_uri, field_value),
@@ -69,12 +71,3 @@ class LOCATION_NOT_ABSOLUTE(Note):
 It is in the process of being updated, and most clients will work around this.
 
 The correct absolute URI is (probably): `%(full_uri)s`"""
-
-
-class LocationTest(FieldTest[ResponseLinterProtocol]):
-    name = "Location"
-    inputs = [b"http://other.example.com/foo"]
-    expected_out = "http://other.example.com/foo"
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.status_code = 300
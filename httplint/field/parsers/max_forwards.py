@@ -1,5 +1,4 @@
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FakeRequestLinter, FieldTest
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9110
 from httplint.types import (
@@ -29,41 +28,3 @@ the number of times that the request is forwarded by intermediaries."""
     def evaluate(self, add_note: AddNoteMethodType) -> None:
         if getattr(self.message, "method", None) not in ["TRACE", "OPTIONS"]:
             add_note(MAX_FORWARDS_IGNORED)
-
-
-class MaxForwardsTest(FieldTest[RequestLinterProtocol]):
-    name = "Max-Forwards"
-    inputs = [b"5"]
-    expected_out = "5"
-
-    def setUp(self) -> None:
-        self.message = FakeRequestLinter()
-        self.message.method = "TRACE"
-        self.set_context(self.message)
-
-    def test_trace_method(self) -> None:
-        assert isinstance(self.message, FakeRequestLinter)
-        self.message.method = "TRACE"
-        self.inputs = [b"5"]
-        self.expected_out = "5"
-        self.expected_notes = []
-        self.setUp()
-        self.test_header()
-
-    def test_options_method(self) -> None:
-        assert isinstance(self.message, FakeRequestLinter)
-        self.message.method = "OPTIONS"
-        self.inputs = [b"5"]
-        self.expected_out = "5"
-        self.expected_notes = []
-        self.setUp()
-        self.test_header()
-
-    def test_get_method(self) -> None:
-        self.inputs = [b"5"]
-        self.expected_out = "5"
-        self.expected_notes = [MAX_FORWARDS_IGNORED]
-        self.setUp()
-        assert isinstance(self.message, FakeRequestLinter)
-        self.message.method = "GET"
-        self.test_header()
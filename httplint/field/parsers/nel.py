@@ -1,13 +1,10 @@
 from typing import Any, List, Set
 from urllib.parse import urljoin, urlsplit
 
-from httplint.field.json_field import BAD_JSON, JsonField
-from httplint.field.parsers.reporting_endpoints import ENDPOINT_NOT_SECURE
-from httplint.field.tests import FieldTest
+from httplint.field.json_field import JsonField
 from httplint.note import Note, categories, levels
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ResponseLinterProtocol,
 )
 
@@ -34,6 +31,7 @@ The `NEL` header field configures Network Error Logging policies.
 It allows websites to declare that they want to receive reports about network errors."""
     reference = "https://w3c.github.io/network-error-logging/#nel-header-field"
     deprecated = False
+    always_evaluate = True  # post_check uses _clean_policies
 
     def __init__(self, wire_name: str, message: ResponseLinterProtocol) -> None:
         super().__init__(wire_name, message)
@@ -191,98 +189,3 @@ class NEL_REPORT_TO_MISSING(Note):
 The `report_to` member in the [Network Error Logging](https://w3c.github.io/network-error-logging/)
 policy specifies a reporting endpoint, but no matching endpoint refers to it in the
 `Reporting-Endpoints` header."""
-
-
-class NelTest(FieldTest[ResponseLinterProtocol]):
-    name = "NEL"
-    inputs = [
-        b'{"report_to": "group1", "max_age": 2592000, "include_subdomains": true, '
-        b'"success_fraction": 0.5}'
-    ]
-    expected_out = [
-        {
-            "report_to": "group1",
-            "max_age": 2592000,
-            "include_subdomains": True,
-            "success_fraction": 0.5,
-        }
-    ]
-    expected_notes: NoteClassListType = [NEL_CONFIGURED]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.headers.process([(b"Reporting-Endpoints", b'group1="https://example.com/reports"')])
-
-
-class NelMultiLineTest(FieldTest[ResponseLinterProtocol]):
-    name = "NEL"
-    inputs = [
-        b'{"report_to": "group1", "max_age": 2592000}',
-        b'{"report_to": "group2", "max_age": 3600}',
-    ]
-    expected_out = [
-        {"report_to": "group1", "max_age": 2592000},
-        {"report_to": "group2", "max_age": 3600},
-    ]
-    expected_notes: NoteClassListType = [NEL_CONFIGURED]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.headers.process(
-            [
-                (
-                    b"Reporting-Endpoints",
-                    b'group1="https://example.com/1", group2="https://example.com/2"',
-                )
-            ]
-        )
-
-
-class NelMissingReportToTest(FieldTest[ResponseLinterProtocol]):
-    name = "NEL"
-    inputs = [b'{"max_age": 100}']
-    expected_out = [{"max_age": 100}]
-    expected_notes: NoteClassListType = [NEL_MISSING_KEY]
-
-
-class NelBadFractionTest(FieldTest[ResponseLinterProtocol]):
-    name = "NEL"
-    inputs = [b'{"report_to": "a", "max_age": 1, "success_fraction": 1.5}']
-    expected_out = [{"report_to": "a", "max_age": 1, "success_fraction": 1.5}]
-    expected_notes: NoteClassListType = [NEL_BAD_VALUE]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.headers.process([(b"Reporting-Endpoints", b'a="https://example.com/reports"')])
-
-
-class NelBadJsonTest(FieldTest[ResponseLinterProtocol]):
-    name = "NEL"
-    inputs = [b"{unquoted: key}"]
-    expected_out = None
-    expected_out = None
-    expected_notes: NoteClassListType = [BAD_JSON]
-
-
-class NelReportToTest(FieldTest[ResponseLinterProtocol]):
-    name = "NEL"
-    inputs = [b'{"report_to": "group1", "max_age": 100}']
-    expected_out = [{"report_to": "group1", "max_age": 100}]
-    expected_notes: NoteClassListType = [NEL_CONFIGURED]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.headers.process([(b"Reporting-Endpoints", b'group1="https://example.com/reports"')])
-
-
-class NelReportToMissingTest(FieldTest[ResponseLinterProtocol]):
-    name = "NEL"
-    inputs = [b'{"report_to": "group1", "max_age": 100}']
-    expected_out = [{"report_to": "group1", "max_age": 100}]
-    expected_notes: NoteClassListType = [NEL_REPORT_TO_MISSING]
-
-
-class NelReportToInsecureTest(FieldTest[ResponseLinterProtocol]):
-    name = "NEL"
-    inputs = [b'{"report_to": "group1", "max_age": 100}']
-    expected_out = [{"report_to": "group1", "max_age": 100}]
-    expected_notes: NoteClassListType = [ENDPOINT_NOT_SECURE]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.headers.process([(b"Reporting-Endpoints", b'group1="http://example.com/reports"')])
@@ -3,12 +3,10 @@ from dataclasses import dataclass
 from typing import Union
 
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc3986
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     RequestLinterProtocol,
 )
 
@@ -73,29 +71,3 @@ class ORIGIN_MULTIPLE_VALUES(Note):
     _text = """\
 The `Origin` header should only contain a single value. Any values after the first
 will be ignored."""
-
-
-class OriginBasicTest(FieldTest[RequestLinterProtocol]):
-    name = "Origin"
-    inputs = [b"https://example.com"]
-    expected_out: Union[None, OriginValue] = OriginValue("https", "example.com", None)
-
-
-class OriginNullTest(FieldTest[RequestLinterProtocol]):
-    name = "Origin"
-    inputs = [b"null"]
-    expected_out = None
-
-
-class OriginMultipleTest(FieldTest[RequestLinterProtocol]):
-    name = "Origin"
-    inputs = [b"https://example.com http://example.org:8080"]
-    expected_out = OriginValue("https", "example.com", None)
-    expected_notes: NoteClassListType = [ORIGIN_MULTIPLE_VALUES]
-
-
-class OriginBadSyntaxTest(FieldTest[RequestLinterProtocol]):
-    name = "Origin"
-    inputs = [b"https://example.com/foo"]
-    expected_notes: NoteClassListType = [BAD_ORIGIN_SYNTAX]
-    expected_out = None
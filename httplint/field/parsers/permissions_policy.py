@@ -1,11 +1,9 @@
 from http_sf import Token
 
 from httplint.field.structured_field import StructuredField
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ResponseLinterProtocol,
     SFDictionaryType,
 )
@@ -136,34 +134,3 @@ SENSITIVE_FEATURES = [
     "gyroscope",
     "screen-wake-lock",
 ]
-
-
-class PermissionsPolicyTest(FieldTest[ResponseLinterProtocol]):
-    name = "Permissions-Policy"
-    inputs = [b"geolocation=(), camera=self"]
-    expected_out = {"geolocation": ([], {}), "camera": (Token("self"), {})}
-    expected_notes: NoteClassListType = [
-        PERMISSIONS_POLICY_INVALID_VALUE,
-        PERMISSIONS_POLICY_PRESENT,
-    ]
-
-
-class PermissionsPolicyWildcardTest(FieldTest[ResponseLinterProtocol]):
-    name = "Permissions-Policy"
-    inputs = [b"geolocation=*, camera=()"]
-    expected_out = {"geolocation": (Token("*"), {}), "camera": ([], {})}
-    expected_notes: NoteClassListType = [PERMISSIONS_POLICY_WILDCARD, PERMISSIONS_POLICY_PRESENT]
-
-
-class PermissionsPolicyInvalidTest(FieldTest[ResponseLinterProtocol]):
-    name = "Permissions-Policy"
-    inputs = [b'geolocation=("self"), camera=(none)']
-    expected_out = {
-        "geolocation": ([("self", {})], {}),
-        "camera": ([(Token("none"), {})], {}),
-    }
-    expected_notes: NoteClassListType = [
-        PERMISSIONS_POLICY_QUOTED_KEYWORD,
-        PERMISSIONS_POLICY_UNKNOWN_TOKEN,
-        PERMISSIONS_POLICY_PRESENT,
-    ]
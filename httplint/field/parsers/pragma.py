@@ -1,11 +1,8 @@
-from httplint.field import FIELD_DEPRECATED
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9111
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     RequestLinterProtocol,
 )
 
@@ -36,10 +33,3 @@ class PRAGMA_OTHER(Note):
     level = levels.WARN
     _summary = """The Pragma header is being used in an undefined way."""
     _text = """HTTP only defines `Pragma: no-cache`; other uses of this header are deprecated."""
-
-
-class PragmaTest(FieldTest[RequestLinterProtocol]):
-    name = "Pragma"
-    inputs = [b"no-cache"]
-    expected_out = ["no-cache"]
-    expected_notes: NoteClassListType = [FIELD_DEPRECATED]
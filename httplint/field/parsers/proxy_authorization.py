@@ -1,5 +1,4 @@
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
 from httplint.syntax import rfc9110
 from httplint.types import AddNoteMethodType, RequestLinterProtocol
 
@@ -15,9 +14,3 @@ The `Proxy-Authorization` header field allows a user agent to authenticate itsel
 
     def evaluate(self, add_note: AddNoteMethodType) -> None:
         pass
-
-
-class ProxyAuthorizationTest(FieldTest[RequestLinterProtocol]):
-    name = "Proxy-Authorization"
-    inputs = [b"Basic QWxhZGRpbjpvcGVuIHNlc2FtZQ=="]
-    expected_out = "Basic QWxhZGRpbjpvcGVuIHNlc2FtZQ=="
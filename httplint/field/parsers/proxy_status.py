@@ -4,12 +4,10 @@ from typing import Any, Dict
 from http_sf import Token
 
 from httplint.field.structured_field import StructuredField
-from httplint.field.tests import FieldTest
 from httplint.field.utils import check_sf_params
 from httplint.note import Note, categories, levels
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ResponseLinterProtocol,
     SFListType,
 )
@@ -137,30 +135,3 @@ class PROXY_STATUS_BAD_PARAM_VAL(Note):
     _text = """\
 The value `%(value)s` is not defined for the `%(param)s` parameter.
 """
-
-
-class ProxyStatusTest(FieldTest[ResponseLinterProtocol]):
-    name = "Proxy-Status"
-    inputs = [
-        b"ExampleProxy; error=http_protocol_error",
-        b"AnotherProxy; next-hop=example.com",
-    ]
-    expected_out = [
-        (Token("ExampleProxy"), {"error": Token("http_protocol_error")}),
-        (Token("AnotherProxy"), {"next-hop": "example.com"}),
-    ]
-    expected_notes: NoteClassListType = [PROXY_STATUS]
-
-
-class ProxyStatusUnknownParamTest(FieldTest[ResponseLinterProtocol]):
-    name = "Proxy-Status"
-    inputs = [b"ExampleProxy; unknown=1"]
-    expected_out = [(Token("ExampleProxy"), {"unknown": 1})]
-    expected_notes: NoteClassListType = [PROXY_STATUS_UNKNOWN_PARAM, PROXY_STATUS]
-
-
-class ProxyStatusBadParamValTest(FieldTest[ResponseLinterProtocol]):
-    name = "Proxy-Status"
-    inputs = [b'ExampleProxy; error="string"']
-    expected_out = [(Token("ExampleProxy"), {"error": "string"})]
-    expected_notes: NoteClassListType = [PROXY_STATUS_BAD_PARAM_VAL, PROXY_STATUS]
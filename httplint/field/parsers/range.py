@@ -2,10 +2,9 @@ from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9110
-from httplint.types import AddNoteMethodType, NoteClassListType, RequestLinterProtocol
+from httplint.types import AddNoteMethodType, RequestLinterProtocol
 
 
 @dataclass
@@ -108,48 +107,3 @@ class RANGE_BAD_SYNTAX(Note):
 The value for this field doesn't conform to its specified syntax; %(problem)s.
 
 See [its definition](%(ref_uri)s) for more information."""
-
-
-class RangeTest(FieldTest[RequestLinterProtocol]):
-    name = "Range"
-    inputs = [b"bytes=0-499"]
-    expected_out = RangeValue("bytes", [(0, 499)])
-
-
-class RangeMultiTest(FieldTest[RequestLinterProtocol]):
-    name = "Range"
-    inputs = [b"bytes=0-499, 500-"]
-    expected_out = RangeValue("bytes", [(0, 499), (500, None)])
-
-
-class RangeSuffixTest(FieldTest[RequestLinterProtocol]):
-    name = "Range"
-    inputs = [b"bytes=-500"]
-    expected_out = RangeValue("bytes", [(None, 500)])
-
-
-class RangeInvalidTest(FieldTest[RequestLinterProtocol]):
-    name = "Range"
-    inputs = [b"bytes=0-0, -1"]
-    expected_out = RangeValue("bytes", [(0, 0), (None, 1)])
-
-
-class RangeInvalidOrderTest(FieldTest[RequestLinterProtocol]):
-    name = "Range"
-    inputs = [b"bytes=500-100"]
-    expected_out = RangeValue("bytes", [(500, 100)])
-    expected_notes: NoteClassListType = [RANGE_INVALID]
-
-
-class RangeSyntaxErrorTest(FieldTest[RequestLinterProtocol]):
-    name = "Range"
-    inputs = [b"bytes=a-b"]
-    expected_out = None
-    expected_notes: NoteClassListType = [RANGE_BAD_SYNTAX]
-
-
-class RangeNoSplitTest(FieldTest[RequestLinterProtocol]):
-    name = "Range"
-    inputs = [b"bytes"]
-    expected_out = None
-    expected_notes: NoteClassListType = [RANGE_BAD_SYNTAX]
@@ -1,7 +1,6 @@
 from urllib.parse import urlparse
 
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9110
 from httplint.types import (
@@ -69,9 +68,3 @@ referring resource, unless the referring resource explicitly allows Referer to b
 
 See [RFC 9110 Section 10.1.3](https://www.rfc-editor.org/rfc/rfc9110.html#section-10.1.3)
 for details."""
-
-
-class RefererTest(FieldTest[RequestLinterProtocol]):
-    name = "Referer"
-    inputs = [b"http://www.example.org/hypertext/Overview.html"]
-    expected_out = "http://www.example.org/hypertext/Overview.html"
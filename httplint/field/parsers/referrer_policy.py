@@ -1,8 +1,7 @@
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9110
-from httplint.types import AddNoteMethodType, NoteClassListType, ResponseLinterProtocol
+from httplint.types import AddNoteMethodType, ResponseLinterProtocol
 
 
 class referrer_policy(HttpListField[ResponseLinterProtocol]):
@@ -105,31 +104,3 @@ VALID_REFERRER_POLICIES = [
     "strict-origin-when-cross-origin",
     "unsafe-url",
 ]
-
-
-class ReferrerPolicyTest(FieldTest[ResponseLinterProtocol]):
-    name = "Referrer-Policy"
-    inputs = [b"no-referrer", b"unsafe-url"]
-    expected_out = ["no-referrer", "unsafe-url"]
-    expected_notes: NoteClassListType = [REFERRER_POLICY_UNSAFE, REFERRER_POLICY_MULTIPLE]
-
-
-class ReferrerPolicyStrictTest(FieldTest[ResponseLinterProtocol]):
-    name = "Referrer-Policy"
-    inputs = [b"strict-origin-when-cross-origin"]
-    expected_out = ["strict-origin-when-cross-origin"]
-    expected_notes: NoteClassListType = [REFERRER_POLICY_STRICT]
-
-
-class ReferrerPolicyUnknownTest(FieldTest[ResponseLinterProtocol]):
-    name = "Referrer-Policy"
-    inputs = [b"unknown-value"]
-    expected_out = ["unknown-value"]
-    expected_notes: NoteClassListType = [REFERRER_POLICY_UNKNOWN, REFERRER_POLICY_EMPTY]
-
-
-class ReferrerPolicyOverrideTest(FieldTest[ResponseLinterProtocol]):
-    name = "Referrer-Policy"
-    inputs = [b"unsafe-url, no-referrer"]
-    expected_out = ["unsafe-url", "no-referrer"]
-    expected_notes: NoteClassListType = [REFERRER_POLICY_MULTIPLE, REFERRER_POLICY_STRICT]
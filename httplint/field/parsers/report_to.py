@@ -1,8 +1,6 @@
-from httplint.field import FIELD_DEPRECATED
-from httplint.field.json_field import BAD_JSON, JsonField
-from httplint.field.tests import FieldTest
+from httplint.field.json_field import JsonField
 from httplint.note import Note, categories, levels
-from httplint.types import AddNoteMethodType, NoteClassListType, ResponseLinterProtocol
+from httplint.types import AddNoteMethodType, ResponseLinterProtocol
 
 
 class report_to(JsonField[ResponseLinterProtocol]):
@@ -70,37 +68,3 @@ class REPORT_TO_BAD_TYPE(Note):
     _summary = "The Report-To header has an invalid type for '%(key)s'."
     _text = """\
 The `%(key)s` key must be of type %(expected)s."""
-
-
-class ReportToTest(FieldTest[ResponseLinterProtocol]):
-    name = "Report-To"
-    inputs = [b'{"max_age": 10886400, "endpoints": [{"url": "https://example.com/reports"}]}']
-    expected_out = [{"max_age": 10886400, "endpoints": [{"url": "https://example.com/reports"}]}]
-    expected_notes: NoteClassListType = [FIELD_DEPRECATED]
-
-
-class ReportToMultiLineTest(FieldTest[ResponseLinterProtocol]):
-    name = "Report-To"
-    inputs = [
-        b'{"group": "a", "max_age": 1, "endpoints": [{"url": "https://a.com"}]}',
-        b'{"group": "b", "max_age": 2, "endpoints": [{"url": "https://b.com"}]}',
-    ]
-    expected_out = [
-        {"group": "a", "max_age": 1, "endpoints": [{"url": "https://a.com"}]},
-        {"group": "b", "max_age": 2, "endpoints": [{"url": "https://b.com"}]},
-    ]
-    expected_notes: NoteClassListType = [FIELD_DEPRECATED]
-
-
-class ReportToMissingMaxAgeTest(FieldTest[ResponseLinterProtocol]):
-    name = "Report-To"
-    inputs = [b'{"endpoints": [{"url": "https://a.com"}]}']
-    expected_out = [{"endpoints": [{"url": "https://a.com"}]}]
-    expected_notes: NoteClassListType = [FIELD_DEPRECATED, REPORT_TO_MISSING_KEY]
-
-
-class ReportToBadJsonTest(FieldTest[ResponseLinterProtocol]):
-    name = "Report-To"
-    inputs = [b'{unquoted: "keys"}']
-    expected_out = None
-    expected_notes: NoteClassListType = [FIELD_DEPRECATED, BAD_JSON]
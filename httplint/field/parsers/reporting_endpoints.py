@@ -1,12 +1,9 @@
-from typing import Any
 from urllib.parse import urljoin, urlsplit
 
 from httplint.field.structured_field import StructuredField
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ResponseLinterProtocol,
     SFDictionaryType,
 )
@@ -56,43 +53,3 @@ class BAD_REPORTING_ENDPOINT_SYNTAX(Note):
     _text = """\
 The reporting endpoint `%(name)s` must be a string URL.
 Found: `%(value)s` (type `%(found_type)s`)."""
-
-
-class ReportingEndpointsTest(FieldTest[ResponseLinterProtocol]):
-    name = "Reporting-Endpoints"
-    inputs = [b'endpoint="https://example.com/reports"']
-    expected_out: Any = {"endpoint": ("https://example.com/reports", {})}
-
-
-class ReportingEndpointsInsecureTest(FieldTest[ResponseLinterProtocol]):
-    name = "Reporting-Endpoints"
-    inputs = [b'endpoint="http://example.com/reports"']
-    expected_out: Any = {"endpoint": ("http://example.com/reports", {})}
-    expected_notes: NoteClassListType = [ENDPOINT_NOT_SECURE]
-
-
-class ReportingEndpointsBadSyntaxTest(FieldTest[ResponseLinterProtocol]):
-    name = "Reporting-Endpoints"
-    inputs = [b"endpoint=123"]
-    expected_out: Any = {"endpoint": (123, {})}
-    expected_notes: NoteClassListType = [BAD_REPORTING_ENDPOINT_SYNTAX]
-
-
-class ReportingEndpointsRelativeTest(FieldTest[ResponseLinterProtocol]):
-    name = "Reporting-Endpoints"
-    inputs = [b'endpoint="/reports"']
-    expected_out: Any = {"endpoint": ("/reports", {})}
-    expected_notes: NoteClassListType = []
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.base_uri = "https://example.com/"
-
-
-class ReportingEndpointsInsecureBaseTest(FieldTest[ResponseLinterProtocol]):
-    name = "Reporting-Endpoints"
-    inputs = [b'endpoint="/reports"']
-    expected_out: Any = {"endpoint": ("/reports", {})}
-    expected_notes: NoteClassListType = [ENDPOINT_NOT_SECURE]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.base_uri = "http://example.com/"
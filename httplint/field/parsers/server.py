@@ -1,8 +1,7 @@
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9110
-from httplint.types import AddNoteMethodType, NoteClassListType, ResponseLinterProtocol
+from httplint.types import AddNoteMethodType, ResponseLinterProtocol
 
 MAX_SERVER_LENGTH = 64
 
@@ -26,13 +25,6 @@ handle the request."""
         return field_value
 
 
-class ServerTest(FieldTest[ResponseLinterProtocol]):
-    name = "Server"
-    inputs = [b"Apache/2.4.1 (Unix)", b"CERN/3.0 libwww/2.17"]
-    expected_out = ["Apache/2.4.1 (Unix)", "CERN/3.0 libwww/2.17"]
-    expected_notes: NoteClassListType = []
-
-
 class SERVER_TOO_LONG(Note):
     category = categories.GENERAL
     level = levels.INFO
@@ -42,10 +34,3 @@ The `Server` header is %(server_length)s long, which uses unnecessary bandwidth
 and can expose details of the back-end system to attackers.
 
 Consider shortening it."""
-
-
-class ServerTooLongTest(FieldTest[ResponseLinterProtocol]):
-    name = "Server"
-    inputs = [b"a" * (MAX_SERVER_LENGTH + 1)]
-    expected_out = ["a" * (MAX_SERVER_LENGTH + 1)]
-    expected_notes: NoteClassListType = [SERVER_TOO_LONG]
@@ -1,13 +1,11 @@
 from typing import Tuple
 
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.field.utils import parse_params
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ParamDictType,
     ResponseLinterProtocol,
 )
@@ -88,34 +86,3 @@ The `%(metric)s` metric in the Server-Timing header is missing the `desc` (descr
 
 Descriptions can help contextualise a metric when displayed.
 """
-
-
-class ServerTimingTest(FieldTest[ResponseLinterProtocol]):
-    name = "Server-Timing"
-    inputs = [b"miss, db;dur=53, app;dur=47.2"]
-    expected_out = [("miss", {}), ("db", {"dur": "53"}), ("app", {"dur": "47.2"})]
-    expected_notes: NoteClassListType = [
-        SERVER_TIMING_MISSING_DUR,
-        SERVER_TIMING_MISSING_DESC,  # miss
-        SERVER_TIMING_MISSING_DESC,  # db
-        SERVER_TIMING_MISSING_DESC,  # app
-    ]
-
-
-class ServerTimingDescTest(FieldTest[ResponseLinterProtocol]):
-    name = "Server-Timing"
-    inputs = [b'cache;desc="Cache Read", db;dur=50;desc="Database"']
-    expected_out = [
-        ("cache", {"desc": "Cache Read"}),
-        ("db", {"dur": "50", "desc": "Database"}),
-    ]
-    expected_notes: NoteClassListType = [
-        SERVER_TIMING_MISSING_DUR,  # cache
-    ]
-
-
-class ServerTimingBadDurTest(FieldTest[ResponseLinterProtocol]):
-    name = "Server-Timing"
-    inputs = [b"db;dur=foo"]
-    expected_out = [("db", {"dur": "foo"})]
-    expected_notes: NoteClassListType = [SERVER_TIMING_BAD_PARAM, SERVER_TIMING_MISSING_DESC]
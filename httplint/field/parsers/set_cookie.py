@@ -5,12 +5,10 @@ from urllib.parse import urlsplit
 
 from httplint.field import RFC6265
 from httplint.field.broken_field import BrokenField
-from httplint.field.tests import FieldTest
 from httplint.note import MarkdownSafe, Note, categories, levels
 from httplint.types import (
     AddNoteMethodType,
     DeferredNoteType,
-    NoteClassListType,
     ResponseLinterProtocol,
 )
 from httplint.util import relative_time
@@ -546,13 +544,6 @@ This `Set-Cookie` value is %(set_cookie_value_length)s long.
 """
 
 
-class ValueTooLargeSCTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"foo=" + b"a" * (MAX_SET_COOKIE_VALUE_LENGTH + 1)]
-    expected_out = [("foo", "a" * (MAX_SET_COOKIE_VALUE_LENGTH + 1), [])]
-    expected_notes: NoteClassListType = [SET_COOKIE_VALUE_TOO_LARGE]
-
-
 class SET_COOKIE_LIFETIME_TOO_LONG(Note):
     category = categories.COOKIES
     level = levels.WARN
@@ -626,202 +617,3 @@ The following cookies are set more than once in this response: `%(cookie_names)s
 
 Browsers will likely accept all of them, but the order of application
 may vary or be confusing."""
-
-
-class BasicSCTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"SID=31d4d96e407aad42"]
-    expected_out = [("SID", "31d4d96e407aad42", [])]
-
-
-class ParameterSCTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"SID=31d4d96e407aad42; Path=/; Domain=example.com"]
-    expected_out = [("SID", "31d4d96e407aad42", [("Path", "/"), ("Domain", "example.com")])]
-
-
-class TwoSCTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [
-        b"SID=31d4d96e407aad42; Path=/; Secure; HttpOnly",
-        b"lang=en-US; Path=/; Domain=example.com",
-    ]
-    expected_out = [
-        ("SID", "31d4d96e407aad42", [("Path", "/"), ("Secure", ""), ("HttpOnly", "")]),
-        ("lang", "en-US", [("Path", "/"), ("Domain", "example.com")]),
-    ]
-
-
-class ExpiresScTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"lang=en-US; Expires=Wed, 09 Jun 2021 10:18:14 GMT"]
-    expected_out = [("lang", "en-US", [("Expires", 1623233894)])]
-
-
-class ExpiresSingleScTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"lang=en-US; Expires=Wed, 9 Jun 2021 10:18:14 GMT"]
-    expected_out = [("lang", "en-US", [("Expires", 1623233894)])]
-
-
-class MaxAgeScTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"lang=en-US; Max-Age=123"]
-    expected_out = [("lang", "en-US", [("Max-Age", 123)])]
-
-
-class MaxAgeLeadingZeroScTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"lang=en-US; Max-Age=0123"]
-    expected_out = [("lang", "en-US", [("Max-Age", 123)])]
-    expected_notes: NoteClassListType = [SET_COOKIE_LEADING_ZERO_MAX_AGE]
-
-
-class RemoveSCTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"lang=; Expires=Sun, 06 Nov 1994 08:49:37 GMT"]
-    expected_out = [("lang", "", [("Expires", 784111777)])]
-
-
-class WolframSCTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"WR_SID=50.56.234.188.1398; path=/; max-age=315360000; " b"domain=.wolframalpha.com"]
-    expected_out = [
-        (
-            "WR_SID",
-            "50.56.234.188.1398",
-            [
-                ("Path", "/"),
-                ("Max-Age", 315360000),
-                ("Domain", "wolframalpha.com"),
-            ],
-        )
-    ]
-    expected_notes: NoteClassListType = [SET_COOKIE_LIFETIME_TOO_LONG]
-
-
-class PartitionedSCTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"SID=31d4d96e407aad42; Partitioned; Secure"]
-    expected_out = [("SID", "31d4d96e407aad42", [("Partitioned", ""), ("Secure", "")])]
-
-
-class PartitionedNoSecureSCTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"SID=31d4d96e407aad42; Partitioned"]
-    expected_out = [("SID", "31d4d96e407aad42", [("Partitioned", "")])]
-    expected_notes: NoteClassListType = [SET_COOKIE_PARTITIONED_NO_SECURE]
-
-
-class NamelessSCTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"foo; Path=/"]
-    expected_out = [("", "foo", [("Path", "/")])]
-
-
-class TooLargeSCTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"foo=" + b"a" * 4094]
-    expected_out = [("foo", "a" * 4094, [])]
-    expected_notes: NoteClassListType = [SET_COOKIE_TOO_LARGE, SET_COOKIE_VALUE_TOO_LARGE]
-
-
-class SecurePrefixSCTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"__Secure-ID=123; Secure; Path=/"]
-    expected_out = [("__Secure-ID", "123", [("Secure", ""), ("Path", "/")])]
-
-
-class SecurePrefixMissingSecureSCTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"__Secure-ID=123; Path=/"]
-    expected_out = [("__Secure-ID", "123", [("Path", "/")])]
-    expected_notes: NoteClassListType = [SET_COOKIE_PREFIX_SECURE_MISSING]
-
-
-class HostPrefixSCTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"__Host-ID=123; Secure; Path=/"]
-    expected_out = [("__Host-ID", "123", [("Secure", ""), ("Path", "/")])]
-
-
-class HostPrefixMissingSecureSCTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"__Host-ID=123; Path=/"]
-    expected_out = [("__Host-ID", "123", [("Path", "/")])]
-    expected_notes: NoteClassListType = [SET_COOKIE_PREFIX_SECURE_MISSING]
-
-
-class HostPrefixBadPathSCTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"__Host-ID=123; Secure; Path=/foo"]
-    expected_out = [("__Host-ID", "123", [("Secure", ""), ("Path", "/foo")])]
-    expected_notes: NoteClassListType = [SET_COOKIE_PREFIX_HOST_BAD_PATH]
-
-
-class HostPrefixBadDomainSCTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"__Host-ID=123; Secure; Path=/; Domain=example.com"]
-    expected_out = [
-        ("__Host-ID", "123", [("Secure", ""), ("Path", "/"), ("Domain", "example.com")])
-    ]
-    expected_notes: NoteClassListType = [SET_COOKIE_PREFIX_HOST_BAD_DOMAIN]
-
-
-class LifetimeTooLongMaxAgeSCTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"lang=en-US; Max-Age=34560001"]
-    expected_out = [("lang", "en-US", [("Max-Age", 34560001)])]
-    expected_notes: NoteClassListType = [SET_COOKIE_LIFETIME_TOO_LONG]
-
-
-class LifetimeTooLongBothSCTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"lang=en-US; Max-Age=34560001; Expires=Wed, 09 Jun 2021 10:18:14 GMT"]
-    expected_out = [("lang", "en-US", [("Max-Age", 34560001), ("Expires", 1623233894)])]
-    expected_notes: NoteClassListType = [SET_COOKIE_LIFETIME_TOO_LONG]
-
-
-class SetCookieAttributeDupTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"a=b; Path=/; Path=/foo"]
-    expected_out = [("a", "b", [("Path", "/"), ("Path", "/foo")])]
-    expected_notes: NoteClassListType = [SET_COOKIE_ATTRIBUTE_DUP]
-
-
-class SetCookieNameDupTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"a=1; Path=/", b"a=2; Path=/"]
-    expected_out = [("a", "1", [("Path", "/")]), ("a", "2", [("Path", "/")])]
-    expected_notes: NoteClassListType = [SET_COOKIE_NAME_DUP]
-
-
-class SetCookiePriorityTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"a=1; Priority=High"]
-    expected_out = [("a", "1", [])]
-    expected_notes: NoteClassListType = [SET_COOKIE_PRIORITY]
-
-
-class HardenedSCTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"SID=abc; Secure; HttpOnly; SameSite=Lax"]
-    expected_out = [
-        ("SID", "abc", [("Secure", ""), ("HttpOnly", ""), ("SameSite", "Lax")]),
-    ]
-    expected_notes: NoteClassListType = [SET_COOKIE_HARDENED]
-
-
-class HardenedSameSiteNoneSCTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"SID=abc; Secure; HttpOnly; SameSite=None"]
-    expected_out = [
-        ("SID", "abc", [("Secure", ""), ("HttpOnly", ""), ("SameSite", "None")]),
-    ]
-
-
-class SetCookieVersionTest(FieldTest[ResponseLinterProtocol]):
-    name = "Set-Cookie"
-    inputs = [b"a=1; Version=1"]
-    expected_out = [("a", "1", [])]
-    expected_notes: NoteClassListType = [SET_COOKIE_VERSION]
@@ -1,13 +1,11 @@
 from typing import Any
 
-from httplint.field.singleton_field import SINGLE_HEADER_REPEAT, SingletonField
-from httplint.field.tests import FieldTest
+from httplint.field.singleton_field import SingletonField
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
     NoteArgsType,
-    NoteClassListType,
     ResponseLinterProtocol,
 )
 
@@ -134,10 +132,8 @@ browsers that it should only be communicated with using HTTPS, instead of using
                 is_valid = False
                 break
 
-        for note in self.message.notes:
-            if isinstance(note, invalidating_notes):
-                is_valid = False
-                break
+        if self.message.notes.find(invalidating_notes) is not None:
+            is_valid = False
 
         if is_valid:
             parent = add_note(HSTS_VALID)
@@ -299,183 +295,3 @@ class HSTS_VALUE_NOT_ALLOWED(Note):
     _text = """\
 The `%(directive)s` directive in the `Strict-Transport-Security` header is a valueless
 directive. It should not have an associated value."""
-
-
-class HSTSTest(FieldTest[ResponseLinterProtocol]):
-    name = "Strict-Transport-Security"
-    inputs = [b"max-age=31536000; includeSubDomains"]
-    expected_out = {"max-age": 31536000, "includesubdomains": True, "preload": False}
-    expected_notes: NoteClassListType = [HSTS_SUBDOMAINS, HSTS_NO_PRELOAD, HSTS_VALID]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.base_uri = "https://www.example.com/"
-
-
-class HSTSValidTest(FieldTest[ResponseLinterProtocol]):
-    name = "Strict-Transport-Security"
-    inputs = [b"max-age=31536000; includeSubDomains; preload"]
-    expected_out = {"max-age": 31536000, "includesubdomains": True, "preload": True}
-    expected_notes: NoteClassListType = [HSTS_SUBDOMAINS, HSTS_PRELOAD, HSTS_VALID]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.base_uri = "https://www.example.com/"
-
-
-class HSTSHttpTest(FieldTest[ResponseLinterProtocol]):
-    name = "Strict-Transport-Security"
-    inputs = [b"max-age=31536000"]
-    expected_out = {"max-age": 31536000, "includesubdomains": False, "preload": False}
-    expected_notes: NoteClassListType = [
-        HSTS_OVER_HTTP,
-        HSTS_NO_SUBDOMAINS,
-        HSTS_NO_PRELOAD,
-        HSTS_INVALID,
-    ]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.base_uri = "http://www.example.com/"
-
-
-class HSTSDuplicateTest(FieldTest[ResponseLinterProtocol]):
-    name = "Strict-Transport-Security"
-    inputs = [b"max-age=31536000; max-age=100"]
-    expected_out = {"max-age": 31536000, "includesubdomains": False, "preload": False}
-    expected_notes: NoteClassListType = [
-        HSTS_DUPLICATE_DIRECTIVE,
-        HSTS_NO_SUBDOMAINS,
-        HSTS_NO_PRELOAD,
-        HSTS_INVALID,
-    ]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.base_uri = "https://www.example.com/"
-
-
-class HSTSTripleDuplicateTest(FieldTest[ResponseLinterProtocol]):
-    name = "Strict-Transport-Security"
-    inputs = [b"max-age=31536000; max-age=100; max-age=200"]
-    expected_out = {"max-age": 31536000, "includesubdomains": False, "preload": False}
-    expected_notes: NoteClassListType = [
-        HSTS_DUPLICATE_DIRECTIVE,
-        HSTS_NO_SUBDOMAINS,
-        HSTS_NO_PRELOAD,
-        HSTS_INVALID,
-    ]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.base_uri = "https://www.example.com/"
-
-
-class HSTSMultipleHeadersTest(FieldTest[ResponseLinterProtocol]):
-    name = "Strict-Transport-Security"
-    inputs = [b"max-age=31536000", b"max-age=0"]
-    expected_out = {"max-age": 31536000, "includesubdomains": False, "preload": False}
-    expected_notes: NoteClassListType = [
-        SINGLE_HEADER_REPEAT,
-        HSTS_NO_SUBDOMAINS,
-        HSTS_NO_PRELOAD,
-        HSTS_VALID,
-    ]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.base_uri = "https://www.example.com/"
-
-
-class HSTSPreloadNotSuitableTest(FieldTest[ResponseLinterProtocol]):
-    name = "Strict-Transport-Security"
-    inputs = [b"max-age=100; includeSubDomains; preload"]
-    expected_out = {"max-age": 100, "includesubdomains": True, "preload": True}
-    expected_notes: NoteClassListType = [
-        HSTS_SUBDOMAINS,
-        HSTS_PRELOAD_NOT_SUITABLE,
-        HSTS_SHORT_MAX_AGE,
-        HSTS_VALID,
-    ]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.base_uri = "https://www.example.com/"
-
-
-class HSTSShortMaxAgeTest(FieldTest[ResponseLinterProtocol]):
-    name = "Strict-Transport-Security"
-    inputs = [b"max-age=100"]
-    expected_out = {"max-age": 100, "includesubdomains": False, "preload": False}
-    expected_notes: NoteClassListType = [
-        HSTS_NO_SUBDOMAINS,
-        HSTS_NO_PRELOAD,
-        HSTS_SHORT_MAX_AGE,
-        HSTS_VALID,
-    ]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.base_uri = "https://www.example.com/"
-
-
-class HSTSMaxAgeZeroTest(FieldTest[ResponseLinterProtocol]):
-    name = "Strict-Transport-Security"
-    inputs = [b"max-age=0"]
-    expected_out = {"max-age": 0, "includesubdomains": False, "preload": False}
-    expected_notes: NoteClassListType = [
-        HSTS_NO_SUBDOMAINS,
-        HSTS_NO_PRELOAD,
-        HSTS_MAX_AGE_ZERO,
-        HSTS_VALID,
-    ]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.base_uri = "https://www.example.com/"
-
-
-class HSTSNoSubdomainsTest(FieldTest[ResponseLinterProtocol]):
-    name = "Strict-Transport-Security"
-    inputs = [b"max-age=31536000"]
-    expected_out = {"max-age": 31536000, "includesubdomains": False, "preload": False}
-    expected_notes: NoteClassListType = [HSTS_NO_SUBDOMAINS, HSTS_NO_PRELOAD, HSTS_VALID]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.base_uri = "https://www.example.com/"
-
-
-class HSTSPreloadMissingMaxAgeTest(FieldTest[ResponseLinterProtocol]):
-    name = "Strict-Transport-Security"
-    inputs = [b"includeSubDomains; preload"]
-    expected_out = {"max-age": None, "includesubdomains": True, "preload": True}
-    expected_notes: NoteClassListType = [
-        HSTS_PRELOAD_NOT_SUITABLE,
-        HSTS_NO_MAX_AGE,
-        HSTS_SUBDOMAINS,
-        HSTS_INVALID,
-    ]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.base_uri = "https://www.example.com/"
-
-
-class HSTSBadMaxAgeValueTest(FieldTest[ResponseLinterProtocol]):
-    name = "Strict-Transport-Security"
-    inputs = [b"max-age=foo"]
-    expected_out = {"max-age": None, "includesubdomains": False, "preload": False}
-    expected_notes: NoteClassListType = [
-        HSTS_BAD_MAX_AGE,
-        HSTS_NO_SUBDOMAINS,
-        HSTS_NO_PRELOAD,
-        HSTS_INVALID,
-    ]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.base_uri = "https://www.example.com/"
-
-
-class HSTSTrailingSemicolonTest(FieldTest[ResponseLinterProtocol]):
-    name = "Strict-Transport-Security"
-    inputs = [b"max-age=31536000;includeSubdomains;"]
-    expected_out = {"max-age": 31536000, "includesubdomains": True, "preload": False}
-    expected_notes: NoteClassListType = [
-        HSTS_SUBDOMAINS,
-        HSTS_NO_PRELOAD,
-        HSTS_VALID,
-        HSTS_TRAILING_SEMICOLON,
-    ]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.base_uri = "https://www.example.com/"
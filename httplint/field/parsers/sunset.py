@@ -1,8 +1,7 @@
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
-from httplint.field.utils import BAD_DATE_SYNTAX, parse_http_date
+from httplint.field.utils import parse_http_date
 from httplint.note import Note, categories, levels
-from httplint.types import AddNoteMethodType, NoteClassListType, ResponseLinterProtocol
+from httplint.types import AddNoteMethodType, ResponseLinterProtocol
 
 
 class sunset(SingletonField[ResponseLinterProtocol]):
@@ -29,26 +28,3 @@ class SUNSET_PAST(Note):
     _text = """\
 The `Sunset` header indicates that this resource has already passed its sunset date and may become
 unresponsive."""
-
-
-class SunsetTest(FieldTest[ResponseLinterProtocol]):
-    name = "Sunset"
-    inputs = [b"Sat, 31 Dec 2022 23:59:59 GMT"]
-    expected_out = 1672531199
-
-
-class SunsetPastTest(FieldTest[ResponseLinterProtocol]):
-    name = "Sunset"
-    inputs = [b"Sat, 01 Jan 2000 00:00:00 GMT"]
-    expected_out = 946684800
-    expected_notes: NoteClassListType = [SUNSET_PAST]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        message.start_time = 1000000000
-
-
-class SunsetBadSyntaxTest(FieldTest[ResponseLinterProtocol]):
-    name = "Sunset"
-    inputs = [b"not a date"]
-    expected_out = None
-    expected_notes: NoteClassListType = [BAD_DATE_SYNTAX]
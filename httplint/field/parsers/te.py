@@ -1,7 +1,6 @@
 from typing import Tuple
 
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.field.utils import parse_params
 from httplint.syntax import rfc9110
 from httplint.types import AddNoteMethodType, AnyMessageLinterProtocol, ParamDictType
@@ -29,9 +28,3 @@ The most common transfer-coding, `chunked`, doesn't need to be listed in `TE`.
         encoding = encoding.lower()
         param_dict = parse_params(param_str, add_note, ["q"], delim=";")
         return encoding, param_dict
-
-
-class TETest(FieldTest[AnyMessageLinterProtocol]):
-    name = "TE"
-    inputs = [b"trailers, deflate; q=0.5"]
-    expected_out = [("trailers", {}), ("deflate", {"q": "0.5"})]
@@ -1,17 +1,13 @@
 from typing import Tuple
 
-from httplint.field import BAD_SYNTAX
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FakeRequestLinter, FieldTest
 from httplint.field.utils import parse_params
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9112
 from httplint.types import (
     AddNoteMethodType,
     AnyMessageLinterProtocol,
-    NoteClassListType,
     ParamDictType,
-    ResponseLinterProtocol,
 )
 
 
@@ -98,68 +94,3 @@ doesn't define what they mean.
 
 This message has encodings with such parameters; although they're technically allowed, they may
 cause interoperability problems. They should be removed."""
-
-
-class TransferEncodingTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Transfer-Encoding"
-    inputs = [b"chunked"]
-    expected_out = [("chunked", {})]
-
-
-class TransferEncodingParamTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Transfer-Encoding"
-    inputs = [b"chunked; foo=bar"]
-    expected_out = [("chunked", {"foo": "bar"})]
-    expected_notes: NoteClassListType = [TRANSFER_CODING_PARAM]
-
-
-class BadTransferEncodingTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Transfer-Encoding"
-    inputs = [b"chunked=foo"]
-    expected_out = [("chunked=foo", {})]
-    expected_notes: NoteClassListType = [BAD_SYNTAX, TRANSFER_CODING_UNWANTED]
-
-
-class TransferEncodingCaseTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Transfer-Encoding"
-    inputs = [b"chUNked"]
-    expected_out = [("chunked", {})]
-
-
-class TransferEncodingIdentityTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Transfer-Encoding"
-    inputs = [b"identity"]
-    expected_out = [("identity", {})]
-    expected_notes: NoteClassListType = [TRANSFER_CODING_IDENTITY]
-
-
-class TransferEncodingUnwantedTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Transfer-Encoding"
-    inputs = [b"foo"]
-    expected_out = [("foo", {})]
-    expected_notes: NoteClassListType = [TRANSFER_CODING_UNWANTED]
-
-
-class TransferEncodingMultTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Transfer-Encoding"
-    inputs = [b"chunked", b"identity"]
-    expected_out = [("chunked", {}), ("identity", {})]
-    expected_notes: NoteClassListType = [TRANSFER_CODING_IDENTITY]
-
-
-class TransferEncodingMultUnwantedTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Transfer-Encoding"
-    inputs = [b"chunked", b"foo", b"bar"]
-    expected_out = [("chunked", {}), ("foo", {}), ("bar", {})]
-    expected_notes: NoteClassListType = [TRANSFER_CODING_UNWANTED]
-
-
-class TransferEncodingWantedTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Transfer-Encoding"
-    inputs = [b"foo"]
-    expected_out = [("foo", {})]
-
-    def set_response_context(self, message: ResponseLinterProtocol) -> None:
-        request = FakeRequestLinter()
-        request.headers.process([(b"te", b"foo")])
-        message.request = request
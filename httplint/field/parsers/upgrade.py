@@ -1,7 +1,6 @@
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.syntax import rfc9110
-from httplint.types import AnyMessageLinterProtocol, NoteClassListType
+from httplint.types import AnyMessageLinterProtocol
 
 
 class upgrade(HttpListField[AnyMessageLinterProtocol]):
@@ -17,10 +16,3 @@ protocol.
     reference = f"{rfc9110.SPEC_URL}#field.upgrade"
     syntax = rfc9110.Upgrade
     deprecated = False
-
-
-class UpgradeTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Upgrade"
-    inputs = [b"HTTP/2.0, SHTTP/1.3, IRC/6.9, RTA/x11", b"websocket"]
-    expected_out = ["HTTP/2.0", "SHTTP/1.3", "IRC/6.9", "RTA/x11", "websocket"]
-    expected_notes: NoteClassListType = []
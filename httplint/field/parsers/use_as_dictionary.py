@@ -1,11 +1,9 @@
 from typing import Any, List, Union
 
 from httplint.field.structured_field import StructuredField
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
 from httplint.types import (
     AddNoteMethodType,
-    NoteClassListType,
     ResponseLinterProtocol,
     SFDictionaryType,
 )
@@ -89,17 +87,3 @@ class USE_AS_DICTIONARY_BAD_MATCH_DEST(Note):
     _summary = "The match-dest parameter has an invalid type."
     _text = """\
 The `match-dest` parameter must be a String or a list of Strings."""
-
-
-class UseAsDictionaryTest(FieldTest[ResponseLinterProtocol]):
-    name = "Use-As-Dictionary"
-    inputs = [b'match="/foo/*", ttl=123']
-    expected_out = {"match": ("/foo/*", {}), "ttl": (123, {})}
-    expected_notes: NoteClassListType = []
-
-
-class UseAsDictionaryBadParamTest(FieldTest[ResponseLinterProtocol]):
-    name = "Use-As-Dictionary"
-    inputs = [b'match=123, ttl="abc"']
-    expected_out = {"match": (123, {}), "ttl": ("abc", {})}
-    expected_notes: NoteClassListType = [USE_AS_DICTIONARY_BAD_TYPE, USE_AS_DICTIONARY_BAD_TYPE]
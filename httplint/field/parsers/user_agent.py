@@ -1,5 +1,4 @@
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
 from httplint.syntax import rfc9110
 from httplint.types import AddNoteMethodType, RequestLinterProtocol
 
@@ -14,9 +13,3 @@ The `User-Agent` header field contains information about the user agent originat
 
     def evaluate(self, add_note: AddNoteMethodType) -> None:
         pass
-
-
-class UserAgentTest(FieldTest[RequestLinterProtocol]):
-    name = "User-Agent"
-    inputs = [b"CERN-LineMode/2.15 libwww/2.17b3"]
-    expected_out = "CERN-LineMode/2.15 libwww/2.17b3"
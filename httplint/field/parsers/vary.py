@@ -1,8 +1,7 @@
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
-from httplint.note import Note, categories, levels
+from httplint.note import Deferred, Note, categories, levels
 from httplint.syntax import rfc9110
-from httplint.types import AddNoteMethodType, NoteClassListType, ResponseLinterProtocol
+from httplint.types import AddNoteMethodType, ResponseLinterProtocol
 from httplint.util import f_num
 
 
@@ -18,6 +17,7 @@ that were used to select the representation."""
     syntax = rfc9110.Vary
     category = categories.CACHING
     deprecated = False
+    always_evaluate = True  # normalises value
 
     def parse(self, field_value: str, add_note: AddNoteMethodType) -> str:
         return field_value.lower()
@@ -29,7 +29,7 @@ that were used to select the representation."""
         if "*" in self.value:
             add_note(VARY_ASTERISK)
         if len(self.value) > 3:
-            add_note(VARY_COMPLEX, vary_count=f_num(len(self.value)))
+            add_note(VARY_COMPLEX, vary_count=Deferred(f_num, len(self.value)))
         if "user-agent" in self.value:
             add_note(VARY_USER_AGENT)
         if "host" in self.value:
@@ -110,24 +110,3 @@ The `Vary` mechanism allows a resource to describe the dimensions that its respo
 change, over; each listed header is another dimension.
 
 Varying by too many dimensions makes using this information impractical."""
-
-
-class VaryTest(FieldTest[ResponseLinterProtocol]):
-    name = "Vary"
-    inputs = [b"Accept-Encoding", b"*, User-Agent", b"Host"]
-    expected_out = ["accept-encoding", "*", "user-agent", "host"]
-    expected_notes: NoteClassListType = [VARY_ASTERISK, VARY_USER_AGENT, VARY_HOST, VARY_COMPLEX]
-
-
-class VaryNegotiateTest(FieldTest[ResponseLinterProtocol]):
-    name = "Vary"
-    inputs = [b"Negotiate"]
-    expected_out = ["negotiate"]
-    expected_notes: NoteClassListType = [VARY_NEGOTIATE]
-
-
-class VaryDuplicateTest(FieldTest[ResponseLinterProtocol]):
-    name = "Vary"
-    inputs = [b"a, b", b"a, c"]
-    expected_out = ["a", "b", "c"]
-    expected_notes: NoteClassListType = [VARY_DUPLICATE]
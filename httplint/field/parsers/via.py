@@ -1,11 +1,9 @@
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc9110
 from httplint.types import (
     AddNoteMethodType,
     AnyMessageLinterProtocol,
-    NoteClassListType,
 )
 
 
@@ -39,10 +37,3 @@ There field has three space-separated components; first, the HTTP version of the
 intermediary received, then the identity of the intermediary (usually but not always its hostname),
 and then optionally a product identifier or comment (usually used to identify the software being
 used)."""
-
-
-class ViaTest(FieldTest[AnyMessageLinterProtocol]):
-    name = "Via"
-    inputs = [b"1.1 test"]
-    expected_out = ["1.1 test"]
-    expected_notes: NoteClassListType = [VIA_PRESENT]
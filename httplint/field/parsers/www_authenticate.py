@@ -1,7 +1,6 @@
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.syntax import rfc9110
-from httplint.types import NoteClassListType, ResponseLinterProtocol
+from httplint.types import ResponseLinterProtocol
 
 
 class www_authenticate(HttpListField[ResponseLinterProtocol]):
@@ -12,10 +11,3 @@ indicates the authentication scheme(s) and parameters applicable."""
     reference = f"{rfc9110.SPEC_URL}#field.www-authenticate"
     syntax = rfc9110.WWW_Authenticate
     deprecated = False
-
-
-class WWWAuthenticateTest(FieldTest[ResponseLinterProtocol]):
-    name = "WWW-Authenticate"
-    inputs = [b'Basic realm="WallyWorld"']
-    expected_out = ['Basic realm="WallyWorld"']
-    expected_notes: NoteClassListType = []
@@ -1,8 +1,6 @@
-from httplint.field import BAD_SYNTAX
 from httplint.field.list_field import HttpListField
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
-from httplint.types import AddNoteMethodType, NoteClassListType, ResponseLinterProtocol
+from httplint.types import AddNoteMethodType, ResponseLinterProtocol
 
 
 class x_content_type_options(HttpListField[ResponseLinterProtocol]):
@@ -50,10 +48,3 @@ necessarily cause problems, but they probably won't have any effect either.
 
 See [MDN](https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/X-Content-Type-Options)
 for more information about this header."""
-
-
-class XContentTypeOptionsTest(FieldTest[ResponseLinterProtocol]):
-    name = "X-Content-Type-Options"
-    inputs = [b"nosniff", b"foo"]
-    expected_out = ["nosniff", "foo"]
-    expected_notes: NoteClassListType = [CONTENT_TYPE_OPTIONS, BAD_SYNTAX]
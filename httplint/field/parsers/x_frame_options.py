@@ -1,9 +1,7 @@
-from httplint.field import BAD_SYNTAX
 from httplint.field.singleton_field import SingletonField
-from httplint.field.tests import FieldTest
 from httplint.note import Note, categories, levels
 from httplint.syntax import rfc3986, rfc9110
-from httplint.types import AddNoteMethodType, NoteClassListType, ResponseLinterProtocol
+from httplint.types import AddNoteMethodType, ResponseLinterProtocol
 
 # X-Frame-Options = "DENY"
 #          / "SAMEORIGIN"
@@ -92,31 +90,3 @@ here won't necessarily cause problems, but they probably won't have any effect e
 
 See [MDN](https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/X-Frame-Options) for more information.
 """
-
-
-class DenyXFOTest(FieldTest[ResponseLinterProtocol]):
-    name = "X-Frame-Options"
-    inputs = [b"DENY"]
-    expected_out = "DENY"
-    expected_notes: NoteClassListType = [FRAME_OPTIONS_DENY]
-
-
-class DenyXFOCaseTest(FieldTest[ResponseLinterProtocol]):
-    name = "X-Frame-Options"
-    inputs = [b"deny"]
-    expected_out = "DENY"
-    expected_notes: NoteClassListType = [FRAME_OPTIONS_DENY]
-
-
-class SameOriginXFOTest(FieldTest[ResponseLinterProtocol]):
-    name = "X-Frame-Options"
-    inputs = [b"SAMEORIGIN"]
-    expected_out = "SAMEORIGIN"
-    expected_notes: NoteClassListType = [FRAME_OPTIONS_SAMEORIGIN]
-
-
-class UnknownXFOTest(FieldTest[ResponseLinterProtocol]):
-    name = "X-Frame-Options"
-    inputs = [b"foO"]
-    expected_out = "FOO"
-    expected_notes: NoteClassListType = [BAD_SYNTAX, FRAME_OPTIONS_UNKNOWN]
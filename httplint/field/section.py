@@ -1,19 +1,25 @@
 import weakref
 from functools import partial
-from typing import Any, Dict
+from itertools import chain
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type
 
 from httplint.field import HttpField
 from httplint.field.finder import HttpFieldFinder
 from httplint.i18n import L_
-from httplint.note import Note, categories, levels
+from httplint.note import Deferred, Note, categories, levels
 from httplint.types import (
+    AddNoteMethodType,
     FieldDictType,
     LinterProtocol,
     RawFieldListType,
     StrFieldListType,
+    VariableType,
 )
 from httplint.util import f_num
 
+NotesAddType = Callable[..., Note]  # Notes.add
+
 
 class FieldSection:
     """
@@ -27,6 +33,8 @@ class FieldSection:
         self.message = weakref.proxy(message)
         self.is_trailer = is_trailer
         self.text: StrFieldListType = []  # unicode version of the field tuples as received
+        # lowercase field name: list of (value, offset) for each line with that name
+        self.index: Dict[str, List[Tuple[str, int]]] = {}
         self.parsed: FieldDictType = {}  # dictionary of parsed field values
         self.size: int = 0  # size of textual field block w/o delimiters, in bytes
         self.handlers: Dict[str, HttpField[Any]] = {}
@@ -39,43 +47,42 @@ class FieldSection:
             - calculate the total section size
             - call msg.add_note as appropriate
         """
-        offset = 0  # what number field we're on
+        timings = self.message.timings
+        notes_add = self.message.notes.add
+        find_handler = self._finder.find_handler
 
-        for name, value in raw_fields:
-            add_note = partial(self.message.notes.add, f"offset-{offset}")
+        offset = 0  # what number field we're on; lines that fail pre_check don't count
 
-            # track size
-            field_size = len(name) + len(value)
+        for str_name, str_value, field_size, encoding_notes in self._decode(raw_fields):
             self.size += field_size
-
-            # decode the field to make it unicode clean
-            try:
-                str_name = name.decode("ascii", "strict")
-            except UnicodeError:
-                str_name = name.decode("ascii", "ignore")
-                add_note(FIELD_NAME_ENCODING, field_name=str_name)
-            try:
-                str_value = value.decode("ascii", "strict")
-            except UnicodeError:
-                str_value = value.decode("iso-8859-1", "replace")
-                add_note(FIELD_VALUE_ENCODING, field_name=str_name)
             self.text.append((str_name, str_value))
-
-            handler = self._finder.find_handler(str_name)
-            field_add_note = partial(
-                add_note,
-                field_name=handler.canonical_name,
+            for encoding_note in encoding_notes:
+                notes_add(f"offset-{offset}", encoding_note, field_name=str_name)
+
+            handler = find_handler(str_name)
+            lines = self.index.get(handler.norm_name)
+            if lines is None:
+                self.index[handler.norm_name] = [(str_value, offset)]
+            else:
+                lines.append((str_value, offset))
+            field_add_note: AddNoteMethodType = _LineNoteAdder(
+                notes_add, offset, handler.canonical_name
             )
-            if not handler.pre_check(field_add_note):
-                continue
-            handler.handle_input(str_value, field_add_note, offset)
+            if timings is None:
+                if not handler.pre_check(field_add_note):
+                    continue
+                handler.handle_input(str_value, field_add_note, offset)
+            else:
+                start = perf_counter()
+                try:
+                    if not handler.pre_check(field_add_note):
+                        continue
+                    handler.handle_input(str_value, field_add_note, offset)
+                finally:
+                    timings.add_field(handler.__class__.__name__, perf_counter() - start)
 
             if field_size > self.max_field_size:
-                add_note(
-                    FIELD_TOO_LARGE,
-                    field_name=handler.canonical_name,
-                    field_size=f_num(field_size),
-                )
+                field_add_note(FIELD_TOO_LARGE, field_size=Deferred(f_num, field_size))
             offset += 1
 
         if self.size > self.max_total_size:
@@ -83,7 +90,7 @@ class FieldSection:
                 "field-block",
                 FIELD_SECTION_TOO_LARGE,
                 field_type=self.is_trailer and L_("trailer") or L_("header"),
-                section_size=f_num(self.size),
+                section_size=Deferred(f_num, self.size),
             )
 
         # check each of the complete header values and get the parsed value
@@ -94,9 +101,71 @@ class FieldSection:
                 field_name=handler.canonical_name,
                 field_type=self.is_trailer and L_("trailer") or L_("header"),
             )
-            handler.finish(field_add_note)
+            if timings is None:
+                handler.finish(field_add_note)
+            else:
+                start = perf_counter()
+                handler.finish(field_add_note)
+                timings.add_field(handler.__class__.__name__, perf_counter() - start)
             self.parsed[handler.norm_name] = handler.value
 
+    @staticmethod
+    def _decode(raw_fields: RawFieldListType) -> Iterator[Tuple[str, str, int, List[Type[Note]]]]:
+        """
+        Yield the (name, value, size, encoding notes) of each field line, decoded
+        to str.
+
+        Nearly all field sections are pure ASCII, so the whole block is checked and
+        decoded at once; otherwise, each line is decoded on its own, noting any
+        non-ASCII names and values.
+        """
+        block = b"".join(chain.from_iterable(raw_fields))
+        if block.isascii():
+            text = block.decode("ascii")
+            start = 0
+            for name, value in raw_fields:
+                name_end = start + len(name)
+                end = name_end + len(value)
+                yield text[start:name_end], text[name_end:end], end - start, []
+                start = end
+            return
+
+        for name, value in raw_fields:
+            encoding_notes: List[Type[Note]] = []
+            try:
+                str_name = name.decode("ascii", "strict")
+            except UnicodeError:
+                str_name = name.decode("ascii", "ignore")
+                encoding_notes.append(FIELD_NAME_ENCODING)
+            try:
+                str_value = value.decode("ascii", "strict")
+            except UnicodeError:
+                str_value = value.decode("iso-8859-1", "replace")
+                encoding_notes.append(FIELD_VALUE_ENCODING)
+            yield str_name, str_value, len(name) + len(value), encoding_notes
+
+
+class _LineNoteAdder:
+    """
+    Adds notes about a single field line.
+
+    The note's subject is only formatted when a note is actually added, and the
+    field's name is supplied unless the caller gives one.
+    """
+
+    __slots__ = ("notes_add", "offset", "field_name")
+
+    def __init__(self, notes_add: NotesAddType, offset: int, field_name: str) -> None:
+        self.notes_add = notes_add
+        self.offset = offset
+        self.field_name = field_name
+
+    def __call__(
+        self, note: Type[Note], category: Optional[Any] = None, **vrs: VariableType
+    ) -> Note:
+        vrs.setdefault("field_name", self.field_name)
+        return self.notes_add(f"offset-{self.offset}", note, category, **vrs)
+
 
 class FIELD_TOO_LARGE(Note):
     category = categories.GENERAL
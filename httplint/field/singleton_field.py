@@ -1,8 +1,6 @@
-import re
 from typing import Any, Generic, List
 
 from httplint.field import BAD_SYNTAX, HttpField
-from httplint.field.utils import RE_FLAGS
 from httplint.note import Note, categories, levels
 from httplint.types import AddNoteMethodType, TMessage
 
@@ -33,8 +31,9 @@ class SingletonField(HttpField[TMessage], Generic[TMessage]):
             if len(self.raw_values) > 1:
                 add_note(SINGLE_HEADER_REPEAT)
             first_raw = self.raw_values[0]
-            if self.syntax:
-                if not re.match(rf"^\s*(?:{self.syntax})\s*$", first_raw, RE_FLAGS):
+            syntax_patterns = self.syntax_patterns()
+            if syntax_patterns:
+                if not syntax_patterns[0].match(first_raw):
                     if self.report_syntax:
                         add_note(BAD_SYNTAX, ref_uri=self.reference)
             try:
@@ -43,7 +42,7 @@ class SingletonField(HttpField[TMessage], Generic[TMessage]):
                 self.value = None
 
         if self.value is not None:
-            self.evaluate(add_note)
+            self._evaluate(add_note)
 
 
 class SINGLE_HEADER_REPEAT(Note):
@@ -1,6 +1,6 @@
 import unittest
 from functools import partial
-from typing import Any, Generic, Iterable, List, Tuple, Type, cast
+from typing import Any, Dict, Generic, Iterable, List, Tuple, Type, cast
 
 from httplint.field.cors import check_preflight_request, check_preflight_response
 from httplint.i18n import L_
@@ -49,6 +49,7 @@ class FakeRequestLinter(HttpRequestLinter):
 class FakeHeaders:
     def __init__(self) -> None:
         self.text: List[Tuple[str, str]] = []
+        self.index: Dict[str, List[Tuple[str, int]]] = {}
 
 
 class FakeRequest:
@@ -1,7 +1,22 @@
 import calendar
 import re
+import sys
+from dataclasses import dataclass
 from email.utils import parsedate as lib_parsedate
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from urllib.parse import unquote as urlunquote
 
 from http_sf import Token
@@ -12,6 +27,100 @@ from httplint.types import AddNoteMethodType, ParamDictType
 
 RE_FLAGS = re.VERBOSE | re.IGNORECASE
 
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class PatternStats:
+    "A snapshot of PatternRegistry activity."
+
+    patterns: int  # number of distinct compiled patterns held
+    compiles: int  # number of times re.compile was called
+    hits: int  # number of lookups satisfied without compiling
+    memory: int  # approximate size of the compiled patterns, in bytes
+
+
+class PatternRegistry:
+    """
+    A process-wide cache of compiled regular expressions.
+
+    The syntax patterns are large and numerous enough to overflow the re module's own
+    cache, so they're kept here instead. Patterns are compiled the first time they're
+    asked for and never evicted; callers should only use it for patterns built from
+    a fixed set of inputs (e.g., ABNF from httplint.syntax), not from message content.
+
+    Patterns whose source is itself costly to build are kept by derived(), keyed by
+    what they're built from, so that the source isn't rebuilt on every use.
+    """
+
+    def __init__(self) -> None:
+        self._patterns: Dict[Tuple[str, int], Pattern[str]] = {}
+        self._derived: Dict[Hashable, Any] = {}
+        self._lock = Lock()
+        self.compiles = 0
+        self.hits = 0
+
+    def compile(self, pattern: str, flags: int = RE_FLAGS) -> Pattern[str]:
+        """
+        Return a compiled version of pattern, compiling it if it hasn't been seen yet.
+        """
+        key = (pattern, flags)
+        compiled = self._patterns.get(key)
+        if compiled is not None:
+            self.hits += 1
+            return compiled
+        with self._lock:
+            compiled = self._patterns.get(key)
+            if compiled is None:
+                compiled = re.compile(pattern, flags)
+                self._patterns[key] = compiled
+                self.compiles += 1
+        return compiled
+
+    def derived(self, key: Hashable, build: Callable[[], T]) -> T:
+        """
+        Return the value kept under key, calling build (which should compile its
+        patterns with this registry) to make it if there isn't one yet.
+        """
+        try:
+            value: T = self._derived[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            return value
+        value = build()
+        with self._lock:
+            return self._derived.setdefault(key, value)  # type: ignore[no-any-return]
+
+    def split_pattern(self, item: str, split: str) -> Pattern[str]:
+        "Return a pattern that finds each item that is followed by split (see split_string)."
+        return self.derived(
+            ("split", item, split),
+            lambda: self.compile(rf"{item}(?={split}|\s*$)", re.VERBOSE),
+        )
+
+    def stats(self) -> PatternStats:
+        "Return a snapshot of the registry's activity."
+        patterns = list(self._patterns.values())
+        return PatternStats(
+            patterns=len(patterns),
+            compiles=self.compiles,
+            hits=self.hits,
+            memory=sum(sys.getsizeof(pattern) for pattern in patterns),
+        )
+
+    def clear(self) -> None:
+        "Forget all compiled patterns and reset the counters."
+        with self._lock:
+            self._patterns.clear()
+            self._derived.clear()
+            self.compiles = 0
+            self.hits = 0
+
+
+pattern_registry = PatternRegistry()
+
 # restricted-name (RFC 6838, Section 4.2) without its 126-character bound, so that
 # over-long names are reported as MEDIA_TYPE_LONG_NAME instead of being lumped in
 # with character errors.
@@ -20,6 +129,15 @@ RESTRICTED_NAME_UNBOUNDED = (
     rf"(?: {rfc6838.restricted_name_first} {rfc6838.restricted_name_chars}* )"
 )
 
+TOKEN_PATTERN = rf"^{rfc9110.token}$"
+RESTRICTED_NAME_PATTERN = rf"^{RESTRICTED_NAME_UNBOUNDED}$"
+HTTP_DATE_PATTERN = rf"^{rfc9110.HTTP_date}$"
+OBS_DATE_PATTERN = rf"^{rfc9110.obs_date}$"
+LIST_ITEM_PATTERN = r'((?:[^",]|%s)+)(?=%s|\s*$)' % (
+    rfc9110.quoted_string,
+    r"(?:\s*(?:,\s*)+)",
+)
+
 
 def parse_media_type(
     field_value: str,
@@ -90,7 +208,8 @@ def check_media_type(
             return
         names = [name for name in names if name != "*"]
 
-    tokens = [name for name in names if re.match(rf"^{rfc9110.token}$", name, RE_FLAGS)]
+    token_re = pattern_registry.compile(TOKEN_PATTERN)
+    tokens = [name for name in names if token_re.match(name)]
     if len(tokens) != len(names):
         if check_token:
             bad_syntax()
@@ -101,7 +220,8 @@ def check_media_type(
 
     if any(len(name) > rfc6838.RESTRICTED_NAME_MAX_LEN for name in names):
         add_note(MEDIA_TYPE_LONG_NAME, value=media_type)
-    if any(not re.match(rf"^{RESTRICTED_NAME_UNBOUNDED}$", name, RE_FLAGS) for name in names):
+    restricted_name_re = pattern_registry.compile(RESTRICTED_NAME_PATTERN)
+    if any(not restricted_name_re.match(name) for name in names):
         add_note(MEDIA_TYPE_BAD_NAME, value=media_type)
 
 
@@ -109,10 +229,10 @@ def parse_http_date(
     value: str, add_note: AddNoteMethodType, category: Optional[categories] = None
 ) -> int:
     """Parse a HTTP date. Raises ValueError if it's bad."""
-    if not re.match(rf"^{rfc9110.HTTP_date}$", value, RE_FLAGS):
+    if not pattern_registry.compile(HTTP_DATE_PATTERN).match(value):
         add_note(BAD_DATE_SYNTAX, category=category)
         raise ValueError
-    if re.match(rf"^{rfc9110.obs_date}$", value, RE_FLAGS):
+    if pattern_registry.compile(OBS_DATE_PATTERN).match(value):
         add_note(DATE_OBSOLETE, category=category)
     date_tuple = lib_parsedate(value)
     if date_tuple is None:
@@ -155,7 +275,7 @@ def split_string(instr: str, item: str, split: str) -> List[str]:
     """
     if not instr:
         return []
-    return [h.strip() for h in re.findall(rf"{item}(?={split}|\s*$)", instr, re.VERBOSE)]
+    return [h.strip() for h in pattern_registry.split_pattern(item, split).findall(instr)]
 
 
 def split_list_field(field_value: str) -> List[str]:
@@ -163,12 +283,7 @@ def split_list_field(field_value: str) -> List[str]:
     return [
         stripped
         for stripped in (
-            f.strip()
-            for f in re.findall(
-                r'((?:[^",]|%s)+)(?=%s|\s*$)' % (rfc9110.quoted_string, r"(?:\s*(?:,\s*)+)"),
-                field_value,
-                RE_FLAGS,
-            )
+            f.strip() for f in pattern_registry.compile(LIST_ITEM_PATTERN).findall(field_value)
         )
         if stripped
     ]
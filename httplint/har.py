@@ -0,0 +1,349 @@
+"""
+Lint the exchanges in HAR (HTTP Archive) files.
+
+HAR files can be very large, so read_har() parses them incrementally, holding
+no more than one entry in memory at a time, and yields each entry as a
+RawExchange (see httplint/batch.py). lint_har() lints them, optionally across
+worker processes:
+
+    with open("site.har", "rb") as fh:
+        for exchange, outcome in lint_har(fh, workers=4):
+            ...
+
+HAR content is usually stored with its content-coding removed, so the content
+of messages that have a Content-Encoding is not checked (no_content is set).
+"""
+
+import codecs
+import json
+import re
+from base64 import b64decode
+from collections import deque
+from datetime import datetime
+from typing import (
+    Any,
+    BinaryIO,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    overload,
+)
+
+from httplint.batch import (
+    DEFAULT_CHUNK_SIZE,
+    ExchangeOutcome,
+    RawExchange,
+    RawMessage,
+    lint_exchanges,
+)
+from httplint.types import RawFieldListType
+
+READ_SIZE = 256 * 1024
+CONTENT_CHUNK_SIZE = 63 * 1024  # bytes per chunk of content; a multiple of 3 for base64
+
+_SIGNIFICANT = re.compile(r'[{}\[\]:,"]')
+_STRING_REST = re.compile(r'(?:[^"\\]|\\.)*"', re.DOTALL)
+_FRACTION = re.compile(r"\.(\d+)")
+
+
+class HarError(ValueError):
+    "The input isn't a HAR file that can be read."
+
+
+class HarContent(Sequence[bytes]):
+    """
+    The content of a HAR message, decoded (from base64, or as UTF-8) into chunks
+    only when it's first used, so that doing so can be left to worker processes.
+    """
+
+    def __init__(self, text: str, base64: bool = False) -> None:
+        self.text = text
+        self.base64 = base64
+        self._decoded: Optional[List[bytes]] = None
+
+    def _chunks(self) -> List[bytes]:
+        if self._decoded is None:
+            if self.base64:
+                text = "".join(self.text.split())
+                step = CONTENT_CHUNK_SIZE // 3 * 4
+                self._decoded = [
+                    b64decode(text[start : start + step]) for start in range(0, len(text), step)
+                ]
+            else:
+                self._decoded = [
+                    self.text[start : start + CONTENT_CHUNK_SIZE].encode("utf-8")
+                    for start in range(0, len(self.text), CONTENT_CHUNK_SIZE)
+                ]
+        return self._decoded
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self._chunks())
+
+    def __len__(self) -> int:
+        return len(self._chunks())
+
+    @overload
+    def __getitem__(self, index: int) -> bytes: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[bytes]: ...
+
+    def __getitem__(self, index: Any) -> Any:
+        return self._chunks()[index]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state: Dict[str, Any] = self.__dict__.copy()
+        state["_decoded"] = None  # leave decoding to whichever process uses it
+        return state
+
+
+def iter_har_entries(stream: BinaryIO, read_size: int = READ_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Yield each entry in the log.entries array of the HAR JSON read from stream,
+    without reading all of it into memory.
+
+    The JSON around the entries is scanned a token at a time to find them; each
+    entry is then parsed with json, reading more of the stream when the entry
+    isn't complete yet.
+    """
+    reader = _Reader(stream, read_size)
+    stack: List[str] = []  # "{" or "[" for each enclosing container
+    keys: List[Optional[str]] = []  # the last key seen in each enclosing object
+    last_string: Optional[str] = None
+
+    while True:
+        match = _SIGNIFICANT.search(reader.buf, reader.pos)
+        if match is None:
+            if not reader.more():
+                break
+            continue
+        token = match.group()
+        if token == '"':
+            rest = _STRING_REST.match(reader.buf, match.end())
+            if rest is None:  # the string isn't complete yet
+                if not reader.more():
+                    break
+                continue
+            last_string = json.loads(reader.buf[match.start() : rest.end()])
+            reader.pos = rest.end()
+            continue
+        reader.pos = match.end()
+        if token == ":":
+            if stack and stack[-1] == "{":
+                keys[-1] = last_string
+        elif token in "{[":
+            stack.append(token)
+            keys.append(None)
+            if token == "[" and keys[:2] == ["log", "entries"] and len(stack) == 3:
+                yield from _entries(reader)
+                stack.pop()
+                keys.pop()
+        elif token in "}]":
+            if not stack:
+                raise HarError("unbalanced brackets")
+            stack.pop()
+            keys.pop()
+    if stack:
+        raise HarError("the input ended before the HAR was complete")
+
+
+class _Reader:
+    "A window on the text of a stream, of which everything before pos has been used."
+
+    def __init__(self, stream: BinaryIO, read_size: int) -> None:
+        self.stream = stream
+        self.read_size = read_size
+        self.decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def more(self, at_least: int = 0) -> bool:
+        "Drop what has been used and read more; return False at the end of the stream."
+        if self.eof:
+            return False
+        self.buf = self.buf[self.pos :]
+        self.pos = 0
+        target = len(self.buf) + max(at_least, 1)
+        while len(self.buf) < target and not self.eof:
+            data = self.stream.read(max(self.read_size, at_least))
+            self.eof = not data
+            self.buf += self.decoder.decode(data, final=self.eof)
+        return True
+
+
+_DECODER = json.JSONDecoder()
+_ENTRY_SEPARATORS = re.compile(r"[\s,]*")
+# What can follow where json reports an error in text that's only incomplete: nothing
+# but whitespace, or the start of a string, \u escape, number or literal.
+_INCOMPLETE = re.compile(
+    r'\s*|"(?:[^"\\]|\\.)*\\?|u[0-9a-fA-F]{0,4}\\?|-?[0-9.eE+-]*'
+    r"|t(?:ru?)?|f(?:a(?:ls?)?)?|n(?:ul?)?",
+    re.DOTALL,
+)
+
+
+def _entries(reader: _Reader) -> Iterator[Dict[str, Any]]:
+    "Yield the entries in an array that starts at reader.pos, leaving pos after the array."
+    while True:
+        reader.pos = _ENTRY_SEPARATORS.match(reader.buf, reader.pos).end()  # type: ignore[union-attr]
+        if reader.pos == len(reader.buf):
+            if not reader.more():
+                raise HarError("the input ended before the HAR was complete")
+            continue
+        if reader.buf[reader.pos] == "]":
+            reader.pos += 1
+            return
+        try:
+            entry, end = _DECODER.raw_decode(reader.buf, reader.pos)
+        except json.JSONDecodeError as why:
+            # If it's only incomplete, read at least as much again before retrying, so
+            # that a large entry isn't parsed many times over.
+            incomplete = _INCOMPLETE.fullmatch(reader.buf, why.pos) is not None
+            if not (incomplete and reader.more(len(reader.buf) - reader.pos)):
+                raise HarError(f"bad entry: {why}") from why
+            continue
+        reader.pos = end
+        yield entry
+
+
+def read_har(stream: BinaryIO) -> Iterator[RawExchange]:
+    "Yield a RawExchange for each entry in the HAR read from stream."
+    for entry in iter_har_entries(stream):
+        yield har_exchange(entry)
+
+
+def har_exchange(entry: Dict[str, Any]) -> RawExchange:
+    "Convert a HAR entry to a RawExchange."
+    request = entry.get("request", {})
+    response = entry.get("response", {})
+    request_headers = _headers(request.get("headers", []))
+    response_headers = _headers(response.get("headers", []))
+    post_data = request.get("postData") or {}
+    raw_request = RawMessage(
+        (
+            request.get("method", "GET").encode("ascii", "replace"),
+            request.get("url", "").encode("utf-8"),
+            _version(request.get("httpVersion", "")),
+        ),
+        request_headers,
+        HarContent(post_data["text"]) if post_data.get("text") else (),
+    )
+
+    content = response.get("content") or {}
+    text: Optional[str] = content.get("text")
+    response_content: Sequence[bytes] = ()
+    if text is not None and not _content_coded(response_headers):
+        response_content = HarContent(text, content.get("encoding") == "base64")
+    raw_response = RawMessage(
+        (
+            _version(response.get("httpVersion", "")),
+            str(response.get("status", "")).encode("ascii"),
+            response.get("statusText", "").encode("utf-8"),
+        ),
+        response_headers,
+        response_content,
+    )
+    no_content = not isinstance(response_content, HarContent)
+
+    start_time = _parse_time(entry.get("startedDateTime"))
+    response_time = None
+    if start_time is not None:
+        timings = entry.get("timings") or {}
+        waited = sum(
+            max(0, timings.get(phase) or 0)
+            for phase in ["blocked", "dns", "connect", "send", "wait"]
+        )
+        response_time = start_time + waited / 1000
+    return RawExchange(raw_response, raw_request, start_time, no_content, response_time)
+
+
+def lint_har(
+    stream: BinaryIO,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    locale: Optional[str] = None,
+) -> Iterator[Tuple[RawExchange, ExchangeOutcome]]:
+    """
+    Lint each entry in the HAR read from stream, yielding it with its
+    ExchangeOutcome, in order. See lint_exchanges for workers, chunk_size and
+    locale.
+    """
+    pending: Deque[RawExchange] = deque()
+
+    def exchanges() -> Iterator[RawExchange]:
+        for exchange in read_har(stream):
+            pending.append(exchange)
+            yield exchange
+
+    for outcome in lint_exchanges(exchanges(), workers, chunk_size, locale):
+        yield pending.popleft(), outcome
+
+
+def _headers(headers: List[Dict[str, str]]) -> RawFieldListType:
+    "Return the header fields in a HAR list, leaving out HTTP/2 and HTTP/3 pseudo-headers."
+    return [
+        (_field_bytes(h.get("name", "")), _field_bytes(h.get("value", "")))
+        for h in headers
+        if not h.get("name", "").startswith(":")
+    ]
+
+
+def _field_bytes(value: str) -> bytes:
+    try:
+        return value.encode("iso-8859-1")
+    except UnicodeEncodeError:
+        return value.encode("utf-8")
+
+
+def _version(value: str) -> bytes:
+    "Return the version from a HAR httpVersion, e.g. 'HTTP/1.1' -> b'1.1'."
+    version = value.upper()
+    if version in ("H2", "HTTP/2.0"):
+        return b"2"
+    if version in ("H3", "HTTP/3.0"):
+        return b"3"
+    return version.rsplit("/", 1)[-1].encode("ascii", "replace") or b"1.1"
+
+
+def _content_coded(headers: RawFieldListType) -> bool:
+    for name, value in headers:
+        if name.lower() == b"content-encoding" and value.strip().lower() not in (b"", b"identity"):
+            return True
+    return False
+
+
+def _parse_time(value: Optional[str]) -> Optional[float]:
+    "Parse an ISO 8601 date/time, as used in HAR, to seconds since the epoch."
+    if not value:
+        return None
+    value = _FRACTION.sub(lambda match: "." + match.group(1)[:6].ljust(6, "0"), value, count=1)
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return None
+
+
+def outcome_record(index: int, entry: RawExchange, outcome: ExchangeOutcome) -> Dict[str, Any]:
+    "Return the NDJSON record for a linted HAR entry."
+    request = entry.request
+    return {
+        "entry": index,
+        "method": request.top_line[0].decode("ascii", "replace") if request else None,
+        "url": request.top_line[1].decode("utf-8", "replace") if request else None,
+        "status": entry.response.top_line[1].decode("ascii", "replace"),
+        "response": [_note_record(note) for note in outcome.response_notes],
+        "request": [_note_record(note) for note in outcome.request_notes or ()],
+    }
+
+
+def _note_record(note: Tuple[Any, ...]) -> Dict[str, Any]:
+    record = dict(note._asdict())  # type: ignore[attr-defined]
+    record["subnotes"] = [_note_record(subnote) for subnote in record["subnotes"]]
+    return record
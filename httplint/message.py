@@ -1,22 +1,26 @@
 import codecs
-import hashlib
 import re
 import weakref
 from functools import partial
-from typing import Any, Dict, Optional, TypedDict, cast
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional, TypedDict, TypeVar, cast
 
 from typing_extensions import NotRequired, Unpack
 
 from httplint.cache import ResponseCacheChecker
 from httplint.charset import verify_charset
-from httplint.content_encoding import ContentEncodingProcessor
+from httplint.content_encoding import ContentEncodingProcessor, ContentNeeds
 from httplint.content_type import verify_content_type
+from httplint.dictionaries import DictionaryCapture, DictionaryStore
 from httplint.field.cors import check_preflight_request, check_preflight_response
 from httplint.field.section import FieldSection
+from httplint.field.utils import pattern_registry
 from httplint.i18n import L_, translate
-from httplint.note import Note, Notes, categories, levels
+from httplint.note import Deferred, Note, Notes, VerdictNotes, categories, levels
+from httplint.note_filter import NoteFilter
 from httplint.status import StatusChecker
 from httplint.syntax import rfc3986
+from httplint.timings import Timings
 from httplint.types import (
     CachingProtocol,
     LinterProtocol,
@@ -26,13 +30,23 @@ from httplint.types import (
     ResponseLinterProtocol,
     SectionProtocol,
 )
-from httplint.util import f_num, iri_to_uri
+from httplint.util import f_num, iri_to_uri, new_content_hash
+
+URI_PATTERN = rf"^\s*{rfc3986.URI}\s*$"
+
+T = TypeVar("T")
 
 
 class HttpMessageParams(TypedDict):
     start_time: NotRequired[Optional[float]]
     _related: NotRequired[Optional[LinterProtocol]]
     no_content: NotRequired[bool]
+    hash_algorithm: NotRequired[Optional[str]]
+    content_needs: NotRequired[ContentNeeds]
+    dictionaries: NotRequired[Optional[DictionaryStore]]
+    timings: NotRequired[Optional[Timings]]
+    verdict_only: NotRequired[bool]
+    note_filter: NotRequired[Optional[NoteFilter]]
 
 
 class HttpMessageLinter:
@@ -59,12 +73,29 @@ class HttpMessageLinter:
         start_time: Optional[float] = None,
         _related: Optional[LinterProtocol] = None,
         no_content: bool = False,
+        hash_algorithm: Optional[str] = "md5",
+        timings: Optional[Timings] = None,
+        content_needs: ContentNeeds = ContentNeeds.ALL,
+        dictionaries: Optional[DictionaryStore] = None,
+        verdict_only: bool = False,
+        note_filter: Optional[NoteFilter] = None,
     ) -> None:
-        self.notes: NotesProtocol = Notes({"message_type": translate(self.message_type)})
+        self.notes: NotesProtocol
+        if verdict_only:
+            self.notes = VerdictNotes(note_filter)
+        else:
+            self.notes = Notes({"message_type": translate(self.message_type)}, note_filter)
+        self.note_filter = note_filter
+        self.timings = timings
         self._related = _related
         self.start_time = start_time
         self.finish_time: Optional[float] = None
         self.no_content = no_content
+        self.content_needs = content_needs
+        self.dictionaries = dictionaries
+        self._dictionary_capture: Optional[DictionaryCapture] = None
+        if ContentNeeds.HASH not in content_needs:
+            hash_algorithm = None
 
         self.version: str = ""
         self.base_uri: str = ""
@@ -73,14 +104,16 @@ class HttpMessageLinter:
 
         self.content_length: int = 0
         self.content_hash: Optional[bytes] = None
-        self._hash_processor = hashlib.new("md5")
+        self._hash_processor = new_content_hash(hash_algorithm)
         self.character_encoding: Optional[str] = None
-        self.content_sample: bytes = b""
+        self._content_sample = bytearray()
+        self._content_sample_len = 0
+        self._content_sample_bytes: Optional[bytes] = b""
 
         self.transfer_length: int = 0
         self.complete: bool = False
 
-        self.decoded = ContentEncodingProcessor(self)
+        self.decoded = ContentEncodingProcessor(self, hash_algorithm, content_needs)
         self_ref = weakref.ref(self)
 
         def weak_content_sample_processor(chunk: bytes) -> None:
@@ -88,7 +121,10 @@ class HttpMessageLinter:
             if obj is not None:
                 obj._content_sample_processor(chunk)  # pylint: disable=protected-access
 
-        self.decoded.processors.append(weak_content_sample_processor)
+        self._sample_processor: Optional[Callable[[bytes], None]] = None
+        if ContentNeeds.SAMPLE in content_needs:
+            self._sample_processor = weak_content_sample_processor
+            self.decoded.processors.append(weak_content_sample_processor)
 
     def process_request_topline(self, method: bytes, iri: bytes, version: bytes) -> None: ...
 
@@ -100,7 +136,7 @@ class HttpMessageLinter:
         """
         Feed a list of (bytes name, bytes value) header tuples in and process them.
         """
-        self.headers.process(headers)
+        self._stage("headers", self.headers.process, headers)
 
         # set the character encoding from headers
         if "content-type" in self.headers.parsed:
@@ -111,6 +147,16 @@ class HttpMessageLinter:
             except (LookupError, TypeError):
                 pass
 
+        # keep the content of responses that can be used as compression dictionaries
+        if (
+            self.dictionaries is not None
+            and not self.no_content
+            and self.as_response
+            and "use-as-dictionary" in self.headers.parsed
+        ):
+            self._dictionary_capture = DictionaryCapture(self.dictionaries, self.decoded.processors)
+            self.decoded.processors.append(self._dictionary_capture)
+
     def feed_content(self, chunk: bytes) -> None:
         """
         Feed a chunk of the content in. Can be called 0 to many times.
@@ -118,9 +164,16 @@ class HttpMessageLinter:
         Each processor in content_processors will be run over the chunk.
         """
         self.content_length += len(chunk)
-        if not self.no_content:
-            self._hash_processor.update(chunk)
+        if self.no_content:
+            return
+        if self.timings is None:
+            if self._hash_processor is not None:
+                self._hash_processor.update(chunk)
             self.decoded.feed_content(chunk)
+        else:
+            if self._hash_processor is not None:
+                self._stage("hash", self._hash_processor.update, chunk)
+            self._stage("content-encoding", self.decoded.feed_content, chunk)
 
     def finish_content(self, complete: bool, trailers: Optional[RawFieldListType] = None) -> None:
         """
@@ -128,10 +181,14 @@ class HttpMessageLinter:
         know it's complete according to message framing.
         """
         self.complete = complete
-        self.content_hash = self._hash_processor.digest()
+        self.content_hash = (
+            self._hash_processor.digest() if self._hash_processor is not None else b""
+        )
         if trailers:
-            self.trailers.process(trailers)
-        self.decoded.finish_content()
+            self._stage("trailers", self.trailers.process, trailers)
+        self._stage("content-encoding", self.decoded.finish_content)
+        if self._dictionary_capture is not None and complete and self.decoded.decode_ok:
+            self._dictionary_capture.finish()
 
         if self.can_have_content():
             if "content-length" in self.headers.parsed and not self.no_content:
@@ -141,13 +198,15 @@ class HttpMessageLinter:
                     self.notes.add(
                         "field-content-length",
                         CL_INCORRECT,
-                        content_length=f_num(self.content_length),
+                        content_length=Deferred(f_num, self.content_length),
                     )
         else:
             if self.content_length and not self.no_content:
-                self.notes.add("message", CONTENT_NOT_ALLOWED)
+                self.notes.add("message", CONTENT_NOT_ALLOWED, message=translate(self.message_type))
         self.post_checks()
+        self._stage("field-post-checks", self._field_post_checks)
 
+    def _field_post_checks(self) -> None:
         for section in [self.headers, self.trailers]:
             for handler in section.handlers.values():
                 field_add_note = partial(
@@ -166,14 +225,59 @@ class HttpMessageLinter:
     def post_checks(self) -> None:
         "Post-parsing checks to perform."
 
+    def _check(self, stage: str, checker: Callable[..., Any], *args: Any) -> None:
+        """
+        Run checker, which only adds notes, as stage; skip it if note_filter won't
+        keep any of the notes it can add.
+        """
+        if self.note_filter is None or self.note_filter.runs(checker):
+            self._stage(stage, checker, *args)
+
+    def _stage(self, stage: str, func: Callable[..., T], *args: Any) -> T:
+        """
+        Call func with args, recording the time taken as stage if timings are on.
+        """
+        if self.timings is None:
+            return func(*args)
+        start = perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.timings.add(stage, perf_counter() - start)
+
     content_sample_size = 8192
 
+    @property
+    def content_sample(self) -> bytes:
+        "The first content_sample_size bytes of the decoded content."
+        if self._content_sample_bytes is None:
+            with memoryview(self._content_sample) as view:
+                self._content_sample_bytes = bytes(view[: self._content_sample_len])
+        return self._content_sample_bytes
+
     def _content_sample_processor(self, chunk: bytes) -> None:
         """
-        Capture a sample of the decoded content.
+        Capture a sample of the decoded content into a preallocated buffer, and
+        stop being called once it's full.
         """
-        if len(self.content_sample) < self.content_sample_size:
-            self.content_sample += chunk[: self.content_sample_size - len(self.content_sample)]
+        if not self._content_sample:
+            self._content_sample = bytearray(self.content_sample_size)
+        start = self._content_sample_len
+        end = start + len(chunk)
+        if end < self.content_sample_size:
+            self._content_sample[start:end] = chunk
+        else:
+            end = self.content_sample_size
+            with memoryview(chunk) as view:
+                self._content_sample[start:end] = view[: end - start]
+            if self._sample_processor is not None:
+                # replace rather than mutate the list, as it may be being iterated over
+                self.decoded.processors = [
+                    proc for proc in self.decoded.processors if proc is not self._sample_processor
+                ]
+                self._sample_processor = None
+        self._content_sample_len = end
+        self._content_sample_bytes = None
 
     def __repr__(self) -> str:
         status = [self.__class__.__module__ + "." + self.__class__.__name__]
@@ -183,6 +287,9 @@ class HttpMessageLinter:
         state: Dict[str, Any] = self.__dict__.copy()
         for key in [
             "_hash_processor",
+            "_sample_processor",
+            "_dictionary_capture",
+            "dictionaries",
         ]:
             if key in state:
                 del state[key]
@@ -219,13 +326,13 @@ class HttpRequestLinter(HttpMessageLinter):
             self.notes.add("uri", URI_BAD_SYNTAX)
             self.uri = iri  # hope?
             return
-        if not re.match(rf"^\s*{rfc3986.URI}\s*$", self.uri, re.VERBOSE):
+        if not pattern_registry.compile(URI_PATTERN, re.VERBOSE).match(self.uri):
             self.notes.add("uri", URI_BAD_SYNTAX)
         if "#" in self.uri:
             # chop off the fragment
             self.uri = self.uri[: self.uri.index("#")]
         if len(self.uri) > self.max_uri_chars:
-            self.notes.add("uri", URI_TOO_LONG, uri_len=f_num(len(self.uri)))
+            self.notes.add("uri", URI_TOO_LONG, uri_len=Deferred(f_num, len(self.uri)))
 
     def can_have_content(self) -> bool:
         return True
@@ -239,7 +346,7 @@ class HttpRequestLinter(HttpMessageLinter):
         self._related = value
 
     def post_checks(self) -> None:
-        check_preflight_request(self)
+        self._check("cors", check_preflight_request, self)
         if "user-agent" not in self.headers.parsed:
             self.notes.add("field-user-agent", MISSING_USER_AGENT)
 
@@ -305,12 +412,12 @@ class HttpResponseLinter(HttpMessageLinter):
         return True
 
     def post_checks(self) -> None:
-        check_preflight_response(self)
-        self.caching = ResponseCacheChecker(self)
-        StatusChecker(self, self.request)
-        if not self.no_content:
-            verify_content_type(self)
-            verify_charset(self)
+        self._check("cors", check_preflight_response, self)
+        self.caching = self._stage("cache", ResponseCacheChecker, self)
+        self._check("status", StatusChecker, self, self.request)
+        if not self.no_content and ContentNeeds.SAMPLE in self.content_needs:
+            self._check("content-type", verify_content_type, self)
+            self._check("charset", verify_charset, self)
 
 
 class CL_CORRECT(Note):
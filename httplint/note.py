@@ -1,16 +1,36 @@
 from __future__ import annotations
 
-from collections import UserList
+from collections import ChainMap, UserList
 from enum import Enum
+from functools import lru_cache
 from threading import local
-from typing import Any, Dict, MutableMapping, Optional, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    MutableMapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from markdown import Markdown
 from markupsafe import Markup
 
-from httplint.i18n import L_, translate
+from httplint.i18n import L_, get_locale, translate
 from httplint.types import NoteListType, VariableType
 
+if TYPE_CHECKING:
+    from httplint.note_filter import NoteFilter
+
 
 class _MdLocal(local):
     md: Markdown
@@ -64,11 +84,18 @@ class levels(Enum):
 class Notes(UserList[Any]):
     """
     A list of notes.
+
+    default_vars are shared by every note added, rather than copied into each one;
+    they shouldn't be changed once notes have been added. Notes that note_filter
+    doesn't allow aren't added.
     """
 
-    def __init__(self, default_vars: Dict[str, VariableType]):
+    def __init__(
+        self, default_vars: Dict[str, VariableType], note_filter: Optional[NoteFilter] = None
+    ):
         UserList.__init__(self)
         self._default_vars = default_vars
+        self._note_filter = note_filter
 
     def add(
         self,
@@ -77,16 +104,176 @@ class Notes(UserList[Any]):
         category: Optional[categories] = None,
         **vrs: VariableType,
     ) -> Note:
-        tmp_vars: MutableMapping[str, VariableType] = self._default_vars.copy()
-        tmp_vars.update(vrs)
-        new_note = note(subject, **tmp_vars)
+        if self._note_filter is not None and not self._note_filter.allows(note, category):
+            return _DISCARDED
+        new_note = note(subject, **vrs)
+        new_note._default_vars = self._default_vars  # pylint: disable=protected-access
         if category and new_note.category == categories.GENERAL:
             new_note.category = category
         self.data.append(new_note)
         return new_note
 
+    def find(self, note: Union[Type[Note], Tuple[Type[Note], ...]]) -> Optional[Note]:
+        """
+        Return the first note added that is an instance of note (or one of a tuple
+        of classes), or None if there isn't one.
+        """
+        for candidate in self.data:
+            if isinstance(candidate, note):
+                return candidate
+        return None
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        Return a list of the notes as dictionaries; see Note.to_dict.
+        """
+        return [note.to_dict() for note in self.data]
+
+
+class Verdict(NamedTuple):
+    "A note that VerdictNotes recorded: its class, subject and category."
+
+    note: Type[Note]
+    subject: str
+    category: categories
+
+    @property
+    def level(self) -> levels:
+        return self.note.level
 
-class Note:
+
+class VerdictNotes:
+    """
+    A stand-in for Notes when only the verdict is needed: which notes were added,
+    and how many of each level.
+
+    Notes aren't created, so their vars are ignored and children added to them are
+    discarded; iterating yields a Verdict for each note added. Notes that
+    note_filter doesn't allow aren't recorded.
+    """
+
+    __slots__ = ("data", "counts", "_note_filter")
+
+    def __init__(self, note_filter: Optional[NoteFilter] = None) -> None:
+        self.data: List[Verdict] = []
+        self.counts: Dict[levels, int] = dict.fromkeys(levels, 0)
+        self._note_filter = note_filter
+
+    def add(
+        self,
+        subject: str,
+        note: Type[Note],
+        category: Optional[categories] = None,
+        **vrs: VariableType,
+    ) -> Note:
+        if self._note_filter is not None and not self._note_filter.allows(note, category):
+            return _DISCARDED
+        note_category = note._class_category  # pylint: disable=protected-access
+        if category and note_category == categories.GENERAL:
+            note_category = category
+        self.data.append(Verdict(note, subject, note_category))
+        self.counts[note.level] += 1
+        return _DISCARDED
+
+    def find(self, note: Union[Type[Note], Tuple[Type[Note], ...]]) -> Optional[Note]:
+        """
+        Return a stand-in for the first note added that is an instance of note (or
+        one of a tuple of classes), or None if there isn't one.
+        """
+        for verdict in self.data:
+            if issubclass(verdict.note, note):
+                return _DISCARDED
+        return None
+
+    def has_level(self, level: levels) -> bool:
+        "Whether any note of the given level was added."
+        return self.counts[level] > 0
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        Return a list of the notes as dictionaries, like Notes.to_records but
+        without vars or subnotes.
+        """
+        return [
+            {
+                "note": verdict.note.__name__,
+                "subject": verdict.subject,
+                "level": verdict.level.value,
+                "category": verdict.category.name,
+            }
+            for verdict in self.data
+        ]
+
+    def __iter__(self) -> Iterator[Verdict]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
+class _DiscardedNote:
+    "What VerdictNotes.add returns, so that callers can still add children."
+
+    __slots__ = ()
+
+    def add_child(self, note: Type[Note], **vrs: VariableType) -> Note:
+        return _DISCARDED
+
+
+_DISCARDED = cast("Note", _DiscardedNote())
+
+
+class Deferred:
+    """
+    A var value that is only worked out when it's needed: when the note is
+    rendered, or its vars are read. Use it for values that are costly to format,
+    e.g. Deferred(f_num, length).
+    """
+
+    __slots__ = ("func", "args")
+
+    def __init__(self, func: Callable[..., VariableType], *args: Any) -> None:
+        self.func = func
+        self.args = args
+
+    def __call__(self) -> VariableType:
+        return self.func(*self.args)
+
+
+class _NoteType(type):
+    """
+    Metaclass for Note.
+
+    Gives every subclass empty __slots__ unless it declares its own, so that notes
+    don't carry an instance __dict__, and stores the category a class declares where
+    Note.category can find it.
+    """
+
+    def __new__(
+        mcs, name: str, bases: Tuple[type, ...], namespace: Dict[str, Any], **kwargs: Any
+    ) -> _NoteType:
+        namespace.setdefault("__slots__", ())
+        if isinstance(namespace.get("category"), categories):
+            namespace["_class_category"] = namespace.pop("category")
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+
+class _NoteCategory:
+    """
+    Descriptor for Note.category: the category of the note's class, unless one has
+    been set on the note itself.
+    """
+
+    def __get__(self, note: Optional[Note], owner: Type[Note]) -> categories:
+        if note is not None and note._category is not None:  # pylint: disable=protected-access
+            return note._category  # pylint: disable=protected-access
+        return owner._class_category  # pylint: disable=protected-access
+
+    def __set__(self, note: Note, value: categories) -> None:
+        note._category = value  # pylint: disable=protected-access
+
+
+class Note(metaclass=_NoteType):
     """
     A note about an HTTP resource, representation, or other component
     related to the URI under test.
@@ -97,30 +284,98 @@ class Note:
     into it need to be escaped to be safe for use in HTML.
     """
 
-    category: categories
-    level: levels
+    __slots__ = ("subject", "_vars", "_default_vars", "_subnotes", "_category")
+
+    if TYPE_CHECKING:
+
+        @property
+        def category(self) -> categories: ...
+
+        @category.setter
+        def category(self, value: categories) -> None: ...
+
+    else:
+        category = _NoteCategory()
+    _class_category: ClassVar[categories]
+    level: ClassVar[levels]
     _summary = ""
     _text = ""
 
     def __init__(self, subject: str, **vrs: VariableType) -> None:
         self.subject = subject
-        self.vars = vrs or {}
-        self.subnotes: NoteListType = []
+        self._vars: Dict[str, VariableType] = vrs
+        self._default_vars: Optional[Dict[str, VariableType]] = None
+        self._subnotes: Optional[NoteListType] = None
+        self._category: Optional[categories] = None
+
+    @property
+    def vars(self) -> MutableMapping[str, VariableType]:
+        """
+        The note's variables, including any defaults from the Notes it was added to.
+
+        The defaults are shared with other notes; changes are made to the note's own
+        variables, which take precedence over them.
+        """
+        self._resolve()
+        if self._default_vars is None:
+            return self._vars
+        return ChainMap(self._vars, self._default_vars)
+
+    @vars.setter
+    def vars(self, value: MutableMapping[str, VariableType]) -> None:
+        self._vars = dict(value)
+        self._default_vars = None
+
+    def _resolve(self) -> None:
+        "Replace any Deferred vars with their values."
+        for name, value in self._vars.items():
+            if isinstance(value, Deferred):
+                self._vars[name] = value()
+
+    def _all_vars(self) -> Dict[str, VariableType]:
+        self._resolve()
+        if self._default_vars is None:
+            return self._vars
+        return {**self._default_vars, **self._vars}
+
+    @property
+    def subnotes(self) -> Sequence[Note]:
+        "Notes that were added as children of this one; see add_child."
+        if self._subnotes is None:
+            return ()
+        return self._subnotes
 
     def add_child(self, note: Type[Note], **vrs: VariableType) -> Note:
-        tmp_vars = self.vars.copy()
-        tmp_vars.update(vrs)
-        new_note = note(self.subject, **tmp_vars)
-        self.subnotes.append(new_note)
+        new_note = note(self.subject, **{**self._vars, **vrs})
+        new_note._default_vars = self._default_vars  # pylint: disable=protected-access
+        if self._subnotes is None:
+            self._subnotes = []
+        self._subnotes.append(new_note)
         return new_note
 
     def __str__(self) -> str:
         return str(self.summary)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the note as a dictionary, without translating or rendering it.
+
+        The level and category are given by their enum value and name respectively,
+        and vars are as they were set; subnotes are included as dictionaries too.
+        """
+        return {
+            "note": self.__class__.__name__,
+            "subject": self.subject,
+            "level": self.level.value,
+            "category": self.category.name,
+            "vars": dict(self._all_vars()),
+            "subnotes": [subnote.to_dict() for subnote in self.subnotes],
+        }
+
     def __eq__(self, other: Any) -> bool:
         return bool(
             self.__class__ == other.__class__
-            and self.vars == other.vars
+            and self._all_vars() == other._all_vars()  # pylint: disable=protected-access
             and self.subject == other.subject
         )
 
@@ -131,7 +386,8 @@ class Note:
         The value is NOT HTML-escaped.  Consumers are responsible for escaping
         before embedding in HTML.
         """
-        return translate(self._summary) % self.vars
+        frozen = tuple(sorted((k, str(v)) for k, v in self._all_vars().items()))
+        return _render_summary(self._summary, get_locale(), frozen)
 
     def _get_detail(self) -> Markup:
         """
@@ -149,15 +405,67 @@ class Note:
         (e.g. a joined list of code spans) should be wrapped in
         MarkdownSafe to opt out of this stripping.
         """
+
         def _coerce(val: Any) -> str:
             if isinstance(val, MarkdownSafe):
                 return str(val)
             return str(val).replace("`", "")
 
-        safe_vars = {k: _coerce(v) for k, v in self.vars.items()}
-        return Markup(
-            _get_markdown().reset().convert(translate(self._text) % safe_vars)
-        )
+        frozen = tuple(sorted((k, _coerce(v)) for k, v in self._all_vars().items()))
+        return _render_detail(self._text, get_locale(), frozen)
 
     summary = property(_get_summary)
     detail = property(_get_detail)
+
+
+# Rendered summaries and details are cached by template, locale and the string
+# values of the vars, since that is all that rendering depends upon.
+RENDER_CACHE_SIZE = 4096
+
+FrozenVarsType = Tuple[Tuple[str, str], ...]
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _render_summary(
+    template: str, locale: str, frozen: FrozenVarsType  # pylint: disable=unused-argument
+) -> str:
+    return translate(template) % dict(frozen)
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _render_detail(
+    template: str, locale: str, frozen: FrozenVarsType  # pylint: disable=unused-argument
+) -> Markup:
+    return Markup(_get_markdown().reset().convert(translate(template) % dict(frozen)))
+
+
+class RenderCacheInfo(NamedTuple):
+    "Statistics for the caches of rendered summaries and details, combined."
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def render_cache_info() -> RenderCacheInfo:
+    """
+    Return statistics for the caches of rendered Note summaries and details.
+    """
+    # pylint: disable=no-value-for-parameter
+    summary = _render_summary.cache_info()
+    detail = _render_detail.cache_info()
+    return RenderCacheInfo(
+        summary.hits + detail.hits,
+        summary.misses + detail.misses,
+        RENDER_CACHE_SIZE * 2,
+        summary.currsize + detail.currsize,
+    )
+
+
+def clear_render_cache() -> None:
+    """
+    Empty the caches of rendered Note summaries and details.
+    """
+    _render_summary.cache_clear()
+    _render_detail.cache_clear()
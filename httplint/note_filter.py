@@ -0,0 +1,112 @@
+"""
+Choosing which notes to keep, so that checks which can only add unwanted notes
+don't need to run at all.
+"""
+
+import inspect
+import sys
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Set, Tuple, Type, Union
+
+from httplint.note import Note, categories
+
+NoteSpecType = Union[Type[Note], categories]
+
+
+class NoteFilter:
+    """
+    Which notes a linter keeps, given as note classes or categories.
+
+    If allow is given, only notes that are (or are in) one of its members are
+    kept; notes that are in deny never are. A note's category is the one it's
+    added with, which is usually that of its class.
+
+    Only notes added to a linter's notes are filtered; children of a note that is
+    kept are kept too.
+    """
+
+    def __init__(
+        self,
+        allow: Optional[Iterable[NoteSpecType]] = None,
+        deny: Iterable[NoteSpecType] = (),
+    ) -> None:
+        self.allow: Optional[FrozenSet[NoteSpecType]] = (
+            frozenset(allow) if allow is not None else None
+        )
+        self.deny: FrozenSet[NoteSpecType] = frozenset(deny)
+        self._allows: Dict[Tuple[Type[Note], Optional[categories]], bool] = {}
+        self._runs: Dict[Tuple[Any, Optional[str], Optional[categories]], bool] = {}
+
+    def allows(self, note: Type[Note], category: Optional[categories] = None) -> bool:
+        "Whether a note of class note, added with category, is kept."
+        key = (note, category)
+        try:
+            return self._allows[key]
+        except KeyError:
+            pass
+        note_category = note._class_category  # pylint: disable=protected-access
+        if category is not None and note_category == categories.GENERAL:
+            note_category = category
+        result = note not in self.deny and note_category not in self.deny
+        if result and self.allow is not None:
+            result = note in self.allow or note_category in self.allow
+        self._allows[key] = result
+        return result
+
+    def runs(
+        self,
+        checker: Any,
+        method: Optional[str] = None,
+        category: Optional[categories] = None,
+    ) -> bool:
+        """
+        Whether checker (a function or class, or the given method of a class) needs
+        to run: i.e., whether any of the notes it can add (see checker_notes) are
+        kept. category is the one it adds notes with, if any.
+        """
+        key = (checker, method, category)
+        try:
+            return self._runs[key]
+        except KeyError:
+            pass
+        result = any(self.allows(note, category) for note in checker_notes(checker, method))
+        self._runs[key] = result
+        return result
+
+
+@lru_cache(maxsize=None)
+def checker_notes(checker: Any, method: Optional[str] = None) -> FrozenSet[Type[Note]]:
+    """
+    Return the note classes that checker (a function or class) can add; if method
+    is given, only those that the method of that name on the class can add.
+
+    These are the notes defined in or imported into the modules that define the
+    checker (for a class, the classes in its MRO; for a method, those of them
+    that define it, until one doesn't call super()), and into the httplint
+    modules of any functions those modules import. This errs on the side of
+    including notes that it can't actually add.
+    """
+    modules: Set[ModuleType] = set()
+    owners = inspect.getmro(checker) if inspect.isclass(checker) else (checker,)
+    for owner in owners:
+        func = vars(owner).get(method) if method is not None else None
+        if method is not None and func is None:
+            continue
+        module = sys.modules.get(owner.__module__)
+        if module is not None and module.__name__.startswith("httplint"):
+            modules.add(module)
+        if func is not None and "super" not in func.__code__.co_names:
+            break
+    for module in list(modules):
+        for value in vars(module).values():
+            if inspect.isfunction(value):
+                used = sys.modules.get(value.__module__)
+                if used is not None and used.__name__.startswith("httplint"):
+                    modules.add(used)
+    return frozenset(
+        value
+        for module in modules
+        for value in vars(module).values()
+        if inspect.isclass(value) and issubclass(value, Note) and hasattr(value, "level")
+    )
@@ -3,34 +3,28 @@
 from functools import partial
 from typing import List, Optional
 
-from httplint.note import Note, categories, levels
+from httplint.note import Deferred, Note, categories, levels
 from httplint.util import markdown_list
 from httplint.types import (
     RequestLinterProtocol,
     ResponseLinterProtocol,
-    StrFieldListType,
+    SectionProtocol,
 )
 
 safe_methods = ["GET", "HEAD", "OPTIONS", "TRACE"]
 
 
-def get_header(hdr_tuples: StrFieldListType, name: str) -> List[str]:
+def get_header(section: SectionProtocol, name: str) -> List[str]:
     """
-    Given a list of (name, value) header tuples and a header name (lowercase),
-    return a list of all values for that header.
+    Given a field section and a header name (lowercase), return a list of all
+    values for that header.
 
     This includes header lines with multiple values separated by a comma;
     such headers will be split into separate values. As a result, it is NOT
     safe to use this on headers whose values may include a comma (e.g.,
     Set-Cookie, or any value with a quoted string).
     """
-    return [
-        v.strip()
-        for v in sum(
-            [l.split(",") for l in [i[1] for i in hdr_tuples if i[0].lower() == name]],
-            [],
-        )
-    ]
+    return [value.strip() for line, _ in section.index.get(name, ()) for value in line.split(",")]
 
 
 class StatusChecker:
@@ -57,11 +51,11 @@ class StatusChecker:
         status_method()
 
     def status100(self) -> None:  # Continue
-        if self.request and not "100-continue" in get_header(self.request.headers.text, "expect"):
+        if self.request and not "100-continue" in get_header(self.request.headers, "expect"):
             self.add_note("status", UNEXPECTED_CONTINUE)
 
     def status101(self) -> None:  # Switching Protocols
-        if self.request and not get_header(self.request.headers.text, "upgrade"):
+        if self.request and not get_header(self.request.headers, "upgrade"):
             self.add_note("status", UPGRADE_NOT_REQUESTED)
 
     def status102(self) -> None:  # Processing
@@ -95,7 +89,7 @@ class StatusChecker:
         pass
 
     def status206(self) -> None:  # Partial Content
-        if self.request and not get_header(self.request.headers.text, "range"):
+        if self.request and not get_header(self.request.headers, "range"):
             self.add_note("", PARTIAL_NOT_REQUESTED)
         if "content-range" not in self.response.headers.parsed:
             self.add_note("field-location", PARTIAL_WITHOUT_RANGE)
@@ -136,7 +130,7 @@ class StatusChecker:
             self.add_note(
                 "field-content-type",
                 HEADER_SHOULD_NOT_BE_IN_304,
-                headers=markdown_list(prohibited_headers, markup="`"),
+                headers=Deferred(markdown_list, prohibited_headers, "`"),
             )
 
     def status305(self) -> None:  # Use Proxy
@@ -184,7 +178,7 @@ class StatusChecker:
                 "accept-encoding",
                 "accept-language",
             ]
-            if not any(get_header(self.request.headers.text, h) for h in negotiation_headers):
+            if not any(get_header(self.request.headers, h) for h in negotiation_headers):
                 self.add_note("", STATUS_406_WITHOUT_NEGOTIATION)
                 return
         self.add_note("", STATUS_NOT_ACCEPTABLE)
@@ -213,7 +207,7 @@ class StatusChecker:
                 "if-unmodified-since",
                 "if-range",
             ]
-            if not any(get_header(self.request.headers.text, h) for h in match_headers):
+            if not any(get_header(self.request.headers, h) for h in match_headers):
                 self.add_note("", STATUS_412_WITHOUT_PRECONDITION)
                 return
         self.add_note("", STATUS_PRECONDITION_FAILED)
@@ -232,12 +226,12 @@ class StatusChecker:
         self.add_note("", STATUS_UNSUPPORTED_MEDIA_TYPE)
 
     def status416(self) -> None:  # Requested Range Not Satisfiable
-        if self.request and not get_header(self.request.headers.text, "range"):
+        if self.request and not get_header(self.request.headers, "range"):
             self.add_note("", STATUS_416_WITHOUT_RANGE)
 
     def status417(self) -> None:  # Expectation Failed
         if self.request:
-            expect_headers = get_header(self.request.headers.text, "expect")
+            expect_headers = get_header(self.request.headers, "expect")
             if not expect_headers:
                 self.add_note("", STATUS_417_WITHOUT_EXPECT)
                 return
@@ -0,0 +1,62 @@
+from dataclasses import dataclass
+from typing import Dict
+
+
+@dataclass
+class StageTiming:
+    "Accumulated wall time (in seconds) and number of calls."
+
+    seconds: float = 0.0
+    calls: int = 0
+
+
+class Timings:
+    """
+    Wall time and call counts for each stage of linting a message, and for each
+    field handler class.
+
+    Pass a Timings instance to a linter as `timings` to turn instrumentation on.
+    The same instance can be passed to many linters to aggregate across messages,
+    or separate instances can be combined with merge().
+    """
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, StageTiming] = {}
+        self.fields: Dict[str, StageTiming] = {}
+
+    def add(self, stage: str, seconds: float) -> None:
+        "Record one call to a stage."
+        timing = self.stages.get(stage)
+        if timing is None:
+            timing = self.stages[stage] = StageTiming()
+        timing.seconds += seconds
+        timing.calls += 1
+
+    def add_field(self, handler_name: str, seconds: float) -> None:
+        "Record one call into a field handler."
+        timing = self.fields.get(handler_name)
+        if timing is None:
+            timing = self.fields[handler_name] = StageTiming()
+        timing.seconds += seconds
+        timing.calls += 1
+
+    def merge(self, other: "Timings") -> None:
+        "Add the timings in other to these."
+        for mine, theirs in [(self.stages, other.stages), (self.fields, other.fields)]:
+            for name, timing in theirs.items():
+                target = mine.setdefault(name, StageTiming())
+                target.seconds += timing.seconds
+                target.calls += timing.calls
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        "Return the timings as plain dictionaries, e.g. for serialising to JSON."
+        return {
+            "stages": {
+                name: {"seconds": timing.seconds, "calls": timing.calls}
+                for name, timing in self.stages.items()
+            },
+            "fields": {
+                name: {"seconds": timing.seconds, "calls": timing.calls}
+                for name, timing in self.fields.items()
+            },
+        }
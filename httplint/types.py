@@ -22,7 +22,10 @@ from http_sf.types import (
 )
 
 if TYPE_CHECKING:
+    from httplint.dictionaries import DictionaryStore
     from httplint.note import Note
+    from httplint.note_filter import NoteFilter
+    from httplint.timings import Timings
 else:
     Note = Any  # pylint: disable=invalid-name
 
@@ -53,6 +56,12 @@ NoteArgsType = Tuple[Type[Note], Dict[str, VariableType]]
 TMessage = TypeVar("TMessage", bound="LinterProtocol")  # pylint: disable=invalid-name
 
 
+class HashProtocol(Protocol):
+    def update(self, data: bytes, /) -> None: ...
+
+    def digest(self) -> bytes: ...
+
+
 # Linter Protocols
 @runtime_checkable
 class NotesProtocol(Protocol):
@@ -64,6 +73,10 @@ class NotesProtocol(Protocol):
         **vrs: VariableType,
     ) -> Note: ...
 
+    def find(self, note: Any) -> Optional[Note]: ...
+
+    def to_records(self) -> List[Dict[str, Any]]: ...
+
     def __iter__(self) -> Any: ...
 
 
@@ -71,6 +84,7 @@ class NotesProtocol(Protocol):
 class SectionProtocol(Protocol):
     parsed: Dict[str, Any]
     text: List[Tuple[str, str]]
+    index: Dict[str, List[Tuple[str, int]]]
     handlers: Dict[str, Any]  # Avoiding circularity with HttpField
     is_trailer: bool
     _finder: Any  # Avoiding circularity with HttpFieldFinder; for tests
@@ -98,8 +112,13 @@ class LinterProtocol(Protocol):
     trailers: SectionProtocol
     content_length: int
     content_hash: Optional[bytes]
-    content_sample: bytes
     complete: bool
+    timings: Optional[Timings]
+    dictionaries: Optional[DictionaryStore]
+    note_filter: Optional[NoteFilter]
+
+    @property
+    def content_sample(self) -> bytes: ...
 
     @property
     def as_request(self) -> Optional[RequestLinterProtocol]: ...
@@ -1,14 +1,15 @@
+import hashlib
 import locale
-import time
-import unittest
+import zlib
 from binascii import b2a_hex
 from datetime import timedelta
-from typing import Any, List
+from typing import Any, List, Optional
 from urllib.parse import quote as urlquote
 from urllib.parse import urlsplit, urlunsplit
 
 from httplint.i18n import format_timedelta, translate
 from httplint.note import MarkdownSafe
+from httplint.types import HashProtocol
 
 
 def iri_to_uri(iri: str) -> str:
@@ -107,25 +108,28 @@ def relative_time(utime: float, now: float, show_sign: int = 1) -> Any:
     return RelativeTime(utime, now, show_sign)
 
 
-class RelativeTimeTester(unittest.TestCase):
-    minute = 60
-    hour = minute * 60
-    day = hour * 24
-    year = day * 365
-    cases = [
-        (+year, "in 12 months"),
-        (-year, "12 months ago"),
-        (+year + 1, "in 12 months"),
-        (+year + 0.9, "in 12 months"),
-        (+year + day, "in 12 months"),
-        (+year + (10 * day), "in 12 months"),
-        (+year + (90 * day) + (3 * hour), "in 1 year"),
-        (+(13 * day) - 0.4, "in 2 weeks"),
-    ]
-
-    def setUp(self) -> None:
-        self.now = time.time()
-
-    def test_relative_time(self) -> None:
-        for delta, result in self.cases:
-            self.assertEqual(str(relative_time(self.now + delta, self.now)), result)
+class Crc32Hash:
+    """
+    A cheap, non-cryptographic content hash with the hashlib update/digest interface.
+    """
+
+    def __init__(self) -> None:
+        self._value = 0
+
+    def update(self, data: bytes, /) -> None:
+        self._value = zlib.crc32(data, self._value)
+
+    def digest(self) -> bytes:
+        return self._value.to_bytes(4, "big")
+
+
+def new_content_hash(algorithm: Optional[str]) -> Optional[HashProtocol]:
+    """
+    Return a new hash object for the named algorithm: "crc32", or anything that
+    hashlib.new() accepts. Returns None if algorithm is None, meaning don't hash.
+    """
+    if algorithm is None:
+        return None
+    if algorithm == "crc32":
+        return Crc32Hash()
+    return hashlib.new(algorithm)
@@ -0,0 +1,33 @@
+from httplint.field import BAD_SYNTAX
+from httplint.field.parsers.accept import ACCEPT_BAD_SYNTAX, BAD_Q_VALUE, AcceptValue
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, RequestLinterProtocol
+
+
+class AcceptTest(FieldTest[RequestLinterProtocol]):
+    name = "Accept"
+    inputs = [b"audio/*; q=0.2, audio/basic"]
+    expected_out = [
+        AcceptValue("audio/*", {}, 0.2),
+        AcceptValue("audio/basic", {}, None),
+    ]
+
+
+class AcceptComplexTest(FieldTest[RequestLinterProtocol]):
+    name = "Accept"
+    inputs = [b"text/html; level=1; q=0.5"]
+    expected_out = [AcceptValue("text/html", {"level": "1"}, 0.5)]
+
+
+class AcceptBadQTest(FieldTest[RequestLinterProtocol]):
+    name = "Accept"
+    inputs = [b"text/html; q=1.001"]
+    expected_out = [AcceptValue("text/html", {}, None)]
+    expected_notes: NoteClassListType = [BAD_Q_VALUE]
+
+
+class AcceptBadTypeTest(FieldTest[RequestLinterProtocol]):
+    name = "Accept"
+    inputs = [b"invalid"]
+    expected_out = [AcceptValue("invalid", {}, None)]
+    expected_notes: NoteClassListType = [ACCEPT_BAD_SYNTAX, BAD_SYNTAX]
@@ -0,0 +1,52 @@
+from types import SimpleNamespace
+from typing import cast
+
+from http_sf import Token
+
+from httplint.field.parsers.accept_ch import (
+    ACCEPT_CH_BAD_TYPE,
+    ACCEPT_CH_IN_PLAIN_HTTP,
+    ACCEPT_CH_MISSING_VARY,
+)
+from httplint.field.tests import FakeRequestLinter, FieldTest
+from httplint.types import CachingProtocol, NoteClassListType, ResponseLinterProtocol
+
+
+class AcceptCHTest(FieldTest[ResponseLinterProtocol]):
+    name = "Accept-CH"
+    inputs = [b"Sec-CH-Example, Sec-CH-Example-2"]
+    expected_out = [(Token("Sec-CH-Example"), {}), (Token("Sec-CH-Example-2"), {})]
+    expected_notes: NoteClassListType = []
+
+
+class AcceptCHBadSyntaxTest(FieldTest[ResponseLinterProtocol]):
+    name = "Accept-CH"
+    inputs = [b'"foo"']
+    expected_out = [("foo", {})]
+    expected_notes: NoteClassListType = [
+        ACCEPT_CH_BAD_TYPE,
+    ]
+
+
+class AcceptCHHTTPTest(FieldTest[ResponseLinterProtocol]):
+    name = "Accept-CH"
+    inputs = [b"Sec-CH-Example"]
+    expected_out = [(Token("Sec-CH-Example"), {})]
+    expected_notes = [ACCEPT_CH_IN_PLAIN_HTTP]
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        request = FakeRequestLinter()
+        request.uri = "http://example.com/"
+        message.request = request
+
+
+class AcceptCHMissingVaryTest(FieldTest[ResponseLinterProtocol]):
+    name = "Accept-CH"
+    inputs = [b"Sec-CH-Example"]
+    expected_out = [(Token("Sec-CH-Example"), {})]
+    expected_notes = [ACCEPT_CH_MISSING_VARY]
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        message.caching = cast(
+            CachingProtocol, SimpleNamespace(store_shared=True, store_private=True)
+        )
@@ -0,0 +1,12 @@
+from httplint.field.tests import FieldTest
+from httplint.types import RequestLinterProtocol
+
+
+class AcceptEncodingTest(FieldTest[RequestLinterProtocol]):
+    name = "Accept-Encoding"
+    inputs = [b"gzip, identity; q=0.5, *;q=0"]
+    expected_out = [
+        ("gzip", {}),
+        ("identity", {"q": "0.5"}),
+        ("*", {"q": "0"}),
+    ]
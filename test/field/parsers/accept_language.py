@@ -0,0 +1,32 @@
+from httplint.field import BAD_SYNTAX
+from httplint.field.parsers.accept_language import (
+    ACCEPT_LANGUAGE_BAD_SYNTAX,
+    BAD_Q_VALUE,
+    AcceptLanguageValue,
+)
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, RequestLinterProtocol
+
+
+class AcceptLanguageTest(FieldTest[RequestLinterProtocol]):
+    name = "Accept-Language"
+    inputs = [b"da, en-gb;q=0.8, en;q=0.7"]
+    expected_out = [
+        AcceptLanguageValue("da", None),
+        AcceptLanguageValue("en-gb", 0.8),
+        AcceptLanguageValue("en", 0.7),
+    ]
+
+
+class AcceptLanguageParamTest(FieldTest[RequestLinterProtocol]):
+    name = "Accept-Language"
+    inputs = [b"en; foo=bar"]
+    expected_out = [AcceptLanguageValue("en", None)]
+    expected_notes: NoteClassListType = [ACCEPT_LANGUAGE_BAD_SYNTAX, BAD_SYNTAX]
+
+
+class AcceptLanguageBadQTest(FieldTest[RequestLinterProtocol]):
+    name = "Accept-Language"
+    inputs = [b"en; q=abc"]
+    expected_out = [AcceptLanguageValue("en", None)]
+    expected_notes: NoteClassListType = [BAD_Q_VALUE, BAD_SYNTAX]
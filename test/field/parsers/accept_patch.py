@@ -0,0 +1,35 @@
+from httplint.field import BAD_SYNTAX
+from httplint.field.parsers.accept_patch import ACCEPT_PATCH_BAD_SYNTAX
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class AcceptPatchTest(FieldTest[ResponseLinterProtocol]):
+    name = "Accept-Patch"
+    inputs = [b"application/json-patch+json, application/merge-patch+json"]
+    expected_out = [
+        ("application/json-patch+json", {}),
+        ("application/merge-patch+json", {}),
+    ]
+
+
+class AcceptPatchParamsTest(FieldTest[ResponseLinterProtocol]):
+    name = "Accept-Patch"
+    inputs = [b"text/example;charset=utf-8"]
+    expected_out = [("text/example", {"charset": "utf-8"})]
+
+
+class AcceptPatchBadTest(FieldTest[ResponseLinterProtocol]):
+    name = "Accept-Patch"
+    inputs = [b"invalid"]
+    expected_out = [("invalid", {})]
+    expected_notes: NoteClassListType = [ACCEPT_PATCH_BAD_SYNTAX, BAD_SYNTAX]
+
+
+class AcceptPatchWildcardTest(FieldTest[ResponseLinterProtocol]):
+    "Accept-Patch lists media types, not media ranges."
+
+    name = "Accept-Patch"
+    inputs = [b"*/*"]
+    expected_out = [("*/*", {})]
+    expected_notes: NoteClassListType = [ACCEPT_PATCH_BAD_SYNTAX]
@@ -0,0 +1,23 @@
+from httplint.field import BAD_SYNTAX
+from httplint.field.parsers.accept_post import ACCEPT_POST_BAD_SYNTAX
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class AcceptPostTest(FieldTest[ResponseLinterProtocol]):
+    name = "Accept-Post"
+    inputs = [b"text/turtle, application/ld+json"]
+    expected_out = [("text/turtle", {}), ("application/ld+json", {})]
+
+
+class AcceptPostWildcardTest(FieldTest[ResponseLinterProtocol]):
+    name = "Accept-Post"
+    inputs = [b"*/*"]
+    expected_out = [("*/*", {})]
+
+
+class AcceptPostBadTest(FieldTest[ResponseLinterProtocol]):
+    name = "Accept-Post"
+    inputs = [b"invalid"]
+    expected_out = [("invalid", {})]
+    expected_notes: NoteClassListType = [ACCEPT_POST_BAD_SYNTAX, BAD_SYNTAX]
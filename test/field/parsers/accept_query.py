@@ -0,0 +1,67 @@
+from httplint.field.parsers.accept_query import ACCEPT_QUERY_BAD_SYNTAX, ACCEPT_QUERY_BAD_TYPE
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class AcceptQueryTest(FieldTest[ResponseLinterProtocol]):
+    name = "Accept-Query"
+    inputs = [b"application/sparql-query, application/sql"]
+    expected_out = [("application/sparql-query", {}), ("application/sql", {})]
+
+
+class AcceptQueryStringTest(FieldTest[ResponseLinterProtocol]):
+    "Media types that aren't valid Tokens have to be sent as Strings."
+
+    name = "Accept-Query"
+    inputs = [b'"application/jsonpath", "3d/example"']
+    expected_out = [("application/jsonpath", {}), ("3d/example", {})]
+
+
+class AcceptQueryParamsTest(FieldTest[ResponseLinterProtocol]):
+    name = "Accept-Query"
+    inputs = [b'application/sql;charset="UTF-8"']
+    expected_out = [("application/sql", {"charset": "UTF-8"})]
+
+
+class AcceptQueryWildcardTest(FieldTest[ResponseLinterProtocol]):
+    name = "Accept-Query"
+    inputs = [b"*/*, text/*"]
+    expected_out = [("*/*", {}), ("text/*", {})]
+
+
+class AcceptQueryCaseTest(FieldTest[ResponseLinterProtocol]):
+    name = "Accept-Query"
+    inputs = [b'APPLICATION/SQL, "TEXT/Plain"']
+    expected_out = [("application/sql", {}), ("text/plain", {})]
+
+
+class AcceptQueryBadTest(FieldTest[ResponseLinterProtocol]):
+    name = "Accept-Query"
+    inputs = [b"invalid"]
+    expected_out = [("invalid", {})]
+    expected_notes: NoteClassListType = [ACCEPT_QUERY_BAD_SYNTAX]
+
+
+class AcceptQueryBadStringTest(FieldTest[ResponseLinterProtocol]):
+    "A String member can carry a name that isn't a valid HTTP token."
+
+    name = "Accept-Query"
+    inputs = [b'"text/pl in"']
+    expected_out = [("text/pl in", {})]
+    expected_notes: NoteClassListType = [ACCEPT_QUERY_BAD_SYNTAX]
+
+
+class AcceptQueryBareStarTest(FieldTest[ResponseLinterProtocol]):
+    "Only */* and type/* are permitted, not a bare *."
+
+    name = "Accept-Query"
+    inputs = [b"*"]
+    expected_out = [("*", {})]
+    expected_notes: NoteClassListType = [ACCEPT_QUERY_BAD_SYNTAX]
+
+
+class AcceptQueryBadTypeTest(FieldTest[ResponseLinterProtocol]):
+    name = "Accept-Query"
+    inputs = [b"123"]
+    expected_out = [(123, {})]
+    expected_notes: NoteClassListType = [ACCEPT_QUERY_BAD_TYPE]
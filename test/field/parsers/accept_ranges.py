@@ -0,0 +1,34 @@
+from httplint.field.parsers.accept_ranges import UNKNOWN_RANGE
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class AcceptRangeTest(FieldTest[ResponseLinterProtocol]):
+    name = "Accept-Ranges"
+    inputs = [b"bytes"]
+    expected_out = ["bytes"]
+
+
+class NoneAcceptRangeTest(FieldTest[ResponseLinterProtocol]):
+    name = "Accept-Ranges"
+    inputs = [b"none"]
+    expected_out = ["none"]
+
+
+class BothAcceptRangeTest(FieldTest[ResponseLinterProtocol]):
+    name = "Accept-Ranges"
+    inputs = [b"bytes, none"]
+    expected_out = ["bytes", "none"]
+
+
+class BadAcceptRangeTest(FieldTest[ResponseLinterProtocol]):
+    name = "Accept-Ranges"
+    inputs = [b"foo"]
+    expected_out = ["foo"]
+    expected_notes: NoteClassListType = [UNKNOWN_RANGE]
+
+
+class CaseAcceptRangeTest(FieldTest[ResponseLinterProtocol]):
+    name = "Accept-Ranges"
+    inputs = [b"Bytes, NONE"]
+    expected_out = ["bytes", "none"]
@@ -0,0 +1,10 @@
+from httplint.field import FIELD_DEPRECATED
+from httplint.field.tests import FieldTest
+from httplint.types import AnyMessageLinterProtocol, NoteClassListType
+
+
+class AccessControlTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Access-Control"
+    inputs = [b"foo"]
+    expected_out = "foo"
+    expected_notes: NoteClassListType = [FIELD_DEPRECATED]
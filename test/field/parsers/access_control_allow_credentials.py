@@ -0,0 +1,30 @@
+from httplint.field import BAD_SYNTAX
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class AccessControlAllowCredentialsTest(FieldTest[ResponseLinterProtocol]):
+    name = "Access-Control-Allow-Credentials"
+    inputs = [b"true"]
+    expected_out = "true"
+
+
+class AccessControlAllowCredentialsTestFalse(FieldTest[ResponseLinterProtocol]):
+    name = "Access-Control-Allow-Credentials"
+    inputs = [b"false"]
+    expected_out = None
+    expected_notes: NoteClassListType = [BAD_SYNTAX]
+
+
+class AccessControlAllowCredentialsTestTruethy(FieldTest[ResponseLinterProtocol]):
+    name = "Access-Control-Allow-Credentials"
+    inputs = [b"truethy"]
+    expected_out = None
+    expected_notes: NoteClassListType = [BAD_SYNTAX]
+
+
+class AccessControlAllowCredentialsTestCapTrue(FieldTest[ResponseLinterProtocol]):
+    name = "Access-Control-Allow-Credentials"
+    inputs = [b"True"]
+    expected_out = None
+    expected_notes: NoteClassListType = [BAD_SYNTAX]
@@ -0,0 +1,10 @@
+from httplint.field.cors import CORS_PREFLIGHT_ONLY
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class AccessControlAllowHeadersTest(FieldTest[ResponseLinterProtocol]):
+    name = "Access-Control-Allow-Headers"
+    inputs = [b"a, b"]
+    expected_out = ["a", "b"]
+    expected_notes: NoteClassListType = [CORS_PREFLIGHT_ONLY]
@@ -0,0 +1,10 @@
+from httplint.field.cors import CORS_PREFLIGHT_ONLY
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class AccessControlAllowMethodsTest(FieldTest[ResponseLinterProtocol]):
+    name = "Access-Control-Allow-Methods"
+    inputs = [b"GET, PUT, DELETE"]
+    expected_out = ["GET", "PUT", "DELETE"]
+    expected_notes: NoteClassListType = [CORS_PREFLIGHT_ONLY]
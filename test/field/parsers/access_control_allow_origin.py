@@ -0,0 +1,74 @@
+from httplint.field.cors import (
+    CORS_ORIGIN_MATCH,
+    CORS_ORIGIN_MISMATCH,
+    CORS_ORIGIN_NULL,
+    CORS_ORIGIN_STAR,
+)
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class AccessControlAllowOriginTest(FieldTest[ResponseLinterProtocol]):
+    name = "Access-Control-Allow-Origin"
+    inputs = [b"https://developer.mozilla.org"]
+    expected_out = "https://developer.mozilla.org"
+
+
+class AccessControlAllowOriginStarTest(FieldTest[ResponseLinterProtocol]):
+    name = "Access-Control-Allow-Origin"
+    inputs = [b"*"]
+    expected_out = "*"
+
+
+class AccessControlAllowOriginNullTest(FieldTest[ResponseLinterProtocol]):
+    name = "Access-Control-Allow-Origin"
+    inputs = [b"null"]
+    expected_out = "null"
+
+
+class AccessControlAllowOriginMatchTest(FieldTest[ResponseLinterProtocol]):
+    name = "Access-Control-Allow-Origin"
+    inputs = [b"https://example.com"]
+    expected_out = "https://example.com"
+    expected_notes: NoteClassListType = [CORS_ORIGIN_MATCH]
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        request = message.request
+        assert request is not None
+        request.headers.process([(b"Origin", b"https://example.com")])
+
+
+class AccessControlAllowOriginMismatchTest(FieldTest[ResponseLinterProtocol]):
+    name = "Access-Control-Allow-Origin"
+    inputs = [b"https://other.com"]
+    expected_out = "https://other.com"
+    expected_notes: NoteClassListType = [CORS_ORIGIN_MISMATCH]
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        request = message.request
+        assert request is not None
+        request.headers.process([(b"Origin", b"https://example.com")])
+
+
+class AccessControlAllowOriginStarContextTest(FieldTest[ResponseLinterProtocol]):
+    name = "Access-Control-Allow-Origin"
+    inputs = [b"*"]
+    expected_out = "*"
+    expected_notes: NoteClassListType = [CORS_ORIGIN_STAR]
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        request = message.request
+        assert request is not None
+        request.headers.process([(b"Origin", b"https://example.com")])
+
+
+class AccessControlAllowOriginNullContextTest(FieldTest[ResponseLinterProtocol]):
+    name = "Access-Control-Allow-Origin"
+    inputs = [b"null"]
+    expected_out = "null"
+    expected_notes: NoteClassListType = [CORS_ORIGIN_NULL]
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        request = message.request
+        assert request is not None
+        request.headers.process([(b"Origin", b"https://example.com")])
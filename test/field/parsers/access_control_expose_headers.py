@@ -0,0 +1,8 @@
+from httplint.field.tests import FieldTest
+from httplint.types import ResponseLinterProtocol
+
+
+class AccessControlExposeHeadersTest(FieldTest[ResponseLinterProtocol]):
+    name = "Access-Control-Expose-Headers"
+    inputs = [b"Content-Length, Kuma-Revision"]
+    expected_out = ["Content-Length", "Kuma-Revision"]
@@ -0,0 +1,28 @@
+from httplint.field.cors import CORS_PREFLIGHT_ONLY
+from httplint.field.parsers.access_control_max_age import (
+    CORS_MAX_AGE_INVALID,
+    CORS_MAX_AGE_NEGATIVE,
+)
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class AccessControlMaxAgeTest(FieldTest[ResponseLinterProtocol]):
+    name = "Access-Control-Max-Age"
+    inputs = [b"123"]
+    expected_out = 123
+    expected_notes: NoteClassListType = [CORS_PREFLIGHT_ONLY]
+
+
+class AccessControlMaxAgeInvalidTest(FieldTest[ResponseLinterProtocol]):
+    name = "Access-Control-Max-Age"
+    inputs = [b"abc"]
+    expected_out = None
+    expected_notes: NoteClassListType = [CORS_MAX_AGE_INVALID, CORS_PREFLIGHT_ONLY]
+
+
+class AccessControlMaxAgeNegativeTest(FieldTest[ResponseLinterProtocol]):
+    name = "Access-Control-Max-Age"
+    inputs = [b"-1"]
+    expected_out = None
+    expected_notes: NoteClassListType = [CORS_MAX_AGE_NEGATIVE, CORS_PREFLIGHT_ONLY]
@@ -0,0 +1,16 @@
+from httplint.field.cors import CORS_PREFLIGHT_REQUEST
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, RequestLinterProtocol
+
+
+class AccessControlRequestHeadersTest(FieldTest[RequestLinterProtocol]):
+    name = "Access-Control-Request-Headers"
+    inputs = [b"Custom-Header, Upgrade-Insecure-Requests"]
+    expected_out = ["custom-header", "upgrade-insecure-requests"]
+    expected_notes: NoteClassListType = [CORS_PREFLIGHT_REQUEST]
+
+    def set_request_context(self, message: RequestLinterProtocol) -> None:
+        message.method = "OPTIONS"
+        # Manually populate parsed headers to avoid triggering notes on context headers
+        message.headers.parsed["origin"] = "http://example.com"
+        message.headers.parsed["access-control-request-method"] = "POST"
@@ -0,0 +1,15 @@
+from httplint.field.cors import CORS_PREFLIGHT_REQUEST
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, RequestLinterProtocol
+
+
+class AccessControlRequestMethodTest(FieldTest[RequestLinterProtocol]):
+    name = "Access-Control-Request-Method"
+    inputs = [b"POST"]
+    expected_out = "POST"
+    expected_notes: NoteClassListType = [CORS_PREFLIGHT_REQUEST]
+
+    def set_request_context(self, message: RequestLinterProtocol) -> None:
+        message.method = "OPTIONS"
+        # Manually populate parsed headers to avoid triggering notes on context headers
+        message.headers.parsed["origin"] = "http://example.com"
@@ -0,0 +1,38 @@
+from httplint.field.parsers.age import AGE_LARGE, AGE_NEGATIVE, AGE_NOT_INT
+from httplint.field.singleton_field import SINGLE_HEADER_REPEAT
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class AgeTest(FieldTest[ResponseLinterProtocol]):
+    name = "Age"
+    inputs = [b"10"]
+    expected_out = 10
+
+
+class MultipleAgeTest(FieldTest[ResponseLinterProtocol]):
+    name = "Age"
+    inputs = [b"20", b"10"]
+    expected_out = 20
+    expected_notes: NoteClassListType = [SINGLE_HEADER_REPEAT]
+
+
+class CharAgeTest(FieldTest[ResponseLinterProtocol]):
+    name = "Age"
+    inputs = [b"foo"]
+    expected_out = None
+    expected_notes: NoteClassListType = [AGE_NOT_INT]
+
+
+class NegAgeTest(FieldTest[ResponseLinterProtocol]):
+    name = "Age"
+    inputs = [b"-20"]
+    expected_out = None
+    expected_notes: NoteClassListType = [AGE_NEGATIVE]
+
+
+class BigAgeTest(FieldTest[ResponseLinterProtocol]):
+    name = "Age"
+    inputs = [b"2147483649"]
+    expected_out = 2147483649
+    expected_notes: NoteClassListType = [AGE_LARGE]
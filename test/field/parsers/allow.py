@@ -0,0 +1,8 @@
+from httplint.field.tests import FieldTest
+from httplint.types import ResponseLinterProtocol
+
+
+class AllowTest(FieldTest[ResponseLinterProtocol]):
+    name = "Allow"
+    inputs = [b"GET, POST"]
+    expected_out = ["GET", "POST"]
@@ -0,0 +1,35 @@
+from httplint.field import BAD_SYNTAX
+from httplint.field.parsers.alt_svc import ALTSVC_CLEAR_LIST
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class AltSvcTest(FieldTest[ResponseLinterProtocol]):
+    name = "Alt-Svc"
+    inputs = [b'h2=":443"']
+    expected_out = ['h2=":443"']
+
+
+class AltSvcParamTest(FieldTest[ResponseLinterProtocol]):
+    name = "Alt-Svc"
+    inputs = [b'h2=":443"; ma=60']
+    expected_out = ['h2=":443"; ma=60']
+
+
+class AltSvcClearTest(FieldTest[ResponseLinterProtocol]):
+    name = "Alt-Svc"
+    inputs = [b"clear"]
+    expected_out = ["clear"]
+
+
+class AltSvcMixedTest(FieldTest[ResponseLinterProtocol]):
+    name = "Alt-Svc"
+    inputs = [b'clear, h2=":443"']
+    expected_out = ["clear", 'h2=":443"']
+    expected_notes: NoteClassListType = [ALTSVC_CLEAR_LIST]
+
+
+class AltSvcBadTest(FieldTest[ResponseLinterProtocol]):
+    name = "Alt-Svc"
+    inputs = [b"foo"]
+    expected_notes: NoteClassListType = [BAD_SYNTAX]
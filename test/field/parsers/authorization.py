@@ -0,0 +1,8 @@
+from httplint.field.tests import FieldTest
+from httplint.types import RequestLinterProtocol
+
+
+class AuthorizationTest(FieldTest[RequestLinterProtocol]):
+    name = "Authorization"
+    inputs = [b"Basic QWxhZGRpbjpvcGVuIHNlc2FtZQ=="]
+    expected_out = "Basic QWxhZGRpbjpvcGVuIHNlc2FtZQ=="
@@ -0,0 +1,47 @@
+from typing import Any
+
+from httplint.field.parsers.available_dictionary import (
+    AVAILABLE_DICTIONARY_BAD_TYPE,
+    AVAILABLE_DICTIONARY_MISSING_AE,
+)
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, RequestLinterProtocol
+
+
+class AvailableDictionaryTest(FieldTest[RequestLinterProtocol]):
+    name = "Available-Dictionary"
+    inputs = [b":pZGm1Av0IEBKARczz7exkNYsZb8LzaMrV7J32a2fFG4=:"]
+    expected_out: tuple[bytes, dict[str, Any]] = (
+        b"\xa5\x91\xa6\xd4\x0b\xf4 @J\x01\x173\xcf\xb7\xb1\x90\xd6,e\xbf\x0b\xcd\xa3"
+        b"+W\xb2w\xd9\xad\x9f\x14n",
+        {},
+    )
+    expected_notes: NoteClassListType = []
+
+    def set_request_context(self, message: RequestLinterProtocol) -> None:
+        message.headers.parsed["accept-encoding"] = [("dcb", {})]
+
+
+class AvailableDictionaryBadTypeTest(FieldTest[RequestLinterProtocol]):
+    name = "Available-Dictionary"
+    inputs = [b'"not-binary"']
+    expected_out: tuple[str, dict[str, Any]] = ("not-binary", {})
+    expected_notes: NoteClassListType = [AVAILABLE_DICTIONARY_BAD_TYPE]
+
+    def set_request_context(self, message: RequestLinterProtocol) -> None:
+        message.headers.parsed["accept-encoding"] = [("dcb", {})]
+
+
+class AvailableDictionaryMissingAETest(FieldTest[RequestLinterProtocol]):
+    name = "Available-Dictionary"
+    inputs = [b":pZGm1Av0IEBKARczz7exkNYsZb8LzaMrV7J32a2fFG4=:"]
+    expected_out: tuple[bytes, dict[str, Any]] = (
+        b"\xa5\x91\xa6\xd4\x0b\xf4 @J\x01\x173\xcf\xb7\xb1\x90\xd6,e\xbf\x0b\xcd\xa3"
+        b"+W\xb2w\xd9\xad\x9f\x14n",
+        {},
+    )
+    expected_notes: NoteClassListType = [AVAILABLE_DICTIONARY_MISSING_AE]
+
+    def set_request_context(self, message: RequestLinterProtocol) -> None:
+        # Accept-Encoding missing 'dcb' or 'dcz'
+        message.headers.parsed["accept-encoding"] = [("gzip", {})]
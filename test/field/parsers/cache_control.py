@@ -0,0 +1,68 @@
+from httplint.field.parsers.cache_control import (
+    CC_BAD_VALUE_TYPE,
+    CC_DUP,
+    CC_MAX_AGE_TOO_LARGE,
+    CC_MISCAP,
+    CC_SHOULD_NOT_HAVE_VALUE,
+)
+from httplint.field.tests import FieldTest
+from httplint.types import AnyMessageLinterProtocol, NoteClassListType
+
+
+class CacheControlTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Cache-Control"
+    inputs = [b"a=b, c=d", b"e=f", b"g"]
+    expected_out = [("a", "b"), ("c", "d"), ("e", "f"), ("g", None)]
+
+
+class CacheControlCaseTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Cache-Control"
+    inputs = [b"A=b, c=D"]
+    expected_out = [("a", "b"), ("c", "D")]
+    expected_notes: NoteClassListType = [CC_MISCAP]
+
+
+class CacheControlQuotedTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Cache-Control"
+    inputs = [b'private="b,c", c=d']
+    expected_out = [("private", "b,c"), ("c", "d")]
+
+
+class CacheControlMaxAgeTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Cache-Control"
+    inputs = [b"max-age=5"]
+    expected_out = [("max-age", 5)]
+
+
+class CacheControlBadMaxAgeTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Cache-Control"
+    inputs = [b"max-age=foo"]
+    expected_notes: NoteClassListType = [CC_BAD_VALUE_TYPE]
+
+
+class CacheControlBigTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Cache-Control"
+    inputs = [b"max-age=2147483649"]
+    expected_out = [("max-age", 2147483649)]
+    expected_notes: NoteClassListType = [CC_MAX_AGE_TOO_LARGE]
+
+
+class CacheControlValueNotAllowedTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Cache-Control"
+    inputs = [b"no-store=foo"]
+    expected_out = [("no-store", "foo")]
+    expected_notes: NoteClassListType = [CC_SHOULD_NOT_HAVE_VALUE]
+
+
+class CacheControlDupTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Cache-Control"
+    inputs = [b"max-age=5, max-age=10"]
+    expected_out = [("max-age", 5), ("max-age", 10)]
+    expected_notes: NoteClassListType = [CC_DUP]
+
+
+class CacheControlUnknownDupTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Cache-Control"
+    inputs = [b"foo=1, foo=2"]
+    expected_out = [("foo", "1"), ("foo", "2")]
+    expected_notes: NoteClassListType = []
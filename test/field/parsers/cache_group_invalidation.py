@@ -0,0 +1,63 @@
+from httplint.field.parsers.cache_group_invalidation import (
+    CACHE_GROUP_INVALIDATION_BAD_TYPE,
+    CACHE_GROUP_INVALIDATION_IGNORED,
+)
+from httplint.field.tests import FakeRequestLinter, FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class CacheGroupInvalidationTest(FieldTest[ResponseLinterProtocol]):
+    name = "Cache-Group-Invalidation"
+    inputs = [b'"group1"']
+    expected_out = [("group1", {})]
+
+    def setUp(self) -> None:
+        super().setUp()
+        request = FakeRequestLinter()
+        request.method = "POST"
+        self.message.request = request
+
+    expected_notes: NoteClassListType = []
+
+
+class CacheGroupInvalidationIgnoredTest(FieldTest[ResponseLinterProtocol]):
+    name = "Cache-Group-Invalidation"
+    inputs = [b'"group1"']
+    expected_out = [("group1", {})]
+
+    def setUp(self) -> None:
+        super().setUp()
+        request = FakeRequestLinter()
+        request.method = "GET"
+        self.message.request = request
+
+    expected_notes: NoteClassListType = [CACHE_GROUP_INVALIDATION_IGNORED]
+
+
+class CacheGroupInvalidationBadTypeTest(FieldTest[ResponseLinterProtocol]):
+    name = "Cache-Group-Invalidation"
+    inputs = [b"123"]
+    expected_out = [(123, {})]
+
+    def setUp(self) -> None:
+        super().setUp()
+        # Ensure check passes (unsafe method)
+        request = FakeRequestLinter()
+        request.method = "POST"
+        self.message.request = request
+
+    expected_notes: NoteClassListType = [CACHE_GROUP_INVALIDATION_BAD_TYPE]
+
+
+class CacheGroupInvalidationMultipleBadTypesTest(FieldTest[ResponseLinterProtocol]):
+    name = "Cache-Group-Invalidation"
+    inputs = [b'123, "group2", ?0']
+    expected_out = [(123, {}), ("group2", {}), (False, {})]
+
+    def setUp(self) -> None:
+        super().setUp()
+        request = FakeRequestLinter()
+        request.method = "POST"
+        self.message.request = request
+
+    expected_notes: NoteClassListType = [CACHE_GROUP_INVALIDATION_BAD_TYPE]
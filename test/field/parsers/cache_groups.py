@@ -0,0 +1,24 @@
+from httplint.field.parsers.cache_groups import CACHE_GROUPS_BAD_TYPE
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class CacheGroupsTest(FieldTest[ResponseLinterProtocol]):
+    name = "Cache-Groups"
+    inputs = [b'"group1", "group2"']
+    expected_out = [("group1", {}), ("group2", {})]
+    expected_notes: NoteClassListType = []
+
+
+class CacheGroupsBadTypeTest(FieldTest[ResponseLinterProtocol]):
+    name = "Cache-Groups"
+    inputs = [b'123, "group2"']
+    expected_out = [(123, {}), ("group2", {})]
+    expected_notes: NoteClassListType = [CACHE_GROUPS_BAD_TYPE]
+
+
+class CacheGroupsMultipleBadTypesTest(FieldTest[ResponseLinterProtocol]):
+    name = "Cache-Groups"
+    inputs = [b'123, "group2", ?0']
+    expected_out = [(123, {}), ("group2", {}), (False, {})]
+    expected_notes: NoteClassListType = [CACHE_GROUPS_BAD_TYPE]
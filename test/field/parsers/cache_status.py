@@ -0,0 +1,33 @@
+from http_sf import Token
+
+from httplint.field.parsers.cache_status import (
+    CACHE_STATUS,
+    CACHE_STATUS_BAD_PARAM_VAL,
+    CACHE_STATUS_UNKNOWN_PARAM,
+)
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class CacheStatusTest(FieldTest[ResponseLinterProtocol]):
+    name = "Cache-Status"
+    inputs = [b"ExampleCache; hit; ttl=3700", b"AnotherCache; fwd=uri-miss"]
+    expected_out = [
+        (Token("ExampleCache"), {"hit": True, "ttl": 3700}),
+        (Token("AnotherCache"), {"fwd": Token("uri-miss")}),
+    ]
+    expected_notes: NoteClassListType = [CACHE_STATUS]
+
+
+class CacheStatusUnknownParamTest(FieldTest[ResponseLinterProtocol]):
+    name = "Cache-Status"
+    inputs = [b"ExampleCache; unknown=1"]
+    expected_out = [(Token("ExampleCache"), {"unknown": 1})]
+    expected_notes: NoteClassListType = [CACHE_STATUS_UNKNOWN_PARAM, CACHE_STATUS]
+
+
+class CacheStatusBadParamValTest(FieldTest[ResponseLinterProtocol]):
+    name = "Cache-Status"
+    inputs = [b"ExampleCache; fwd=invalid"]
+    expected_out = [(Token("ExampleCache"), {"fwd": Token("invalid")})]
+    expected_notes: NoteClassListType = [CACHE_STATUS_BAD_PARAM_VAL, CACHE_STATUS]
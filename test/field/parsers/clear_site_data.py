@@ -0,0 +1,65 @@
+from httplint.field import BAD_SYNTAX
+from httplint.field.parsers.clear_site_data import (
+    CSD_EMPTY,
+    CSD_PRESENT,
+    CSD_UNKNOWN_VALUE,
+    CSD_UNQUOTED,
+)
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class ClearSiteDataTest(FieldTest[ResponseLinterProtocol]):
+    name = "Clear-Site-Data"
+    inputs = [b'"cache", "cookies"']
+    expected_out = ["cache", "cookies"]
+    expected_notes: NoteClassListType = [CSD_PRESENT]
+
+
+class ClearSiteDataWildcardTest(FieldTest[ResponseLinterProtocol]):
+    name = "Clear-Site-Data"
+    inputs = [b'"*"']
+    expected_out = ["*"]
+    expected_notes: NoteClassListType = [CSD_PRESENT]
+
+
+class ClearSiteDataUnknownTest(FieldTest[ResponseLinterProtocol]):
+    name = "Clear-Site-Data"
+    inputs = [b'"foo"']
+    expected_out = ["foo"]
+    expected_notes: NoteClassListType = [CSD_UNKNOWN_VALUE]
+
+
+class ClearSiteDataEmptyTest(FieldTest[ResponseLinterProtocol]):
+    name = "Clear-Site-Data"
+    inputs = [b'""']
+    expected_out = [""]
+    expected_notes: NoteClassListType = [CSD_EMPTY]
+
+
+class ClearSiteDataTrulyEmptyTest(FieldTest[ResponseLinterProtocol]):
+    name = "Clear-Site-Data"
+    inputs = [b""]
+    expected_out = []
+    expected_notes: NoteClassListType = [CSD_EMPTY]
+
+
+class ClearSiteDataBadSyntaxTest(FieldTest[ResponseLinterProtocol]):
+    name = "Clear-Site-Data"
+    inputs = [b"foo"]
+    expected_out = ["foo"]
+    expected_notes: NoteClassListType = [BAD_SYNTAX, CSD_UNKNOWN_VALUE]
+
+
+class ClearSiteDataUnquotedTest(FieldTest[ResponseLinterProtocol]):
+    name = "Clear-Site-Data"
+    inputs = [b"cache"]
+    expected_out = ["cache"]
+    expected_notes: NoteClassListType = [BAD_SYNTAX, CSD_UNQUOTED]
+
+
+class ClearSiteDataMultipleUnquotedTest(FieldTest[ResponseLinterProtocol]):
+    name = "Clear-Site-Data"
+    inputs = [b"cache, cookies"]
+    expected_out = ["cache", "cookies"]
+    expected_notes: NoteClassListType = [BAD_SYNTAX, CSD_UNQUOTED]
@@ -0,0 +1,8 @@
+from httplint.field.tests import FieldTest
+from httplint.types import AnyMessageLinterProtocol
+
+
+class ConnectionTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Connection"
+    inputs = [b"close"]
+    expected_out = ["close"]
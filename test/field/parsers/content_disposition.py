@@ -0,0 +1,60 @@
+from httplint.field.parsers.content_disposition import (
+    DISPOSITION_FILENAME_PATH_CHAR,
+    DISPOSITION_FILENAME_PERCENT,
+)
+from httplint.field.singleton_field import SINGLE_HEADER_REPEAT
+from httplint.field.tests import FieldTest
+from httplint.field.utils import PARAM_STAR_QUOTED
+from httplint.types import AnyMessageLinterProtocol, NoteClassListType
+
+
+class QuotedCDTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Disposition"
+    inputs = [b'attachment; filename="foo.txt"']
+    expected_out = ("attachment", {"filename": "foo.txt"})
+
+
+class TokenCDTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Disposition"
+    inputs = [b"attachment; filename=foo.txt"]
+    expected_out = ("attachment", {"filename": "foo.txt"})
+
+
+class InlineCDTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Disposition"
+    inputs = [b"inline; filename=foo.txt"]
+    expected_out = ("inline", {"filename": "foo.txt"})
+
+
+class RepeatCDTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Disposition"
+    inputs = [b"attachment; filename=foo.txt", b"inline; filename=bar.txt"]
+    expected_out = ("attachment", {"filename": "foo.txt"})
+    expected_notes: NoteClassListType = [SINGLE_HEADER_REPEAT]
+
+
+class FilenameStarCDTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Disposition"
+    inputs = [b"attachment; filename=foo.txt; filename*=UTF-8''a%cc%88.txt"]
+    expected_out = ("attachment", {"filename": "foo.txt", "filename*": "a\u0308.txt"})
+
+
+class FilenameStarQuotedCDTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Disposition"
+    inputs = [b"attachment; filename=foo.txt; filename*=\"UTF-8''a%cc%88.txt\""]
+    expected_out = ("attachment", {"filename": "foo.txt", "filename*": "a\u0308.txt"})
+    expected_notes: NoteClassListType = [PARAM_STAR_QUOTED]
+
+
+class FilenamePercentCDTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Disposition"
+    inputs = [b"attachment; filename=fo%22o.txt"]
+    expected_out = ("attachment", {"filename": "fo%22o.txt"})
+    expected_notes: NoteClassListType = [DISPOSITION_FILENAME_PERCENT]
+
+
+class FilenamePathCharCDTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Disposition"
+    inputs = [b'attachment; filename="/foo.txt"']
+    expected_out = ("attachment", {"filename": "/foo.txt"})
+    expected_notes: NoteClassListType = [DISPOSITION_FILENAME_PATH_CHAR]
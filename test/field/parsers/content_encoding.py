@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+from typing import cast
+
+from httplint.field.parsers.content_encoding import (
+    DICTIONARY_COMPRESSED_MISSING_VARY,
+    ENCODING_UNWANTED,
+)
+from httplint.field.tests import FakeRequestLinter, FieldTest
+from httplint.types import (
+    AnyMessageLinterProtocol,
+    CachingProtocol,
+    NoteClassListType,
+    ResponseLinterProtocol,
+)
+
+
+class ContentEncodingTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Encoding"
+    inputs = [b"gzip"]
+    expected_out = ["gzip"]
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        assert message.request is not None
+        message.request.headers.process([(b"accept-encoding", b"gzip")])
+
+
+class ContentEncodingCaseTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Encoding"
+    inputs = [b"GZip"]
+    expected_out = ["gzip"]
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        assert message.request is not None
+        message.request.headers.process([(b"accept-encoding", b"gzip")])
+
+
+class ContentEncodingUnwantedTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Encoding"
+    inputs = [b"gzip, foo"]
+    expected_out = ["gzip", "foo"]
+    expected_notes: NoteClassListType = [ENCODING_UNWANTED]
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        request = FakeRequestLinter()
+        request.headers.process([(b"accept-encoding", b"gzip")])
+        message.request = request
+
+
+class DictionaryCompressedMissingVaryTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Encoding"
+    inputs = [b"dcb"]
+    expected_out = ["dcb"]
+    expected_notes: NoteClassListType = [DICTIONARY_COMPRESSED_MISSING_VARY]
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        assert message.request is not None
+        message.request.headers.process([(b"accept-encoding", b"dcb")])
+        message.caching = cast(
+            CachingProtocol, SimpleNamespace(store_shared=True, store_private=True)
+        )
+        # Vary missing 'Available-Dictionary'
+        message.headers.parsed["vary"] = set()
@@ -0,0 +1,22 @@
+from httplint.field.parsers.content_language import CONTENT_LANGUAGE_DUP
+from httplint.field.tests import FieldTest
+from httplint.types import AnyMessageLinterProtocol, NoteClassListType
+
+
+class ContentLanguageTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Language"
+    inputs = [b"en-US"]
+    expected_out = ["en-us"]
+
+
+class ContentLanguageListTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Language"
+    inputs = [b"en-US, fr"]
+    expected_out = ["en-us", "fr"]
+
+
+class ContentLanguageDupTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Language"
+    inputs = [b"en-US, en-US"]
+    expected_out = ["en-us", "en-us"]
+    expected_notes: NoteClassListType = [CONTENT_LANGUAGE_DUP]
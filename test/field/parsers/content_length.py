@@ -0,0 +1,75 @@
+from httplint.field.parsers.content_length import CL_AND_TE_PRESENT, CL_BAD_SYNTAX, CL_TOO_LARGE
+from httplint.field.singleton_field import SINGLE_HEADER_REPEAT
+from httplint.field.tests import FieldTest
+from httplint.types import AnyMessageLinterProtocol, NoteClassListType, ResponseLinterProtocol
+
+
+class ContentLengthTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Length"
+    inputs = [b"1"]
+    expected_out = 1
+
+
+class ContentLengthTextTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Length"
+    inputs = [b"a"]
+    expected_out = None
+    expected_notes: NoteClassListType = [CL_BAD_SYNTAX]
+
+
+class ContentLengthSemiTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Length"
+    inputs = [b"1;"]
+    expected_out = None
+    expected_notes: NoteClassListType = [CL_BAD_SYNTAX]
+
+
+class ContentLengthSpaceTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Length"
+    inputs = [b" 1 "]
+    expected_out = 1
+
+
+class ContentLengthBigTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Length"
+    inputs = [b"9" * 999]
+    expected_out = int("9" * 999)
+    expected_notes: NoteClassListType = [CL_TOO_LARGE]
+
+
+class ContentLengthDuplicateTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Length"
+    inputs = [b"1", b"1"]
+    expected_out = 1
+    expected_notes: NoteClassListType = [SINGLE_HEADER_REPEAT]
+
+
+class ContentLengthCommaTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Length"
+    inputs = [b"1, 1"]
+    expected_out = None
+    expected_notes: NoteClassListType = [CL_BAD_SYNTAX]
+
+
+class ContentLengthDiffTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Length"
+    inputs = [b"1", b"2"]
+    expected_out = 1
+    expected_notes: NoteClassListType = [SINGLE_HEADER_REPEAT]
+
+
+class ContentLengthDiffCommaTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Length"
+    inputs = [b"1, 2"]
+    expected_out = None
+    expected_notes: NoteClassListType = [CL_BAD_SYNTAX]
+
+
+class ContentLengthTEPresentTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Length"
+    inputs = [b"1"]
+    expected_out = 1
+    expected_notes: NoteClassListType = [CL_AND_TE_PRESENT]
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        message.headers.parsed["transfer-encoding"] = "chunked"
@@ -0,0 +1,8 @@
+from httplint.field.tests import FieldTest
+from httplint.types import ResponseLinterProtocol
+
+
+class ContentLocationTest(FieldTest[ResponseLinterProtocol]):
+    name = "Content-Location"
+    inputs = [b"/foo"]
+    expected_out = "/foo"
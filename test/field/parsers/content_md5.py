@@ -0,0 +1,10 @@
+from httplint.field import FIELD_DEPRECATED
+from httplint.field.tests import FieldTest
+from httplint.types import AnyMessageLinterProtocol, NoteClassListType
+
+
+class ContentMD5Test(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-MD5"
+    inputs = [b"Q2hlY2sgSW50ZWdyaXR5IQ=="]
+    expected_out = "Q2hlY2sgSW50ZWdyaXR5IQ=="
+    expected_notes: NoteClassListType = [FIELD_DEPRECATED]
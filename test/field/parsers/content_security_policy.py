@@ -0,0 +1,82 @@
+from httplint.field.parsers.content_security_policy import (
+    CONTENT_SECURITY_POLICY,
+    CSP_DEPRECATED_REPORT_URI,
+    CSP_DUPLICATE_DIRECTIVE,
+    CSP_REPORT_TO_MISSING,
+    CSP_UNSAFE_EVAL,
+    CSP_UNSAFE_INLINE,
+    CSP_WIDE_OPEN,
+)
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class CSPTest(FieldTest[ResponseLinterProtocol]):
+    name = "Content-Security-Policy"
+    inputs = [b"default-src 'self'; script-src 'unsafe-inline'"]
+    expected_out = [{"default-src": "'self'", "script-src": "'unsafe-inline'"}]
+    expected_notes: NoteClassListType = [CONTENT_SECURITY_POLICY, CSP_UNSAFE_INLINE]
+
+
+class CSPMultipleTest(FieldTest[ResponseLinterProtocol]):
+    name = "Content-Security-Policy"
+    inputs = [b"default-src 'self'", b"script-src 'unsafe-eval'"]
+    expected_out = [{"default-src": "'self'"}, {"script-src": "'unsafe-eval'"}]
+    expected_notes: NoteClassListType = [CONTENT_SECURITY_POLICY, CSP_UNSAFE_EVAL]
+
+
+class CSPDuplicateTest(FieldTest[ResponseLinterProtocol]):
+    name = "Content-Security-Policy"
+    inputs = [b"default-src 'self'; default-src 'none'"]
+    expected_out = [{"default-src": "'self'"}]
+    expected_notes: NoteClassListType = [CONTENT_SECURITY_POLICY, CSP_DUPLICATE_DIRECTIVE]
+
+
+class CSPReportUriTest(FieldTest[ResponseLinterProtocol]):
+    name = "Content-Security-Policy"
+    inputs = [b"report-uri /csp-report"]
+    expected_out = [{"report-uri": "/csp-report"}]
+    expected_notes: NoteClassListType = [CONTENT_SECURITY_POLICY, CSP_DEPRECATED_REPORT_URI]
+
+
+class CSPWideOpenTest(FieldTest[ResponseLinterProtocol]):
+    name = "Content-Security-Policy"
+    inputs = [b"script-src *"]
+    expected_out = [{"script-src": "*"}]
+    expected_notes: NoteClassListType = [CONTENT_SECURITY_POLICY, CSP_WIDE_OPEN]
+
+
+class CSPTrailingSemiTest(FieldTest[ResponseLinterProtocol]):
+    name = "Content-Security-Policy"
+    inputs = [b"default-src 'self'; script-src 'self';"]
+    expected_out = [{"default-src": "'self'", "script-src": "'self'"}]
+    expected_notes: NoteClassListType = [CONTENT_SECURITY_POLICY]
+
+
+class CSPReportToTest(FieldTest[ResponseLinterProtocol]):
+    name = "Content-Security-Policy"
+    inputs = [b"sort-src 'self'; report-to endpoint"]
+    expected_out = [{"sort-src": "'self'", "report-to": "endpoint"}]
+    expected_notes: NoteClassListType = [CONTENT_SECURITY_POLICY]
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        message.headers.process(
+            [(b"Reporting-Endpoints", b'endpoint="https://example.com/reports"')]
+        )
+
+
+class CSPReportToMissingTest(FieldTest[ResponseLinterProtocol]):
+    name = "Content-Security-Policy"
+    inputs = [b"script-src 'self'; report-to endpoint"]
+    expected_out = [{"script-src": "'self'", "report-to": "endpoint"}]
+    expected_notes: NoteClassListType = [CONTENT_SECURITY_POLICY, CSP_REPORT_TO_MISSING]
+
+
+class CSPReportToMismatchTest(FieldTest[ResponseLinterProtocol]):
+    name = "Content-Security-Policy"
+    inputs = [b"script-src 'self'; report-to endpoint"]
+    expected_out = [{"script-src": "'self'", "report-to": "endpoint"}]
+    expected_notes: NoteClassListType = [CONTENT_SECURITY_POLICY, CSP_REPORT_TO_MISSING]
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        message.headers.process([(b"Reporting-Endpoints", b'endpoint-2="https://example.com"')])
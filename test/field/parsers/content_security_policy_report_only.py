@@ -0,0 +1,13 @@
+from httplint.field.parsers.content_security_policy import (
+    CONTENT_SECURITY_POLICY,
+    CSP_UNSAFE_INLINE,
+)
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class CSPROTest(FieldTest[ResponseLinterProtocol]):
+    name = "Content-Security-Policy-Report-Only"
+    inputs = [b"default-src 'self'; script-src 'unsafe-inline'"]
+    expected_out = [{"default-src": "'self'", "script-src": "'unsafe-inline'"}]
+    expected_notes: NoteClassListType = [CONTENT_SECURITY_POLICY, CSP_UNSAFE_INLINE]
@@ -0,0 +1,51 @@
+from typing import Any
+
+from httplint.field.tests import FieldTest
+from httplint.field.utils import MEDIA_TYPE_BAD_NAME, MEDIA_TYPE_LONG_NAME
+from httplint.types import AnyMessageLinterProtocol, NoteClassListType
+
+
+class BasicCTTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Type"
+    inputs = [b"text/plain; charset=utf-8"]
+    expected_out = ("text/plain", {"charset": "utf-8"})
+
+
+class CTSuffixTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Type"
+    inputs = [b"application/vnd.example.foo-bar+json"]
+    expected_out: Any = ("application/vnd.example.foo-bar+json", {})
+
+
+class CTBadNameTest(FieldTest[AnyMessageLinterProtocol]):
+    "A media type that's a valid HTTP token, but not a valid RFC 6838 name."
+
+    name = "Content-Type"
+    inputs = [b"text/pl~in"]
+    expected_out: Any = ("text/pl~in", {})
+    expected_notes: NoteClassListType = [MEDIA_TYPE_BAD_NAME]
+
+
+class CTBadTypeNameTest(FieldTest[AnyMessageLinterProtocol]):
+    "The type half is checked as well as the subtype half."
+
+    name = "Content-Type"
+    inputs = [b"~text/plain"]
+    expected_out: Any = ("~text/plain", {})
+    expected_notes: NoteClassListType = [MEDIA_TYPE_BAD_NAME]
+
+
+class CTBadNameFirstTest(FieldTest[AnyMessageLinterProtocol]):
+    "RFC 6838 names have to start with a letter or a digit."
+
+    name = "Content-Type"
+    inputs = [b"text/.plain"]
+    expected_out: Any = ("text/.plain", {})
+    expected_notes: NoteClassListType = [MEDIA_TYPE_BAD_NAME]
+
+
+class CTLongNameTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Content-Type"
+    inputs = [b"text/" + b"a" * 128]
+    expected_out: Any = ("text/" + "a" * 128, {})
+    expected_notes: NoteClassListType = [MEDIA_TYPE_LONG_NAME]
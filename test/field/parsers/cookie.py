@@ -0,0 +1,26 @@
+from httplint.field.parsers.cookie import CookiePair
+from httplint.field.tests import FieldTest
+from httplint.types import RequestLinterProtocol
+
+
+class CookieTest(FieldTest[RequestLinterProtocol]):
+    name = "Cookie"
+    inputs = [b"SID=31d4d96e407aad42"]
+    expected_out = [[CookiePair("SID", "31d4d96e407aad42")]]
+
+    def test_multiple_pairs(self) -> None:
+        self.inputs = [b"SID=31d4d96e407aad42; lang=en-US"]
+        self.expected_out = [[CookiePair("SID", "31d4d96e407aad42"), CookiePair("lang", "en-US")]]
+        self.setUp()
+        self.test_header()
+
+    def test_multiple_headers(self) -> None:
+        self.inputs = [b"SID=31d4d96e407aad42", b"lang=en-US"]
+        # BrokenField collates all values into a list of parsed results.
+        # Each parse returns a list of CookiePairs.
+        self.expected_out = [
+            [CookiePair("SID", "31d4d96e407aad42")],
+            [CookiePair("lang", "en-US")],
+        ]
+        self.setUp()
+        self.test_header()
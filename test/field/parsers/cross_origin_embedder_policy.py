@@ -0,0 +1,60 @@
+from typing import Any
+
+from http_sf import Token
+
+from httplint.field.parsers.cross_origin_embedder_policy import (
+    COEP_CREDENTIALLESS,
+    COEP_REPORT_TO_MISSING,
+    COEP_REQUIRE_CORP,
+    COEP_UNSAFE_NONE,
+    CROSS_ORIGIN_EMBEDDER_POLICY_BAD_VALUE,
+)
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class CrossOriginEmbedderPolicyRequireCorpTest(FieldTest[ResponseLinterProtocol]):
+    name = "Cross-Origin-Embedder-Policy"
+    inputs = [b"require-corp"]
+    expected_out: Any = (Token("require-corp"), {})
+    expected_notes: NoteClassListType = [COEP_REQUIRE_CORP]
+
+
+class CrossOriginEmbedderPolicyCredentiallessTest(FieldTest[ResponseLinterProtocol]):
+    name = "Cross-Origin-Embedder-Policy"
+    inputs = [b"credentialless"]
+    expected_out: Any = (Token("credentialless"), {})
+    expected_notes: NoteClassListType = [COEP_CREDENTIALLESS]
+
+
+class CrossOriginEmbedderPolicyUnsafeNoneTest(FieldTest[ResponseLinterProtocol]):
+    name = "Cross-Origin-Embedder-Policy"
+    inputs = [b"unsafe-none"]
+    expected_out: Any = (Token("unsafe-none"), {})
+    expected_notes: NoteClassListType = [COEP_UNSAFE_NONE]
+
+
+class CrossOriginEmbedderPolicyBadValueTest(FieldTest[ResponseLinterProtocol]):
+    name = "Cross-Origin-Embedder-Policy"
+    inputs = [b"foo"]
+    expected_out: Any = (Token("foo"), {})
+    expected_notes: NoteClassListType = [CROSS_ORIGIN_EMBEDDER_POLICY_BAD_VALUE]
+
+
+class CrossOriginEmbedderPolicyReportToTest(FieldTest[ResponseLinterProtocol]):
+    name = "Cross-Origin-Embedder-Policy"
+    inputs = [b"require-corp; report-to=endpoint"]
+    expected_out: Any = (Token("require-corp"), {"report-to": "endpoint"})
+    expected_notes: NoteClassListType = [COEP_REQUIRE_CORP]
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        message.headers.process(
+            [(b"Reporting-Endpoints", b'endpoint="https://example.com/reports"')]
+        )
+
+
+class CrossOriginEmbedderPolicyReportToMissingTest(FieldTest[ResponseLinterProtocol]):
+    name = "Cross-Origin-Embedder-Policy"
+    inputs = [b"require-corp; report-to=endpoint"]
+    expected_out: Any = (Token("require-corp"), {"report-to": "endpoint"})
+    expected_notes: NoteClassListType = [COEP_REQUIRE_CORP, COEP_REPORT_TO_MISSING]
@@ -0,0 +1,24 @@
+from typing import Any
+
+from http_sf import Token
+
+from httplint.field.parsers.cross_origin_embedder_policy import (
+    COEP_REQUIRE_CORP,
+    CROSS_ORIGIN_EMBEDDER_POLICY_BAD_VALUE,
+)
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class CrossOriginEmbedderPolicyReportOnlyRequireCorpTest(FieldTest[ResponseLinterProtocol]):
+    name = "Cross-Origin-Embedder-Policy-Report-Only"
+    inputs = [b"require-corp"]
+    expected_out: Any = (Token("require-corp"), {})
+    expected_notes: NoteClassListType = [COEP_REQUIRE_CORP]
+
+
+class CrossOriginEmbedderPolicyReportOnlyBadValueTest(FieldTest[ResponseLinterProtocol]):
+    name = "Cross-Origin-Embedder-Policy-Report-Only"
+    inputs = [b"foo"]
+    expected_out: Any = (Token("foo"), {})
+    expected_notes: NoteClassListType = [CROSS_ORIGIN_EMBEDDER_POLICY_BAD_VALUE]
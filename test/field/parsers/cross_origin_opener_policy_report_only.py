@@ -0,0 +1,24 @@
+from typing import Any
+
+from http_sf import Token
+
+from httplint.field.parsers.cross_origin_opener_policy import (
+    COOP_SAME_ORIGIN,
+    CROSS_ORIGIN_OPENER_POLICY_BAD_VALUE,
+)
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class CrossOriginOpenerPolicyReportOnlySameOriginTest(FieldTest[ResponseLinterProtocol]):
+    name = "Cross-Origin-Opener-Policy-Report-Only"
+    inputs = [b"same-origin"]
+    expected_out: Any = (Token("same-origin"), {})
+    expected_notes: NoteClassListType = [COOP_SAME_ORIGIN]
+
+
+class CrossOriginOpenerPolicyReportOnlyBadValueTest(FieldTest[ResponseLinterProtocol]):
+    name = "Cross-Origin-Opener-Policy-Report-Only"
+    inputs = [b"foo"]
+    expected_out: Any = (Token("foo"), {})
+    expected_notes: NoteClassListType = [CROSS_ORIGIN_OPENER_POLICY_BAD_VALUE]
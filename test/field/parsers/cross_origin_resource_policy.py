@@ -0,0 +1,36 @@
+from httplint.field.parsers.cross_origin_resource_policy import (
+    CORP_CROSS_ORIGIN,
+    CORP_SAME_ORIGIN,
+    CORP_SAME_SITE,
+    CROSS_ORIGIN_RESOURCE_POLICY_BAD_VALUE,
+)
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class CrossOriginResourcePolicySameOriginTest(FieldTest[ResponseLinterProtocol]):
+    name = "Cross-Origin-Resource-Policy"
+    inputs = [b"same-origin"]
+    expected_out = "same-origin"
+    expected_notes: NoteClassListType = [CORP_SAME_ORIGIN]
+
+
+class CrossOriginResourcePolicySameSiteTest(FieldTest[ResponseLinterProtocol]):
+    name = "Cross-Origin-Resource-Policy"
+    inputs = [b"same-site"]
+    expected_out = "same-site"
+    expected_notes: NoteClassListType = [CORP_SAME_SITE]
+
+
+class CrossOriginResourcePolicyCrossOriginTest(FieldTest[ResponseLinterProtocol]):
+    name = "Cross-Origin-Resource-Policy"
+    inputs = [b"cross-origin"]
+    expected_out = "cross-origin"
+    expected_notes: NoteClassListType = [CORP_CROSS_ORIGIN]
+
+
+class CrossOriginResourcePolicyBadValueTest(FieldTest[ResponseLinterProtocol]):
+    name = "Cross-Origin-Resource-Policy"
+    inputs = [b"foo"]
+    expected_out = "foo"
+    expected_notes: NoteClassListType = [CROSS_ORIGIN_RESOURCE_POLICY_BAD_VALUE]
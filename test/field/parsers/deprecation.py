@@ -0,0 +1,41 @@
+from datetime import datetime, timezone
+from typing import Any
+
+from httplint.field.parsers.deprecation import (
+    DEPRECATION_BAD_TYPE,
+    DEPRECATION_PAST,
+    DEPRECATION_TRUE,
+)
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class DeprecationDateTest(FieldTest[ResponseLinterProtocol]):
+    name = "Deprecation"
+    inputs = [b"@1672531199"]
+    expected_out: Any = (datetime.fromtimestamp(1672531199, tz=timezone.utc), {})
+    expected_notes: NoteClassListType = [DEPRECATION_PAST]
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        message.start_time = 2000000000
+
+
+class DeprecationBoolTest(FieldTest[ResponseLinterProtocol]):
+    name = "Deprecation"
+    inputs = [b"?1"]
+    expected_out: Any = (True, {})
+    expected_notes: NoteClassListType = [DEPRECATION_TRUE]
+
+
+class DeprecationFalseTest(FieldTest[ResponseLinterProtocol]):
+    name = "Deprecation"
+    inputs = [b"?0"]
+    expected_out: Any = (False, {})
+    expected_notes: NoteClassListType = [DEPRECATION_BAD_TYPE]
+
+
+class DeprecationInvalidTest(FieldTest[ResponseLinterProtocol]):
+    name = "Deprecation"
+    inputs = [b'""']
+    expected_out: Any = ("", {})
+    expected_notes: NoteClassListType = [DEPRECATION_BAD_TYPE]
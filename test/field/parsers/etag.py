@@ -0,0 +1,22 @@
+from httplint.field import BAD_SYNTAX
+from httplint.field.tests import FieldTest
+from httplint.types import AnyMessageLinterProtocol, NoteClassListType
+
+
+class ETagTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "ETag"
+    inputs = [b'"foo"']
+    expected_out = (False, "foo")
+
+
+class WeakETagTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "ETag"
+    inputs = [b'W/"foo"']
+    expected_out = (True, "foo")
+
+
+class UnquotedETagTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "ETag"
+    inputs = [b"foo"]
+    expected_out = (False, "foo")
+    expected_notes: NoteClassListType = [BAD_SYNTAX]
@@ -0,0 +1,32 @@
+from httplint.field.parsers.expect import EXPECT_HTTP_1_0, EXPECT_UNKNOWN
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, RequestLinterProtocol
+
+
+class ExpectTest(FieldTest[RequestLinterProtocol]):
+    name = "Expect"
+    inputs = [b"100-continue"]
+    expected_out = ["100-continue"]
+    expected_notes: NoteClassListType = []
+
+    def test_unknown(self) -> None:
+        self.inputs = [b"foo"]
+        self.expected_out = ["foo"]
+        self.expected_notes = [EXPECT_UNKNOWN]
+        self.setUp()
+        self.test_header()
+
+    def test_multiple_unknown(self) -> None:
+        self.inputs = [b"foo", b"bar"]
+        self.expected_out = ["foo", "bar"]
+        self.expected_notes = [EXPECT_UNKNOWN]
+        self.setUp()
+        self.test_header()
+
+    def test_http_1_0(self) -> None:
+        self.inputs = [b"100-continue"]
+        self.expected_out = ["100-continue"]
+        self.expected_notes = [EXPECT_HTTP_1_0]
+        self.setUp()
+        self.message.version = "1.0"
+        self.test_header()
@@ -0,0 +1,29 @@
+from httplint.field.tests import FieldTest
+from httplint.field.utils import BAD_DATE_SYNTAX
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class BasicExpiresTest(FieldTest[ResponseLinterProtocol]):
+    name = "Expires"
+    inputs = [b"Mon, 04 Jul 2011 09:08:06 GMT"]
+    expected_out = 1309770486
+
+
+class BadExpiresTest(FieldTest[ResponseLinterProtocol]):
+    name = "Expires"
+    inputs = [b"0"]
+    expected_out = None
+    expected_notes: NoteClassListType = [BAD_DATE_SYNTAX]
+
+
+class BlankExpiresTest(FieldTest[ResponseLinterProtocol]):
+    name = "Expires"
+    inputs = [b""]
+    expected_out = None
+    expected_notes: NoteClassListType = [BAD_DATE_SYNTAX]
+
+
+class ExpiresYearBigTest(FieldTest[ResponseLinterProtocol]):
+    name = "Expires"
+    inputs = [b"Fri, 31 Dec 9999 23:59:59 GMT"]
+    expected_out = 253402300799
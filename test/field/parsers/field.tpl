@@ -0,0 +1,10 @@
+from httplint.field.parsers.MODULE_NAME import SHORT_NAME_NOTE
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class SHORT_NAMETest(FieldTest[ResponseLinterProtocol]):
+    name = "SHORT_NAME"
+    inputs = [b"FIXME"]
+    expected_out = "FIXME"
+    expected_notes: NoteClassListType = []
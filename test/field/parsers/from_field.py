@@ -0,0 +1,8 @@
+from httplint.field.tests import FieldTest
+from httplint.types import RequestLinterProtocol
+
+
+class FromTest(FieldTest[RequestLinterProtocol]):
+    name = "From"
+    inputs = [b"webmaster@example.org"]
+    expected_out = "webmaster@example.org"
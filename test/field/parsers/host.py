@@ -0,0 +1,8 @@
+from httplint.field.tests import FieldTest
+from httplint.types import RequestLinterProtocol
+
+
+class HostTest(FieldTest[RequestLinterProtocol]):
+    name = "Host"
+    inputs = [b"www.example.org"]
+    expected_out = "www.example.org"
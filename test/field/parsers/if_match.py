@@ -0,0 +1,8 @@
+from httplint.field.tests import FieldTest
+from httplint.types import RequestLinterProtocol
+
+
+class IfMatchTest(FieldTest[RequestLinterProtocol]):
+    name = "If-Match"
+    inputs = [b'"xyzzy", "r2d2xxxx", "c3piozzzz"']
+    expected_out = ['"xyzzy"', '"r2d2xxxx"', '"c3piozzzz"']
@@ -0,0 +1,8 @@
+from httplint.field.tests import FieldTest
+from httplint.types import RequestLinterProtocol
+
+
+class IfNoneMatchTest(FieldTest[RequestLinterProtocol]):
+    name = "If-None-Match"
+    inputs = [b'W/"xyzzy", W/"r2d2xxxx", W/"c3piozzzz"']
+    expected_out = ['W/"xyzzy"', 'W/"r2d2xxxx"', 'W/"c3piozzzz"']
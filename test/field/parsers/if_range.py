@@ -0,0 +1,8 @@
+from httplint.field.tests import FieldTest
+from httplint.types import RequestLinterProtocol
+
+
+class IfRangeTest(FieldTest[RequestLinterProtocol]):
+    name = "If-Range"
+    inputs = [b'"xyzzy"']
+    expected_out = '"xyzzy"'
@@ -0,0 +1,8 @@
+from httplint.field.tests import FieldTest
+from httplint.types import RequestLinterProtocol
+
+
+class IfUnmodifiedSinceTest(FieldTest[RequestLinterProtocol]):
+    name = "If-Unmodified-Since"
+    inputs = [b"Sat, 29 Oct 1994 19:43:31 GMT"]
+    expected_out = "Sat, 29 Oct 1994 19:43:31 GMT"
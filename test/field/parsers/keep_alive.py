@@ -0,0 +1,16 @@
+from httplint.field import FIELD_DEPRECATED
+from httplint.field.tests import FieldTest
+from httplint.types import AnyMessageLinterProtocol, NoteClassListType
+
+
+class KeepAliveTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Keep-Alive"
+    inputs = [b"timeout=30"]
+    expected_out = [("timeout", "30")]
+    expected_notes: NoteClassListType = [FIELD_DEPRECATED]
+
+
+class EmptyKeepAliveTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Keep-Alive"
+    inputs = [b""]
+    expected_notes: NoteClassListType = [FIELD_DEPRECATED]
@@ -0,0 +1,23 @@
+from httplint.field.tests import FieldTest
+from httplint.field.utils import BAD_DATE_SYNTAX
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class BasicLMTest(FieldTest[ResponseLinterProtocol]):
+    name = "Last-Modified"
+    inputs = [b"Mon, 04 Jul 2011 09:08:06 GMT"]
+    expected_out = 1309770486
+
+
+class BadLMTest(FieldTest[ResponseLinterProtocol]):
+    name = "Last-Modified"
+    inputs = [b"0"]
+    expected_out = None
+    expected_notes: NoteClassListType = [BAD_DATE_SYNTAX]
+
+
+class BlankLMTest(FieldTest[ResponseLinterProtocol]):
+    name = "Last-Modified"
+    inputs = [b""]
+    expected_out = None
+    expected_notes: NoteClassListType = [BAD_DATE_SYNTAX]
@@ -0,0 +1,132 @@
+from httplint.field import BAD_SYNTAX
+from httplint.field.parsers.link import (
+    LINK_BAD_ANCHOR,
+    LINK_BAD_HINT_TARGET,
+    LINK_BAD_TYPE,
+    LINK_RESOURCE_HINTS,
+    LINK_REV,
+)
+from httplint.field.tests import FieldTest
+from httplint.field.utils import PARAM_REPEATS
+from httplint.types import AnyMessageLinterProtocol, NoteClassListType
+
+
+class BasicLinkTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Link"
+    inputs = [b"<http://www.example.com/>; rel=example"]
+    expected_out = [("http://www.example.com/", {"rel": "example"})]
+
+
+class QuotedLinkTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Link"
+    inputs = [b'"http://www.example.com/"; rel=example']
+    expected_out = [("http://www.example.com/", {"rel": "example"})]
+    expected_notes: NoteClassListType = [BAD_SYNTAX]
+
+
+class QuotedRelationLinkTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Link"
+    inputs = [b'<http://www.example.com/>; rel="example"']
+    expected_out = [("http://www.example.com/", {"rel": "example"})]
+
+
+class RelativeLinkTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Link"
+    inputs = [b'</foo>; rel="example"']
+    expected_out = [("/foo", {"rel": "example"})]
+
+
+class RepeatingRelationLinkTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Link"
+    inputs = [b'</foo>; rel="example"; rel="another"']
+    expected_out = [("/foo", {"rel": "another"})]
+    expected_notes: NoteClassListType = [PARAM_REPEATS]
+
+
+class RevLinkTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Link"
+    inputs = [b'</foo>; rev="bar"']
+    expected_out = [("/foo", {"rev": "bar"})]
+    expected_notes: NoteClassListType = [LINK_REV]
+
+
+class BadAnchorLinkTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Link"
+    inputs = [b'</foo>; rel="bar"; anchor="{blah}"']
+    expected_out = [("/foo", {"rel": "bar", "anchor": "{blah}"})]
+    expected_notes: NoteClassListType = [LINK_BAD_ANCHOR]
+
+
+class BadTypeLinkTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Link"
+    inputs = [b'</foo>; rel="bar"; type="{blah}"']
+    expected_out = [("/foo", {"rel": "bar", "type": "{blah}"})]
+    expected_notes: NoteClassListType = [LINK_BAD_TYPE]
+
+
+class PreloadLinkTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Link"
+    inputs = [b'</main.css>; rel="preload"; as="style"']
+    expected_out = [("/main.css", {"rel": "preload", "as": "style"})]
+    expected_notes: NoteClassListType = [LINK_RESOURCE_HINTS]
+
+
+class PreconnectLinkTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Link"
+    inputs = [b'<https://cdn.example.com>; rel="preconnect"']
+    expected_out = [("https://cdn.example.com", {"rel": "preconnect"})]
+    expected_notes: NoteClassListType = [LINK_RESOURCE_HINTS]
+
+
+class DnsPrefetchLinkTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Link"
+    inputs = [b'<https://cdn.example.com>; rel="dns-prefetch"']
+    expected_out = [("https://cdn.example.com", {"rel": "dns-prefetch"})]
+    expected_notes: NoteClassListType = [LINK_RESOURCE_HINTS]
+
+
+class MultipleHintsLinkTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Link"
+    inputs = [
+        b'</main.css>; rel="preload"; as="style"',
+        b'<https://cdn.example.com>; rel="preconnect"',
+    ]
+    expected_out = [
+        ("/main.css", {"rel": "preload", "as": "style"}),
+        ("https://cdn.example.com", {"rel": "preconnect"}),
+    ]
+    expected_notes: NoteClassListType = [LINK_RESOURCE_HINTS]
+
+
+class CombinedRelHintLinkTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Link"
+    inputs = [b'<https://cdn.example.com>; rel="preconnect dns-prefetch"']
+    expected_out = [("https://cdn.example.com", {"rel": "preconnect dns-prefetch"})]
+    expected_notes: NoteClassListType = [LINK_RESOURCE_HINTS]
+
+
+class NonHintLinkTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Link"
+    inputs = [b'</style.css>; rel="stylesheet"']
+    expected_out = [("/style.css", {"rel": "stylesheet"})]
+    expected_notes: NoteClassListType = []
+
+
+class BadHintTargetLinkTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Link"
+    inputs = [b'<javascript:alert(1)>; rel="preload"']
+    expected_out = [("javascript:alert(1)", {"rel": "preload"})]
+    expected_notes: NoteClassListType = [LINK_BAD_HINT_TARGET]
+
+
+class MixedHintTargetsLinkTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Link"
+    inputs = [
+        b'<https://cdn.example.com>; rel="preconnect"',
+        b'<ftp://example.com/x>; rel="preload"',
+    ]
+    expected_out = [
+        ("https://cdn.example.com", {"rel": "preconnect"}),
+        ("ftp://example.com/x", {"rel": "preload"}),
+    ]
+    expected_notes: NoteClassListType = [LINK_RESOURCE_HINTS, LINK_BAD_HINT_TARGET]
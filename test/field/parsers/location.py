@@ -0,0 +1,11 @@
+from httplint.field.tests import FieldTest
+from httplint.types import ResponseLinterProtocol
+
+
+class LocationTest(FieldTest[ResponseLinterProtocol]):
+    name = "Location"
+    inputs = [b"http://other.example.com/foo"]
+    expected_out = "http://other.example.com/foo"
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        message.status_code = 300
@@ -0,0 +1,41 @@
+from httplint.field.parsers.max_forwards import MAX_FORWARDS_IGNORED
+from httplint.field.tests import FakeRequestLinter, FieldTest
+from httplint.types import RequestLinterProtocol
+
+
+class MaxForwardsTest(FieldTest[RequestLinterProtocol]):
+    name = "Max-Forwards"
+    inputs = [b"5"]
+    expected_out = "5"
+
+    def setUp(self) -> None:
+        self.message = FakeRequestLinter()
+        self.message.method = "TRACE"
+        self.set_context(self.message)
+
+    def test_trace_method(self) -> None:
+        assert isinstance(self.message, FakeRequestLinter)
+        self.message.method = "TRACE"
+        self.inputs = [b"5"]
+        self.expected_out = "5"
+        self.expected_notes = []
+        self.setUp()
+        self.test_header()
+
+    def test_options_method(self) -> None:
+        assert isinstance(self.message, FakeRequestLinter)
+        self.message.method = "OPTIONS"
+        self.inputs = [b"5"]
+        self.expected_out = "5"
+        self.expected_notes = []
+        self.setUp()
+        self.test_header()
+
+    def test_get_method(self) -> None:
+        self.inputs = [b"5"]
+        self.expected_out = "5"
+        self.expected_notes = [MAX_FORWARDS_IGNORED]
+        self.setUp()
+        assert isinstance(self.message, FakeRequestLinter)
+        self.message.method = "GET"
+        self.test_header()
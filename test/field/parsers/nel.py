@@ -0,0 +1,105 @@
+from httplint.field.json_field import BAD_JSON
+from httplint.field.parsers.nel import (
+    NEL_BAD_VALUE,
+    NEL_CONFIGURED,
+    NEL_MISSING_KEY,
+    NEL_REPORT_TO_MISSING,
+)
+from httplint.field.parsers.reporting_endpoints import ENDPOINT_NOT_SECURE
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class NelTest(FieldTest[ResponseLinterProtocol]):
+    name = "NEL"
+    inputs = [
+        b'{"report_to": "group1", "max_age": 2592000, "include_subdomains": true, '
+        b'"success_fraction": 0.5}'
+    ]
+    expected_out = [
+        {
+            "report_to": "group1",
+            "max_age": 2592000,
+            "include_subdomains": True,
+            "success_fraction": 0.5,
+        }
+    ]
+    expected_notes: NoteClassListType = [NEL_CONFIGURED]
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        message.headers.process([(b"Reporting-Endpoints", b'group1="https://example.com/reports"')])
+
+
+class NelMultiLineTest(FieldTest[ResponseLinterProtocol]):
+    name = "NEL"
+    inputs = [
+        b'{"report_to": "group1", "max_age": 2592000}',
+        b'{"report_to": "group2", "max_age": 3600}',
+    ]
+    expected_out = [
+        {"report_to": "group1", "max_age": 2592000},
+        {"report_to": "group2", "max_age": 3600},
+    ]
+    expected_notes: NoteClassListType = [NEL_CONFIGURED]
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        message.headers.process(
+            [
+                (
+                    b"Reporting-Endpoints",
+                    b'group1="https://example.com/1", group2="https://example.com/2"',
+                )
+            ]
+        )
+
+
+class NelMissingReportToTest(FieldTest[ResponseLinterProtocol]):
+    name = "NEL"
+    inputs = [b'{"max_age": 100}']
+    expected_out = [{"max_age": 100}]
+    expected_notes: NoteClassListType = [NEL_MISSING_KEY]
+
+
+class NelBadFractionTest(FieldTest[ResponseLinterProtocol]):
+    name = "NEL"
+    inputs = [b'{"report_to": "a", "max_age": 1, "success_fraction": 1.5}']
+    expected_out = [{"report_to": "a", "max_age": 1, "success_fraction": 1.5}]
+    expected_notes: NoteClassListType = [NEL_BAD_VALUE]
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        message.headers.process([(b"Reporting-Endpoints", b'a="https://example.com/reports"')])
+
+
+class NelBadJsonTest(FieldTest[ResponseLinterProtocol]):
+    name = "NEL"
+    inputs = [b"{unquoted: key}"]
+    expected_out = None
+    expected_out = None
+    expected_notes: NoteClassListType = [BAD_JSON]
+
+
+class NelReportToTest(FieldTest[ResponseLinterProtocol]):
+    name = "NEL"
+    inputs = [b'{"report_to": "group1", "max_age": 100}']
+    expected_out = [{"report_to": "group1", "max_age": 100}]
+    expected_notes: NoteClassListType = [NEL_CONFIGURED]
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        message.headers.process([(b"Reporting-Endpoints", b'group1="https://example.com/reports"')])
+
+
+class NelReportToMissingTest(FieldTest[ResponseLinterProtocol]):
+    name = "NEL"
+    inputs = [b'{"report_to": "group1", "max_age": 100}']
+    expected_out = [{"report_to": "group1", "max_age": 100}]
+    expected_notes: NoteClassListType = [NEL_REPORT_TO_MISSING]
+
+
+class NelReportToInsecureTest(FieldTest[ResponseLinterProtocol]):
+    name = "NEL"
+    inputs = [b'{"report_to": "group1", "max_age": 100}']
+    expected_out = [{"report_to": "group1", "max_age": 100}]
+    expected_notes: NoteClassListType = [ENDPOINT_NOT_SECURE]
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        message.headers.process([(b"Reporting-Endpoints", b'group1="http://example.com/reports"')])
@@ -0,0 +1,31 @@
+from typing import Union
+
+from httplint.field.parsers.origin import BAD_ORIGIN_SYNTAX, ORIGIN_MULTIPLE_VALUES, OriginValue
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, RequestLinterProtocol
+
+
+class OriginBasicTest(FieldTest[RequestLinterProtocol]):
+    name = "Origin"
+    inputs = [b"https://example.com"]
+    expected_out: Union[None, OriginValue] = OriginValue("https", "example.com", None)
+
+
+class OriginNullTest(FieldTest[RequestLinterProtocol]):
+    name = "Origin"
+    inputs = [b"null"]
+    expected_out = None
+
+
+class OriginMultipleTest(FieldTest[RequestLinterProtocol]):
+    name = "Origin"
+    inputs = [b"https://example.com http://example.org:8080"]
+    expected_out = OriginValue("https", "example.com", None)
+    expected_notes: NoteClassListType = [ORIGIN_MULTIPLE_VALUES]
+
+
+class OriginBadSyntaxTest(FieldTest[RequestLinterProtocol]):
+    name = "Origin"
+    inputs = [b"https://example.com/foo"]
+    expected_notes: NoteClassListType = [BAD_ORIGIN_SYNTAX]
+    expected_out = None
@@ -0,0 +1,42 @@
+from http_sf import Token
+
+from httplint.field.parsers.permissions_policy import (
+    PERMISSIONS_POLICY_INVALID_VALUE,
+    PERMISSIONS_POLICY_PRESENT,
+    PERMISSIONS_POLICY_QUOTED_KEYWORD,
+    PERMISSIONS_POLICY_UNKNOWN_TOKEN,
+    PERMISSIONS_POLICY_WILDCARD,
+)
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class PermissionsPolicyTest(FieldTest[ResponseLinterProtocol]):
+    name = "Permissions-Policy"
+    inputs = [b"geolocation=(), camera=self"]
+    expected_out = {"geolocation": ([], {}), "camera": (Token("self"), {})}
+    expected_notes: NoteClassListType = [
+        PERMISSIONS_POLICY_INVALID_VALUE,
+        PERMISSIONS_POLICY_PRESENT,
+    ]
+
+
+class PermissionsPolicyWildcardTest(FieldTest[ResponseLinterProtocol]):
+    name = "Permissions-Policy"
+    inputs = [b"geolocation=*, camera=()"]
+    expected_out = {"geolocation": (Token("*"), {}), "camera": ([], {})}
+    expected_notes: NoteClassListType = [PERMISSIONS_POLICY_WILDCARD, PERMISSIONS_POLICY_PRESENT]
+
+
+class PermissionsPolicyInvalidTest(FieldTest[ResponseLinterProtocol]):
+    name = "Permissions-Policy"
+    inputs = [b'geolocation=("self"), camera=(none)']
+    expected_out = {
+        "geolocation": ([("self", {})], {}),
+        "camera": ([(Token("none"), {})], {}),
+    }
+    expected_notes: NoteClassListType = [
+        PERMISSIONS_POLICY_QUOTED_KEYWORD,
+        PERMISSIONS_POLICY_UNKNOWN_TOKEN,
+        PERMISSIONS_POLICY_PRESENT,
+    ]
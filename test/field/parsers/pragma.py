@@ -0,0 +1,10 @@
+from httplint.field import FIELD_DEPRECATED
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, RequestLinterProtocol
+
+
+class PragmaTest(FieldTest[RequestLinterProtocol]):
+    name = "Pragma"
+    inputs = [b"no-cache"]
+    expected_out = ["no-cache"]
+    expected_notes: NoteClassListType = [FIELD_DEPRECATED]
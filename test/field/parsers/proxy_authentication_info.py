@@ -0,0 +1,20 @@
+from httplint.field.tests import FieldTest
+from httplint.types import ResponseLinterProtocol
+
+
+class ProxyAuthenticationInfoTest(FieldTest[ResponseLinterProtocol]):
+    name = "Proxy-Authentication-Info"
+    inputs = [
+        b'nextnonce="5Yg8-VL198_7ulNinj-Vfs4567-32n3-84333", '
+        b'qop="auth", '
+        b'rspauth="6629fae49393a05397450978507c4ef1", '
+        b'cnonce="0a4f113b", '
+        b"nc=00000002"
+    ]
+    expected_out = [
+        'nextnonce="5Yg8-VL198_7ulNinj-Vfs4567-32n3-84333"',
+        'qop="auth"',
+        'rspauth="6629fae49393a05397450978507c4ef1"',
+        'cnonce="0a4f113b"',
+        "nc=00000002",
+    ]
@@ -0,0 +1,8 @@
+from httplint.field.tests import FieldTest
+from httplint.types import RequestLinterProtocol
+
+
+class ProxyAuthorizationTest(FieldTest[RequestLinterProtocol]):
+    name = "Proxy-Authorization"
+    inputs = [b"Basic QWxhZGRpbjpvcGVuIHNlc2FtZQ=="]
+    expected_out = "Basic QWxhZGRpbjpvcGVuIHNlc2FtZQ=="
@@ -0,0 +1,36 @@
+from http_sf import Token
+
+from httplint.field.parsers.proxy_status import (
+    PROXY_STATUS,
+    PROXY_STATUS_BAD_PARAM_VAL,
+    PROXY_STATUS_UNKNOWN_PARAM,
+)
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class ProxyStatusTest(FieldTest[ResponseLinterProtocol]):
+    name = "Proxy-Status"
+    inputs = [
+        b"ExampleProxy; error=http_protocol_error",
+        b"AnotherProxy; next-hop=example.com",
+    ]
+    expected_out = [
+        (Token("ExampleProxy"), {"error": Token("http_protocol_error")}),
+        (Token("AnotherProxy"), {"next-hop": "example.com"}),
+    ]
+    expected_notes: NoteClassListType = [PROXY_STATUS]
+
+
+class ProxyStatusUnknownParamTest(FieldTest[ResponseLinterProtocol]):
+    name = "Proxy-Status"
+    inputs = [b"ExampleProxy; unknown=1"]
+    expected_out = [(Token("ExampleProxy"), {"unknown": 1})]
+    expected_notes: NoteClassListType = [PROXY_STATUS_UNKNOWN_PARAM, PROXY_STATUS]
+
+
+class ProxyStatusBadParamValTest(FieldTest[ResponseLinterProtocol]):
+    name = "Proxy-Status"
+    inputs = [b'ExampleProxy; error="string"']
+    expected_out = [(Token("ExampleProxy"), {"error": "string"})]
+    expected_notes: NoteClassListType = [PROXY_STATUS_BAD_PARAM_VAL, PROXY_STATUS]
@@ -0,0 +1,48 @@
+from httplint.field.parsers.range import RANGE_BAD_SYNTAX, RANGE_INVALID, RangeValue
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, RequestLinterProtocol
+
+
+class RangeTest(FieldTest[RequestLinterProtocol]):
+    name = "Range"
+    inputs = [b"bytes=0-499"]
+    expected_out = RangeValue("bytes", [(0, 499)])
+
+
+class RangeMultiTest(FieldTest[RequestLinterProtocol]):
+    name = "Range"
+    inputs = [b"bytes=0-499, 500-"]
+    expected_out = RangeValue("bytes", [(0, 499), (500, None)])
+
+
+class RangeSuffixTest(FieldTest[RequestLinterProtocol]):
+    name = "Range"
+    inputs = [b"bytes=-500"]
+    expected_out = RangeValue("bytes", [(None, 500)])
+
+
+class RangeInvalidTest(FieldTest[RequestLinterProtocol]):
+    name = "Range"
+    inputs = [b"bytes=0-0, -1"]
+    expected_out = RangeValue("bytes", [(0, 0), (None, 1)])
+
+
+class RangeInvalidOrderTest(FieldTest[RequestLinterProtocol]):
+    name = "Range"
+    inputs = [b"bytes=500-100"]
+    expected_out = RangeValue("bytes", [(500, 100)])
+    expected_notes: NoteClassListType = [RANGE_INVALID]
+
+
+class RangeSyntaxErrorTest(FieldTest[RequestLinterProtocol]):
+    name = "Range"
+    inputs = [b"bytes=a-b"]
+    expected_out = None
+    expected_notes: NoteClassListType = [RANGE_BAD_SYNTAX]
+
+
+class RangeNoSplitTest(FieldTest[RequestLinterProtocol]):
+    name = "Range"
+    inputs = [b"bytes"]
+    expected_out = None
+    expected_notes: NoteClassListType = [RANGE_BAD_SYNTAX]
@@ -0,0 +1,8 @@
+from httplint.field.tests import FieldTest
+from httplint.types import RequestLinterProtocol
+
+
+class RefererTest(FieldTest[RequestLinterProtocol]):
+    name = "Referer"
+    inputs = [b"http://www.example.org/hypertext/Overview.html"]
+    expected_out = "http://www.example.org/hypertext/Overview.html"
@@ -0,0 +1,37 @@
+from httplint.field.parsers.referrer_policy import (
+    REFERRER_POLICY_EMPTY,
+    REFERRER_POLICY_MULTIPLE,
+    REFERRER_POLICY_STRICT,
+    REFERRER_POLICY_UNKNOWN,
+    REFERRER_POLICY_UNSAFE,
+)
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class ReferrerPolicyTest(FieldTest[ResponseLinterProtocol]):
+    name = "Referrer-Policy"
+    inputs = [b"no-referrer", b"unsafe-url"]
+    expected_out = ["no-referrer", "unsafe-url"]
+    expected_notes: NoteClassListType = [REFERRER_POLICY_UNSAFE, REFERRER_POLICY_MULTIPLE]
+
+
+class ReferrerPolicyStrictTest(FieldTest[ResponseLinterProtocol]):
+    name = "Referrer-Policy"
+    inputs = [b"strict-origin-when-cross-origin"]
+    expected_out = ["strict-origin-when-cross-origin"]
+    expected_notes: NoteClassListType = [REFERRER_POLICY_STRICT]
+
+
+class ReferrerPolicyUnknownTest(FieldTest[ResponseLinterProtocol]):
+    name = "Referrer-Policy"
+    inputs = [b"unknown-value"]
+    expected_out = ["unknown-value"]
+    expected_notes: NoteClassListType = [REFERRER_POLICY_UNKNOWN, REFERRER_POLICY_EMPTY]
+
+
+class ReferrerPolicyOverrideTest(FieldTest[ResponseLinterProtocol]):
+    name = "Referrer-Policy"
+    inputs = [b"unsafe-url, no-referrer"]
+    expected_out = ["unsafe-url", "no-referrer"]
+    expected_notes: NoteClassListType = [REFERRER_POLICY_MULTIPLE, REFERRER_POLICY_STRICT]
@@ -0,0 +1,39 @@
+from httplint.field import FIELD_DEPRECATED
+from httplint.field.json_field import BAD_JSON
+from httplint.field.parsers.report_to import REPORT_TO_MISSING_KEY
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class ReportToTest(FieldTest[ResponseLinterProtocol]):
+    name = "Report-To"
+    inputs = [b'{"max_age": 10886400, "endpoints": [{"url": "https://example.com/reports"}]}']
+    expected_out = [{"max_age": 10886400, "endpoints": [{"url": "https://example.com/reports"}]}]
+    expected_notes: NoteClassListType = [FIELD_DEPRECATED]
+
+
+class ReportToMultiLineTest(FieldTest[ResponseLinterProtocol]):
+    name = "Report-To"
+    inputs = [
+        b'{"group": "a", "max_age": 1, "endpoints": [{"url": "https://a.com"}]}',
+        b'{"group": "b", "max_age": 2, "endpoints": [{"url": "https://b.com"}]}',
+    ]
+    expected_out = [
+        {"group": "a", "max_age": 1, "endpoints": [{"url": "https://a.com"}]},
+        {"group": "b", "max_age": 2, "endpoints": [{"url": "https://b.com"}]},
+    ]
+    expected_notes: NoteClassListType = [FIELD_DEPRECATED]
+
+
+class ReportToMissingMaxAgeTest(FieldTest[ResponseLinterProtocol]):
+    name = "Report-To"
+    inputs = [b'{"endpoints": [{"url": "https://a.com"}]}']
+    expected_out = [{"endpoints": [{"url": "https://a.com"}]}]
+    expected_notes: NoteClassListType = [FIELD_DEPRECATED, REPORT_TO_MISSING_KEY]
+
+
+class ReportToBadJsonTest(FieldTest[ResponseLinterProtocol]):
+    name = "Report-To"
+    inputs = [b'{unquoted: "keys"}']
+    expected_out = None
+    expected_notes: NoteClassListType = [FIELD_DEPRECATED, BAD_JSON]
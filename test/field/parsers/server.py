@@ -0,0 +1,17 @@
+from httplint.field.parsers.server import MAX_SERVER_LENGTH, SERVER_TOO_LONG
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class ServerTest(FieldTest[ResponseLinterProtocol]):
+    name = "Server"
+    inputs = [b"Apache/2.4.1 (Unix)", b"CERN/3.0 libwww/2.17"]
+    expected_out = ["Apache/2.4.1 (Unix)", "CERN/3.0 libwww/2.17"]
+    expected_notes: NoteClassListType = []
+
+
+class ServerTooLongTest(FieldTest[ResponseLinterProtocol]):
+    name = "Server"
+    inputs = [b"a" * (MAX_SERVER_LENGTH + 1)]
+    expected_out = ["a" * (MAX_SERVER_LENGTH + 1)]
+    expected_notes: NoteClassListType = [SERVER_TOO_LONG]
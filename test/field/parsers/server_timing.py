@@ -0,0 +1,38 @@
+from httplint.field.parsers.server_timing import (
+    SERVER_TIMING_BAD_PARAM,
+    SERVER_TIMING_MISSING_DESC,
+    SERVER_TIMING_MISSING_DUR,
+)
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class ServerTimingTest(FieldTest[ResponseLinterProtocol]):
+    name = "Server-Timing"
+    inputs = [b"miss, db;dur=53, app;dur=47.2"]
+    expected_out = [("miss", {}), ("db", {"dur": "53"}), ("app", {"dur": "47.2"})]
+    expected_notes: NoteClassListType = [
+        SERVER_TIMING_MISSING_DUR,
+        SERVER_TIMING_MISSING_DESC,  # miss
+        SERVER_TIMING_MISSING_DESC,  # db
+        SERVER_TIMING_MISSING_DESC,  # app
+    ]
+
+
+class ServerTimingDescTest(FieldTest[ResponseLinterProtocol]):
+    name = "Server-Timing"
+    inputs = [b'cache;desc="Cache Read", db;dur=50;desc="Database"']
+    expected_out = [
+        ("cache", {"desc": "Cache Read"}),
+        ("db", {"dur": "50", "desc": "Database"}),
+    ]
+    expected_notes: NoteClassListType = [
+        SERVER_TIMING_MISSING_DUR,  # cache
+    ]
+
+
+class ServerTimingBadDurTest(FieldTest[ResponseLinterProtocol]):
+    name = "Server-Timing"
+    inputs = [b"db;dur=foo"]
+    expected_out = [("db", {"dur": "foo"})]
+    expected_notes: NoteClassListType = [SERVER_TIMING_BAD_PARAM, SERVER_TIMING_MISSING_DESC]
@@ -0,0 +1,65 @@
+from typing import Any
+
+from httplint.field.parsers.speculation_rules import (
+    SPECULATION_RULE_NOT_SECURE,
+    SPECULATION_RULES_BAD_TYPE,
+)
+from httplint.field.structured_field import STRUCTURED_FIELD_PARSE_ERROR
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class SpeculationRulesTest(FieldTest[ResponseLinterProtocol]):
+    name = "Speculation-Rules"
+    inputs = [b'"https://example.com/rules.json"']
+    expected_out: Any = [("https://example.com/rules.json", {})]
+
+
+class SpeculationRulesMultipleTest(FieldTest[ResponseLinterProtocol]):
+    name = "Speculation-Rules"
+    inputs = [b'"https://example.com/rules1.json", "https://example.com/rules2.json"']
+    expected_out: Any = [
+        ("https://example.com/rules1.json", {}),
+        ("https://example.com/rules2.json", {}),
+    ]
+
+
+class SpeculationRulesInsecureTest(FieldTest[ResponseLinterProtocol]):
+    name = "Speculation-Rules"
+    inputs = [b'"http://example.com/rules.json"']
+    expected_out: Any = [("http://example.com/rules.json", {})]
+    expected_notes: NoteClassListType = [SPECULATION_RULE_NOT_SECURE]
+
+
+class SpeculationRulesBadSyntaxTest(FieldTest[ResponseLinterProtocol]):
+    name = "Speculation-Rules"
+    inputs = [b"123"]
+    expected_out: Any = [(123, {})]
+    expected_notes: NoteClassListType = [SPECULATION_RULES_BAD_TYPE]
+
+
+class SpeculationRulesRelativeTest(FieldTest[ResponseLinterProtocol]):
+    name = "Speculation-Rules"
+    inputs = [b'"/rules.json"']
+    expected_out: Any = [("/rules.json", {})]
+    expected_notes: NoteClassListType = []
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        message.base_uri = "https://example.com/"
+
+
+class SpeculationRulesRelativeInsecureTest(FieldTest[ResponseLinterProtocol]):
+    name = "Speculation-Rules"
+    inputs = [b'"/rules.json"']
+    expected_out: Any = [("/rules.json", {})]
+    expected_notes: NoteClassListType = [SPECULATION_RULE_NOT_SECURE]
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        message.base_uri = "http://example.com/"
+
+
+class SpeculationRulesInvalidSFTest(FieldTest[ResponseLinterProtocol]):
+    name = "Speculation-Rules"
+    inputs = [b"<script>"]
+    expected_out: Any = None
+    expected_notes: NoteClassListType = [STRUCTURED_FIELD_PARSE_ERROR]
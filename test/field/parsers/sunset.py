@@ -0,0 +1,27 @@
+from httplint.field.parsers.sunset import SUNSET_PAST
+from httplint.field.tests import FieldTest
+from httplint.field.utils import BAD_DATE_SYNTAX
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class SunsetTest(FieldTest[ResponseLinterProtocol]):
+    name = "Sunset"
+    inputs = [b"Sat, 31 Dec 2022 23:59:59 GMT"]
+    expected_out = 1672531199
+
+
+class SunsetPastTest(FieldTest[ResponseLinterProtocol]):
+    name = "Sunset"
+    inputs = [b"Sat, 01 Jan 2000 00:00:00 GMT"]
+    expected_out = 946684800
+    expected_notes: NoteClassListType = [SUNSET_PAST]
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        message.start_time = 1000000000
+
+
+class SunsetBadSyntaxTest(FieldTest[ResponseLinterProtocol]):
+    name = "Sunset"
+    inputs = [b"not a date"]
+    expected_out = None
+    expected_notes: NoteClassListType = [BAD_DATE_SYNTAX]
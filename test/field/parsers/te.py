@@ -0,0 +1,8 @@
+from httplint.field.tests import FieldTest
+from httplint.types import AnyMessageLinterProtocol
+
+
+class TETest(FieldTest[AnyMessageLinterProtocol]):
+    name = "TE"
+    inputs = [b"trailers, deflate; q=0.5"]
+    expected_out = [("trailers", {}), ("deflate", {"q": "0.5"})]
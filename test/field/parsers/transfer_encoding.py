@@ -0,0 +1,73 @@
+from httplint.field import BAD_SYNTAX
+from httplint.field.parsers.transfer_encoding import (
+    TRANSFER_CODING_IDENTITY,
+    TRANSFER_CODING_PARAM,
+    TRANSFER_CODING_UNWANTED,
+)
+from httplint.field.tests import FakeRequestLinter, FieldTest
+from httplint.types import AnyMessageLinterProtocol, NoteClassListType, ResponseLinterProtocol
+
+
+class TransferEncodingTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Transfer-Encoding"
+    inputs = [b"chunked"]
+    expected_out = [("chunked", {})]
+
+
+class TransferEncodingParamTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Transfer-Encoding"
+    inputs = [b"chunked; foo=bar"]
+    expected_out = [("chunked", {"foo": "bar"})]
+    expected_notes: NoteClassListType = [TRANSFER_CODING_PARAM]
+
+
+class BadTransferEncodingTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Transfer-Encoding"
+    inputs = [b"chunked=foo"]
+    expected_out = [("chunked=foo", {})]
+    expected_notes: NoteClassListType = [BAD_SYNTAX, TRANSFER_CODING_UNWANTED]
+
+
+class TransferEncodingCaseTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Transfer-Encoding"
+    inputs = [b"chUNked"]
+    expected_out = [("chunked", {})]
+
+
+class TransferEncodingIdentityTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Transfer-Encoding"
+    inputs = [b"identity"]
+    expected_out = [("identity", {})]
+    expected_notes: NoteClassListType = [TRANSFER_CODING_IDENTITY]
+
+
+class TransferEncodingUnwantedTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Transfer-Encoding"
+    inputs = [b"foo"]
+    expected_out = [("foo", {})]
+    expected_notes: NoteClassListType = [TRANSFER_CODING_UNWANTED]
+
+
+class TransferEncodingMultTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Transfer-Encoding"
+    inputs = [b"chunked", b"identity"]
+    expected_out = [("chunked", {}), ("identity", {})]
+    expected_notes: NoteClassListType = [TRANSFER_CODING_IDENTITY]
+
+
+class TransferEncodingMultUnwantedTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Transfer-Encoding"
+    inputs = [b"chunked", b"foo", b"bar"]
+    expected_out = [("chunked", {}), ("foo", {}), ("bar", {})]
+    expected_notes: NoteClassListType = [TRANSFER_CODING_UNWANTED]
+
+
+class TransferEncodingWantedTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Transfer-Encoding"
+    inputs = [b"foo"]
+    expected_out = [("foo", {})]
+
+    def set_response_context(self, message: ResponseLinterProtocol) -> None:
+        request = FakeRequestLinter()
+        request.headers.process([(b"te", b"foo")])
+        message.request = request
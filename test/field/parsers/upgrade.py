@@ -0,0 +1,9 @@
+from httplint.field.tests import FieldTest
+from httplint.types import AnyMessageLinterProtocol, NoteClassListType
+
+
+class UpgradeTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Upgrade"
+    inputs = [b"HTTP/2.0, SHTTP/1.3, IRC/6.9, RTA/x11", b"websocket"]
+    expected_out = ["HTTP/2.0", "SHTTP/1.3", "IRC/6.9", "RTA/x11", "websocket"]
+    expected_notes: NoteClassListType = []
@@ -0,0 +1,17 @@
+from httplint.field.parsers.use_as_dictionary import USE_AS_DICTIONARY_BAD_TYPE
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class UseAsDictionaryTest(FieldTest[ResponseLinterProtocol]):
+    name = "Use-As-Dictionary"
+    inputs = [b'match="/foo/*", ttl=123']
+    expected_out = {"match": ("/foo/*", {}), "ttl": (123, {})}
+    expected_notes: NoteClassListType = []
+
+
+class UseAsDictionaryBadParamTest(FieldTest[ResponseLinterProtocol]):
+    name = "Use-As-Dictionary"
+    inputs = [b'match=123, ttl="abc"']
+    expected_out = {"match": (123, {}), "ttl": ("abc", {})}
+    expected_notes: NoteClassListType = [USE_AS_DICTIONARY_BAD_TYPE, USE_AS_DICTIONARY_BAD_TYPE]
@@ -0,0 +1,8 @@
+from httplint.field.tests import FieldTest
+from httplint.types import RequestLinterProtocol
+
+
+class UserAgentTest(FieldTest[RequestLinterProtocol]):
+    name = "User-Agent"
+    inputs = [b"CERN-LineMode/2.15 libwww/2.17b3"]
+    expected_out = "CERN-LineMode/2.15 libwww/2.17b3"
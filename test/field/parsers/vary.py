@@ -0,0 +1,31 @@
+from httplint.field.parsers.vary import (
+    VARY_ASTERISK,
+    VARY_COMPLEX,
+    VARY_DUPLICATE,
+    VARY_HOST,
+    VARY_NEGOTIATE,
+    VARY_USER_AGENT,
+)
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class VaryTest(FieldTest[ResponseLinterProtocol]):
+    name = "Vary"
+    inputs = [b"Accept-Encoding", b"*, User-Agent", b"Host"]
+    expected_out = ["accept-encoding", "*", "user-agent", "host"]
+    expected_notes: NoteClassListType = [VARY_ASTERISK, VARY_USER_AGENT, VARY_HOST, VARY_COMPLEX]
+
+
+class VaryNegotiateTest(FieldTest[ResponseLinterProtocol]):
+    name = "Vary"
+    inputs = [b"Negotiate"]
+    expected_out = ["negotiate"]
+    expected_notes: NoteClassListType = [VARY_NEGOTIATE]
+
+
+class VaryDuplicateTest(FieldTest[ResponseLinterProtocol]):
+    name = "Vary"
+    inputs = [b"a, b", b"a, c"]
+    expected_out = ["a", "b", "c"]
+    expected_notes: NoteClassListType = [VARY_DUPLICATE]
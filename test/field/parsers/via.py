@@ -0,0 +1,10 @@
+from httplint.field.parsers.via import VIA_PRESENT
+from httplint.field.tests import FieldTest
+from httplint.types import AnyMessageLinterProtocol, NoteClassListType
+
+
+class ViaTest(FieldTest[AnyMessageLinterProtocol]):
+    name = "Via"
+    inputs = [b"1.1 test"]
+    expected_out = ["1.1 test"]
+    expected_notes: NoteClassListType = [VIA_PRESENT]
@@ -0,0 +1,10 @@
+from httplint.field import FIELD_DEPRECATED
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class WarningTest(FieldTest[ResponseLinterProtocol]):
+    name = "Warning"
+    inputs = [b'110 - "Response is stale"', b'299 - "Miscellaneous warning"']
+    expected_out = ['110 - "Response is stale"', '299 - "Miscellaneous warning"']
+    expected_notes: NoteClassListType = [FIELD_DEPRECATED]
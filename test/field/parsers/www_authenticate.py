@@ -0,0 +1,9 @@
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class WWWAuthenticateTest(FieldTest[ResponseLinterProtocol]):
+    name = "WWW-Authenticate"
+    inputs = [b'Basic realm="WallyWorld"']
+    expected_out = ['Basic realm="WallyWorld"']
+    expected_notes: NoteClassListType = []
@@ -0,0 +1,11 @@
+from httplint.field import BAD_SYNTAX
+from httplint.field.parsers.x_content_type_options import CONTENT_TYPE_OPTIONS
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class XContentTypeOptionsTest(FieldTest[ResponseLinterProtocol]):
+    name = "X-Content-Type-Options"
+    inputs = [b"nosniff", b"foo"]
+    expected_out = ["nosniff", "foo"]
+    expected_notes: NoteClassListType = [CONTENT_TYPE_OPTIONS, BAD_SYNTAX]
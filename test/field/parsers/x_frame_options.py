@@ -0,0 +1,36 @@
+from httplint.field import BAD_SYNTAX
+from httplint.field.parsers.x_frame_options import (
+    FRAME_OPTIONS_DENY,
+    FRAME_OPTIONS_SAMEORIGIN,
+    FRAME_OPTIONS_UNKNOWN,
+)
+from httplint.field.tests import FieldTest
+from httplint.types import NoteClassListType, ResponseLinterProtocol
+
+
+class DenyXFOTest(FieldTest[ResponseLinterProtocol]):
+    name = "X-Frame-Options"
+    inputs = [b"DENY"]
+    expected_out = "DENY"
+    expected_notes: NoteClassListType = [FRAME_OPTIONS_DENY]
+
+
+class DenyXFOCaseTest(FieldTest[ResponseLinterProtocol]):
+    name = "X-Frame-Options"
+    inputs = [b"deny"]
+    expected_out = "DENY"
+    expected_notes: NoteClassListType = [FRAME_OPTIONS_DENY]
+
+
+class SameOriginXFOTest(FieldTest[ResponseLinterProtocol]):
+    name = "X-Frame-Options"
+    inputs = [b"SAMEORIGIN"]
+    expected_out = "SAMEORIGIN"
+    expected_notes: NoteClassListType = [FRAME_OPTIONS_SAMEORIGIN]
+
+
+class UnknownXFOTest(FieldTest[ResponseLinterProtocol]):
+    name = "X-Frame-Options"
+    inputs = [b"foO"]
+    expected_out = "FOO"
+    expected_notes: NoteClassListType = [BAD_SYNTAX, FRAME_OPTIONS_UNKNOWN]
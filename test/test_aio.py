@@ -0,0 +1,95 @@
+import asyncio
+import gzip
+import threading
+import time
+import unittest
+
+from httplint.aio import AsyncRequestLinter, AsyncResponseLinter, Offloader
+from httplint.i18n import set_locale
+from httplint.message import HttpResponseLinter
+
+CONTENT = b"<html><body>" + b"<p>hello world</p>" * 5000 + b"</body></html>"
+COMPRESSED = gzip.compress(CONTENT)
+HEADERS = [
+    (b"Content-Type", b"text/html; charset=utf-8"),
+    (b"Content-Encoding", b"gzip"),
+    (b"Content-Length", str(len(COMPRESSED)).encode("ascii")),
+]
+
+
+def chunks(content: bytes, size: int):
+    return [content[i : i + size] for i in range(0, len(content), size)]
+
+
+class AsyncLinterTest(unittest.IsolatedAsyncioTestCase):
+    async def test_same_as_sync(self) -> None:
+        linter = AsyncResponseLinter()
+        linter.process_response_topline(b"HTTP/1.1", b"200", b"OK")
+        linter.process_headers(HEADERS)
+        for chunk in chunks(COMPRESSED, 100):
+            await linter.feed_content(chunk)
+        await linter.finish_content(True)
+
+        sync = HttpResponseLinter()
+        sync.process_response_topline(b"HTTP/1.1", b"200", b"OK")
+        sync.process_headers(HEADERS)
+        sync.feed_content(COMPRESSED)
+        sync.finish_content(True)
+
+        self.assertEqual(linter.content_length, len(COMPRESSED))
+        self.assertEqual(linter.decoded.hash, sync.decoded.hash)
+        self.assertEqual(linter.content_sample, sync.content_sample)
+        self.assertEqual(
+            [n.__class__.__name__ for n in linter.notes],
+            [n.__class__.__name__ for n in sync.notes],
+        )
+
+    async def test_request(self) -> None:
+        linter = AsyncRequestLinter()
+        linter.process_request_topline(b"GET", b"/", b"HTTP/1.1")
+        linter.process_headers([(b"Host", b"example.com")])
+        await linter.finish_content(True)
+        self.assertEqual(linter.method, "GET")
+        self.assertIn("MISSING_USER_AGENT", [n.__class__.__name__ for n in linter.notes])
+
+    async def test_locale(self) -> None:
+        linter = AsyncResponseLinter()
+        linter.process_response_topline(b"HTTP/1.1", b"304", b"Not Modified")
+        linter.process_headers([])
+        await linter.feed_content(b"hello")
+        with set_locale("fr"):
+            await linter.finish_content(True)
+        notes = [n for n in linter.notes if n.__class__.__name__ == "CONTENT_NOT_ALLOWED"]
+        self.assertEqual([n.vars["message"] for n in notes], ["réponse"])
+
+    async def test_backpressure(self) -> None:
+        linter = AsyncResponseLinter(max_buffer=1000)
+        linter.process_response_topline(b"HTTP/1.1", b"200", b"OK")
+        linter.process_headers(HEADERS)
+        for chunk in chunks(COMPRESSED, 400):
+            await linter.feed_content(chunk)
+            self.assertLessEqual(linter._buffered, 1000)
+        await linter.finish_content(True)
+        self.assertEqual(linter._buffered, 0)
+
+    async def test_max_concurrency(self) -> None:
+        offloader = Offloader(max_concurrency=2)
+        running = 0
+        most = 0
+        lock = threading.Lock()
+
+        def work() -> None:
+            nonlocal running, most
+            with lock:
+                running += 1
+                most = max(most, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+
+        await asyncio.gather(*[offloader.run(work) for _ in range(8)])
+        self.assertEqual(most, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import pickle
+import unittest
+
+from httplint.batch import ExchangeOutcome, RawExchange, RawMessage, lint_exchange, lint_exchanges
+
+
+def _exchange(i: int) -> RawExchange:
+    return RawExchange(
+        request=RawMessage(
+            (b"GET", f"/{i}".encode("ascii"), b"HTTP/1.1"),
+            [(b"Host", b"example.com"), (b"User-Agent", b"test")],
+        ),
+        response=RawMessage(
+            (b"HTTP/1.1", b"200", b"OK"),
+            [
+                (b"Date", b"Mon, 04 Jul 2011 09:08:06 GMT"),
+                (b"Cache-Control", f"max-age={i}".encode("ascii")),
+                (b"Content-Type", b"text/plain"),
+                (b"Content-Length", b"3"),
+            ],
+            [b"f", b"oo"],
+        ),
+    )
+
+
+class BatchTest(unittest.TestCase):
+    def test_lint_exchange(self) -> None:
+        outcome = lint_exchange(_exchange(60))
+        names = [note.name for note in outcome.response_notes]
+        self.assertIn("CL_CORRECT", names)
+        self.assertIn("FRESHNESS_FRESH", names)
+        self.assertIsNotNone(outcome.request_notes)
+
+    def test_response_only(self) -> None:
+        outcome = lint_exchange(RawExchange(_exchange(1).response))
+        self.assertIsNone(outcome.request_notes)
+
+    def test_head_response(self) -> None:
+        exchange = _exchange(1)
+        request = exchange.request._replace(top_line=(b"HEAD", b"/", b"HTTP/1.1"))
+        outcome = lint_exchange(exchange._replace(request=request))
+        names = [note.name for note in outcome.response_notes]
+        self.assertNotIn("CL_CORRECT", names)
+
+    def test_outcome_pickles(self) -> None:
+        outcome = lint_exchange(_exchange(60))
+        self.assertEqual(pickle.loads(pickle.dumps(outcome)), outcome)
+
+    def test_in_process(self) -> None:
+        exchanges = [_exchange(i) for i in range(10)]
+        results = list(lint_exchanges(exchanges, workers=1, chunk_size=3))
+        self.assertEqual(results, [lint_exchange(exchange) for exchange in exchanges])
+
+    def test_pool_keeps_order(self) -> None:
+        exchanges = [_exchange(i) for i in range(50)]
+        results = list(lint_exchanges(iter(exchanges), workers=2, chunk_size=4))
+        self.assertEqual(len(results), 50)
+        self.assertTrue(all(isinstance(result, ExchangeOutcome) for result in results))
+        self.assertEqual(results, [lint_exchange(exchange) for exchange in exchanges])
+
+    def test_bad_arguments(self) -> None:
+        with self.assertRaises(ValueError):
+            lint_exchanges([], chunk_size=0)
+        with self.assertRaises(ValueError):
+            lint_exchanges([], workers=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from httplint import HttpResponseLinter
+from httplint import HttpRequestLinter, HttpResponseLinter
 from httplint.cache import (
     FRESHNESS_FRESH,
     FRESHNESS_SHARED_PRIVATE,
@@ -139,6 +139,21 @@ class TestCacheFreshness(unittest.TestCase):
         self.assertIn(STALE_WHILE_REVALIDATE, notes)
         self.assertIn(STALE_IF_ERROR, notes)
 
+    def test_invalid_age_with_request_time(self):
+        request = HttpRequestLinter(start_time=1000)
+        request.process_request_topline(b"GET", b"/", b"HTTP/1.1")
+        request.process_headers([])
+        request.finish_content(True)
+        linter = HttpResponseLinter(start_time=1002, _related=request)
+        linter.process_response_topline(b"HTTP/1.1", b"200", b"OK")
+        linter.process_headers([
+            (b"Age", b"abc"),
+            (b"Cache-Control", b"max-age=60"),
+        ])
+        linter.finish_content(True)
+
+        self.assertEqual(linter.caching.age, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
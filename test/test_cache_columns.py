@@ -0,0 +1,127 @@
+import random
+import unittest
+
+from httplint import HttpRequestLinter, HttpResponseLinter
+
+try:
+    import numpy as np
+
+    from httplint.cache_columns import analyse_caching, columns_from_responses
+except ImportError:
+    np = None
+
+START = 1309770486
+
+DATES = [None, b"Mon, 04 Jul 2011 09:08:06 GMT", b"Mon, 04 Jul 2011 09:00:00 GMT", b"yesterday"]
+EXPIRES = [None, b"Mon, 04 Jul 2011 09:18:06 GMT", b"Mon, 04 Jul 2011 08:00:00 GMT", b"0"]
+AGES = [None, b"0", b"30", b"700", b"abc"]
+DIRECTIVES = [
+    b"max-age=600",
+    b"max-age=0",
+    b"s-maxage=1200",
+    b"no-store",
+    b"no-cache",
+    b"private",
+    b"public",
+    b"must-revalidate",
+    b"proxy-revalidate",
+]
+STATUSES = [(b"200", b"OK"), (b"204", b"No Content"), (b"302", b"Found"), (b"404", b"Not Found")]
+
+
+def random_exchange(rng: random.Random) -> HttpResponseLinter:
+    request = None
+    request_time = None
+    if rng.random() < 0.7:
+        request_time = rng.choice([None, START - 2, START])
+        request = HttpRequestLinter(start_time=request_time)
+        request.process_request_topline(rng.choice([b"GET", b"HEAD", b"POST"]), b"/", b"HTTP/1.1")
+        headers = [(b"Host", b"example.com")]
+        if rng.random() < 0.2:
+            headers.append((b"Authorization", b"Basic Zm9vOmJhcg=="))
+        request.process_headers(headers)
+        request.finish_content(True)
+    response = HttpResponseLinter(
+        start_time=rng.choice([None, START, START + 1.5]), _related=request
+    )
+    if request is not None:
+        request.response = response
+    response.process_response_topline(b"HTTP/1.1", *rng.choice(STATUSES))
+    headers = []
+    for name, values in [(b"Date", DATES), (b"Expires", EXPIRES), (b"Age", AGES)]:
+        value = rng.choice(values)
+        if value is not None:
+            headers.append((name, value))
+    directives = rng.sample(DIRECTIVES, rng.randint(0, 3))
+    if directives:
+        headers.append((b"Cache-Control", b", ".join(directives)))
+    if rng.random() < 0.1:
+        headers.append((b"Vary", b"*"))
+    if rng.random() < 0.2:
+        headers.append((b"Last-Modified", b"Sun, 03 Jul 2011 18:00:00 GMT"))
+    response.process_headers(headers)
+    response.finish_content(True)
+    return response
+
+
+@unittest.skipIf(np is None, "numpy isn't installed")
+class CacheColumnsTest(unittest.TestCase):
+    def test_same_as_checker(self) -> None:
+        rng = random.Random(9111)
+        responses = [random_exchange(rng) for _ in range(600)]
+        results = analyse_caching(columns_from_responses(responses))
+        for row, response in enumerate(responses):
+            caching = response.caching
+            checked = hasattr(caching, "is_fresh")
+            with self.subTest(row=row, headers=response.headers.text):
+                self.assertEqual(bool(results.checked[row]), checked)
+                self.assertEqual(bool(results.store_private[row]), caching.store_private)
+                self.assertEqual(bool(results.store_shared[row]), caching.store_shared)
+                if checked:
+                    self.assertEqual(results.age[row], caching.age)
+                    self.assertEqual(
+                        results.freshness_lifetime_private[row],
+                        caching.freshness_lifetime_private,
+                    )
+                    self.assertEqual(
+                        results.freshness_lifetime_shared[row],
+                        caching.freshness_lifetime_shared,
+                    )
+                    self.assertEqual(bool(results.is_fresh[row]), caching.is_fresh)
+                    self.assertEqual(bool(results.is_shared_fresh[row]), caching.is_shared_fresh)
+
+    def test_arrays(self) -> None:
+        nan = float("nan")
+        results = analyse_caching(
+            columns_from_responses([])._replace(
+                status_code=[200, 200, 404],
+                date=[START, START, nan],
+                age=[30, nan, nan],
+                expires=[nan, START + 60, nan],
+                expires_present=[False, True, False],
+                max_age=[600, nan, nan],
+                s_maxage=[nan, nan, nan],
+                no_store=[False, False, False],
+                private=[False, True, False],
+                public=[False, False, False],
+                must_revalidate=[False, False, False],
+                vary_star=[False, False, False],
+                authorization=[False, False, False],
+                cacheable_method=[True, True, True],
+                request_time=[nan, nan, nan],
+                response_time=[START, START, START],
+            )
+        )
+        self.assertEqual(results.store_shared.tolist(), [True, False, True])
+        self.assertEqual(results.age.tolist(), [30, 0, 0])
+        self.assertEqual(results.freshness_lifetime_private.tolist(), [600, 60, 0])
+        self.assertEqual(results.is_fresh.tolist(), [True, True, False])
+        self.assertEqual(results.checked.tolist(), [True, True, False])
+
+    def test_empty(self) -> None:
+        results = analyse_caching(columns_from_responses([]))
+        self.assertEqual(len(results.age), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
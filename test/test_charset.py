@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 
 from httplint.charset import (
     CHARSET_IMPLICIT_MISMATCH,
@@ -87,6 +88,19 @@ class CharsetTest(unittest.TestCase):
         linter = _run([(b"Content-Type", b"application/vnd.api+json")], body)
         self.assertTrue(_has_note(linter.notes, CHARSET_UNDECODABLE))
 
+    def test_valid_utf8_skips_detection(self):
+        body = ("Съешь же ещё этих мягких французских булок. " * 20).encode("utf-8")
+        with patch("httplint.charset.chardet.detect") as detect:
+            linter = _run([(b"Content-Type", b"text/plain; charset=utf-8")], body)
+        detect.assert_not_called()
+        self.assertFalse(_has_note(linter.notes, CHARSET_MISMATCH))
+
+    def test_ascii_skips_detection(self):
+        body = b"Hello world, this is plain ASCII text only." * 20
+        with patch("httplint.charset.chardet.detect") as detect:
+            _run([(b"Content-Type", b"text/plain; charset=iso-8859-1")], body)
+        detect.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
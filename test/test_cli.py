@@ -0,0 +1,101 @@
+import io
+import json
+import unittest
+from argparse import Namespace
+from contextlib import redirect_stderr, redirect_stdout
+
+from httplint.cli.http_parser import HttpCliParser, formats, json_default, modes
+from httplint.util import relative_time
+
+RESPONSES = (
+    b"HTTP/1.1 200 OK\r\nContent-Length: 3\r\nContent-Type: text/plain\r\n\r\nfoo"
+    b"HTTP/1.1 404 Not Found\r\nTransfer-Encoding: chunked\r\n\r\n3\r\nbar\r\n0\r\n\r\n"
+    b"HTTP/1.1 204 No Content\r\n\r\n"
+    b"HTTP/1.1 200 OK\r\nContent-Type: text/plain\r\n\r\nclose-delimited"
+)
+
+REQUESTS = (
+    b"GET /a HTTP/1.1\r\nHost: example.com\r\n\r\n"
+    b"POST /b HTTP/1.1\r\nHost: example.com\r\nContent-Length: 3\r\n\r\nfoo"
+    b"GET /c HTTP/1.1\r\nHost: example.com\r\n\r\n"
+)
+
+
+def run_parser(
+    data: bytes, mode: modes, stream: bool, chunk_size: int, fmt: formats = formats.TEXT
+) -> str:
+    parser = HttpCliParser(Namespace(mode=mode, stream=stream, format=fmt))
+    out = io.StringIO()
+    with redirect_stdout(out):
+        for i in range(0, len(data), chunk_size):
+            parser.handle_input(data[i : i + chunk_size])
+        parser.input_eof()
+    return out.getvalue()
+
+
+class CliStreamTest(unittest.TestCase):
+    def test_single_message(self) -> None:
+        out = run_parser(RESPONSES, modes.RESPONSE, False, len(RESPONSES))
+        self.assertIn("Content-Length header is correct", out)
+        self.assertNotIn("could not be found", out)
+        self.assertNotIn("## HTTP/1.1", out)
+
+    def test_stream_responses(self) -> None:
+        for chunk_size in [1, 7, len(RESPONSES)]:
+            out = run_parser(RESPONSES, modes.RESPONSE, True, chunk_size)
+            headings = [line for line in out.splitlines() if line.startswith("## ")]
+            self.assertEqual(
+                headings,
+                [
+                    "## HTTP/1.1 200 OK",
+                    "## HTTP/1.1 404 Not Found",
+                    "## HTTP/1.1 204 No Content",
+                    "## HTTP/1.1 200 OK",
+                ],
+                chunk_size,
+            )
+            self.assertIn("could not be found", out)
+
+    def test_stream_requests(self) -> None:
+        out = run_parser(REQUESTS, modes.REQUEST, True, 5)
+        headings = [line for line in out.splitlines() if line.startswith("## ")]
+        self.assertEqual(
+            headings, ["## GET /a HTTP/1.1", "## POST /b HTTP/1.1", "## GET /c HTTP/1.1"]
+        )
+
+
+    def test_many_pipelined_messages(self) -> None:
+        data = b"GET / HTTP/1.1\r\nHost: example.com\r\n\r\n" * 3000
+        for chunk_size in [100, 4096, len(data)]:
+            out = run_parser(data, modes.REQUEST, True, chunk_size, formats.NDJSON)
+            messages = {json.loads(line)["message"] for line in out.splitlines()}
+            self.assertEqual(len(messages), 3000, chunk_size)
+
+    def test_input_error_exits(self) -> None:
+        data = b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\nzz\r\n"
+        err = io.StringIO()
+        with redirect_stderr(err), self.assertRaises(SystemExit) as exited:
+            run_parser(data, modes.RESPONSE, True, len(data))
+        self.assertEqual(exited.exception.code, 1)
+        self.assertIn("zz", err.getvalue())
+
+
+class CliNdjsonTest(unittest.TestCase):
+    def test_ndjson(self) -> None:
+        out = run_parser(RESPONSES, modes.RESPONSE, True, 11, formats.NDJSON)
+        records = [json.loads(line) for line in out.splitlines()]
+        self.assertEqual(sorted({record["message"] for record in records}), [0, 1, 2, 3])
+        not_found = [r for r in records if r["note"] == "STATUS_NOT_FOUND"]
+        self.assertEqual(len(not_found), 1)
+        self.assertEqual(not_found[0]["message"], 1)
+        self.assertEqual(not_found[0]["vars"]["status"], 404)
+        self.assertEqual(not_found[0]["level"], "info")
+        self.assertEqual(not_found[0]["category"], "GENERAL")
+
+    def test_relative_time_is_not_rendered(self) -> None:
+        self.assertEqual(json_default(relative_time(1060, 1000)), 60)
+        self.assertEqual(json_default(relative_time(1000, 1060)), -60)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,26 @@
 import unittest
+import zlib
+from unittest import mock
 import brotli
 from httplint.message import HttpResponseLinter
-from httplint.content_encoding import BAD_BROTLI
+from httplint import content_encoding
+from httplint.content_encoding import BAD_BROTLI, BAD_DEFLATE, BAD_GZIP, BAD_ZSTD, ContentNeeds
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def decode(coding, compressed, chunk_size=None):
+    linter = HttpResponseLinter()
+    linter.process_response_topline(b"HTTP/1.1", b"200", b"OK")
+    linter.process_headers([(b"Content-Encoding", coding)])
+    chunk_size = chunk_size or len(compressed) or 1
+    for i in range(0, len(compressed), chunk_size):
+        linter.feed_content(compressed[i : i + chunk_size])
+    linter.finish_content(True)
+    return linter
 
 class TestContentEncoding(unittest.TestCase):
     def test_brotli_valid(self):
@@ -69,5 +88,122 @@ class TestContentEncoding(unittest.TestCase):
 
         self.assertEqual(linter.decoded.hash, hashlib.md5(data).digest())
 
+    def test_gzip_header_fields_bytewise(self):
+        import hashlib
+        import struct
+        import zlib
+
+        data = b"Hello, incremental gzip header! " * 50
+        deflate = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        body = deflate.compress(data) + deflate.flush()
+        header = b"\x1f\x8b\x08\x1e" + b"\x00" * 6
+        header += struct.pack("<H", 5) + b"extra"
+        header += b"a-rather-long-file-name.txt\x00" + b"comment " * 100 + b"\x00"
+        header += b"\x00\x00"  # header CRC
+        trailer = struct.pack("<II", zlib.crc32(data), len(data))
+        compressed = header + body + trailer
+
+        linter = HttpResponseLinter()
+        linter.process_response_topline(b"HTTP/1.1", b"200", b"OK")
+        linter.process_headers([(b"Content-Encoding", b"gzip")])
+        for i in range(len(compressed)):
+            linter.feed_content(compressed[i : i + 1])
+        linter.finish_content(True)
+
+        self.assertEqual(
+            [n.__class__.__name__ for n in linter.notes if "GZIP" in n.__class__.__name__], []
+        )
+        self.assertEqual(linter.decoded.hash, hashlib.md5(data).digest())
+        self.assertEqual(linter.decoded.length, len(data))
+
+    def test_gzip_bad_magic(self):
+        linter = HttpResponseLinter()
+        linter.process_response_topline(b"HTTP/1.1", b"200", b"OK")
+        linter.process_headers([(b"Content-Encoding", b"gzip")])
+        linter.feed_content(b"\x1f\x8c\x08\x00")
+        linter.feed_content(b"\x00" * 20)
+        linter.finish_content(True)
+        self.assertTrue(any(isinstance(n, BAD_GZIP) for n in linter.notes))
+
+    def test_gzip_stops_when_not_needed(self):
+        import gzip
+        import os
+
+        data = os.urandom(16).hex().encode("ascii") * 50000
+        compressed = gzip.compress(data)
+        linter = HttpResponseLinter(content_needs=ContentNeeds.SAMPLE)
+        linter.process_response_topline(b"HTTP/1.1", b"200", b"OK")
+        linter.process_headers([(b"Content-Encoding", b"gzip")])
+        for i in range(0, len(compressed), 1024):
+            linter.feed_content(compressed[i : i + 1024])
+        linter.finish_content(True)
+        self.assertTrue(linter.decoded.stopped)
+        self.assertLess(linter.decoded.length, len(data))
+        self.assertEqual(linter.content_sample, data[: linter.content_sample_size])
+
+    def test_gzip_decoded_fully_when_hashing(self):
+        import gzip
+        import os
+
+        data = os.urandom(16).hex().encode("ascii") * 50000
+        linter = HttpResponseLinter()
+        linter.process_response_topline(b"HTTP/1.1", b"200", b"OK")
+        linter.process_headers([(b"Content-Encoding", b"gzip")])
+        linter.feed_content(gzip.compress(data))
+        linter.finish_content(True)
+        self.assertFalse(linter.decoded.stopped)
+        self.assertEqual(linter.decoded.length, len(data))
+
+    def test_deflate_zlib(self):
+        import hashlib
+
+        data = b"Hello, Deflate! " * 100
+        linter = decode(b"deflate", zlib.compress(data))
+        self.assertEqual(linter.decoded.hash, hashlib.md5(data).digest())
+        self.assertEqual(linter.decoded.length, len(data))
+
+    def test_deflate_raw_bytewise(self):
+        import hashlib
+
+        data = b"Hello, raw Deflate! " * 100
+        deflate = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        linter = decode(b"deflate", deflate.compress(data) + deflate.flush(), 1)
+        self.assertEqual(linter.decoded.hash, hashlib.md5(data).digest())
+
+    def test_deflate_corrupt(self):
+        linter = decode(b"deflate", zlib.compress(b"Hello")[:2] + b"\xff" * 20)
+        self.assertTrue(any(isinstance(n, BAD_DEFLATE) for n in linter.notes))
+
+    def test_deflate_limit(self):
+        with mock.patch.object(content_encoding, "MAX_DECOMPRESSED_BYTES", 1000):
+            linter = decode(b"deflate", zlib.compress(b"a" * 5000))
+        self.assertTrue(
+            any(isinstance(n, content_encoding.DECOMPRESSION_LIMIT) for n in linter.notes)
+        )
+
+    @unittest.skipIf(zstandard is None, "zstandard isn't installed")
+    def test_zstd(self):
+        import hashlib
+
+        data = b"Hello, Zstandard! " * 1000
+        compressed = zstandard.ZstdCompressor().compress(data)
+        linter = decode(b"zstd", compressed + compressed, 7)
+        self.assertEqual(linter.decoded.hash, hashlib.md5(data + data).digest())
+        self.assertFalse(any(isinstance(n, BAD_ZSTD) for n in linter.notes))
+
+    @unittest.skipIf(zstandard is None, "zstandard isn't installed")
+    def test_zstd_corrupt(self):
+        linter = decode(b"zstd", b"Create some corrupt zstd data")
+        self.assertTrue(any(isinstance(n, BAD_ZSTD) for n in linter.notes))
+
+    @unittest.skipIf(zstandard is None, "zstandard isn't installed")
+    def test_zstd_window_limit(self):
+        params = zstandard.ZstdCompressionParameters(window_log=24, write_content_size=False)
+        compressor = zstandard.ZstdCompressor(compression_params=params).compressobj()
+        compressed = compressor.compress(b"a" * 100) + compressor.flush()
+        linter = decode(b"zstd", compressed)
+        self.assertTrue(any(isinstance(n, BAD_ZSTD) for n in linter.notes))
+
+
 if __name__ == "__main__":
     unittest.main()
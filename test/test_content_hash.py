@@ -0,0 +1,53 @@
+import gzip
+import hashlib
+import unittest
+import zlib
+
+from httplint.content_type import CONTENT_TYPE_MISMATCH
+from httplint.message import HttpResponseLinter
+from utils import lint_response as lint
+
+
+class ContentHashTest(unittest.TestCase):
+    data = b"<html><body>hello</body></html>"
+
+    def test_default_md5(self) -> None:
+        linter = lint(self.data)
+        self.assertEqual(linter.content_hash, hashlib.md5(self.data).digest())
+        self.assertEqual(linter.decoded.hash, linter.content_hash)
+
+    def test_passthrough_reuses_wire_hash(self) -> None:
+        linter = lint(self.data)
+        self.assertIsNone(linter.decoded._hash_processor)
+        self.assertIs(linter.decoded.hash, linter.content_hash)
+
+    def test_decoded_hash(self) -> None:
+        compressed = gzip.compress(self.data)
+        linter = lint(compressed, b"gzip")
+        self.assertEqual(linter.content_hash, hashlib.md5(compressed).digest())
+        self.assertEqual(linter.decoded.hash, hashlib.md5(self.data).digest())
+
+    def test_blake2b(self) -> None:
+        compressed = gzip.compress(self.data)
+        linter = lint(compressed, b"gzip", hash_algorithm="blake2b")
+        self.assertEqual(linter.content_hash, hashlib.blake2b(compressed).digest())
+        self.assertEqual(linter.decoded.hash, hashlib.blake2b(self.data).digest())
+
+    def test_crc32(self) -> None:
+        linter = lint(self.data, hash_algorithm="crc32")
+        self.assertEqual(linter.content_hash, zlib.crc32(self.data).to_bytes(4, "big"))
+
+    def test_no_hash(self) -> None:
+        linter = lint(gzip.compress(self.data), b"gzip", hash_algorithm=None)
+        self.assertEqual(linter.content_hash, b"")
+        self.assertEqual(linter.decoded.hash, b"")
+        # content checks still run
+        self.assertIn(CONTENT_TYPE_MISMATCH, [note.__class__ for note in linter.notes])
+
+    def test_unknown_algorithm(self) -> None:
+        with self.assertRaises(ValueError):
+            HttpResponseLinter(hash_algorithm="not-a-hash")
+
+
+if __name__ == "__main__":
+    unittest.main()
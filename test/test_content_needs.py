@@ -0,0 +1,67 @@
+import gzip
+import hashlib
+import random
+import unittest
+from functools import partial
+
+from httplint import ContentNeeds
+from httplint.content_encoding import BAD_ZLIB
+from httplint.content_type import CONTENT_TYPE_MISMATCH
+from utils import lint_response
+
+RNG = random.Random(1)
+DATA = "".join(RNG.choice("abcdefghij ") for _ in range(400000)).encode("ascii")
+COMPRESSED = gzip.compress(DATA)
+CORRUPT = COMPRESSED[: len(COMPRESSED) // 2] + bytes(RNG.getrandbits(8) for _ in range(2000))
+
+lint = partial(lint_response, coding=b"gzip", chunk_size=16384)
+
+
+class ContentNeedsTest(unittest.TestCase):
+    def test_default(self) -> None:
+        linter = lint(COMPRESSED)
+        self.assertFalse(linter.decoded.stopped)
+        self.assertEqual(linter.decoded.length, len(DATA))
+        self.assertEqual(linter.decoded.hash, hashlib.md5(DATA).digest())
+
+    def test_sample_only(self) -> None:
+        linter = lint(COMPRESSED, content_needs=ContentNeeds.SAMPLE)
+        self.assertTrue(linter.decoded.stopped)
+        self.assertLess(linter.decoded.length, len(DATA))
+        self.assertEqual(linter.content_sample, DATA[: linter.content_sample_size])
+        self.assertEqual(linter.content_hash, b"")
+        self.assertEqual(linter.decoded.hash, b"")
+
+    def test_sample_only_identity(self) -> None:
+        linter = lint(DATA, coding=b"", content_needs=ContentNeeds.SAMPLE)
+        self.assertTrue(linter.decoded.stopped)
+        self.assertEqual(linter.content_length, len(DATA))
+        self.assertEqual(linter.content_sample, DATA[: linter.content_sample_size])
+
+    def test_length(self) -> None:
+        linter = lint(COMPRESSED, content_needs=ContentNeeds.LENGTH)
+        self.assertFalse(linter.decoded.stopped)
+        self.assertEqual(linter.decoded.length, len(DATA))
+        self.assertEqual(linter.content_sample, b"")
+        self.assertEqual(linter.content_hash, b"")
+
+    def test_hash_without_sample(self) -> None:
+        linter = lint(COMPRESSED, content_needs=ContentNeeds.HASH)
+        self.assertEqual(linter.content_hash, hashlib.md5(COMPRESSED).digest())
+        self.assertEqual(linter.decoded.hash, hashlib.md5(DATA).digest())
+        self.assertEqual(linter.content_sample, b"")
+        self.assertFalse(any(isinstance(n, CONTENT_TYPE_MISMATCH) for n in linter.notes))
+
+    def test_validity(self) -> None:
+        linter = lint(CORRUPT, content_needs=ContentNeeds.SAMPLE | ContentNeeds.VALIDITY)
+        self.assertTrue(any(isinstance(n, BAD_ZLIB) for n in linter.notes))
+        self.assertEqual(linter.content_hash, b"")
+
+    def test_no_validity(self) -> None:
+        linter = lint(CORRUPT, content_needs=ContentNeeds.SAMPLE)
+        self.assertTrue(linter.decoded.stopped)
+        self.assertFalse(any(isinstance(n, BAD_ZLIB) for n in linter.notes))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import pickle
+import unittest
+
+from httplint.message import HttpResponseLinter
+
+
+def start() -> HttpResponseLinter:
+    linter = HttpResponseLinter()
+    linter.process_response_topline(b"HTTP/1.1", b"200", b"OK")
+    linter.process_headers([(b"Content-Type", b"text/plain")])
+    return linter
+
+
+class ContentSampleTest(unittest.TestCase):
+    def test_empty(self) -> None:
+        linter = start()
+        linter.finish_content(True)
+        self.assertEqual(linter.content_sample, b"")
+
+    def test_small_chunks(self) -> None:
+        linter = start()
+        data = bytes(range(256)) * 4
+        for i in range(len(data)):
+            linter.feed_content(data[i : i + 1])
+        linter.finish_content(True)
+        self.assertEqual(linter.content_sample, data)
+
+    def test_stops_when_full(self) -> None:
+        linter = start()
+        size = linter.content_sample_size
+        linter.feed_content(b"a" * (size - 1))
+        self.assertEqual(len(linter.decoded.processors), 1)
+        linter.feed_content(b"bc")
+        self.assertEqual(linter.decoded.processors, [])
+        linter.feed_content(b"d" * 1024)
+        linter.finish_content(True)
+        self.assertEqual(linter.content_sample, b"a" * (size - 1) + b"b")
+        self.assertEqual(linter.decoded.length, size + 1 + 1024)
+
+    def test_sample_updates(self) -> None:
+        linter = start()
+        linter.feed_content(b"foo")
+        self.assertEqual(linter.content_sample, b"foo")
+        linter.feed_content(b"bar")
+        self.assertEqual(linter.content_sample, b"foobar")
+
+    def test_pickle(self) -> None:
+        linter = start()
+        linter.feed_content(b"a" * (linter.content_sample_size + 10))
+        linter.finish_content(True)
+        loaded = pickle.loads(pickle.dumps(linter))
+        self.assertEqual(loaded.content_sample, linter.content_sample)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import hashlib
+import pickle
+import unittest
+
+from httplint import ContentNeeds
+from httplint.content_encoding import BAD_DICTIONARY_HEADER, DICTIONARY_UNAVAILABLE, DczProcessor
+from httplint.dictionaries import DictionaryStore
+from utils import lint_response
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+DICTIONARY = b"".join(b"function example%d() { return %d; }\n" % (i, i) for i in range(200))
+CONTENT = b"".join(b"function example%d() { return %d; }\n" % (i, i * 2) for i in range(300))
+DCZ_HEADERS = [(b"Content-Encoding", b"dcz")]
+
+
+def dcz(content: bytes, dictionary: bytes) -> bytes:
+    compression_dict = zstandard.ZstdCompressionDict(
+        dictionary, dict_type=zstandard.DICT_TYPE_RAWCONTENT
+    )
+    compressed = zstandard.ZstdCompressor(dict_data=compression_dict).compress(content)
+    return DczProcessor.MAGIC + hashlib.sha256(dictionary).digest() + compressed
+
+
+class DictionaryStoreTest(unittest.TestCase):
+    def test_add_get(self) -> None:
+        store = DictionaryStore()
+        digest = store.add(b"hello")
+        self.assertEqual(digest, hashlib.sha256(b"hello").digest())
+        self.assertIn(digest, store)
+        self.assertEqual(store.get(digest), b"hello")
+        self.assertIsNone(store.get(b"\0" * 32))
+        store.add(b"hello")
+        self.assertEqual((len(store), store.size), (1, 5))
+
+    def test_lru_eviction(self) -> None:
+        store = DictionaryStore(max_size=10)
+        first = store.add(b"aaaa")
+        second = store.add(b"bbbb")
+        store.get(first)
+        third = store.add(b"cccc")
+        self.assertNotIn(second, store)
+        self.assertIn(first, store)
+        self.assertIn(third, store)
+        self.assertEqual(store.size, 8)
+
+    def test_too_big(self) -> None:
+        store = DictionaryStore(max_size=4)
+        store.add(b"aaaaa")
+        self.assertEqual(len(store), 0)
+
+    def test_capture_gives_up(self) -> None:
+        store = DictionaryStore(max_size=len(CONTENT) // 2)
+        linter = lint_response(
+            CONTENT,
+            headers=[(b"Use-As-Dictionary", b'match="/app/*.js"')],
+            chunk_size=1024,
+            dictionaries=store,
+            content_needs=ContentNeeds.SAMPLE,
+        )
+        self.assertTrue(linter.decoded.stopped)
+        self.assertEqual(linter.decoded.processors, [])
+        self.assertEqual(len(store), 0)
+
+
+@unittest.skipIf(zstandard is None, "zstandard isn't installed")
+class DczTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.store = DictionaryStore()
+        lint_response(
+            DICTIONARY,
+            headers=[(b"Use-As-Dictionary", b'match="/app/*.js"')],
+            dictionaries=self.store,
+        )
+
+    def test_captured(self) -> None:
+        self.assertEqual(self.store.get(hashlib.sha256(DICTIONARY).digest()), DICTIONARY)
+
+    def test_not_captured_without_header(self) -> None:
+        store = DictionaryStore()
+        lint_response(DICTIONARY, headers=[], dictionaries=store)
+        self.assertEqual(len(store), 0)
+
+    def test_decode(self) -> None:
+        headers = [(b"Content-Type", b"text/javascript"), (b"Content-Encoding", b"dcz")]
+        linter = lint_response(
+            dcz(CONTENT, DICTIONARY), headers=headers, chunk_size=7, dictionaries=self.store
+        )
+        self.assertTrue(linter.decoded.decode_ok)
+        self.assertEqual(linter.decoded.length, len(CONTENT))
+        self.assertEqual(linter.decoded.hash, hashlib.md5(CONTENT).digest())
+        self.assertEqual(linter.content_sample, CONTENT[: linter.content_sample_size])
+
+    def test_unknown_dictionary(self) -> None:
+        linter = lint_response(
+            dcz(CONTENT, b"another dictionary"), headers=DCZ_HEADERS, dictionaries=self.store
+        )
+        self.assertFalse(linter.decoded.decode_ok)
+        self.assertTrue(any(isinstance(n, DICTIONARY_UNAVAILABLE) for n in linter.notes))
+        self.assertEqual(linter.content_sample, b"")
+
+    def test_no_store(self) -> None:
+        linter = lint_response(dcz(CONTENT, DICTIONARY), headers=DCZ_HEADERS, dictionaries=None)
+        self.assertTrue(any(isinstance(n, DICTIONARY_UNAVAILABLE) for n in linter.notes))
+
+    def test_bad_header(self) -> None:
+        content = b"\0" * 8 + dcz(CONTENT, DICTIONARY)[8:]
+        linter = lint_response(content, headers=DCZ_HEADERS, dictionaries=self.store)
+        self.assertTrue(any(isinstance(n, BAD_DICTIONARY_HEADER) for n in linter.notes))
+
+    def test_pickle(self) -> None:
+        linter = lint_response(
+            dcz(CONTENT, DICTIONARY), headers=DCZ_HEADERS, dictionaries=self.store
+        )
+        copy = pickle.loads(pickle.dumps(linter))
+        self.assertEqual(copy.decoded.length, len(CONTENT))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@
 Check coverage and definitions of HTTP fields.
 """
 
+import importlib
 import os
 import sys
 import types
@@ -9,11 +10,14 @@ import unittest
 import xml.etree.ElementTree as ET
 
 from httplint.field import HttpField
-from httplint.field.finder import HttpFieldFinder
+from httplint.field import finder as finder_module
+from httplint.field.finder import HttpFieldFinder, UnknownHttpField
 from httplint.field.section import FieldSection
 from httplint.field.tests import FakeResponseLinter
+from httplint.field.parsers import FIELD_MODULES
 from httplint.syntax.rfc9110 import list_rule
 
+from tools.update_field_index import find_field_modules
 from utils import checkSubClasses
 
 
@@ -92,8 +96,12 @@ def checkFieldClass(field_cls):
         loader = unittest.TestLoader()
         finder = HttpFieldFinder(message)
         field_mod = finder.find_module(canonical_name)
-        tests = loader.loadTestsFromModule(field_mod)
-        if tests.countTestCases() == 0:
+        test_mod_name = field_mod.__name__.replace("httplint.field.", "test.field.", 1)
+        try:
+            test_mod = importlib.import_module(test_mod_name)
+        except ImportError:
+            test_mod = None
+        if test_mod is None or loader.loadTestsFromModule(test_mod).countTestCases() == 0:
             print(f"* {field_cls.__name__} NO TESTS")
     return errors
 
@@ -115,6 +123,30 @@ class TestFieldFinder(unittest.TestCase):
         handler = self.finder.find_handler("Unknown-Header")
         self.assertEqual(handler.canonical_name, "Unknown-Header")
 
+    def test_handler_class_cached(self) -> None:
+        HttpFieldFinder.clear_cache()
+        first = HttpFieldFinder.find_handler_class("Content-Type")
+        self.assertIs(HttpFieldFinder._handler_classes["content-type"], first)
+        self.assertIs(HttpFieldFinder.find_handler_class("CONTENT-TYPE"), first)
+        self.assertIsNotNone(HttpFieldFinder.find_handler_class("Pragma"))
+
+    def test_unknown_field_names_bounded(self) -> None:
+        HttpFieldFinder.clear_cache()
+        limit = finder_module.MAX_UNKNOWN_FIELD_NAMES
+        for i in range(limit + 10):
+            self.assertIsNone(HttpFieldFinder.find_handler_class(f"X-Unknown-{i}"))
+        self.assertEqual(len(HttpFieldFinder._handler_classes), limit)
+        self.assertIsInstance(self.finder.find_handler("X-Unknown-Extra"), UnknownHttpField)
+        self.assertIsNotNone(HttpFieldFinder.find_handler_class("Content-Type"))
+        HttpFieldFinder.clear_cache()
+
+    def test_field_index_current(self) -> None:
+        self.assertEqual(
+            FIELD_MODULES,
+            set(find_field_modules()),
+            "Field index is stale; run tools/update_field_index.py",
+        )
+
 
 class TestFieldSection(unittest.TestCase):
     def setUp(self) -> None:
@@ -132,8 +164,41 @@ class TestFieldSection(unittest.TestCase):
         self.assertIn("content-type", self.section.parsed)
         self.assertIn("content-length", self.section.parsed)
 
+    def test_process_text_and_size(self) -> None:
+        headers = [(b"Content-Type", b"text/plain"), (b"X-Thing", b"caf\xe9")]
+        self.section.process(headers)
+        self.assertEqual(
+            self.section.text, [("Content-Type", "text/plain"), ("X-Thing", "caf\xe9")]
+        )
+        self.assertEqual(self.section.size, 33)
+        subjects = [note.subject for note in self.message.notes]
+        self.assertIn("offset-1", subjects)
 
+    def test_note_subject_is_line_offset(self) -> None:
+        headers = [(b"Content-Type", b"text/plain"), (b"Set-Cookie", b"a=b; Expires=foo")]
+        self.section.process(headers)
+        cookie_notes = [n for n in self.message.notes if n.vars.get("field_name") == "Set-Cookie"]
+        self.assertTrue(cookie_notes)
+        self.assertTrue(all(note.subject == "offset-1" for note in cookie_notes))
 
+    def test_offset_skips_rejected_lines(self) -> None:
+        headers = [(b"Bad Name", b"x"), (b"X-UA-Compatible", b"IE=edge"), (b"Age", b"caf\xe9")]
+        self.section.process(headers)
+        subjects = {note.__class__.__name__: note.subject for note in self.message.notes}
+        self.assertEqual(subjects["FIELD_DEPRECATED"], "offset-0")
+        self.assertEqual(subjects["FIELD_VALUE_ENCODING"], "offset-1")
+
+    def test_index(self) -> None:
+        headers = [
+            (b"Vary", b"Accept"),
+            (b"Content-Type", b"text/plain"),
+            (b"VARY", b"Cookie, Origin"),
+        ]
+        self.section.process(headers)
+        self.assertEqual(
+            self.section.index,
+            {"vary": [("Accept", 0), ("Cookie, Origin", 2)], "content-type": [("text/plain", 1)]},
+        )
 
 
 if __name__ == "__main__":
@@ -141,9 +206,7 @@ if __name__ == "__main__":
     print("## Listing Unsupported Fields")
     unsupported = checkRegistryCoverage(sys.argv[1])
     print("## Checking Field Definitions")
-    count, errors = checkSubClasses(
-        HttpField, ["httplint/field/parsers"], checkFieldClass
-    )
+    count, errors = checkSubClasses(HttpField, ["httplint/field/parsers"], checkFieldClass)
     print(f"{count} fields checked; {errors} errors; {unsupported} unsupported.")
     if errors > 0:
         sys.exit(1)
@@ -0,0 +1,170 @@
+import base64
+import io
+import json
+import pickle
+import unittest
+
+from httplint.batch import lint_exchange
+from httplint.har import (
+    CONTENT_CHUNK_SIZE,
+    HarContent,
+    HarError,
+    har_exchange,
+    iter_har_entries,
+    lint_har,
+    outcome_record,
+    read_har,
+)
+
+CONTENT = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 4
+
+
+def entry(i: int, **response) -> dict:
+    return {
+        "startedDateTime": "2011-07-04T09:08:06.1234567Z",
+        "request": {
+            "method": "POST" if i % 2 else "GET",
+            "url": f'https://example.com/{i}?q="}}]"',
+            "httpVersion": "HTTP/1.1",
+            "headers": [{"name": "Host", "value": "example.com"}],
+            "postData": {"mimeType": "text/plain", "text": "café"} if i % 2 else None,
+        },
+        "response": {
+            "status": 200,
+            "statusText": "OK",
+            "httpVersion": "h2",
+            "headers": [
+                {"name": "Date", "value": "Mon, 04 Jul 2011 09:08:06 GMT"},
+                {"name": "Content-Type", "value": "image/png"},
+                {"name": "Cache-Control", "value": "max-age=60"},
+            ],
+            "content": {
+                "size": len(CONTENT),
+                "text": base64.b64encode(CONTENT).decode("ascii"),
+                "encoding": "base64",
+            },
+            **response,
+        },
+        "timings": {"blocked": -1, "dns": -1, "connect": 15, "send": 5, "wait": 980},
+    }
+
+
+ENTRIES = [entry(i) for i in range(5)]
+HAR = {
+    "log": {
+        "version": "1.2",
+        "pages": [{"id": "page_1", "title": "[{entries}]"}],
+        "entries": ENTRIES,
+        "comment": "entries: []",
+    }
+}
+
+
+class IterEntriesTest(unittest.TestCase):
+    def test_read_sizes(self) -> None:
+        for text in [json.dumps(HAR), json.dumps(HAR, indent=2, ensure_ascii=False)]:
+            for read_size in [1, 3, 64, 1 << 20]:
+                entries = iter_har_entries(io.BytesIO(text.encode("utf-8")), read_size)
+                self.assertEqual(list(entries), ENTRIES, read_size)
+
+    def test_entries_first(self) -> None:
+        har = {"log": {"entries": ENTRIES[:1], "pages": [{"entries": [1]}]}}
+        self.assertEqual(list(iter_har_entries(io.BytesIO(json.dumps(har).encode()))), ENTRIES[:1])
+
+    def test_truncated(self) -> None:
+        data = json.dumps(HAR).encode("utf-8")
+        with self.assertRaises(HarError):
+            list(iter_har_entries(io.BytesIO(data[: len(data) // 2]), 16))
+
+    def test_bad_entry(self) -> None:
+        with self.assertRaises(HarError):
+            list(iter_har_entries(io.BytesIO(b'{"log": {"entries": [{"a" 1}]}}')))
+
+    def test_bad_entry_early(self) -> None:
+        data = b'{"log": {"entries": [{"a": 1}, {"a" 1}, ' + json.dumps(ENTRIES * 200).encode()[1:]
+        stream = io.BytesIO(data + b"}}")
+        with self.assertRaises(HarError):
+            list(iter_har_entries(stream, 1024))
+        self.assertLess(stream.tell(), 4096)
+
+
+class HarExchangeTest(unittest.TestCase):
+    def test_messages(self) -> None:
+        exchange = har_exchange(entry(1))
+        assert exchange.request is not None
+        self.assertEqual(
+            exchange.request.top_line, (b"POST", b'https://example.com/1?q="}]"', b"1.1")
+        )
+        self.assertEqual(list(exchange.request.content), ["café".encode("utf-8")])
+        self.assertEqual(exchange.response.top_line, (b"2", b"200", b"OK"))
+        self.assertEqual(b"".join(exchange.response.content), CONTENT)
+        self.assertFalse(exchange.no_content)
+
+    def test_pseudo_headers(self) -> None:
+        h2_entry = entry(0, headers=[{"name": ":status", "value": "200"}])
+        h2_entry["request"]["httpVersion"] = "h2"
+        h2_entry["request"]["headers"] = [
+            {"name": ":method", "value": "GET"},
+            {"name": ":scheme", "value": "https"},
+            {"name": ":authority", "value": "example.com"},
+            {"name": ":path", "value": "/0"},
+            {"name": "user-agent", "value": "test"},
+        ]
+        exchange = har_exchange(h2_entry)
+        assert exchange.request is not None
+        self.assertEqual(exchange.request.headers, [(b"user-agent", b"test")])
+        self.assertEqual(exchange.response.headers, [])
+        outcome = lint_exchange(exchange)
+        names = [note.name for note in outcome.request_notes or ()] + [
+            note.name for note in outcome.response_notes
+        ]
+        self.assertNotIn("FIELD_NAME_BAD_SYNTAX", names)
+
+    def test_times(self) -> None:
+        exchange = har_exchange(entry(0))
+        self.assertAlmostEqual(exchange.start_time or 0, 1309770486.123456)
+        self.assertAlmostEqual(exchange.response_time or 0, 1309770487.123456)
+
+    def test_content_coded(self) -> None:
+        headers = entry(0)["response"]["headers"] + [{"name": "Content-Encoding", "value": "br"}]
+        exchange = har_exchange(entry(0, headers=headers))
+        self.assertTrue(exchange.no_content)
+        self.assertEqual(exchange.response.content, ())
+
+    def test_content_chunks(self) -> None:
+        content = HarContent(base64.b64encode(b"x" * 200_000).decode("ascii"), True)
+        self.assertEqual(len(content), 4)
+        self.assertEqual(b"".join(content), b"x" * 200_000)
+        self.assertEqual(content[-1], b"x" * (200_000 - 3 * CONTENT_CHUNK_SIZE))
+        self.assertIs(content[0], content[0])
+        copy = pickle.loads(pickle.dumps(content))
+        self.assertIsNone(copy._decoded)
+        self.assertEqual(b"".join(copy), b"x" * 200_000)
+
+
+class LintHarTest(unittest.TestCase):
+    def test_same_as_lint_exchange(self) -> None:
+        data = json.dumps(HAR).encode("utf-8")
+        expected = [lint_exchange(exchange) for exchange in read_har(io.BytesIO(data))]
+        for workers in [1, 2]:
+            results = list(lint_har(io.BytesIO(data), workers=workers, chunk_size=2))
+            self.assertEqual([outcome for _, outcome in results], expected)
+            self.assertEqual(
+                [exchange.request.top_line[1] for exchange, _ in results],  # type: ignore[union-attr]
+                [f'https://example.com/{i}?q="}}]"'.encode() for i in range(5)],
+            )
+
+    def test_outcome_record(self) -> None:
+        exchange, outcome = next(lint_har(io.BytesIO(json.dumps(HAR).encode("utf-8"))))
+        record = json.loads(json.dumps(outcome_record(0, exchange, outcome)))
+        self.assertEqual(record["entry"], 0)
+        self.assertEqual(record["url"], 'https://example.com/0?q="}]"')
+        self.assertEqual(record["status"], "200")
+        names = [note["name"] for note in record["response"]]
+        self.assertIn("FRESHNESS_FRESH", names)
+        self.assertNotIn("CONTENT_TYPE_MISMATCH", names)
+        self.assertTrue(all(isinstance(note["subnotes"], list) for note in record["response"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
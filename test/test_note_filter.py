@@ -0,0 +1,140 @@
+import unittest
+
+from httplint import HttpRequestLinter, HttpResponseLinter, NoteFilter
+from httplint.cache import STORE_NO_STORE
+from httplint.charset import verify_charset
+from httplint.content_type import CONTENT_TYPE_MISMATCH, verify_content_type
+from httplint.field import FIELD_DEPRECATED
+from httplint.field.parsers.cache_control import CC_CONFLICTING, cache_control
+from httplint.field.parsers.cross_origin_opener_policy import (
+    CROSS_ORIGIN_OPENER_POLICY_BAD_VALUE,
+)
+from httplint.field.parsers.cross_origin_opener_policy_report_only import (
+    COOP_REPORT_ONLY_DUPLICATE,
+    cross_origin_opener_policy_report_only,
+)
+from httplint.field.parsers.vary import VARY_ASTERISK, VARY_COMPLEX, VARY_USER_AGENT, vary
+from httplint.message import MISSING_USER_AGENT
+from httplint.note import categories
+from httplint.note_filter import checker_notes
+from httplint.status import STATUS_NONSTANDARD, StatusChecker
+from httplint.timings import Timings
+
+HEADERS = [
+    (b"Content-Type", b"image/png"),
+    (b"Cache-Control", b"max-age=60, no-store"),
+    (b"Vary", b"Accept, Accept, Accept-Language, Cookie, User-Agent"),
+    (b"Via", b"1.1 example.com"),
+    (b"Date", b"yesterday"),
+]
+
+
+DEPRECATED_HEADERS = HEADERS + [(b"X-UA-Compatible", b"IE=edge"), (b"X-XSS-Protection", b"1")]
+
+
+def lint(note_filter=None, timings=None, headers=HEADERS):
+    request = HttpRequestLinter(note_filter=note_filter)
+    request.process_request_topline(b"GET", b"https://example.com/", b"HTTP/1.1")
+    request.process_headers([])
+    request.finish_content(True)
+    linter = HttpResponseLinter(_related=request, note_filter=note_filter, timings=timings)
+    request.response = linter
+    linter.process_response_topline(b"HTTP/1.1", b"299", b"OK")
+    linter.process_headers(headers)
+    linter.feed_content(b"<html><body>hello</body></html>")
+    linter.finish_content(True)
+    return request, linter
+
+
+def classes(notes):
+    return [note.__class__ for note in notes]
+
+
+class NoteFilterTest(unittest.TestCase):
+    def test_deny(self) -> None:
+        request, linter = lint(NoteFilter(deny=[MISSING_USER_AGENT, CONTENT_TYPE_MISMATCH]))
+        self.assertNotIn(MISSING_USER_AGENT, classes(request.notes))
+        self.assertNotIn(CONTENT_TYPE_MISMATCH, classes(linter.notes))
+        self.assertIn(STATUS_NONSTANDARD, classes(linter.notes))
+
+    def test_allow(self) -> None:
+        _, linter = lint(NoteFilter(allow=[categories.CACHING, STATUS_NONSTANDARD]))
+        for note in linter.notes:
+            self.assertTrue(
+                note.category == categories.CACHING or isinstance(note, STATUS_NONSTANDARD)
+            )
+        self.assertIn(VARY_USER_AGENT, classes(linter.notes))
+        self.assertIn(STORE_NO_STORE, classes(linter.notes))
+        self.assertIn(STATUS_NONSTANDARD, classes(linter.notes))
+
+    def test_deny_category(self) -> None:
+        _, linter = lint(NoteFilter(deny=[categories.CACHING]))
+        self.assertEqual([note for note in linter.notes if note.category == categories.CACHING], [])
+        self.assertIn(CONTENT_TYPE_MISMATCH, classes(linter.notes))
+
+    def test_deny_deprecated(self) -> None:
+        _, linter = lint(NoteFilter(deny=[FIELD_DEPRECATED]), headers=DEPRECATED_HEADERS)
+        self.assertNotIn(FIELD_DEPRECATED, classes(linter.notes))
+        self.assertIn(VARY_USER_AGENT, classes(linter.notes))
+
+    def test_allow_deprecated(self) -> None:
+        _, linter = lint(NoteFilter(allow=[categories.CACHING]), headers=DEPRECATED_HEADERS)
+        self.assertNotIn(FIELD_DEPRECATED, classes(linter.notes))
+        _, linter = lint(NoteFilter(allow=[categories.SECURITY]), headers=DEPRECATED_HEADERS)
+        self.assertEqual(
+            [(note.__class__, note.category) for note in linter.notes],
+            [(FIELD_DEPRECATED, categories.SECURITY)],
+        )
+
+    def test_same_as_filtering_afterwards(self) -> None:
+        note_filter = NoteFilter(
+            allow=[categories.CACHING, categories.GENERAL], deny=[VARY_COMPLEX]
+        )
+        _, full = lint()
+        _, filtered = lint(note_filter)
+        self.assertEqual(
+            [note for note in full.notes if note_filter.allows(note.__class__, note.category)],
+            list(filtered.notes),
+        )
+
+    def test_checks_skipped(self) -> None:
+        timings = Timings()
+        lint(NoteFilter(allow=[categories.CACHING]), timings)
+        self.assertIn("cache", timings.stages)
+        for stage in ["status", "content-type", "charset", "cors"]:
+            self.assertNotIn(stage, timings.stages)
+
+    def test_value_kept(self) -> None:
+        _, linter = lint(NoteFilter(allow=[]))
+        self.assertEqual(list(linter.notes), [])
+        self.assertEqual(
+            linter.headers.parsed["vary"], ["accept", "accept-language", "cookie", "user-agent"]
+        )
+        self.assertFalse(linter.caching.store_private)
+
+    def test_runs(self) -> None:
+        note_filter = NoteFilter(deny=[CONTENT_TYPE_MISMATCH, categories.CACHING])
+        self.assertFalse(note_filter.runs(verify_content_type))
+        self.assertTrue(note_filter.runs(verify_charset))
+        self.assertTrue(note_filter.runs(StatusChecker))
+        self.assertFalse(note_filter.runs(cache_control, "evaluate", cache_control.category))
+        self.assertTrue(NoteFilter(allow=[CC_CONFLICTING]).runs(cache_control, "evaluate"))
+
+
+class CheckerNotesTest(unittest.TestCase):
+    def test_function(self) -> None:
+        self.assertEqual(checker_notes(verify_content_type), {CONTENT_TYPE_MISMATCH})
+
+    def test_method(self) -> None:
+        notes = checker_notes(vary, "evaluate")
+        self.assertIn(VARY_ASTERISK, notes)
+        self.assertNotIn(CC_CONFLICTING, notes)
+
+    def test_super(self) -> None:
+        notes = checker_notes(cross_origin_opener_policy_report_only, "evaluate")
+        self.assertIn(COOP_REPORT_ONLY_DUPLICATE, notes)
+        self.assertIn(CROSS_ORIGIN_OPENER_POLICY_BAD_VALUE, notes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import json
+import unittest
+
+from httplint.note import Note, Notes, categories, levels
+
+
+class RECORD_PARENT(Note):
+    category = categories.CACHING
+    level = levels.WARN
+    _summary = "%(field_name)s is odd."
+    _text = "Really."
+
+
+class RECORD_CHILD(Note):
+    category = categories.GENERAL
+    level = levels.INFO
+    _summary = "Because of %(reason)s."
+    _text = "Really."
+
+
+class NoteRecordsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.notes = Notes({"message_type": "response"})
+        parent = self.notes.add("field-foo", RECORD_PARENT, field_name="Foo")
+        parent.add_child(RECORD_CHILD, reason="<bar>")
+
+    def test_to_dict(self) -> None:
+        record = self.notes[0].to_dict()
+        self.assertEqual(
+            record,
+            {
+                "note": "RECORD_PARENT",
+                "subject": "field-foo",
+                "level": "warning",
+                "category": "CACHING",
+                "vars": {"message_type": "response", "field_name": "Foo"},
+                "subnotes": [
+                    {
+                        "note": "RECORD_CHILD",
+                        "subject": "field-foo",
+                        "level": "info",
+                        "category": "GENERAL",
+                        "vars": {
+                            "message_type": "response",
+                            "field_name": "Foo",
+                            "reason": "<bar>",
+                        },
+                        "subnotes": [],
+                    }
+                ],
+            },
+        )
+
+    def test_vars_are_copied(self) -> None:
+        record = self.notes[0].to_dict()
+        record["vars"]["field_name"] = "Changed"
+        self.assertEqual(self.notes[0].vars["field_name"], "Foo")
+
+    def test_to_records(self) -> None:
+        records = self.notes.to_records()
+        self.assertEqual(len(records), 1)
+        self.assertEqual(json.loads(json.dumps(records)), records)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+from httplint.i18n import set_locale
+from httplint.note import (
+    MarkdownSafe,
+    Note,
+    Notes,
+    categories,
+    clear_render_cache,
+    levels,
+    render_cache_info,
+)
+
+
+class RENDER_CACHE_NOTE(Note):
+    category = categories.GENERAL
+    level = levels.INFO
+    _summary = "The %(thing)s is here."
+    _text = "The thing is `%(thing)s`."
+
+
+class NoteRenderCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_render_cache()
+        self.notes = Notes({"message_type": "response"})
+
+    def test_hits(self) -> None:
+        first = self.notes.add("test", RENDER_CACHE_NOTE, thing="foo")
+        second = self.notes.add("test", RENDER_CACHE_NOTE, thing="foo")
+        self.assertEqual(first.detail, second.detail)
+        self.assertEqual(first.summary, second.summary)
+        info = render_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 2, 2))
+
+    def test_vars_distinguish(self) -> None:
+        foo = self.notes.add("test", RENDER_CACHE_NOTE, thing="foo")
+        bar = self.notes.add("test", RENDER_CACHE_NOTE, thing="bar")
+        self.assertEqual(foo.summary, "The foo is here.")
+        self.assertEqual(bar.summary, "The bar is here.")
+
+    def test_markdown_safe_distinguishes(self) -> None:
+        plain = self.notes.add("test", RENDER_CACHE_NOTE, thing="a`b")
+        safe = self.notes.add("test", RENDER_CACHE_NOTE, thing=MarkdownSafe("a`b"))
+        self.assertNotIn("`", plain.detail)
+        self.assertNotEqual(plain.detail, safe.detail)
+
+    def test_locale_distinguishes(self) -> None:
+        note = self.notes.add("test", RENDER_CACHE_NOTE, thing="foo")
+        summary = note.summary
+        with set_locale("fr"):
+            note.summary  # pylint: disable=pointless-statement
+        self.assertEqual(render_cache_info().misses, 2)
+        self.assertEqual(note.summary, summary)
+
+    def test_clear(self) -> None:
+        self.notes.add("test", RENDER_CACHE_NOTE, thing="foo").detail
+        clear_render_cache()
+        info = render_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import pickle
+import unittest
+
+from httplint.note import Note, Notes, categories, levels
+
+
+class SLOT_NOTE(Note):
+    category = categories.GENERAL
+    level = levels.INFO
+    _summary = "The %(thing)s is in the %(message_type)s."
+    _text = "The thing is `%(thing)s`."
+
+
+class SLOT_CHILD_NOTE(Note):
+    category = categories.CACHING
+    level = levels.WARN
+    _summary = "The %(thing)s is %(state)s."
+    _text = "The thing is `%(state)s`."
+
+
+class NoteSlotsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.notes = Notes({"message_type": "response"})
+
+    def test_no_instance_dict(self) -> None:
+        note = self.notes.add("test", SLOT_NOTE, thing="foo")
+        self.assertFalse(hasattr(note, "__dict__"))
+
+    def test_default_vars(self) -> None:
+        note = self.notes.add("test", SLOT_NOTE, thing="foo")
+        self.assertEqual(dict(note.vars), {"message_type": "response", "thing": "foo"})
+        self.assertEqual(note.summary, "The foo is in the response.")
+
+    def test_vars_override_defaults(self) -> None:
+        note = self.notes.add("test", SLOT_NOTE, thing="foo", message_type="request")
+        self.assertEqual(note.summary, "The foo is in the request.")
+
+    def test_vars_copy_on_write(self) -> None:
+        first = self.notes.add("test", SLOT_NOTE, thing="foo")
+        second = self.notes.add("test", SLOT_NOTE, thing="bar")
+        first.vars.update({"message_type": "request"})
+        self.assertEqual(first.vars["message_type"], "request")
+        self.assertEqual(second.vars["message_type"], "response")
+        self.assertEqual(
+            self.notes.add("test", SLOT_NOTE, thing="baz").vars["message_type"], "response"
+        )
+
+    def test_subnotes(self) -> None:
+        note = self.notes.add("test", SLOT_NOTE, thing="foo")
+        self.assertEqual(list(note.subnotes), [])
+        child = note.add_child(SLOT_CHILD_NOTE, state="stale")
+        self.assertEqual(list(note.subnotes), [child])
+        self.assertEqual(child.subject, "test")
+        self.assertEqual(child.summary, "The foo is stale.")
+        self.assertEqual(child.vars["message_type"], "response")
+
+    def test_category(self) -> None:
+        note = self.notes.add("test", SLOT_NOTE, categories.SECURITY, thing="foo")
+        self.assertEqual(note.category, categories.SECURITY)
+        self.assertEqual(SLOT_NOTE.category, categories.GENERAL)
+        other = self.notes.add("test", SLOT_CHILD_NOTE, categories.SECURITY, thing="foo")
+        self.assertEqual(other.category, categories.CACHING)
+        other.category = categories.VALIDATION
+        self.assertEqual(other.category, categories.VALIDATION)
+        self.assertEqual(SLOT_CHILD_NOTE.category, categories.CACHING)
+
+    def test_eq(self) -> None:
+        first = self.notes.add("test", SLOT_NOTE, thing="foo")
+        self.assertEqual(first, SLOT_NOTE("test", thing="foo", message_type="response"))
+        self.assertNotEqual(first, SLOT_NOTE("test", thing="foo"))
+        self.assertNotEqual(first, self.notes.add("test", SLOT_NOTE, thing="bar"))
+
+    def test_pickle(self) -> None:
+        note = self.notes.add("test", SLOT_NOTE, categories.SECURITY, thing="foo")
+        note.add_child(SLOT_CHILD_NOTE, state="stale")
+        notes = pickle.loads(pickle.dumps(self.notes))
+        copy = notes[0]
+        self.assertEqual(copy, note)
+        self.assertEqual(copy.category, categories.SECURITY)
+        self.assertEqual(copy.summary, note.summary)
+        self.assertEqual(copy.subnotes[0], note.subnotes[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
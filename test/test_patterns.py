@@ -0,0 +1,82 @@
+import unittest
+
+from httplint.field.parsers.cache_control import cache_control
+from httplint.field.parsers.content_length import content_length
+from httplint.field.utils import PatternRegistry, pattern_registry, split_string
+from httplint.message import HttpResponseLinter
+
+
+def _lint() -> HttpResponseLinter:
+    linter = HttpResponseLinter()
+    linter.process_response_topline(b"HTTP/1.1", b"200", b"OK")
+    linter.process_headers(
+        [
+            (b"Date", b"Mon, 04 Jul 2011 09:08:06 GMT"),
+            (b"Last-Modified", b"Mon, 04 Jul 2011 09:08:06 GMT"),
+            (b"Cache-Control", b"max-age=60, public"),
+            (b"Content-Type", b"text/plain; charset=utf-8"),
+            (b"Content-Length", b"3"),
+            (b"Vary", b"Accept-Encoding"),
+        ]
+    )
+    linter.feed_content(b"foo")
+    linter.finish_content(True)
+    return linter
+
+
+class PatternRegistryTest(unittest.TestCase):
+    def test_compile_once(self) -> None:
+        registry = PatternRegistry()
+        first = registry.compile(r"^ foo $")
+        second = registry.compile(r"^ foo $")
+        self.assertIs(first, second)
+        stats = registry.stats()
+        self.assertEqual(stats.patterns, 1)
+        self.assertEqual(stats.compiles, 1)
+        self.assertEqual(stats.hits, 1)
+        self.assertGreater(stats.memory, 0)
+
+    def test_flags_are_distinct(self) -> None:
+        registry = PatternRegistry()
+        registry.compile(r"^foo$", 0)
+        registry.compile(r"^foo$")
+        self.assertEqual(registry.stats().compiles, 2)
+
+    def test_clear(self) -> None:
+        registry = PatternRegistry()
+        registry.compile(r"^foo$")
+        registry.clear()
+        stats = registry.stats()
+        self.assertEqual((stats.patterns, stats.compiles, stats.hits), (0, 0, 0))
+
+    def test_split_pattern_built_once(self) -> None:
+        registry = PatternRegistry()
+        first = registry.split_pattern(r"[a-z]+", r"\s*,\s*")
+        self.assertIs(first, registry.split_pattern(r"[a-z]+", r"\s*,\s*"))
+        self.assertEqual(registry.stats().compiles, 1)
+        self.assertEqual(split_string("a, b ,c", r"[a-z]+", r"\s*,\s*"), ["a", "b", "c"])
+
+    def test_clear_derived(self) -> None:
+        patterns = cache_control.syntax_patterns()
+        try:
+            pattern_registry.clear()
+            self.assertIsNot(cache_control.syntax_patterns(), patterns)
+            self.assertEqual(pattern_registry.stats().compiles, 2)
+        finally:
+            pattern_registry.clear()
+
+    def test_syntax_patterns_per_class(self) -> None:
+        patterns = cache_control.syntax_patterns()
+        self.assertIsNotNone(patterns)
+        self.assertIs(patterns, cache_control.syntax_patterns())
+        self.assertIsNot(patterns, content_length.syntax_patterns())
+
+    def test_steady_state(self) -> None:
+        _lint()
+        compiles = pattern_registry.stats().compiles
+        _lint()
+        self.assertEqual(pattern_registry.stats().compiles, compiles)
+
+
+if __name__ == "__main__":
+    unittest.main()
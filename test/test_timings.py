@@ -0,0 +1,87 @@
+import gzip
+import json
+import unittest
+
+from httplint.message import HttpRequestLinter, HttpResponseLinter
+from httplint.timings import Timings
+
+
+def lint(timings: Timings) -> HttpResponseLinter:
+    linter = HttpResponseLinter(timings=timings)
+    linter.process_response_topline(b"HTTP/1.1", b"200", b"OK")
+    linter.process_headers(
+        [
+            (b"Date", b"Mon, 04 Jul 2011 09:08:06 GMT"),
+            (b"Cache-Control", b"max-age=60"),
+            (b"Content-Type", b"text/html; charset=utf-8"),
+            (b"Content-Encoding", b"gzip"),
+        ]
+    )
+    linter.feed_content(gzip.compress(b"<html><body>hi</body></html>"))
+    linter.finish_content(True)
+    return linter
+
+
+class TimingsTest(unittest.TestCase):
+    def test_off_by_default(self) -> None:
+        self.assertIsNone(HttpResponseLinter().timings)
+
+    def test_stages(self) -> None:
+        timings = Timings()
+        lint(timings)
+        for stage in [
+            "headers",
+            "hash",
+            "content-encoding",
+            "cors",
+            "cache",
+            "status",
+            "content-type",
+            "charset",
+            "field-post-checks",
+        ]:
+            self.assertIn(stage, timings.stages)
+            self.assertGreaterEqual(timings.stages[stage].seconds, 0)
+        self.assertEqual(timings.stages["headers"].calls, 1)
+        # one feed_content, one finish_content
+        self.assertEqual(timings.stages["content-encoding"].calls, 2)
+
+    def test_fields(self) -> None:
+        timings = Timings()
+        lint(timings)
+        # one call to handle the value, one to finish it
+        self.assertEqual(timings.fields["cache_control"].calls, 2)
+        self.assertEqual(timings.fields["content_type"].calls, 2)
+
+    def test_request(self) -> None:
+        timings = Timings()
+        linter = HttpRequestLinter(timings=timings)
+        linter.process_request_topline(b"GET", b"http://example.com/", b"HTTP/1.1")
+        linter.process_headers([(b"User-Agent", b"test")])
+        linter.finish_content(True)
+        self.assertIn("cors", timings.stages)
+        self.assertIn("user_agent", timings.fields)
+
+    def test_aggregate(self) -> None:
+        shared = Timings()
+        lint(shared)
+        lint(shared)
+        self.assertEqual(shared.stages["headers"].calls, 2)
+
+        merged = Timings()
+        for _ in range(3):
+            single = Timings()
+            lint(single)
+            merged.merge(single)
+        self.assertEqual(merged.stages["cache"].calls, 3)
+        self.assertEqual(merged.fields["date"].calls, 6)
+
+    def test_to_dict(self) -> None:
+        timings = Timings()
+        lint(timings)
+        data = json.loads(json.dumps(timings.to_dict()))
+        self.assertEqual(data["stages"]["headers"]["calls"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
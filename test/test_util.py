@@ -0,0 +1,32 @@
+import time
+import unittest
+
+from httplint.util import relative_time
+
+
+class RelativeTimeTester(unittest.TestCase):
+    minute = 60
+    hour = minute * 60
+    day = hour * 24
+    year = day * 365
+    cases = [
+        (+year, "in 12 months"),
+        (-year, "12 months ago"),
+        (+year + 1, "in 12 months"),
+        (+year + 0.9, "in 12 months"),
+        (+year + day, "in 12 months"),
+        (+year + (10 * day), "in 12 months"),
+        (+year + (90 * day) + (3 * hour), "in 1 year"),
+        (+(13 * day) - 0.4, "in 2 weeks"),
+    ]
+
+    def setUp(self) -> None:
+        self.now = time.time()
+
+    def test_relative_time(self) -> None:
+        for delta, result in self.cases:
+            self.assertEqual(str(relative_time(self.now + delta, self.now)), result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+
+from httplint import HttpRequestLinter, HttpResponseLinter, Verdict, VerdictNotes
+from httplint.field import FIELD_DEPRECATED
+from httplint.note import Deferred, Note, Notes, categories, levels
+
+HEADERS = [
+    (b"Date", b"yesterday"),
+    (b"Cache-Control", b"max-age=60, no-store"),
+    (b"Vary", b"Accept, Accept-Language, Accept-Encoding, Cookie"),
+    (b"Strict-Transport-Security", b"max-age=abc"),
+    (b"Content-Security-Policy", b"default-src *; report-to missing"),
+    (b"Content-Length", b"5"),
+]
+
+
+class DEFERRED_NOTE(Note):
+    category = categories.GENERAL
+    level = levels.INFO
+    _summary = "There are %(count)s."
+    _text = "Really."
+
+
+def lint(headers=HEADERS, **kw) -> HttpResponseLinter:
+    request = HttpRequestLinter(**kw)
+    request.process_request_topline(b"GET", b"https://example.com/", b"HTTP/1.1")
+    request.process_headers([(b"Host", b"example.com")])
+    request.finish_content(True)
+    linter = HttpResponseLinter(_related=request, **kw)
+    request.response = linter
+    linter.process_response_topline(b"HTTP/1.1", b"200", b"OK")
+    linter.process_headers(headers)
+    linter.feed_content(b"1234")
+    linter.finish_content(True)
+    return linter
+
+
+class VerdictNotesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.full = lint()
+        self.verdict = lint(verdict_only=True)
+
+    def test_same_notes(self) -> None:
+        self.assertIsInstance(self.verdict.notes, VerdictNotes)
+        self.assertEqual(
+            [(verdict.note, verdict.subject, verdict.category) for verdict in self.verdict.notes],
+            [(note.__class__, note.subject, note.category) for note in self.full.notes],
+        )
+        self.assertTrue(all(isinstance(verdict, Verdict) for verdict in self.verdict.notes))
+
+    def test_counts(self) -> None:
+        for level in levels:
+            expected = len([note for note in self.full.notes if note.level == level])
+            self.assertEqual(self.verdict.notes.counts[level], expected)
+            self.assertEqual(self.verdict.notes.has_level(level), expected > 0)
+        self.assertTrue(self.verdict.notes.has_level(levels.BAD))
+
+    def test_to_records(self) -> None:
+        full = self.full.notes.to_records()
+        self.assertEqual(
+            self.verdict.notes.to_records(),
+            [
+                {key: record[key] for key in ["note", "subject", "level", "category"]}
+                for record in full
+            ],
+        )
+
+    def test_facts(self) -> None:
+        self.assertEqual(self.verdict.caching.store_private, self.full.caching.store_private)
+        self.assertEqual(self.verdict.content_length, self.full.content_length)
+
+    def test_deprecated_fields(self) -> None:
+        headers = HEADERS + [(b"X-UA-Compatible", b"IE=edge"), (b"X-XSS-Protection", b"1")]
+        full = lint(headers)
+        verdict = lint(headers, verdict_only=True)
+        self.assertEqual(
+            [(verdict.note, verdict.subject, verdict.category) for verdict in verdict.notes],
+            [(note.__class__, note.subject, note.category) for note in full.notes],
+        )
+        self.assertIn(
+            (FIELD_DEPRECATED, categories.SECURITY),
+            [(verdict.note, verdict.category) for verdict in verdict.notes],
+        )
+
+    def test_children_discarded(self) -> None:
+        notes = VerdictNotes()
+        parent = notes.add("test", DEFERRED_NOTE, count=1)
+        parent.add_child(DEFERRED_NOTE, count=2).add_child(DEFERRED_NOTE)
+        self.assertEqual(len(notes), 1)
+        self.assertIsNotNone(notes.find(Note))
+        self.assertIsNone(notes.find(Verdict))  # type: ignore[arg-type]
+
+
+class DeferredTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.calls = 0
+
+    def count(self, value: int) -> str:
+        self.calls += 1
+        return f"{value:,}"
+
+    def test_not_called_unless_needed(self) -> None:
+        VerdictNotes().add("test", DEFERRED_NOTE, count=Deferred(self.count, 1000))
+        Notes({}).add("test", DEFERRED_NOTE, count=Deferred(self.count, 1000))
+        self.assertEqual(self.calls, 0)
+
+    def test_rendered(self) -> None:
+        note = Notes({}).add("test", DEFERRED_NOTE, count=Deferred(self.count, 1000))
+        self.assertEqual(note.summary, "There are 1,000.")
+        self.assertEqual(note.vars["count"], "1,000")
+        self.assertEqual(note.to_dict()["vars"], {"count": "1,000"})
+        self.assertEqual(self.calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
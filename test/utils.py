@@ -1,6 +1,8 @@
 import importlib
 import pkgutil
 
+from httplint.message import HttpResponseLinter
+
 
 def checkSubClasses(cls, module_paths, check):
     """
@@ -27,3 +29,24 @@ def loadModules(path, prefix):
         importlib.import_module(name)
         for finder, name, ispkg in pkgutil.iter_modules([path], prefix=prefix)
     ]
+
+
+def lint_response(content, coding=b"", headers=None, chunk_size=0, **kw):
+    """
+    Lint a 200 response with the given content, fed in chunks of chunk_size (all
+    at once by default), and return the linter. headers defaults to an image/png
+    Content-Type and, if coding is given, a Content-Encoding. kw is passed to
+    HttpResponseLinter.
+    """
+    if headers is None:
+        headers = [(b"Content-Type", b"image/png")]
+        if coding:
+            headers.append((b"Content-Encoding", coding))
+    linter = HttpResponseLinter(**kw)
+    linter.process_response_topline(b"HTTP/1.1", b"200", b"OK")
+    linter.process_headers(headers)
+    chunk_size = chunk_size or len(content) or 1
+    for i in range(0, len(content), chunk_size):
+        linter.feed_content(content[i : i + chunk_size])
+    linter.finish_content(True)
+    return linter
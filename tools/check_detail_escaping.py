@@ -52,6 +52,7 @@ KNOWN_SAFE_VARS: frozenset[str] = frozenset(
         "content_length",
         "ok_brotli_len",
         "ok_zlib_len",
+        "ok_zstd_len",
         "server_length",
         "set_cookie_value_length",
         # other numeric / constrained values
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Regenerate httplint/field/parsers/__init__.py, the index of field handler modules
+that HttpFieldFinder uses to import handlers on demand.
+
+Run this (or `make update_field_index`) after adding or removing a field handler.
+"""
+
+import os
+import pkgutil
+
+PARSERS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "httplint", "field", "parsers"
+)
+
+TEMPLATE = '''\
+"""
+Field handlers; one module per field, named after its lowercased, underscored name.
+
+Modules are imported on demand by HttpFieldFinder, so that only the handlers for
+fields that are actually seen are loaded.
+
+FIELD_MODULES is generated by tools/update_field_index.py; don't edit it by hand.
+"""
+
+FIELD_MODULES = frozenset(
+    [
+%s
+    ]
+)
+'''
+
+
+def find_field_modules(path: str = PARSERS_DIR) -> list[str]:
+    "Return a sorted list of the field handler module names in path."
+    return sorted(
+        name for _, name, ispkg in pkgutil.iter_modules([path]) if not ispkg and name[0] != "_"
+    )
+
+
+def render_index(modules: list[str]) -> str:
+    return TEMPLATE % "\n".join(f'        "{name}",' for name in modules)
+
+
+if __name__ == "__main__":
+    index_path = os.path.join(PARSERS_DIR, "__init__.py")
+    content = render_index(find_field_modules())
+    with open(index_path, "r", encoding="utf-8") as fh:
+        current = fh.read()
+    if content != current:
+        with open(index_path, "w", encoding="utf-8") as fh:
+            fh.write(content)
+        print(f"Updated {index_path}")
+    else:
+        print(f"{index_path} already up to date")